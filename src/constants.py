@@ -42,6 +42,10 @@ DIALOG_CONSTANTS_HEIGHT = 400
 # Table and list dimensions
 TABLE_ROW_HEIGHT = 24  # Compact row height
 TABLE_PREVIEW_MAX_HEIGHT = 300
+TABLE_FORMAT_BLOCK_ROWS = 256  # Rows formatted together for display
+TABLE_MAX_CHANGED_RECTS = 32  # Above this, dataChanged covers the whole table
+TABLE_FETCH_BATCH_ROWS = 10000  # Rows handed to the view per fetchMore()
+TABLE_RESIZE_SAMPLE_ROWS = 200  # Rows measured when auto-sizing a column
 
 # Input field constraints
 FORMULA_INPUT_MAX_HEIGHT = 100
@@ -59,12 +63,50 @@ STATS_SPLITTER_RIGHT = 700
 # DPI options for plot export
 PLOT_DPI_OPTIONS = ["72", "100", "150", "200", "300", "600"]
 
+# Plot decimation (series longer than the budget are downsampled)
+PLOT_POINT_BUDGET = 4000  # Points drawn per series
+PLOT_ERRORBAR_BUDGET = 500  # Error bars drawn per series
+PLOT_REDECIMATE_DELAY_MS = 100  # Wait after the last zoom/pan step
+PLOT_DENSITY_COLORMAP = "viridis"  # Default colormap of density series
+PLOT_DENSITY_COLORMAPS = ["viridis", "magma", "inferno", "plasma", "cividis", "Greys", "Blues", "jet"]
+PLOT_DENSITY_BIN_PIXELS = 2  # Screen pixels per density cell
+PLOT_EXPORT_DPI = 150  # Default resolution of exported images
+PLOT_EXPORT_SIZE_INCHES = (8.0, 6.0)  # Figure size of batch-exported plots
+
 # CSV import settings
 CSV_MAX_HEADER_ROW = 100
 
+# Follow mode (live-growing CSV files)
+FOLLOW_POLL_INTERVAL_MS = 500  # How often the file size is checked
+
+# Dependent view refresh (plots/statistics following a data table)
+REFRESH_INTERVAL_MS = 50  # Invalidations within this window are coalesced
+
+# Binary import settings
+BINARY_CHANNEL_DTYPES = [
+    "float32", "float64", "int8", "int16", "int32", "int64",
+    "uint8", "uint16", "uint32", "uint64"
+]
+BINARY_MAX_HEADER_BYTES = 1 << 30
+
 # Excel export settings
 EXCEL_MAX_COLUMN_WIDTH = 50
 EXCEL_COLUMN_WIDTH_PADDING = 2
+EXCEL_WIDTH_SAMPLE_ROWS = 100  # Rows sampled to estimate column widths
+EXCEL_WRITE_CHUNK_ROWS = 10000  # Rows converted per chunk when streaming
+
+# =============================================================================
+# Undo History
+# =============================================================================
+
+# Memory budget for column data captured by undo actions of a study
+UNDO_MAX_BYTES = 256 * 1024 * 1024
+
+# Consecutive cell edits within this many seconds are undone together
+UNDO_COALESCE_SECONDS = 1.0
+
+# Memory budget for cached computed column results of a study
+RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
 
 # =============================================================================
 # Statistics & Visualization
@@ -77,6 +119,20 @@ HISTOGRAM_MAX_BINS = 50
 # Percentiles
 PERCENTILE_Q50 = 50  # Median
 
+# Incremental statistics
+QUANTILE_SKETCH_K = 512  # Quantile sketch size (rank error about 1/k of the count)
+STREAMING_REBUILD_FRACTION = 0.5  # Rebuild once removed values exceed this share of the count
+
+# Bootstrap confidence intervals
+BOOTSTRAP_RESAMPLES = 2000
+BOOTSTRAP_CONFIDENCE = 0.95
+BOOTSTRAP_CHUNK_RESAMPLES = 250  # Resamples per job (fixed, so results do not depend on workers)
+BOOTSTRAP_MAX_BYTES = 64 * 1024 * 1024  # Memory of resamples evaluated at once, per worker
+
+# Correlation heatmap
+CORRELATION_COLORMAP = "coolwarm"
+CORRELATION_ANNOTATE_MAX_COLUMNS = 12  # Cell values are printed up to this many columns
+
 # =============================================================================
 # Display Precision
 # =============================================================================
@@ -1,10 +1,14 @@
 """Core domain models and abstractions."""
 
 from .data_object import DataObject
+from .binary_io import BinaryChannel, BinaryLayout
 from .formula_engine import FormulaEngine
+from .ring_buffer import RingBuffer
+from .result_cache import ResultCache
+from .event_bus import EventBus
 from .study import Study
 from .workspace import Workspace
-from .undo_manager import UndoManager, UndoAction, ActionType, UndoContext
+from .undo_manager import UndoManager, UndoAction, ActionType, UndoContext, ArrayDelta
 from .exceptions import (
     DataManipError,
     DataObjectError,
@@ -33,13 +37,19 @@ from .exceptions import (
 
 __all__ = [
     "DataObject",
+    "BinaryChannel",
+    "BinaryLayout",
     "FormulaEngine",
+    "RingBuffer",
+    "ResultCache",
+    "EventBus",
     "Study",
     "Workspace",
     "UndoManager",
     "UndoAction",
     "ActionType",
     "UndoContext",
+    "ArrayDelta",
     "DataManipError",
     "DataObjectError",
     "ColumnNotFoundError",
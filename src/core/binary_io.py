@@ -0,0 +1,186 @@
+"""
+Memory-mapped access to fixed-record binary files.
+
+DAQ hardware commonly writes interleaved channels as fixed-size records
+after an optional file header. BinaryLayout describes one record and
+map_binary_records() exposes the file as a structured numpy memmap, so
+each channel is a strided view into the file without any copy.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from pathlib import Path
+import numpy as np
+
+from core.exceptions import FileImportError
+
+
+@dataclass
+class BinaryChannel:
+    """One channel (field) of a binary record.
+
+    Attributes:
+        name: Column name for the channel
+        dtype: Numpy dtype string (e.g. "float32", "<f8", "int16")
+        scale: Multiplier applied to raw values
+        offset: Added to raw values after scaling
+        unit: Optional physical unit of the scaled values
+    """
+
+    name: str
+    dtype: str = "float64"
+    scale: float = 1.0
+    offset: float = 0.0
+    unit: Optional[str] = None
+
+    @property
+    def is_raw(self) -> bool:
+        """True if the channel needs no scaling (can stay a zero-copy view)."""
+        return self.scale == 1.0 and self.offset == 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export to dictionary format."""
+        return {
+            "name": self.name,
+            "dtype": self.dtype,
+            "scale": self.scale,
+            "offset": self.offset,
+            "unit": self.unit
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> BinaryChannel:
+        """Create channel from dictionary."""
+        return cls(
+            name=data["name"],
+            dtype=data.get("dtype", "float64"),
+            scale=data.get("scale", 1.0),
+            offset=data.get("offset", 0.0),
+            unit=data.get("unit")
+        )
+
+
+@dataclass
+class BinaryLayout:
+    """Record layout of a fixed-record binary file.
+
+    Attributes:
+        channels: Channels in record order
+        header_bytes: Number of bytes to skip at the start of the file
+        byte_order: Default byte order for channels without an explicit one
+            ("<" little-endian, ">" big-endian, "=" native)
+        padding_bytes: Unused bytes at the end of each record
+    """
+
+    channels: List[BinaryChannel] = field(default_factory=list)
+    header_bytes: int = 0
+    byte_order: str = "<"
+    padding_bytes: int = 0
+
+    def record_dtype(self) -> np.dtype:
+        """Build the structured numpy dtype of one record.
+
+        Returns:
+            Structured dtype with one field per channel
+
+        Raises:
+            ValueError: If the layout is empty or invalid
+        """
+        if not self.channels:
+            raise ValueError("Binary layout has no channels")
+
+        names = [ch.name for ch in self.channels]
+        if len(set(names)) != len(names):
+            raise ValueError("Binary layout has duplicate channel names")
+
+        fields = []
+        for ch in self.channels:
+            dtype = np.dtype(ch.dtype)
+            # Apply layout byte order unless the channel dtype specifies one
+            if ch.dtype[:1] not in "<>=|" and dtype.itemsize > 1:
+                dtype = dtype.newbyteorder(self.byte_order)
+            fields.append((ch.name, dtype))
+
+        if self.padding_bytes > 0:
+            fields.append(("", np.dtype((np.void, self.padding_bytes))))
+
+        return np.dtype(fields)
+
+    @property
+    def record_size(self) -> int:
+        """Size of one record in bytes."""
+        return self.record_dtype().itemsize
+
+    def count_records(self, filepath: str) -> int:
+        """Number of complete records stored in a file.
+
+        Args:
+            filepath: Path to binary file
+
+        Returns:
+            Record count (trailing partial records are ignored)
+        """
+        size = Path(filepath).stat().st_size
+        return max(0, (size - self.header_bytes) // self.record_size)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export to dictionary format."""
+        return {
+            "channels": [ch.to_dict() for ch in self.channels],
+            "header_bytes": self.header_bytes,
+            "byte_order": self.byte_order,
+            "padding_bytes": self.padding_bytes
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> BinaryLayout:
+        """Create layout from dictionary."""
+        return cls(
+            channels=[BinaryChannel.from_dict(ch) for ch in data.get("channels", [])],
+            header_bytes=data.get("header_bytes", 0),
+            byte_order=data.get("byte_order", "<"),
+            padding_bytes=data.get("padding_bytes", 0)
+        )
+
+
+def map_binary_records(filepath: str, layout: BinaryLayout, mode: str = "c") -> np.memmap:
+    """Map a fixed-record binary file into memory.
+
+    The default copy-on-write mode keeps the file untouched: pages are
+    only copied into private memory when a value is edited.
+
+    Args:
+        filepath: Path to binary file
+        layout: Record layout
+        mode: np.memmap mode ("c" copy-on-write, "r" read-only)
+
+    Returns:
+        Structured memmap with one field per channel
+
+    Raises:
+        FileImportError: If the file does not match the layout
+    """
+    try:
+        dtype = layout.record_dtype()
+    except (TypeError, ValueError) as e:
+        raise FileImportError(filepath, f"invalid record layout: {e}") from e
+
+    if layout.header_bytes < 0:
+        raise FileImportError(filepath, "header size cannot be negative")
+
+    size = Path(filepath).stat().st_size
+    if size < layout.header_bytes:
+        raise FileImportError(filepath, "file is smaller than the header")
+
+    count = (size - layout.header_bytes) // dtype.itemsize
+    if count == 0:
+        raise FileImportError(filepath, "file contains no complete record")
+
+    return np.memmap(
+        filepath,
+        dtype=dtype,
+        mode=mode,
+        offset=layout.header_bytes,
+        shape=(count,)
+    )
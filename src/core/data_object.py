@@ -6,11 +6,17 @@ for numerical data, images, and other data types.
 """
 
 from __future__ import annotations
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Tuple
 from dataclasses import dataclass, field
+from collections import deque
 import pandas as pd
 import numpy as np
 
+from core.binary_io import BinaryLayout, map_binary_records
+
+# Row ranges remembered per column for changed_rows()
+ROW_LOG_LENGTH = 64
+
 
 @dataclass
 class DataObject:
@@ -29,12 +35,97 @@ class DataObject:
     name: str
     data: pd.DataFrame
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _versions: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _generation: int = field(default=0, init=False, repr=False, compare=False)
+    _row_log: Dict[str, deque] = field(default_factory=dict, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate data object after initialization."""
         if not isinstance(self.data, pd.DataFrame):
             raise TypeError("data must be a pandas DataFrame")
     
+    def __setattr__(self, name: str, value: Any):
+        # Replacing the whole frame invalidates every column version
+        super().__setattr__(name, value)
+        if name == "data":
+            super().__setattr__("_generation", self._generation + 1)
+    
+    @property
+    def generation(self) -> int:
+        """Number of times the whole frame was replaced."""
+        return self._generation
+    
+    def column_version(self, name: str) -> tuple[int, int]:
+        """Get a version key that changes whenever a column's content changes.
+        
+        Columns set through this class are versioned automatically; code
+        writing into ``data`` in place must call touch().
+        
+        Args:
+            name: Column name
+            
+        Returns:
+            (frame generation, column version)
+        """
+        return (self._generation, self._versions.get(name, 0))
+    
+    def touch(self, name: str, rows: Optional[Tuple[int, int]] = None):
+        """Record an in-place change of a column.
+        
+        Args:
+            name: Column name
+            rows: Changed rows as a (start, stop) range (None: unknown)
+        """
+        version = self._versions.get(name, 0) + 1
+        self._versions[name] = version
+        log = self._row_log.get(name)
+        if log is None:
+            log = self._row_log[name] = deque(maxlen=ROW_LOG_LENGTH)
+        log.append((version, rows))
+    
+    def changed_rows(self, name: str, since: tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """Get the rows of a column changed since a version key.
+        
+        Args:
+            name: Column name
+            since: Earlier result of column_version()
+            
+        Returns:
+            (start, stop) range covering every change ((0, 0) if unchanged),
+            or None if the changed rows are unknown (whole frame replaced,
+            change without a row range, or history too old)
+        """
+        generation, version = since
+        current = self._versions.get(name, 0)
+        if generation != self._generation:
+            return None
+        if version == current:
+            return (0, 0)
+        
+        log = self._row_log.get(name, ())
+        entries = [(v, rows) for v, rows in log if v > version]
+        if len(entries) != current - version:
+            return None
+        if any(rows is None for _, rows in entries):
+            return None
+        return (min(rows[0] for _, rows in entries), max(rows[1] for _, rows in entries))
+    
+    def append(self, rows: pd.DataFrame):
+        """Append rows in place of replacing the frame.
+        
+        Unlike assigning ``data``, column versions stay comparable: every
+        column records the appended row range (see changed_rows()).
+        
+        Args:
+            rows: New rows (same columns as data)
+        """
+        n_old = len(self.data)
+        block = rows.reindex(columns=self.data.columns)
+        block.index = range(n_old, n_old + len(block))
+        object.__setattr__(self, "data", pd.concat([self.data, block]) if n_old else block)
+        for name in self.data.columns:
+            self.touch(name, (n_old, len(self.data)))
+    
     @classmethod
     def from_dict(cls, name: str, data_dict: Dict[str, Any], **metadata) -> DataObject:
         """Create DataObject from dictionary.
@@ -89,7 +180,45 @@ class DataObject:
             New DataObject instance
         """
         return cls(name=name, data=df.copy(), metadata=metadata)
-    
+
+    @classmethod
+    def from_binary(cls, name: str, filepath: str, layout: BinaryLayout, **metadata) -> DataObject:
+        """Create DataObject from a fixed-record binary file.
+
+        The file is memory-mapped copy-on-write. Unscaled channels in
+        native byte order become strided views into the mapping, so no
+        data is read until it is accessed, and edited pages are copied
+        privately without touching the file. Scaled channels are
+        materialized once as float64.
+
+        Args:
+            name: Object name
+            filepath: Path to binary file
+            layout: Record layout describing the channels
+            **metadata: Additional metadata
+
+        Returns:
+            New DataObject instance
+
+        Raises:
+            FileImportError: If the file does not match the layout
+        """
+        records = map_binary_records(filepath, layout)
+
+        columns = {}
+        for channel in layout.channels:
+            values = records[channel.name]
+            if not values.dtype.isnative:
+                values = values.astype(values.dtype.newbyteorder("="))
+            if not channel.is_raw:
+                values = values * np.float64(channel.scale) + np.float64(channel.offset)
+            columns[channel.name] = values
+
+        df = pd.DataFrame(columns, copy=False)
+        metadata.setdefault("source_file", str(filepath))
+        metadata.setdefault("binary_layout", layout.to_dict())
+        return cls(name=name, data=df, metadata=metadata)
+
     @classmethod
     def empty(cls, name: str, rows: int = 0, columns: Optional[list[str]] = None) -> DataObject:
         """Create empty DataObject.
@@ -126,6 +255,7 @@ class DataObject:
     def __setitem__(self, key: str, value: Any):
         """Set column data."""
         self.data[key] = value
+        self.touch(key)
     
     def get_column(self, name: str) -> pd.Series:
         """Get column data.
@@ -146,6 +276,7 @@ class DataObject:
             data: Column values
         """
         self.data[name] = data
+        self.touch(name)
     
     def add_column(self, name: str, data: Optional[pd.Series | np.ndarray | list] = None):
         """Add new column.
@@ -158,6 +289,7 @@ class DataObject:
             self.data[name] = None
         else:
             self.data[name] = data
+        self.touch(name)
     
     def remove_column(self, name: str):
         """Remove column.
@@ -166,6 +298,7 @@ class DataObject:
             name: Column name
         """
         self.data.drop(columns=[name], inplace=True)
+        self.touch(name)
     
     def copy(self) -> DataObject:
         """Create deep copy of this DataObject."""
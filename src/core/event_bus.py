@@ -0,0 +1,123 @@
+"""
+Column-level change notifications between studies.
+
+Producers (data tables) publish which columns of a study changed;
+consumers (plots, statistics) subscribe with the columns they read and
+are only called when one of those changes. Dependencies are plain
+mappings {study name: column names}, where None stands for "any column"
+(for consumers) or "unknown/structural change" (for producers).
+"""
+
+from __future__ import annotations
+from typing import Callable, Dict, Iterable, Iterator, Mapping, Optional, Set, Union
+from contextlib import contextmanager
+
+# study name -> column names read (None: any column)
+Dependencies = Mapping[str, Optional[Set[str]]]
+ChangeCallback = Callable[[str, Optional[Set[str]]], None]
+
+
+def affects(dependencies: Dependencies, study_name: str, columns: Optional[Iterable[str]]) -> bool:
+    """Check whether a change is relevant to a consumer.
+
+    Args:
+        dependencies: Columns the consumer reads, per study
+        study_name: Study whose data changed
+        columns: Changed column names (None: any column)
+
+    Returns:
+        True if the consumer reads one of the changed columns
+    """
+    if study_name not in dependencies:
+        return False
+    read = dependencies[study_name]
+    if read is None or columns is None:
+        return True
+    return not read.isdisjoint(columns)
+
+
+class EventBus:
+    """Synchronous publish/subscribe of column changes.
+
+    Subscribers are called in subscription order. Inside batch(), changes
+    are merged per study and delivered once when the outermost batch ends.
+    """
+
+    def __init__(self):
+        """Initialize bus without subscribers."""
+        self._subscribers: Dict[int, tuple] = {}
+        self._next_token = 0
+        self._batch_depth = 0
+        self._pending: Dict[str, Optional[Set[str]]] = {}
+
+    def subscribe(self, callback: ChangeCallback,
+                  dependencies: Union[Dependencies, Callable[[], Dependencies], None] = None) -> int:
+        """Call a function when columns it reads change.
+
+        Args:
+            callback: Called as callback(study_name, columns) with the
+                changed columns (None: any column)
+            dependencies: Columns read per study, or a function returning
+                them (queried on every publish, so consumers whose inputs
+                change need not resubscribe); None for every change
+
+        Returns:
+            Token for unsubscribe()
+        """
+        token = self._next_token
+        self._next_token += 1
+        self._subscribers[token] = (callback, dependencies)
+        return token
+
+    def unsubscribe(self, token: int):
+        """Remove a subscription.
+
+        Args:
+            token: Token returned by subscribe()
+        """
+        self._subscribers.pop(token, None)
+
+    def publish(self, study_name: str, columns: Optional[Iterable[str]] = None):
+        """Notify consumers of changed columns.
+
+        Args:
+            study_name: Study whose data changed
+            columns: Changed column names (None: any column, e.g. after a
+                structural change)
+        """
+        columns = None if columns is None else set(columns)
+        if columns is not None and not columns:
+            return
+
+        if self._batch_depth:
+            if study_name in self._pending:
+                pending = self._pending[study_name]
+                self._pending[study_name] = None if pending is None or columns is None else pending | columns
+            else:
+                self._pending[study_name] = columns
+            return
+
+        for callback, dependencies in list(self._subscribers.values()):
+            if dependencies is not None:
+                if callable(dependencies):
+                    dependencies = dependencies()
+                if not affects(dependencies, study_name, columns):
+                    continue
+            callback(study_name, columns)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Merge changes published inside the block into one per study."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                pending, self._pending = self._pending, {}
+                for study_name, columns in pending.items():
+                    self.publish(study_name, columns)
+
+    def subscriber_count(self) -> int:
+        """Get number of subscriptions."""
+        return len(self._subscribers)
@@ -8,6 +8,7 @@ and uncertainty propagation.
 from __future__ import annotations
 from typing import Any, Dict, Optional, Set
 import re
+import ast
 import logging
 import numpy as np
 import pandas as pd
@@ -29,6 +30,20 @@ ureg = pint.UnitRegistry()
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# Math context functions that operate element by element
+_ELEMENTWISE_FUNCTIONS = {
+    'sqrt', 'sin', 'cos', 'tan', 'exp', 'log', 'log10', 'abs',
+    'arcsin', 'arccos', 'arctan', 'round', 'floor', 'ceil', 'sign',
+}
+_ELEMENTWISE_NAMES = _ELEMENTWISE_FUNCTIONS | {'np', 'pi', 'e'}
+
+# Syntax allowed in element-wise formulas (besides names, attributes and calls)
+_ELEMENTWISE_NODES = (
+    ast.Expression, ast.Constant, ast.Load,
+    ast.BinOp, ast.UnaryOp, ast.Compare,
+    ast.operator, ast.unaryop, ast.cmpop,
+)
+
 
 class FormulaEngine:
     """Unified formula engine for all calculation types.
@@ -62,6 +77,7 @@ class FormulaEngine:
         self._workspace_cache: Dict[int, Dict[str, Any]] = {}  # {workspace_id: evaluated_constants}
         self._workspace_cache_version: Dict[int, int] = {}  # {workspace_id: version}
         self._compiled_formulas: Dict[str, tuple[str, list[str]]] = {}  # {formula: (eval_formula, deps)}
+        self._elementwise_cache: Dict[str, bool] = {}  # {formula: is_elementwise}
     
     def _build_math_context(self) -> Dict[str, Any]:
         """Build standard math function context.
@@ -418,6 +434,53 @@ class FormulaEngine:
         except Exception as e:
             raise FormulaError(f"Formula evaluation failed: {str(e)}")
     
+    def is_elementwise(self, formula: str) -> bool:
+        """Check whether each result row only depends on the same input row.
+        
+        Element-wise formulas can be evaluated on any slice of rows (e.g.
+        only newly appended rows). Formulas are element-wise if they only
+        use arithmetic, comparisons, scalars/constants and element-wise math
+        functions (sin, exp, numpy ufuncs, ...). Aggregates (mean, sum),
+        cumulative functions, diff and indexing are not.
+        
+        Args:
+            formula: Formula string
+            
+        Returns:
+            True if the formula is element-wise
+        """
+        if formula in self._elementwise_cache:
+            return self._elementwise_cache[formula]
+        
+        eval_formula = formula
+        for dep in self.extract_dependencies(formula):
+            eval_formula = eval_formula.replace(f"{{{dep}}}", dep)
+        
+        try:
+            tree = ast.parse(eval_formula.strip(), mode="eval")
+            result = all(self._is_elementwise_node(node) for node in ast.walk(tree))
+        except SyntaxError:
+            result = False
+        
+        self._elementwise_cache[formula] = result
+        return result
+    
+    def _is_elementwise_node(self, node: ast.AST) -> bool:
+        """Check a single AST node for is_elementwise()."""
+        if isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Name):
+                return func.id in _ELEMENTWISE_FUNCTIONS
+            if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and func.value.id == "np":
+                return isinstance(getattr(np, func.attr, None), np.ufunc)
+            return False
+        if isinstance(node, ast.Name):
+            # Aggregates or helpers used as values (e.g. passed to a call)
+            return node.id not in self._math_functions or node.id in _ELEMENTWISE_NAMES
+        if isinstance(node, ast.Attribute):
+            return isinstance(node.value, ast.Name) and node.value.id == "np"
+        return isinstance(node, _ELEMENTWISE_NODES)
+    
     def extract_dependencies(self, formula: str) -> list[str]:
         """Extract variable/column names from formula.
         
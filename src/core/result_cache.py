@@ -0,0 +1,134 @@
+"""
+Bounded cache for computed column results.
+
+Results are keyed by what produced them - a formula or column spec plus
+content fingerprints of the inputs - so returning to an earlier state
+(undo, redo, toggling a value back) finds the earlier results again.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Hashable, Optional
+from collections import OrderedDict
+import hashlib
+import pickle
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+def fingerprint(value: Any) -> Optional[bytes]:
+    """Content fingerprint of an array or scalar (BLAKE2b, 16 bytes).
+
+    Args:
+        value: Array, Series or picklable value
+
+    Returns:
+        Digest, or None if the value cannot be fingerprinted
+    """
+    if isinstance(value, pd.Series):
+        value = value.to_numpy()
+
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        digest.update(value.dtype.str.encode())
+        digest.update(repr(value.shape).encode())
+        digest.update(np.ascontiguousarray(value).view(np.uint8).reshape(-1))
+        return digest.digest()
+
+    try:
+        digest.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return None
+    return digest.digest()
+
+
+class ResultCache:
+    """Thread-safe LRU cache of result arrays with a byte budget.
+
+    Stored arrays are private copies; get() returns a fresh copy so callers
+    may modify it.
+
+    Attributes:
+        max_bytes: Byte budget (0 disables the cache)
+        hits: Number of successful lookups
+        misses: Number of failed lookups
+    """
+
+    def __init__(self, max_bytes: int):
+        """Initialize cache.
+
+        Args:
+            max_bytes: Byte budget (0 disables the cache)
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether results are cached at all."""
+        return self.max_bytes > 0
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """Look up a result.
+
+        Args:
+            key: Result key
+
+        Returns:
+            Copy of the cached array, or None
+        """
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return result.copy()
+
+    def put(self, key: Hashable, result: Any):
+        """Store a result, evicting least recently used ones over budget.
+
+        Args:
+            key: Result key
+            result: Result array (copied)
+        """
+        result = np.array(result)
+        if result.dtype == object or result.nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = result
+            self._bytes += result.nbytes
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    def clear(self):
+        """Remove all results (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with hits, misses, hit_rate, entries and bytes
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
@@ -0,0 +1,137 @@
+"""
+Fixed-capacity column ring buffer for live acquisition.
+
+Each column is stored twice in a row of a (columns, 2 * capacity) array:
+every value is written at position p and at p + capacity. The active
+window is then always the contiguous slice [head, head + count), so
+columns can be exposed as plain numpy views and evicting the oldest rows
+only moves ``head`` - nothing is copied.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Union
+import numpy as np
+import pandas as pd
+
+
+class RingBuffer:
+    """Mirrored ring buffer holding the last ``capacity`` rows of float columns.
+
+    Attributes:
+        columns: Column names, in storage order
+        capacity: Maximum number of rows kept
+        total_appended: Number of rows appended since creation
+    """
+
+    def __init__(self, columns: List[str], capacity: int):
+        """Initialize an empty ring buffer.
+
+        Args:
+            columns: Column names
+            capacity: Maximum number of rows kept
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive")
+
+        self.columns = list(columns)
+        self.capacity = capacity
+        self.total_appended = 0
+        self._index = {name: i for i, name in enumerate(self.columns)}
+        self._storage = np.full((len(self.columns), 2 * capacity), np.nan)
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Number of rows in the active window."""
+        return self._count
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def column(self, name: str) -> np.ndarray:
+        """Get a column of the active window as a view (no copy).
+
+        The view stays valid until the next append; write through
+        write() rather than into the view so both copies stay in sync.
+        """
+        return self._storage[self._index[name], self._head:self._head + self._count]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Get the active window as a DataFrame of column views."""
+        return pd.DataFrame({name: self.column(name) for name in self.columns}, copy=False)
+
+    def append(self, block: Union[np.ndarray, Dict[str, np.ndarray]]) -> int:
+        """Append rows, evicting the oldest ones beyond capacity.
+
+        Args:
+            block: Array of shape (len(columns), rows), or dict of column ->
+                values (missing columns are filled with NaN)
+
+        Returns:
+            Number of rows evicted from the window
+        """
+        if isinstance(block, dict):
+            lengths = {len(np.atleast_1d(v)) for v in block.values()}
+            if len(lengths) > 1:
+                raise ValueError("All columns of an appended block must have the same length")
+            rows = lengths.pop() if lengths else 0
+            values = np.full((len(self.columns), rows), np.nan)
+            for name, column in block.items():
+                if name in self._index:
+                    values[self._index[name]] = column
+        else:
+            values = np.asarray(block, dtype=float).reshape(len(self.columns), -1)
+
+        rows = values.shape[1]
+        if rows == 0:
+            return 0
+        self.total_appended += rows
+
+        # Only the last `capacity` rows of a large block can survive
+        if rows > self.capacity:
+            values = values[:, -self.capacity:]
+        kept = values.shape[1]
+
+        self._put(slice(None), (self._head + self._count) % self.capacity, values)
+
+        evicted = max(0, self._count + rows - self.capacity)
+        self._head = (self._head + max(0, self._count + kept - self.capacity)) % self.capacity
+        self._count = min(self.capacity, self._count + kept)
+        return evicted
+
+    def write(self, name: str, start: int, values: np.ndarray):
+        """Overwrite rows of a column from window row ``start`` on.
+
+        Args:
+            name: Column name
+            start: First window row to write
+            values: New values (length: rows to write)
+        """
+        values = np.asarray(values, dtype=float)
+        if len(values) == 0:
+            return
+        if start < 0 or start + len(values) > self._count:
+            raise IndexError("Write outside of the ring buffer window")
+        self._put(self._index[name], (self._head + start) % self.capacity, values)
+
+    def clear(self):
+        """Remove all rows."""
+        self._head = 0
+        self._count = 0
+        self._storage[:] = np.nan
+
+    def _put(self, row, position: int, values: np.ndarray):
+        """Store values at a physical position and its mirror, wrapping once."""
+        cap = self.capacity
+        n = values.shape[-1]
+        first = min(n, cap - position)
+
+        self._storage[row, position:position + first] = values[..., :first]
+        self._storage[row, position + cap:position + cap + first] = values[..., :first]
+        if n > first:
+            rest = values[..., first:]
+            self._storage[row, :n - first] = rest
+            self._storage[row, cap:cap + n - first] = rest
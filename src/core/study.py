@@ -6,7 +6,7 @@ Examples: DataTable, Visualization, Statistics, Fitting, etc.
 """
 
 from __future__ import annotations
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from abc import ABC, abstractmethod
 from .data_object import DataObject
 
@@ -83,6 +83,17 @@ class Study(ABC):
         """
         pass
     
+    def get_dependencies(self) -> Dict[str, Optional[Set[str]]]:
+        """Get the columns of other studies this study reads.
+        
+        Used to subscribe to Workspace.events, so the study's views are
+        only refreshed when one of these columns changes.
+        
+        Returns:
+            Dictionary mapping study name to column names (None: any column)
+        """
+        return {}
+    
     def to_dict(self) -> Dict[str, Any]:
         """Export study to dictionary format.
         
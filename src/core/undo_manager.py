@@ -1,8 +1,21 @@
 """Undo/Redo system for DataManip operations."""
 
-from typing import Any, Dict, List, Optional, Callable
-from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Callable, IO
+from collections import deque
+from dataclasses import dataclass, field
 from enum import Enum
+import contextlib
+import itertools
+import pickle
+import tempfile
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+# Payloads at least this large are zlib-compressed (if that makes them smaller)
+_COMPRESS_MIN_BYTES = 4096
 
 
 class ActionType(Enum):
@@ -21,6 +34,150 @@ class ActionType(Enum):
     MODIFY_FUNCTION = "modify_function"
 
 
+class ArrayDelta:
+    """Old (or new) values of selected rows of a column, stored compactly.
+
+    Rows are kept as sorted [start, stop) ranges and their values as raw
+    bytes (numeric dtypes) or a pickle (object columns), zlib-compressed
+    when large. The payload can be spilled to a file to free memory.
+
+    Attributes:
+        length: Length of the captured column
+        ranges: (k, 2) array of [start, stop) row ranges
+        dtype: dtype of the captured values
+        series_dtype: Extension dtype of the captured Series, if any
+    """
+
+    def __init__(self, values: np.ndarray | pd.Series, rows: Optional[np.ndarray] = None):
+        """Capture values.
+
+        Args:
+            values: Column values
+            rows: Row indices to capture (None: the whole column)
+        """
+        series_dtype = values.dtype if isinstance(values, pd.Series) else None
+        values = values.to_numpy() if isinstance(values, pd.Series) else np.asarray(values)
+        if rows is None:
+            self._store(None, values, len(values))
+        else:
+            rows = np.unique(np.asarray(rows, dtype=np.int64))
+            self._store(rows, values[rows], len(values))
+        # Extension dtypes (e.g. pandas 3 "str") are restored by to_series()
+        self.series_dtype = series_dtype if isinstance(series_dtype, pd.api.extensions.ExtensionDtype) else None
+
+    @classmethod
+    def of_rows(cls, rows: np.ndarray, values: np.ndarray, length: int) -> "ArrayDelta":
+        """Create a delta from row indices and their values.
+
+        Args:
+            rows: Row indices (for duplicates, the first occurrence wins)
+            values: Values of those rows
+            length: Length of the column
+        """
+        rows, first = np.unique(np.asarray(rows, dtype=np.int64), return_index=True)
+        delta = cls.__new__(cls)
+        delta._store(rows, np.asarray(values)[first], length)
+        delta.series_dtype = None
+        return delta
+
+    def _store(self, rows: Optional[np.ndarray], values: np.ndarray, length: int):
+        """Store sorted unique rows (None: all rows) and their values."""
+        self.length = length
+        if rows is None:
+            self.ranges = np.array([[0, length]], dtype=np.int64)
+        elif len(rows) == 0:
+            self.ranges = np.empty((0, 2), dtype=np.int64)
+        else:
+            breaks = np.flatnonzero(np.diff(rows) != 1) + 1
+            starts = rows[np.r_[0, breaks]]
+            stops = rows[np.r_[breaks - 1, len(rows) - 1]] + 1
+            self.ranges = np.column_stack([starts, stops])
+        self.dtype = values.dtype
+
+        if values.dtype.kind in "biufcmM":
+            self._pickled = False
+            payload = np.ascontiguousarray(values).tobytes()
+        else:
+            self._pickled = True
+            payload = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self._compressed = False
+        if len(payload) >= _COMPRESS_MIN_BYTES:
+            packed = zlib.compress(payload, 1)
+            if len(packed) < len(payload):
+                payload, self._compressed = packed, True
+
+        self._payload: Optional[bytes] = payload
+        self._spilled: Optional[tuple] = None  # (file, offset, size)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held in memory."""
+        resident = len(self._payload) if self._payload is not None else 0
+        return resident + self.ranges.nbytes
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Captured row indices."""
+        if len(self.ranges) == 0:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([np.arange(start, stop) for start, stop in self.ranges])
+
+    def merge(self, other: "ArrayDelta") -> "ArrayDelta":
+        """Combine with another delta of the same column; this one wins on overlap."""
+        rows = np.concatenate([self.rows, other.rows])
+        mine, theirs = self.values(), other.values()
+        if mine.dtype != theirs.dtype:
+            mine, theirs = mine.astype(object), theirs.astype(object)
+        return ArrayDelta.of_rows(rows, np.concatenate([mine, theirs]), max(self.length, other.length))
+
+    def values(self) -> np.ndarray:
+        """Get the captured values (in row order)."""
+        if self._payload is not None:
+            payload = self._payload
+        else:
+            file, offset, size = self._spilled
+            file.seek(offset)
+            payload = file.read(size)
+
+        if self._compressed:
+            payload = zlib.decompress(payload)
+        if self._pickled:
+            return pickle.loads(payload)
+        return np.frombuffer(payload, dtype=self.dtype).copy()
+
+    def to_series(self) -> pd.Series:
+        """Get a whole-column capture as a Series."""
+        return pd.Series(self.values(), dtype=self.series_dtype)
+
+    def apply(self, column: pd.Series) -> pd.Series:
+        """Write the captured values into a copy of a column.
+
+        Args:
+            column: Column to patch
+
+        Returns:
+            Patched column (upcast if needed to hold the values)
+        """
+        patched = column.copy()
+        if len(self.ranges):
+            patched.iloc[self.rows] = self.values()
+        return patched
+
+    def spill(self, file: IO[bytes]):
+        """Move the payload to the end of a file, freeing memory.
+
+        Args:
+            file: Binary file opened for reading and writing
+        """
+        if self._payload is None:
+            return
+        file.seek(0, 2)
+        self._spilled = (file, file.tell(), len(self._payload))
+        file.write(self._payload)
+        self._payload = None
+
+
 @dataclass
 class UndoAction:
     """Represents a single undoable action.
@@ -32,6 +189,13 @@ class UndoAction:
         description: Human-readable description
         state_before: Optional state before action
         state_after: Optional state after action
+        deltas: Captured column data used by undo_func/redo_func; counted
+            against the manager's byte budget
+        merge_key: Actions pushed in quick succession with the same key
+            may be coalesced into one (see UndoManager.coalesce_window)
+        merge_func: Called on the previous action with the new one;
+            returns the combined action, or None if they cannot be merged
+        timestamp: time.monotonic() when the action was created
     """
     action_type: ActionType
     undo_func: Callable
@@ -39,24 +203,56 @@ class UndoAction:
     description: str
     state_before: Optional[Dict[str, Any]] = None
     state_after: Optional[Dict[str, Any]] = None
+    deltas: List[ArrayDelta] = field(default_factory=list)
+    merge_key: Optional[str] = None
+    merge_func: Optional[Callable[["UndoAction"], Optional["UndoAction"]]] = None
+    timestamp: float = field(default_factory=time.monotonic)
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes of captured data held in memory."""
+        return sum(delta.nbytes for delta in self.deltas)
 
 
 class UndoManager:
     """Manager for undo/redo operations.
     
-    Maintains undo and redo stacks with configurable history limit.
+    Maintains undo and redo stacks with configurable history limit and
+    an optional byte budget for the data captured by actions (see
+    UndoAction.deltas). Over budget, the oldest actions are dropped - or,
+    with spilling enabled, their data is moved to a temporary file.
     """
     
-    def __init__(self, max_history: int = 50):
+    def __init__(self, max_history: int = 50, max_bytes: Optional[int] = None, spill: bool = False,
+                 coalesce_window: float = 1.0):
         """Initialize undo manager.
         
         Args:
             max_history: Maximum number of actions to keep in history
+            max_bytes: Maximum bytes of captured data kept in memory
+                (None: unlimited)
+            spill: Spill data of old actions to a temporary file instead
+                of dropping them when over max_bytes
+            coalesce_window: Seconds within which actions with the same
+                merge_key are coalesced
         """
         self.max_history = max_history
-        self.undo_stack: List[UndoAction] = []
-        self.redo_stack: List[UndoAction] = []
+        self.max_bytes = max_bytes
+        self.spill = spill
+        self.coalesce_window = coalesce_window
+        self._group: Optional[List[UndoAction]] = None
+        self.undo_stack: Deque[UndoAction] = deque()
+        self.redo_stack: Deque[UndoAction] = deque()
         self._enabled = True
+        self._bytes = 0
+        # Actions with in-memory data, oldest first (may hold stale entries)
+        self._resident: Deque[UndoAction] = deque()
+        self._spill_file: Optional[IO[bytes]] = None
+    
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes of captured data currently held in memory."""
+        return self._bytes
     
     def push(self, action: UndoAction):
         """Push action onto undo stack.
@@ -67,15 +263,112 @@ class UndoManager:
         if not self._enabled:
             return
         
+        if self._group is not None:
+            self._group.append(action)
+            return
+        
+        # Coalesce with the previous action (e.g. rapid cell edits)
+        if action.merge_key is not None and self.undo_stack and not self.redo_stack:
+            previous = self.undo_stack[-1]
+            if (previous.merge_key == action.merge_key and previous.merge_func is not None
+                    and action.timestamp - previous.timestamp <= self.coalesce_window):
+                merged = previous.merge_func(action)
+                if merged is not None:
+                    merged.timestamp = action.timestamp
+                    self._drop(self.undo_stack.pop())
+                    action = merged
+        
         # Add to undo stack
         self.undo_stack.append(action)
+        self._bytes += action.nbytes
+        if self.spill and action.nbytes:
+            self._resident.append(action)
         
         # Clear redo stack (new action invalidates redo history)
-        self.redo_stack.clear()
+        while self.redo_stack:
+            self._drop(self.redo_stack.pop())
         
         # Limit stack size
-        if len(self.undo_stack) > self.max_history:
-            self.undo_stack.pop(0)
+        while len(self.undo_stack) > self.max_history:
+            self._drop(self.undo_stack.popleft())
+        self._enforce_budget()
+    
+    def _enforce_budget(self):
+        """Spill or drop the oldest actions until captured data fits max_bytes."""
+        if self.max_bytes is None:
+            return
+        
+        if not self.spill:
+            # Drop oldest actions, always keeping the latest one
+            while self._bytes > self.max_bytes and len(self.undo_stack) > 1:
+                self._drop(self.undo_stack.popleft())
+            return
+        
+        while self._bytes > self.max_bytes and self._resident:
+            oldest = self._resident.popleft()
+            size = oldest.nbytes
+            if size == 0:
+                # Dropped or already spilled
+                continue
+            if self.undo_stack and oldest is self.undo_stack[-1]:
+                # Keep the latest action in memory
+                self._resident.appendleft(oldest)
+                break
+            
+            if self._spill_file is None:
+                self._spill_file = tempfile.TemporaryFile()
+            for delta in oldest.deltas:
+                delta.spill(self._spill_file)
+            self._bytes -= size - oldest.nbytes
+    
+    def _drop(self, action: UndoAction):
+        """Forget an action that left the history and release its data."""
+        self._bytes -= action.nbytes
+        action.deltas.clear()
+        while self._resident and self._resident[0].nbytes == 0:
+            self._resident.popleft()
+    
+    @contextlib.contextmanager
+    def group(self, description: str):
+        """Record all actions pushed inside the block as a single action.
+        
+        Nested groups join the outermost one.
+        
+        Example:
+            with undo_manager.group("Add 3 columns"):
+                study.add_column("a")
+                ...
+        
+        Args:
+            description: Description of the combined action
+        """
+        if self._group is not None:
+            yield
+            return
+        
+        self._group = []
+        try:
+            yield
+        finally:
+            actions, self._group = self._group, None
+            if len(actions) == 1:
+                self.push(actions[0])
+            elif actions:
+                def undo_group():
+                    for action in reversed(actions):
+                        action.undo_func()
+                
+                def redo_group():
+                    for action in actions:
+                        action.redo_func()
+                
+                self.push(UndoAction(
+                    action_type=actions[0].action_type,
+                    undo_func=undo_group,
+                    redo_func=redo_group,
+                    description=description,
+                    deltas=[delta for action in actions for delta in action.deltas]
+                ))
     
     def undo(self) -> bool:
         """Undo last action.
@@ -159,6 +452,11 @@ class UndoManager:
         """Clear all undo/redo history."""
         self.undo_stack.clear()
         self.redo_stack.clear()
+        self._resident.clear()
+        self._bytes = 0
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
     
     def set_enabled(self, enabled: bool):
         """Enable or disable undo tracking.
@@ -201,7 +499,7 @@ class UndoManager:
         Returns:
             List of action descriptions (most recent first)
         """
-        return [action.description for action in reversed(self.undo_stack[-limit:])]
+        return [action.description for action in itertools.islice(reversed(self.undo_stack), limit)]
 
 
 class UndoContext:
@@ -8,6 +8,7 @@ studies of various types.
 from __future__ import annotations
 from typing import Dict, List, Optional, Any
 from .study import Study
+from .event_bus import EventBus
 
 
 class Workspace:
@@ -22,6 +23,7 @@ class Workspace:
         workspace_type: Type identifier (e.g., "numerical", "image")
         studies: Dictionary of studies in this workspace
         metadata: Workspace settings
+        events: Column change notifications between studies
     """
     
     def __init__(self, name: str, workspace_type: str):
@@ -42,6 +44,8 @@ class Workspace:
         
         # Version counter for cache invalidation (incremented on constant changes)
         self._version: int = 0
+        
+        self.events = EventBus()
     
     def add_study(self, study: Study):
         """Add study to workspace.
@@ -59,6 +63,8 @@ class Workspace:
         """
         if name in self.studies:
             del self.studies[name]
+            # Consumers of the study's columns must drop or redraw them
+            self.events.publish(name)
     
     def get_study(self, name: str) -> Optional[Study]:
         """Get study by name.
@@ -0,0 +1,176 @@
+"""
+Batch import of many CSV files into DataTable studies.
+
+Files are parsed in worker processes; studies are built and registered
+in the main process as each file completes, so the workspace fills up
+progressively and one bad file does not abort the batch.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass, field
+from pathlib import Path
+import concurrent.futures
+import copy
+import glob
+import os
+
+import pandas as pd
+
+from core.data_object import DataObject
+from studies.data_table_study import DataTableStudy, ColumnType, read_csv_frame
+
+
+@dataclass
+class BatchImportResult:
+    """Outcome of a batch import.
+
+    Attributes:
+        studies: Imported studies, in input file order
+        errors: Error message per file that failed
+        cancelled: True if the batch was stopped before all files were read
+    """
+
+    studies: List[DataTableStudy] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    cancelled: bool = False
+
+    @property
+    def succeeded(self) -> int:
+        """Number of files imported."""
+        return len(self.studies)
+
+    @property
+    def failed(self) -> int:
+        """Number of files that failed."""
+        return len(self.errors)
+
+
+def collect_import_files(source: str, pattern: str = "*.csv") -> List[str]:
+    """Resolve a directory or glob pattern to a sorted list of files.
+
+    Args:
+        source: Directory (searched with ``pattern``) or glob pattern
+        pattern: File pattern used when ``source`` is a directory
+
+    Returns:
+        Sorted file paths
+    """
+    if os.path.isdir(source):
+        source = os.path.join(source, pattern)
+    return sorted(path for path in glob.glob(source) if os.path.isfile(path))
+
+
+def batch_import_csv(
+    files: List[str],
+    settings: Optional[Dict[str, Any]] = None,
+    workspace=None,
+    metadata_template: Optional[Dict[str, Dict[str, Any]]] = None,
+    max_workers: Optional[int] = None,
+    max_undo_steps: int = 50,
+    on_study: Optional[Callable[[DataTableStudy], None]] = None,
+    progress_callback: Optional[Callable[[int, int, str], bool]] = None
+) -> BatchImportResult:
+    """Import CSV files into one DataTableStudy each.
+
+    Args:
+        files: CSV file paths
+        settings: CSV settings as returned by CSVImportDialog.get_import_settings()
+        workspace: Workspace to register studies in (as they complete)
+        metadata_template: Column metadata applied to every study, e.g. the
+            column_metadata of an existing study. Units/types of columns
+            present in a file are replaced; CALCULATED, DERIVATIVE and RANGE
+            columns are added and computed.
+        max_workers: Worker processes (None: one per core, 1: parse inline)
+        max_undo_steps: Undo history size of the created studies
+        on_study: Called with each study once it is built
+        progress_callback: Called as ``(done, total, filepath)`` after each
+            file; returning False cancels the remaining files
+
+    Returns:
+        BatchImportResult with studies and per-file errors
+    """
+    settings = settings or {}
+    result = BatchImportResult()
+    studies_by_file: Dict[str, DataTableStudy] = {}
+    taken_names = set(workspace.studies) if workspace is not None else set()
+    names = {}
+    for filepath in files:
+        names[filepath] = _unique_name(Path(filepath).stem, taken_names)
+        taken_names.add(names[filepath])
+
+    def finish(filepath: str, df: Optional[pd.DataFrame], error: Optional[BaseException], done: int) -> bool:
+        if error is None:
+            try:
+                study = _build_study(names[filepath], df, workspace, metadata_template, max_undo_steps)
+                studies_by_file[filepath] = study
+                if workspace is not None:
+                    workspace.add_study(study)
+                if on_study:
+                    on_study(study)
+            except Exception as e:
+                result.errors[filepath] = str(e)
+        else:
+            result.errors[filepath] = str(error)
+
+        if progress_callback:
+            return progress_callback(done, len(files), filepath) is not False
+        return True
+
+    if max_workers == 1 or len(files) <= 1:
+        for done, filepath in enumerate(files, start=1):
+            try:
+                df, error = read_csv_frame(filepath, **settings), None
+            except Exception as e:
+                df, error = None, e
+            if not finish(filepath, df, error, done):
+                result.cancelled = done < len(files)
+                break
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(read_csv_frame, filepath, **settings): filepath
+                for filepath in files
+            }
+            for done, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+                error = future.exception()
+                df = future.result() if error is None else None
+                if not finish(futures[future], df, error, done):
+                    result.cancelled = done < len(files)
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+    result.studies = [studies_by_file[f] for f in files if f in studies_by_file]
+    return result
+
+
+def _unique_name(name: str, taken: set) -> str:
+    """Append a counter to a study name until it is unused."""
+    candidate = name
+    counter = 2
+    while candidate in taken:
+        candidate = f"{name}_{counter}"
+        counter += 1
+    return candidate
+
+
+def _build_study(
+    name: str,
+    df: pd.DataFrame,
+    workspace,
+    metadata_template: Optional[Dict[str, Dict[str, Any]]],
+    max_undo_steps: int
+) -> DataTableStudy:
+    """Create a study from a parsed frame and apply the metadata template."""
+    study = DataTableStudy(name, workspace=workspace, max_undo_steps=max_undo_steps)
+    study._load_table(DataObject(name="main_table", data=df))
+
+    if metadata_template:
+        computed_types = (ColumnType.CALCULATED, ColumnType.DERIVATIVE, ColumnType.RANGE)
+        for col_name, meta in metadata_template.items():
+            if col_name in study.column_metadata or meta.get("type") in computed_types:
+                study.column_metadata[col_name] = copy.deepcopy(meta)
+        study._rebuild_computed_columns()
+
+    return study
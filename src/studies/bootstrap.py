@@ -0,0 +1,228 @@
+"""
+Bootstrap confidence intervals of descriptive statistics.
+
+Resamples are drawn in fixed-size chunks, each with its own seed spawned
+from one SeedSequence, so results depend only on the seed and never on
+the number of workers or the order in which chunks finish. Within a
+chunk, resample indices are generated a block of resamples at a time and
+statistics are evaluated vectorized along the resample axis; the block
+size is chosen so that indices and gathered values stay below a memory
+budget. Samples too large for one resample per block are resampled as
+counts per sorted value, accumulated from bounded index blocks. Chunks
+run on a process pool that receives the data once per worker.
+"""
+
+from __future__ import annotations
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+import concurrent.futures
+
+import numpy as np
+
+from constants import (
+    BOOTSTRAP_CHUNK_RESAMPLES, BOOTSTRAP_CONFIDENCE, BOOTSTRAP_MAX_BYTES, BOOTSTRAP_RESAMPLES
+)
+
+BOOTSTRAP_STATISTICS: Tuple[str, ...] = ("mean", "median", "std")
+
+# Sorted sample of the current pool worker (see _init_worker)
+_worker_data: Optional[np.ndarray] = None
+
+
+@dataclass
+class BootstrapResult:
+    """Bootstrap estimates and percentile confidence intervals.
+
+    Attributes:
+        estimates: Statistic of the original sample, per statistic
+        intervals: (low, high) confidence interval per statistic
+        standard_errors: Standard deviation of the bootstrap distribution
+        confidence: Confidence level of the intervals
+        n_resamples: Number of resamples evaluated
+        cancelled: True if stopped before all resamples were evaluated
+    """
+
+    estimates: Dict[str, float] = field(default_factory=dict)
+    intervals: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    standard_errors: Dict[str, float] = field(default_factory=dict)
+    confidence: float = BOOTSTRAP_CONFIDENCE
+    n_resamples: int = 0
+    cancelled: bool = False
+
+
+def bootstrap(
+    values,
+    statistics: Sequence[str] = BOOTSTRAP_STATISTICS,
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+    confidence: float = BOOTSTRAP_CONFIDENCE,
+    seed: int = 0,
+    max_workers: Optional[int] = None,
+    max_bytes: int = BOOTSTRAP_MAX_BYTES,
+    progress_callback: Optional[Callable[[int, int], bool]] = None
+) -> BootstrapResult:
+    """Percentile bootstrap confidence intervals.
+
+    Args:
+        values: Sample (missing and infinite values are ignored)
+        statistics: Statistics to estimate ("mean", "median", "std")
+        n_resamples: Number of resamples
+        confidence: Confidence level in (0, 1)
+        seed: Random seed; equal seeds give equal results for any max_workers
+        max_workers: Worker processes (None: one per core, 1: run inline)
+        max_bytes: Memory budget of the resamples evaluated at once, per worker
+        progress_callback: Called as ``(resamples done, total)`` after each
+            chunk; returning False cancels the remaining chunks
+
+    Returns:
+        BootstrapResult (intervals from the resamples evaluated so far if
+        cancelled)
+
+    Raises:
+        ValueError: If a statistic is unknown or the sample has fewer than
+            two finite values
+    """
+    unknown = set(statistics) - set(BOOTSTRAP_STATISTICS)
+    if unknown:
+        raise ValueError(f"Unknown bootstrap statistics: {', '.join(sorted(unknown))}")
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("Confidence must be between 0 and 1")
+
+    data = np.asarray(values, dtype=float).ravel()
+    data = np.sort(data[np.isfinite(data)])
+    if len(data) < 2:
+        raise ValueError("Bootstrap needs at least two finite values")
+
+    sizes = [BOOTSTRAP_CHUNK_RESAMPLES] * (n_resamples // BOOTSTRAP_CHUNK_RESAMPLES)
+    if n_resamples % BOOTSTRAP_CHUNK_RESAMPLES:
+        sizes.append(n_resamples % BOOTSTRAP_CHUNK_RESAMPLES)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(size, chunk_seed, tuple(statistics), max_bytes) for size, chunk_seed in zip(sizes, seeds)]
+
+    chunks: Dict[int, Dict[str, np.ndarray]] = {}
+    done = 0
+    cancelled = False
+
+    def finish(index: int, chunk: Dict[str, np.ndarray]) -> bool:
+        nonlocal done
+        chunks[index] = chunk
+        done += sizes[index]
+        if progress_callback:
+            return progress_callback(done, n_resamples) is not False
+        return True
+
+    if max_workers == 1 or len(jobs) <= 1:
+        for index, job in enumerate(jobs):
+            if not finish(index, _resample_chunk(data, *job)):
+                cancelled = index + 1 < len(jobs)
+                break
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(data,)
+        ) as executor:
+            futures = {executor.submit(_worker_chunk, *job): index for index, job in enumerate(jobs)}
+            for future in concurrent.futures.as_completed(futures):
+                if not finish(futures[future], future.result()):
+                    cancelled = len(chunks) < len(jobs)
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+    # Chunk order, so the distribution does not depend on scheduling
+    order = sorted(chunks)
+    result = BootstrapResult(confidence=confidence, n_resamples=done, cancelled=cancelled)
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    for name in statistics:
+        result.estimates[name] = float(_STATISTICS[name](data[None, :])[0])
+        if not order:
+            continue
+        distribution = np.concatenate([chunks[index][name] for index in order])
+        low, high = np.percentile(distribution, [tail, 100.0 - tail])
+        result.intervals[name] = (float(low), float(high))
+        result.standard_errors[name] = float(np.std(distribution, ddof=1)) if len(distribution) > 1 else 0.0
+    return result
+
+
+def _mean(resamples: np.ndarray) -> np.ndarray:
+    return resamples.mean(axis=1)
+
+
+def _median(resamples: np.ndarray) -> np.ndarray:
+    return np.median(resamples, axis=1)
+
+
+def _std(resamples: np.ndarray) -> np.ndarray:
+    return resamples.std(axis=1, ddof=1)
+
+
+_STATISTICS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "mean": _mean,
+    "median": _median,
+    "std": _std,
+}
+
+
+def _resample_chunk(data: np.ndarray, n_resamples: int, seed: np.random.SeedSequence,
+                    statistics: Tuple[str, ...], max_bytes: int) -> Dict[str, np.ndarray]:
+    """Evaluate statistics on n_resamples resamples of sorted data."""
+    rng = np.random.default_rng(seed)
+    n = len(data)
+    # Indices (int64) and gathered values (float64) of one resample
+    per_resample = 16 * n
+    results: Dict[str, List[np.ndarray]] = {name: [] for name in statistics}
+
+    if per_resample <= max_bytes:
+        block = max(1, max_bytes // per_resample)
+        for start in range(0, n_resamples, block):
+            resamples = data[rng.integers(0, n, size=(min(block, n_resamples - start), n))]
+            for name in statistics:
+                results[name].append(_STATISTICS[name](resamples))
+            del resamples
+    else:
+        for _ in range(n_resamples):
+            counts = _resample_counts(rng, n, max(1, max_bytes // 16))
+            for name, value in _count_statistics(data, counts, statistics).items():
+                results[name].append(np.array([value]))
+
+    return {name: np.concatenate(parts) for name, parts in results.items()}
+
+
+def _resample_counts(rng: np.random.Generator, n: int, block: int) -> np.ndarray:
+    """How often each of n values is drawn into one resample."""
+    counts = np.zeros(n, dtype=np.int64)
+    for start in range(0, n, block):
+        counts += np.bincount(rng.integers(0, n, size=min(block, n - start)), minlength=n)
+    return counts
+
+
+def _count_statistics(data: np.ndarray, counts: np.ndarray, statistics: Tuple[str, ...]) -> Dict[str, float]:
+    """Statistics of a resample given as counts per sorted value."""
+    n = len(data)
+    values = {}
+    if "mean" in statistics or "std" in statistics:
+        # Shifted by the sample mean for accuracy
+        shift = data.mean()
+        centered = data - shift
+        total = float(np.dot(counts, centered))
+        mean = total / n
+        values["mean"] = mean + shift
+        if "std" in statistics:
+            squares = float(np.dot(counts, centered * centered))
+            values["std"] = float(np.sqrt(max(squares - n * mean * mean, 0.0) / (n - 1)))
+    if "median" in statistics:
+        cumulative = np.cumsum(counts)
+        low = data[np.searchsorted(cumulative, (n - 1) // 2, side="right")]
+        high = data[np.searchsorted(cumulative, n // 2, side="right")]
+        values["median"] = float((low + high) / 2.0)
+    return {name: values[name] for name in statistics}
+
+
+def _init_worker(data: np.ndarray):
+    """Keep the sorted sample in a pool worker."""
+    global _worker_data
+    _worker_data = data
+
+
+def _worker_chunk(n_resamples: int, seed: np.random.SeedSequence, statistics: Tuple[str, ...],
+                  max_bytes: int) -> Dict[str, np.ndarray]:
+    """Evaluate a chunk on the worker's sample."""
+    return _resample_chunk(_worker_data, n_resamples, seed, statistics, max_bytes)
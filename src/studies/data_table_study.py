@@ -6,7 +6,10 @@ and uncertainty tracking.
 """
 
 from __future__ import annotations
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
+from array import array
+import json
+import re
 import pandas as pd
 import numpy as np
 import sympy as sp
@@ -14,9 +17,22 @@ import concurrent.futures
 
 from core.study import Study
 from core.data_object import DataObject
+from core.binary_io import BinaryLayout
 from core.formula_engine import FormulaEngine
-from core.undo_manager import UndoManager, UndoAction, ActionType, UndoContext
+from core.ring_buffer import RingBuffer
+from core.result_cache import ResultCache, fingerprint
+from core.undo_manager import UndoManager, UndoAction, ActionType, UndoContext, ArrayDelta
+from studies.row_view import RowView
 from utils.uncertainty_propagation import UncertaintyPropagator
+from constants import (
+    EXCEL_MAX_COLUMN_WIDTH,
+    EXCEL_COLUMN_WIDTH_PADDING,
+    EXCEL_WIDTH_SAMPLE_ROWS,
+    EXCEL_WRITE_CHUNK_ROWS,
+    UNDO_MAX_BYTES,
+    UNDO_COALESCE_SECONDS,
+    RESULT_CACHE_MAX_BYTES,
+)
 
 
 class ColumnType:
@@ -44,15 +60,18 @@ class DataTableStudy(Study):
         column_metadata: Metadata for each column (type, formula, unit)
         variables: Global variables/constants
         formula_engine: Formula evaluator
+        row_view: Sorted/filtered row order used for display
     """
     
-    def __init__(self, name: str, workspace=None, max_undo_steps: int = 50):
+    def __init__(self, name: str, workspace=None, max_undo_steps: int = 50,
+                 max_undo_bytes: Optional[int] = UNDO_MAX_BYTES):
         """Initialize DataTable study.
         
         Args:
             name: Study name
             workspace: Reference to parent workspace for variables access
             max_undo_steps: Maximum undo history steps
+            max_undo_bytes: Memory budget for column data kept for undo
         """
         super().__init__(name)
         
@@ -70,12 +89,34 @@ class DataTableStudy(Study):
         self.formula_engine = FormulaEngine()
         
         # Undo/Redo manager
-        self.undo_manager = UndoManager(max_history=max_undo_steps)
+        self.undo_manager = UndoManager(
+            max_history=max_undo_steps,
+            max_bytes=max_undo_bytes,
+            coalesce_window=UNDO_COALESCE_SECONDS
+        )
         
         # Dirty flag tracking for lazy evaluation
         self._dirty_columns: set = set()
         self._dependency_graph: Dict[str, set] = {}  # col -> dependents
         self._auto_recalc: bool = True  # Auto-recalc on data changes
+        
+        # Full computed columns by (spec, input fingerprints, constants version);
+        # fingerprints are computed once per column version
+        self.result_cache = ResultCache(RESULT_CACHE_MAX_BYTES)
+        self._fingerprints: Dict[str, Tuple[tuple, Optional[bytes]]] = {}
+        
+        # Followed file for live-growing data (see follow_file)
+        self._follower = None
+        
+        # Ring buffer backing for live acquisition (see enable_ring_buffer)
+        self._ring: Optional[RingBuffer] = None
+        self._ring_frame: Optional[pd.DataFrame] = None
+        
+        # Sort/filter order for display (table rows are never moved)
+        self.row_view = RowView(self)
+        
+        # Column versions at the last publish_changes() (None: never published)
+        self._published_versions: Optional[Dict[str, tuple]] = None
     
     def get_type(self) -> str:
         """Get study type identifier."""
@@ -90,7 +131,8 @@ class DataTableStudy(Study):
         if column_name not in self.table.data.columns:
             return
         
-        # Mark this column
+        # Mark this column (its content changed)
+        self.table.touch(column_name)
         self._dirty_columns.add(column_name)
         
         # Mark all dependents recursively
@@ -172,6 +214,36 @@ class DataTableStudy(Study):
         # RANGE and DATA columns have no dependencies
         return set()
     
+    # ========================================================================
+    # Change Notification
+    # ========================================================================
+    
+    def publish_changes(self) -> Optional[Set[str]]:
+        """Publish columns changed since the last call on Workspace.events.
+        
+        Changes are found by comparing column versions, so edits,
+        recalculated columns, undo/redo and appended rows are all covered
+        without callers tracking what they touched.
+        
+        Returns:
+            Changed column names, or None after a structural change (columns
+            added, removed or renamed), when every consumer is notified
+        """
+        versions = {name: self.table.column_version(name) for name in self.table.data.columns}
+        previous, self._published_versions = self._published_versions, versions
+        
+        if previous is None or previous.keys() != versions.keys():
+            changed = None
+        else:
+            changed = {name for name, version in versions.items() if previous[name] != version}
+            if not changed:
+                return changed
+        
+        events = getattr(self.workspace, "events", None)
+        if events is not None:
+            events.publish(self.name, changed)
+        return changed
+    
     # ========================================================================
     # Column Management
     # ========================================================================
@@ -302,10 +374,10 @@ class DataTableStudy(Study):
                 
                 # Create undo action after column is fully set up
                 # Capture final column data and metadata
-                column_data = self.table.get_column(name).copy()
+                column_data = ArrayDelta(self.table.get_column(name))
                 metadata = self.column_metadata[name].copy()
                 uncert_name = f"{name}_u" if propagate_uncertainty else None
-                uncert_data = self.table.get_column(uncert_name).copy() if uncert_name and uncert_name in self.table.data.columns else None
+                uncert_data = ArrayDelta(self.table.get_column(uncert_name)) if uncert_name and uncert_name in self.table.data.columns else None
                 uncert_metadata = self.column_metadata.get(uncert_name, {}).copy() if uncert_name else None
                 
                 def undo_add():
@@ -317,21 +389,22 @@ class DataTableStudy(Study):
                 
                 def redo_add():
                     with UndoContext(self.undo_manager, enabled=False):
-                        self.table.set_column(name, column_data.copy())
+                        self.table.set_column(name, column_data.to_series())
                         self.column_metadata[name] = metadata.copy()
                         # Restore formula registration if needed
                         if metadata.get("formula"):
                             self.formula_engine.register_formula(name, metadata["formula"])
                         # Restore uncertainty column if needed
                         if uncert_data is not None and uncert_metadata is not None:
-                            self.table.set_column(uncert_name, uncert_data.copy())
+                            self.table.set_column(uncert_name, uncert_data.to_series())
                             self.column_metadata[uncert_name] = uncert_metadata.copy()
                 
                 action = UndoAction(
                     action_type=ActionType.ADD_COLUMN,
                     undo_func=undo_add,
                     redo_func=redo_add,
-                    description=f"Add column '{name}'"
+                    description=f"Add column '{name}'",
+                    deltas=[column_data] + ([uncert_data] if uncert_data is not None else [])
                 )
                 self.undo_manager.push(action)
     
@@ -352,21 +425,23 @@ class DataTableStudy(Study):
         self._auto_recalc = False
         
         try:
-            for col_spec in columns:
-                name = col_spec.get('name')
-                if not name:
-                    continue
-                
-                col_type = col_spec.get('column_type', ColumnType.DATA)
-                formula = col_spec.get('formula')
-                initial_data = col_spec.get('initial_data')
-                unit = col_spec.get('unit', '')
-                
-                # Add column without auto-recalc
-                self.add_column(
-                    name, col_type, formula, initial_data, unit
-                )
-                added.append(name)
+            # Undone as a single step
+            with self.undo_manager.group(f"Add {len(columns)} columns"):
+                for col_spec in columns:
+                    name = col_spec.get('name')
+                    if not name:
+                        continue
+                    
+                    col_type = col_spec.get('column_type', ColumnType.DATA)
+                    formula = col_spec.get('formula')
+                    initial_data = col_spec.get('initial_data')
+                    unit = col_spec.get('unit', '')
+                    
+                    # Add column without auto-recalc
+                    self.add_column(
+                        name, col_type, formula, initial_data, unit
+                    )
+                    added.append(name)
         
         finally:
             # Re-enable auto-recalc
@@ -386,11 +461,11 @@ class DataTableStudy(Study):
         """
         # Save state for undo
         if self.undo_manager.is_enabled():
-            column_data = self.table.get_column(name).copy()
+            column_data = ArrayDelta(self.table.get_column(name))
             metadata = self.column_metadata.get(name, {}).copy()
             
             def undo_remove():
-                self.table.add_column(name, column_data)
+                self.table.add_column(name, column_data.to_series())
                 if metadata:
                     self.column_metadata[name] = metadata
             
@@ -403,7 +478,8 @@ class DataTableStudy(Study):
                 action_type=ActionType.REMOVE_COLUMN,
                 undo_func=undo_remove,
                 redo_func=redo_remove,
-                description=f"Remove column '{name}'"
+                description=f"Remove column '{name}'",
+                deltas=[column_data]
             )
             self.undo_manager.push(action)
         
@@ -445,6 +521,8 @@ class DataTableStudy(Study):
         """
         # Rename in DataFrame
         self.table.data.rename(columns={old_name: new_name}, inplace=True)
+        self.table.touch(old_name)
+        self.table.touch(new_name)
         
         # Update metadata
         if old_name in self.column_metadata:
@@ -571,6 +649,9 @@ class DataTableStudy(Study):
                 self.table.data[name] = padded_data
             else:
                 self.table.data[name] = data
+        
+        # Written into the frame directly: record the change
+        self.table.touch(name)
     
     def _calculate_derivative(self, name: str):
         """Calculate numerical derivative for a column.
@@ -590,12 +671,18 @@ class DataTableStudy(Study):
         y = self.table.get_column(y_col).values
         x = self.table.get_column(x_col).values
         
-        # Calculate derivative using numpy gradient
-        deriv = np.gradient(y, x)
-        
-        # Higher order derivatives
-        for _ in range(1, order):
-            deriv = np.gradient(deriv, x)
+        key = self._result_key(("derivative", order), [y_col, x_col])
+        deriv = self.result_cache.get(key) if key is not None else None
+        if deriv is None:
+            # Calculate derivative using numpy gradient
+            deriv = np.gradient(y, x)
+            
+            # Higher order derivatives
+            for _ in range(1, order):
+                deriv = np.gradient(deriv, x)
+            
+            if key is not None:
+                self.result_cache.put(key, deriv)
         
         # Store result
         self.table.set_column(name, pd.Series(deriv))
@@ -658,11 +745,15 @@ class DataTableStudy(Study):
         
         return pd.Series(deriv_uncert)
     
-    def _recalculate_uncertainty(self, column_name: str):
+    def _recalculate_uncertainty(self, column_name: str, start: int = 0, rows: Optional[np.ndarray] = None):
         """Recalculate uncertainty for a column using propagation.
         
         Args:
             column_name: Name of the parent column (not the uncertainty column)
+            start: First row to recalculate (rows before it are kept). Only
+                valid for element-wise formulas and derivatives.
+            rows: (k, 2) [start, stop) row ranges to recalculate instead
+                (element-wise formulas only)
         """
         # Find the uncertainty column for this parent
         uncertainty_col = None
@@ -683,10 +774,10 @@ class DataTableStudy(Study):
         if col_type == ColumnType.DERIVATIVE:
             try:
                 propagated = self._calculate_derivative_uncertainty(column_name)
-                self.table.set_column(uncertainty_col, propagated)
+                self._write_rows(uncertainty_col, start, propagated.values[start:])
             except Exception:
                 # If propagation fails, fill with NaN
-                self.table.set_column(uncertainty_col, pd.Series([np.nan] * len(self.table.data)))
+                self._write_rows(uncertainty_col, start, np.full(len(self.table.data) - start, np.nan))
             return
         
         # Handle calculated columns
@@ -696,6 +787,16 @@ class DataTableStudy(Study):
         
         dependencies = self.formula_engine.extract_dependencies(formula)
         
+        if rows is None:
+            pick = lambda series: self._tail(series, start)
+            count = len(self.table.data) - start
+            write = lambda result: self._write_rows(uncertainty_col, start, result)
+        else:
+            index = _range_rows(rows)
+            pick = lambda series: series.iloc[index].reset_index(drop=True)
+            count = len(index)
+            write = lambda result: self._assign_rows(uncertainty_col, index, np.asarray(result, dtype=float))
+        
         # Build values and uncertainties for propagation
         values = {}
         uncertainties = {}
@@ -704,7 +805,7 @@ class DataTableStudy(Study):
             if dep not in self.table.columns:
                 continue
             
-            values[dep] = self.table.get_column(dep)
+            values[dep] = pick(self.table.data[dep])
             
             # Check if uncertainty column exists (try multiple patterns)
             uncert_col_name = None
@@ -720,18 +821,18 @@ class DataTableStudy(Study):
                 uncert_col_name = f"{dep}_u"
             
             if uncert_col_name:
-                uncertainties[dep] = self.table.get_column(uncert_col_name)
+                uncertainties[dep] = pick(self.table.data[uncert_col_name])
             else:
                 # Check if this is a derivative column - calculate uncertainty on-the-fly
                 dep_meta = self.column_metadata.get(dep, {})
                 if dep_meta.get("type") == ColumnType.DERIVATIVE:
                     try:
                         deriv_uncert = self._calculate_derivative_uncertainty(dep)
-                        uncertainties[dep] = deriv_uncert
+                        uncertainties[dep] = pick(deriv_uncert)
                     except Exception:
-                        uncertainties[dep] = pd.Series([0.0] * len(self.table.data))
+                        uncertainties[dep] = pd.Series([0.0] * count)
                 else:
-                    uncertainties[dep] = pd.Series([0.0] * len(self.table.data))
+                    uncertainties[dep] = pd.Series([0.0] * count)
         
         # Use extracted uncertainty propagator
         workspace_constants = self.workspace.constants if self.workspace else {}
@@ -745,10 +846,45 @@ class DataTableStudy(Study):
                 workspace_constants=workspace_constants,
                 math_functions=self.formula_engine._math_functions
             )
-            self.table.set_column(uncertainty_col, propagated)
+            write(propagated)
         except Exception:
             # If propagation fails, fill with NaN
-            self.table.set_column(uncertainty_col, pd.Series([np.nan] * len(self.table.data)))
+            write(np.full(count, np.nan))
+    
+    @staticmethod
+    def _tail(series: pd.Series, start: int) -> pd.Series:
+        """Rows from start on, re-indexed from 0 (the series itself if start is 0)."""
+        if start == 0:
+            return series
+        return series.iloc[start:].reset_index(drop=True)
+    
+    def _write_rows(self, name: str, start: int, values):
+        """Write values into a column from row start to the end of the table.
+        
+        With start=0 the column is replaced, otherwise rows before start
+        are kept and the tail is assigned in place. Columns backed by the
+        ring buffer are written through it so both mirrored copies agree.
+        """
+        if self._is_ring_column(name):
+            self._ring.write(name, start, values)
+            self.table.touch(name, (start, start + len(values)))
+            return
+        
+        if start == 0:
+            if not isinstance(values, pd.Series):
+                values = pd.Series(values)
+            self.table.set_column(name, values)
+            return
+        
+        values = np.asarray(values, dtype=float)
+        column = self.table.data[name]
+        if column.dtype == np.float64:
+            self.table.data.iloc[start:, self.table.data.columns.get_loc(name)] = values
+            self.table.touch(name, (start, len(self.table.data)))
+        else:
+            full = pd.to_numeric(column, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+            full[start:] = values
+            self.table.set_column(name, full)
     
     def _recalculate_column(self, name: str, context: Optional[Dict[str, Any]] = None):
         """Recalculate a formula column.
@@ -795,7 +931,7 @@ class DataTableStudy(Study):
         
         # Evaluate formula
         try:
-            result = self.formula_engine.evaluate(formula, context)
+            result = self._evaluate_cached(formula, context)
         except Exception:
             # If evaluation fails, fill with NaN (silent - UI shows NaN)
             result = np.full(len(self.table.data), np.nan)
@@ -814,11 +950,89 @@ class DataTableStudy(Study):
         if uncertainty_col and uncertainty_col in self.table.data.columns:
             self._recalculate_uncertainty(name)
     
-    def _recalculate_dirty_columns(self):
-        """Recalculate only dirty columns, parallelizing independent ones."""
+    def _column_fingerprint(self, name: str) -> Optional[bytes]:
+        """Content fingerprint of a table column, computed once per column version.
+        
+        Args:
+            name: Column name
+            
+        Returns:
+            Fingerprint, or None for missing columns
+        """
+        if name not in self.table.data.columns:
+            return None
+        version = self.table.column_version(name)
+        cached = self._fingerprints.get(name)
+        if cached is None or cached[0] != version:
+            cached = self._fingerprints[name] = (version, fingerprint(self.table.data[name]))
+        return cached[1]
+    
+    def _result_key(self, spec: tuple, columns: List[str]) -> Optional[tuple]:
+        """Result cache key for a full-column computation, or None if not cacheable.
+        
+        Input fingerprints are looked up by column version and computed
+        once per new version, so unchanged columns are never re-hashed and
+        undo/redo back to earlier contents still finds the earlier results.
+        
+        Args:
+            spec: What is computed (formula or column spec)
+            columns: Input column names
+        """
+        if not self.result_cache.enabled:
+            return None
+        fingerprints = tuple(self._column_fingerprint(name) for name in columns)
+        if None in fingerprints:
+            return None
+        constants_version = self.workspace._version if self.workspace else 0
+        return (spec, fingerprints, constants_version)
+    
+    def _evaluate_cached(self, formula: str, context: Dict[str, Any]) -> Any:
+        """Evaluate a formula over whole columns, reusing an identical earlier result.
+        
+        The context must hold the current table columns (row slices are
+        evaluated with formula_engine.evaluate() directly).
+        
+        Args:
+            formula: Formula string
+            context: Evaluation context
+            
+        Returns:
+            Formula result
+        """
+        deps = sorted(self.formula_engine.extract_dependencies(formula))
+        # Workspace constants are covered by the constants version in the key
+        constants = self.workspace.constants if self.workspace else {}
+        columns = [dep for dep in deps if dep not in constants or dep in self.table.data.columns]
+        key = self._result_key(("formula", formula, tuple(deps)), columns)
+        if key is not None:
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        result = self.formula_engine.evaluate(formula, context)
+        if key is not None:
+            self.result_cache.put(key, result)
+        return result
+    
+    def get_profiling_stats(self) -> Dict[str, Any]:
+        """Get statistics of the recalculation machinery.
+        
+        Returns:
+            Dict with "result_cache" (hits, misses, hit_rate, entries, bytes)
+        """
+        return {
+            "result_cache": self.result_cache.stats(),
+        }
+    
+    def _recalculate_dirty_columns(self) -> set:
+        """Recalculate only dirty columns, parallelizing independent ones.
+        
+        Returns:
+            Names of the recalculated columns
+        """
         dirty = self.get_dirty_columns()
         if not dirty:
-            return
+            return set()
         
         # Build dependency levels for parallel execution
         levels = self._get_dependency_levels(dirty)
@@ -858,6 +1072,8 @@ class DataTableStudy(Study):
             else:
                 # Multiple independent columns - evaluate in parallel
                 self._evaluate_columns_parallel(level_cols, context)
+        
+        return dirty
     
     def _evaluate_columns_parallel(self, columns: List[str], base_context: Dict[str, Any]):
         """Evaluate multiple independent columns in parallel."""
@@ -881,13 +1097,13 @@ class DataTableStudy(Study):
         if max_workers > 1 and len(formulas_to_eval) > 1:
             with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
                 futures = [
-                    executor.submit(self.formula_engine.evaluate, formula, ctx)
+                    executor.submit(self._evaluate_cached, formula, ctx)
                     for formula, ctx in formulas_to_eval
                 ]
                 results = [f.result() for f in futures]
         else:
             # Single column or small batch - evaluate sequentially
-            results = [self.formula_engine.evaluate(f, c) for f, c in formulas_to_eval]
+            results = [self._evaluate_cached(f, c) for f, c in formulas_to_eval]
         
         # Store results
         for col_name, result in zip(col_names, results):
@@ -984,7 +1200,13 @@ class DataTableStudy(Study):
         return levels
     
     def recalculate_all(self):
-        """Recalculate all formula and derivative columns in dependency order."""
+        """Recalculate all formula and derivative columns in dependency order.
+        
+        Input fingerprints are recomputed from the column contents, so
+        results stay correct after writes that bypassed column versions.
+        """
+        self._fingerprints.clear()
+        
         # Get all calculated and derivative columns
         calc_columns = [
             name for name, meta in self.column_metadata.items()
@@ -1038,6 +1260,8 @@ class DataTableStudy(Study):
         Args:
             column_name: Changed column name
         """
+        self.table.touch(column_name)
+        
         # Get affected CALCULATED columns from formula engine
         affected_calc = self.formula_engine.get_calculation_order([column_name])
         
@@ -1088,6 +1312,157 @@ class DataTableStudy(Study):
     # Variables are managed at workspace level via workspace.constants
     # Access via self.workspace.constants (type="constant")
     
+    # ========================================================================
+    # Cell Editing
+    # ========================================================================
+    
+    def set_values(
+        self,
+        column: str,
+        rows,
+        values,
+        description: Optional[str] = None,
+        merge_key: Optional[str] = None
+    ) -> Dict[str, Tuple[int, int]]:
+        """Set cells of one column as a single undoable edit.
+        
+        Args:
+            column: Column name
+            rows: Row indices
+            values: Values for those rows, or a scalar to fill them all
+            description: Undo description (default: "Edit N cells")
+            merge_key: See set_block()
+            
+        Returns:
+            Changed [start, stop) row range per column, see set_block()
+        """
+        return self.set_block({column: (rows, values)}, description, merge_key)
+    
+    def set_block(
+        self,
+        changes: Dict[str, Tuple[Any, Any]],
+        description: Optional[str] = None,
+        merge_key: Optional[str] = None
+    ) -> Dict[str, Tuple[int, int]]:
+        """Set cells of several columns as a single undoable edit.
+        
+        Each column is written with one vectorized assignment and computed
+        columns are recalculated once, from the first changed row on. Old
+        and new values are kept as ArrayDeltas, so undo and redo restore
+        the block the same way.
+        
+        Args:
+            changes: Column name -> (row indices, values or scalar)
+            description: Undo description (default: "Edit N cells")
+            merge_key: Coalesce with the previous edit pushed with the same
+                key within the undo manager's coalesce window
+                
+        Returns:
+            Changed [start, stop) row range per column, covering the edited
+            columns and every computed column that was recalculated
+        """
+        n = len(self.table.data)
+        old: Dict[str, ArrayDelta] = {}
+        new: Dict[str, ArrayDelta] = {}
+        for name, (rows, values) in changes.items():
+            rows = np.atleast_1d(np.asarray(rows, dtype=np.int64))
+            if len(rows) == 0:
+                continue
+            old[name] = ArrayDelta(self.table.data[name], rows)
+            new[name] = ArrayDelta.of_rows(rows, _as_cell_values(values, len(rows)), n)
+        if not new:
+            return {}
+        
+        changes = self._apply_deltas(new)
+        self.undo_manager.push(self._edit_action(old, new, description, merge_key))
+        return changes
+    
+    def _apply_deltas(self, deltas: Dict[str, ArrayDelta]) -> Dict[str, Tuple[int, int]]:
+        """Write captured cell values back and recalculate dependents once.
+        
+        Returns:
+            Changed [start, stop) row range per column
+        """
+        n = len(self.table.data)
+        start = n
+        changes: Dict[str, Tuple[int, int]] = {}
+        ranges: Dict[str, np.ndarray] = {}
+        for name, delta in deltas.items():
+            if name not in self.table.data.columns or len(delta.ranges) == 0:
+                continue
+            rows = delta.rows
+            rows = rows[rows < n]
+            self._assign_rows(name, rows, delta.values()[:len(rows)])
+            start = min(start, int(delta.ranges[0, 0]))
+            changes[name] = (int(delta.ranges[0, 0]), min(int(delta.ranges[-1, 1]), n))
+            ranges[name] = np.minimum(delta.ranges, n)
+        
+        for name, span in self._recalculate_changes(start, changed=set(deltas), ranges=ranges).items():
+            if name not in changes and span[0] < span[1]:
+                changes[name] = span
+        return changes
+    
+    def _assign_rows(self, name: str, rows: np.ndarray, values: np.ndarray):
+        """Assign values to rows of a column, widening its dtype if needed."""
+        span = (int(rows.min()), int(rows.max()) + 1) if len(rows) else (0, 0)
+        if self._is_ring_column(name):
+            breaks = np.flatnonzero(np.diff(rows) != 1) + 1
+            for run, run_values in zip(np.split(rows, breaks), np.split(values, breaks)):
+                self._ring.write(name, int(run[0]), run_values)
+            self.table.touch(name, span)
+            return
+        
+        column = self.table.data[name]
+        if pd.api.types.is_string_dtype(column.dtype) and column.dtype != object:
+            # String columns (pandas 3 "str") only hold strings
+            if pd.api.types.infer_dtype(values, skipna=True) not in ("string", "empty"):
+                self.table.data[name] = column.astype(object)
+        elif values.dtype == object and column.dtype != object:
+            self.table.data[name] = column.astype(object)
+        elif values.dtype.kind == "f" and column.dtype.kind in "iub":
+            self.table.data[name] = column.astype(float)
+        self.table.data.iloc[rows, self.table.data.columns.get_loc(name)] = values
+        self.table.touch(name, span)
+    
+    def _edit_action(
+        self,
+        old: Dict[str, ArrayDelta],
+        new: Dict[str, ArrayDelta],
+        description: Optional[str],
+        merge_key: Optional[str]
+    ) -> UndoAction:
+        """Build the undo action of a cell edit."""
+        count = sum(int(np.diff(delta.ranges).sum()) for delta in new.values())
+        
+        def undo_edit():
+            self._apply_deltas(old)
+        
+        def redo_edit():
+            self._apply_deltas(new)
+        
+        def merge_edit(later: UndoAction) -> Optional[UndoAction]:
+            later_old, later_new = later.state_before, later.state_after
+            # Oldest "before" and newest "after" values win
+            merged_old = dict(later_old)
+            merged_old.update({name: delta.merge(later_old[name]) if name in later_old else delta
+                               for name, delta in old.items()})
+            merged_new = dict(new)
+            merged_new.update({name: delta.merge(new[name]) if name in new else delta
+                               for name, delta in later_new.items()})
+            return self._edit_action(merged_old, merged_new, None, merge_key)
+        
+        return UndoAction(
+            action_type=ActionType.MODIFY_DATA,
+            undo_func=undo_edit,
+            redo_func=redo_edit,
+            description=description or f"Edit {count} cell{'s' if count != 1 else ''}",
+            state_before=old,
+            state_after=new,
+            deltas=list(old.values()) + list(new.values()),
+            merge_key=merge_key,
+            merge_func=merge_edit
+        )
+    
     # ========================================================================
     # Row Operations
     # ========================================================================
@@ -1123,6 +1498,422 @@ class DataTableStudy(Study):
         # Recalculate formula columns
         self.recalculate_all()
     
+    def append_rows(self, rows: pd.DataFrame | Dict[str, Any]) -> int:
+        """Append rows of data and update computed columns incrementally.
+        
+        Values are matched to DATA columns by name; other table columns
+        start as NaN and unknown columns are ignored. Unlike add_rows(),
+        only the new rows of element-wise formula columns are evaluated.
+        Derivatives are recomputed over a small window around the old end
+        of the table, propagated uncertainties follow their parent column,
+        and formulas that are not element-wise (aggregates, cumsum, ...) are
+        recomputed in full.
+        
+        Args:
+            rows: New rows (DataFrame or dict of column -> values)
+            
+        Returns:
+            Index of the first row whose values changed (the old row count
+            unless derivatives or non-element-wise formulas touched older rows)
+        """
+        if not isinstance(rows, pd.DataFrame):
+            rows = pd.DataFrame(rows)
+        
+        n_old = len(self.table.data)
+        if rows.empty:
+            return n_old
+        
+        self.table.append(rows)
+        return self._recalculate_from(n_old)
+    
+    def replace_rows(self, rows: pd.DataFrame | Dict[str, Any]):
+        """Replace all rows, keeping columns, formulas and metadata.
+        
+        Args:
+            rows: New rows (DataFrame or dict of column -> values)
+        """
+        if not isinstance(rows, pd.DataFrame):
+            rows = pd.DataFrame(rows)
+        
+        self.table.data = rows.reindex(columns=self.table.columns).reset_index(drop=True)
+        self._recalculate_from(0)
+    
+    def _recalculate_from(self, start: int, changed: Optional[set] = None) -> int:
+        """Recalculate computed columns for rows from start on.
+        
+        Args:
+            start: First new/changed row
+            changed: Input columns that changed (None: all of them)
+            
+        Returns:
+            Index of the first row whose values changed
+        """
+        return min((span[0] for span in self._recalculate_changes(start, changed).values()), default=start)
+    
+    def _recalculate_changes(
+        self,
+        start: int,
+        changed: Optional[set] = None,
+        ranges: Optional[Dict[str, np.ndarray]] = None
+    ) -> Dict[str, Tuple[int, int]]:
+        """Recalculate computed columns for rows from start on.
+        
+        Assumes all rows before start are unchanged since the last
+        recalculation. Tracks for every column the rows that changed so
+        that dependents only recompute what they have to: element-wise
+        formulas (and their uncertainties) are evaluated on exactly the
+        changed rows of their inputs, derivatives from the first changed
+        row on, and other formulas as a whole.
+        
+        Args:
+            start: First new/changed row
+            changed: Input columns that changed (None: all of them); computed
+                columns not depending on these are left alone
+            ranges: Changed [start, stop) row ranges ((k, 2) arrays) of input
+                columns (default: all rows from start on)
+            
+        Returns:
+            Changed [start, stop) row span of every changed input column and
+            of every recalculated column (columns left alone are absent)
+        """
+        n = len(self.table.data)
+        tail = np.array([[start, n]], dtype=np.int64)
+        changed_rows: Dict[str, np.ndarray] = {
+            name: _merge_ranges([(ranges or {}).get(name, tail)])
+            for name, meta in self.column_metadata.items()
+            if meta.get("type", ColumnType.DATA) in (ColumnType.DATA, ColumnType.UNCERTAINTY, ColumnType.RANGE)
+            and (changed is None or name in changed)
+        }
+        # Rows beyond the table: "unchanged" for columns outside `changed`
+        base = tail if changed is None else np.empty((0, 2), dtype=np.int64)
+        full = np.array([[0, n]], dtype=np.int64)
+        
+        computed = set(
+            name for name, meta in self.column_metadata.items()
+            if meta.get("type") in (ColumnType.CALCULATED, ColumnType.DERIVATIVE)
+        )
+        # Uncertainties already propagated by a full _recalculate_column()
+        propagated = set()
+        for level in self._get_universal_dependency_levels(computed):
+            for col_name in level:
+                meta = self.column_metadata[col_name]
+                deps = self._get_all_dependencies(col_name) | {meta.get("with_respect_to")}
+                rows = _merge_ranges([base] + [changed_rows[d] for d in deps if d in changed_rows])
+                if len(rows) == 0 and changed is not None:
+                    continue
+                first = int(rows[0, 0]) if len(rows) else n
+                
+                if meta.get("type") == ColumnType.DERIVATIVE:
+                    if self._ring is not None:
+                        # Eviction moves the window edge: recompute the whole window
+                        first = 0
+                    first = self._calculate_derivative_rows(col_name, first)
+                    rows = np.array([[first, n]], dtype=np.int64)
+                elif self.formula_engine.is_elementwise(meta.get("formula", "")):
+                    self._recalculate_column_rows(col_name, rows)
+                else:
+                    self._recalculate_column(col_name)
+                    propagated.add(col_name)
+                    rows = full
+                changed_rows[col_name] = rows
+                self.mark_clean(col_name)
+        
+        # Propagated uncertainties follow their parent column (and change
+        # with any input uncertainty)
+        uncertainty_rows = _merge_ranges([base] + [
+            rows for name, rows in changed_rows.items()
+            if name not in computed and self.get_column_type(name) == ColumnType.UNCERTAINTY
+        ])
+        for uncert_col, uncert_meta in self.column_metadata.items():
+            ref_col = uncert_meta.get("uncertainty_reference")
+            if uncert_meta.get("type") != ColumnType.UNCERTAINTY or ref_col not in computed:
+                continue
+            ref_meta = self.column_metadata[ref_col]
+            rows = _merge_ranges([changed_rows.get(ref_col, base), uncertainty_rows])
+            if len(rows) == 0 and changed is not None:
+                continue
+            
+            if ref_col in propagated:
+                rows = full
+            elif ref_meta.get("type") == ColumnType.DERIVATIVE:
+                first = int(rows[0, 0]) if len(rows) else n
+                self._recalculate_uncertainty(ref_col, start=first)
+                rows = np.array([[first, n]], dtype=np.int64)
+            elif self.formula_engine.is_elementwise(ref_meta.get("formula", "")):
+                self._recalculate_uncertainty(ref_col, rows=rows)
+            else:
+                self._recalculate_uncertainty(ref_col)
+                rows = full
+            changed_rows[uncert_col] = rows
+        
+        return {name: (int(rows[0, 0]), int(rows[-1, 1])) for name, rows in changed_rows.items() if len(rows)}
+    
+    def _recalculate_column_rows(self, name: str, ranges: np.ndarray):
+        """Evaluate an element-wise formula column on rows of the table.
+        
+        Args:
+            name: Calculated column name
+            ranges: (k, 2) sorted, disjoint [start, stop) row ranges to evaluate
+        """
+        n = len(self.table.data)
+        ranges = np.minimum(ranges, n)
+        ranges = ranges[ranges[:, 1] > ranges[:, 0]]
+        if len(ranges) == 0:
+            return
+        
+        # A single range reaching the end is written as a tail, anything
+        # else gathered and scattered by row index
+        start = int(ranges[0, 0])
+        rows = slice(start, None) if len(ranges) == 1 and ranges[0, 1] == n else _range_rows(ranges)
+        count = n - start if isinstance(rows, slice) else len(rows)
+        
+        formula = self.get_column_formula(name)
+        context = {}
+        for dep in self.formula_engine.extract_dependencies(formula):
+            if dep in self.table.data.columns:
+                arr = self.table.data[dep].values[rows]
+                context[dep] = np.where(pd.isna(arr), np.nan, arr).astype(float)
+        
+        workspace_constants = self.workspace.constants if self.workspace else None
+        workspace_id = id(self.workspace) if self.workspace else None
+        workspace_version = self.workspace._version if self.workspace else 0
+        context = self.formula_engine.build_context_with_workspace(
+            context, workspace_constants, workspace_id, workspace_version
+        )
+        
+        try:
+            result = self.formula_engine.evaluate(formula, context)
+            if np.ndim(result) == 0:
+                result = np.full(count, result, dtype=float)
+        except Exception:
+            result = np.full(count, np.nan)
+        
+        if isinstance(rows, slice):
+            self._write_rows(name, start, result)
+        else:
+            self._assign_rows(name, rows, np.asarray(result, dtype=float))
+    
+    def _calculate_derivative_rows(self, name: str, start: int) -> int:
+        """Recompute a derivative column for rows affected by changes from start on.
+        
+        np.gradient uses central differences, so a changed row also changes
+        the derivative of its neighbours; each additional order widens the
+        affected range by one row. The gradient is evaluated over a window
+        wide enough that edge effects stay outside the written rows.
+        
+        Args:
+            name: Derivative column name
+            start: First row whose inputs changed
+            
+        Returns:
+            First row written
+        """
+        meta = self.column_metadata[name]
+        y_col = meta.get("derivative_of")
+        x_col = meta.get("with_respect_to")
+        order = meta.get("order", 1)
+        n = len(self.table.data)
+        
+        if n < 2:
+            # np.gradient needs at least two points
+            self._write_rows(name, 0, np.full(n, np.nan))
+            return 0
+        
+        first = max(0, start - order)
+        lo = max(0, start - 2 * order)
+        if first == 0 or not y_col or not x_col or n - lo < order + 2:
+            self._calculate_derivative(name)
+            return 0
+        
+        y = pd.to_numeric(self.table.data[y_col].iloc[lo:], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+        x = pd.to_numeric(self.table.data[x_col].iloc[lo:], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+        
+        deriv = np.gradient(y, x)
+        for _ in range(1, order):
+            deriv = np.gradient(deriv, x)
+        
+        self._write_rows(name, first, deriv[first - lo:])
+        return first
+
+    # ========================================================================
+    # Ring Buffer Mode
+    # ========================================================================
+    
+    def enable_ring_buffer(self, capacity: int):
+        """Back the table by a ring buffer keeping only the last rows.
+        
+        The table then holds at most ``capacity`` rows as float64 views of
+        the buffer; append() adds rows and evicts the oldest ones without
+        copying. Existing rows beyond capacity are dropped (oldest first).
+        Cells must not be edited in place while the ring buffer is enabled.
+        
+        Args:
+            capacity: Maximum number of rows kept
+        """
+        self._ring = RingBuffer(self.table.columns, capacity)
+        self._seed_ring()
+    
+    def disable_ring_buffer(self):
+        """Detach the table from the ring buffer, keeping the current window."""
+        if self._ring is None:
+            return
+        self.table.data = self.table.data.copy()
+        self._ring = None
+        self._ring_frame = None
+    
+    @property
+    def ring_buffer(self) -> Optional[RingBuffer]:
+        """RingBuffer backing the table (None if not enabled)."""
+        return self._ring
+    
+    def append(self, block: pd.DataFrame | Dict[str, Any] | np.ndarray) -> int:
+        """Append a block of samples, e.g. from an acquisition loop.
+        
+        In ring buffer mode the rows are written into the buffer, evicting
+        the oldest rows beyond capacity. Element-wise formula columns are
+        evaluated for the new rows only; derivatives and formulas that are
+        not element-wise are recomputed over the active window. Without a
+        ring buffer this is append_rows().
+        
+        Args:
+            block: DataFrame or dict of column -> values (matched by name,
+                other columns start as NaN), or a 2D array with one column
+                per DATA column in table order
+        
+        Returns:
+            Index of the first row whose values changed (0 if rows were
+            evicted, as all rows then moved up)
+        """
+        if isinstance(block, np.ndarray):
+            data_columns = [
+                name for name in self.table.columns
+                if self.get_column_type(name) == ColumnType.DATA
+            ]
+            block = np.atleast_2d(block)
+            if block.shape[1] != len(data_columns):
+                raise ValueError(
+                    f"Block has {block.shape[1]} columns, expected {len(data_columns)} "
+                    f"({', '.join(data_columns)})"
+                )
+            block = {name: block[:, i] for i, name in enumerate(data_columns)}
+        
+        if self._ring is None:
+            return self.append_rows(block)
+        
+        if self.table.data is not self._ring_frame or self.table.columns != self._ring.columns:
+            # Columns or rows were changed through another API
+            self._ring = RingBuffer(self.table.columns, self._ring.capacity)
+            self._seed_ring()
+        
+        if isinstance(block, pd.DataFrame):
+            block = {name: block[name].to_numpy(dtype=float, na_value=np.nan)
+                     for name in block.columns if name in self._ring}
+        else:
+            block = {name: np.asarray(values, dtype=float)
+                     for name, values in block.items() if name in self._ring}
+        
+        evicted = self._ring.append(block)
+        self.table.data = self._ring_frame = self._ring.to_frame()
+        rows = len(next(iter(block.values()))) if block else 0
+        if rows == 0:
+            return len(self.table.data)
+        
+        first = self._recalculate_from(max(0, len(self.table.data) - rows))
+        self._sync_ring_columns()
+        return 0 if evicted else first
+    
+    def _is_ring_column(self, name: str) -> bool:
+        """Check whether a table column is still a view of the ring buffer."""
+        return (
+            self._ring is not None
+            and name in self._ring
+            and np.may_share_memory(self.table.data[name].values, self._ring._storage)
+        )
+    
+    def _seed_ring(self):
+        """Load the current table rows into the (empty) ring buffer."""
+        data = self.table.data.iloc[-self._ring.capacity:]
+        self._ring.append({
+            name: pd.to_numeric(data[name], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+            for name in self._ring.columns
+        })
+        self.table.data = self._ring_frame = self._ring.to_frame()
+    
+    def _sync_ring_columns(self):
+        """Write columns that were replaced during recalculation back into the ring."""
+        detached = [name for name in self._ring.columns if not self._is_ring_column(name)]
+        for name in detached:
+            values = pd.to_numeric(self.table.data[name], errors='coerce')
+            self._ring.write(name, 0, values.to_numpy(dtype=float, na_value=np.nan))
+        if detached:
+            self.table.data = self._ring_frame = self._ring.to_frame()
+    
+    # ========================================================================
+    # Follow Mode
+    # ========================================================================
+    
+    def follow_file(self, filepath: str, **csv_settings) -> int:
+        """Start following a CSV file that is being appended to.
+        
+        If the table has no columns yet, the current file content is loaded
+        as the table. Otherwise the table is assumed to hold the first rows
+        of the file (e.g. after import_from_csv) and only rows beyond the
+        current row count are appended; columns and formulas are kept.
+        
+        Args:
+            filepath: Path to CSV file
+            **csv_settings: CSV settings (see import_from_csv)
+            
+        Returns:
+            Number of rows appended or loaded
+        """
+        from studies.file_follower import FileFollower
+        
+        follower = FileFollower(filepath, **csv_settings)
+        rows = follower.read_all()
+        self._follower = follower
+        
+        if not self.table.columns:
+            self._load_table(DataObject(name="main_table", data=rows))
+            return len(rows)
+        
+        n_old = len(self.table.data)
+        if len(rows) > n_old:
+            self.append_rows(rows.iloc[n_old:])
+        return max(0, len(rows) - n_old)
+    
+    def poll_follow(self) -> Optional[int]:
+        """Append rows written to the followed file since the last poll.
+        
+        If the file was truncated or replaced, the table rows are reloaded
+        from its new content.
+        
+        Returns:
+            Index of the first row whose values changed, or None if nothing
+            changed (or no file is followed)
+        """
+        if self._follower is None:
+            return None
+        
+        rows = self._follower.poll()
+        if rows is None:
+            return None
+        if self._follower.truncated:
+            self.replace_rows(rows)
+            return 0
+        if rows.empty:
+            return None
+        return self.append_rows(rows)
+    
+    def stop_follow(self):
+        """Stop following the file."""
+        self._follower = None
+    
+    @property
+    def follower(self):
+        """FileFollower of the followed file (None if not following)."""
+        return self._follower
+    
     # ========================================================================
     # Serialization
     # ========================================================================
@@ -1205,57 +1996,72 @@ class DataTableStudy(Study):
                 data_dict=table_data["data"],
                 **table_data.get("metadata", {})
             )
+            study.add_data_object(study.table)
         
+        study._rebuild_computed_columns()
+        
+        return study
+    
+    def _rebuild_computed_columns(self):
+        """Recreate computed columns from column metadata.
+        
+        Used after loading a table whose metadata was restored from a file:
+        registers formulas and dependencies, adds missing computed columns,
+        then recalculates everything in dependency order.
+        """
         # Get number of rows from existing data
-        num_rows = len(study.table.data) if not study.table.data.empty else 0
+        num_rows = len(self.table.data) if not self.table.data.empty else 0
         
         # Recreate computed columns in correct order
         # 1. Register formulas for calculated columns
-        for col_name, meta in study.column_metadata.items():
+        for col_name, meta in self.column_metadata.items():
             if meta.get("type") == ColumnType.CALCULATED and meta.get("formula"):
-                study.formula_engine.register_formula(col_name, meta["formula"])
+                self.formula_engine.register_formula(col_name, meta["formula"])
         
         # 2. Add computed columns (initially empty/NaN)
         computed_types = [ColumnType.CALCULATED, ColumnType.DERIVATIVE, ColumnType.RANGE, ColumnType.UNCERTAINTY]
-        for col_name, meta in study.column_metadata.items():
+        for col_name, meta in self.column_metadata.items():
             col_type = meta.get("type")
-            if col_type in computed_types and col_name not in study.table.columns:
+            if col_type in computed_types and col_name not in self.table.columns:
                 # Add column with NaN values initially
-                study.table.add_column(col_name, [np.nan] * num_rows if num_rows > 0 else [])
+                self.table.add_column(col_name, [np.nan] * num_rows if num_rows > 0 else [])
+        
+        # Dependency graph needs all columns present
+        for col_name, meta in self.column_metadata.items():
+            if meta.get("type") == ColumnType.CALCULATED and meta.get("formula"):
+                self._update_dependencies(col_name, meta["formula"])
         
         # 3. Recalculate RANGE columns first (they don't depend on other columns)
-        for col_name, meta in study.column_metadata.items():
+        for col_name, meta in self.column_metadata.items():
             if meta.get("type") == ColumnType.RANGE:
-                study._generate_range(col_name)
+                self._generate_range(col_name)
         
         # 4. Mark all computed columns as dirty and calculate in dependency order
         computed_cols = set(
-            col for col, meta in study.column_metadata.items()
+            col for col, meta in self.column_metadata.items()
             if meta.get("type") in [ColumnType.CALCULATED, ColumnType.DERIVATIVE]
         )
         for col in computed_cols:
-            study.mark_dirty(col)
+            self.mark_dirty(col)
         
         # 5. Calculate in proper dependency order (SINGLE PASS using universal dependency tracking)
-        levels = study._get_universal_dependency_levels(computed_cols)
+        levels = self._get_universal_dependency_levels(computed_cols)
         for level in levels:
             for col_name in level:
-                meta = study.column_metadata[col_name]
+                meta = self.column_metadata[col_name]
                 col_type = meta.get("type")
                 
                 if col_type == ColumnType.CALCULATED:
-                    study._recalculate_column(col_name)
+                    self._recalculate_column(col_name)
                 elif col_type == ColumnType.DERIVATIVE:
-                    study._calculate_derivative(col_name)
+                    self._calculate_derivative(col_name)
         
         # 6. Recalculate uncertainty columns last (depend on parent columns)
-        for col_name, meta in study.column_metadata.items():
+        for col_name, meta in self.column_metadata.items():
             if meta.get("type") == ColumnType.UNCERTAINTY:
                 parent_col = meta.get("uncertainty_reference")
-                if parent_col and parent_col in study.column_metadata:
-                    study._recalculate_uncertainty(parent_col)
-        
-        return study
+                if parent_col and parent_col in self.column_metadata:
+                    self._recalculate_uncertainty(parent_col)
     
     def export_to_csv(self, filepath: str, include_metadata: bool = True) -> None:
         """Export table to CSV format.
@@ -1332,32 +2138,17 @@ class DataTableStudy(Study):
             >>> study.import_from_csv("euro.csv", delimiter=";", decimal=",")
             >>> study.import_from_csv("simple.csv", has_metadata=False, header=None)
         """
-        # Read CSV with advanced parameters
-        df = pd.read_csv(
-            filepath, 
+        df = read_csv_frame(
+            filepath,
+            has_metadata=has_metadata,
             delimiter=delimiter,
             encoding=encoding,
             decimal=decimal,
-            skiprows=skip_rows if skip_rows > 0 else None,
-            header=header,
-            comment='#' if has_metadata else None
+            skip_rows=skip_rows,
+            header=header
         )
         
-        # If no header, generate column names
-        if header is None:
-            df.columns = [f"Column_{i}" for i in range(len(df.columns))]
-        
-        # Clear existing table
-        self.table = DataObject.from_dataframe("table", df)
-        self.column_metadata.clear()
-        self.formula_engine = FormulaEngine()
-        
-        # Create basic metadata for all columns
-        for col_name in df.columns:
-            self.column_metadata[col_name] = {
-                "type": ColumnType.DATA,
-                "unit": None
-            }
+        self._load_table(DataObject.from_dataframe("main_table", df))
         
         # TODO: Parse metadata from comments if has_metadata=True
         # For now, all columns imported as DATA type
@@ -1365,6 +2156,11 @@ class DataTableStudy(Study):
     def export_to_excel(self, filepath: str, sheet_name: str = "Data") -> None:
         """Export table to Excel format.
         
+        Uses openpyxl's write-only mode: rows are streamed to the file in
+        chunks instead of building every cell in memory first. Each column's
+        full metadata is stored as JSON in the metadata table so that
+        import_from_excel() can restore column types and formulas.
+        
         Args:
             filepath: Path to save Excel file (.xlsx)
             sheet_name: Name of the sheet to create
@@ -1378,7 +2174,9 @@ class DataTableStudy(Study):
         """
         try:
             import openpyxl
+            from openpyxl.cell import WriteOnlyCell
             from openpyxl.styles import Font, PatternFill
+            from openpyxl.utils import get_column_letter
         except ImportError:
             raise ImportError(
                 "openpyxl is required for Excel export. "
@@ -1387,80 +2185,91 @@ class DataTableStudy(Study):
         
         df = self.table.data
         
-        # Create workbook and sheet
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = sheet_name
-        
-        # Write metadata section
-        ws['A1'] = 'DataManip Export'
-        ws['A1'].font = Font(bold=True, size=14)
-        ws['A2'] = f'Study: {self.name}'
-        ws['A3'] = 'Version: 0.2.0'
-        
-        # Write column metadata
-        row = 5
-        ws[f'A{row}'] = 'Column Metadata:'
-        ws[f'A{row}'].font = Font(bold=True)
-        row += 1
-        
-        ws[f'A{row}'] = 'Column'
-        ws[f'B{row}'] = 'Type'
-        ws[f'C{row}'] = 'Unit'
-        ws[f'D{row}'] = 'Formula/Info'
-        for cell in [ws[f'A{row}'], ws[f'B{row}'], ws[f'C{row}'], ws[f'D{row}']]:
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color='DDDDDD', fill_type='solid')
-        row += 1
-        
+        # Build column metadata rows
+        metadata_rows = []
         for col_name in self.table.columns:
             meta = self.column_metadata.get(col_name, {})
-            ws[f'A{row}'] = col_name
-            ws[f'B{row}'] = meta.get('type', ColumnType.DATA)
-            ws[f'C{row}'] = meta.get('unit', '')
             
             # Formula or other info
+            info = ''
             if meta.get('formula'):
-                ws[f'D{row}'] = meta['formula']
+                info = meta['formula']
             elif meta.get('type') == ColumnType.DERIVATIVE:
-                ws[f'D{row}'] = f"d({meta.get('derivative_of', '')})/d({meta.get('with_respect_to', '')})"
+                info = f"d({meta.get('derivative_of', '')})/d({meta.get('with_respect_to', '')})"
             elif meta.get('type') == ColumnType.RANGE:
-                ws[f'D{row}'] = meta.get('range_type', '')
-            row += 1
+                info = meta.get('range_type', '')
+            
+            metadata_rows.append([
+                col_name,
+                meta.get('type', ColumnType.DATA),
+                meta.get('unit') or '',
+                info,
+                json.dumps(meta, default=str)
+            ])
+        
+        # Column widths must be set before any row is written in write-only mode,
+        # so estimate them from headers, metadata and a sample of the data
+        widths: Dict[int, int] = {1: len('DataManip Export')}
+        sample = df.head(EXCEL_WIDTH_SAMPLE_ROWS)
+        sized_rows = metadata_rows + [[str(c) for c in df.columns]]
+        sized_rows += sample.astype(str).values.tolist()
+        for values in sized_rows:
+            for col_idx, value in enumerate(values, start=1):
+                widths[col_idx] = max(widths.get(col_idx, 0), len(str(value)))
+        
+        # Create workbook and sheet
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet(title=sheet_name)
+        for col_idx, width in widths.items():
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(
+                width + EXCEL_COLUMN_WIDTH_PADDING, EXCEL_MAX_COLUMN_WIDTH
+            )
+        
+        def styled(value, font=None, fill=None):
+            cell = WriteOnlyCell(ws, value=value)
+            if font:
+                cell.font = font
+            if fill:
+                cell.fill = fill
+            return cell
+        
+        bold = Font(bold=True)
+        
+        # Write metadata section
+        ws.append([styled('DataManip Export', Font(bold=True, size=14))])
+        ws.append([f'Study: {self.name}'])
+        ws.append(['Version: 0.2.0'])
+        ws.append([])
+        
+        # Write column metadata
+        ws.append([styled('Column Metadata:', bold)])
+        header_fill = PatternFill(start_color='DDDDDD', fill_type='solid')
+        ws.append([
+            styled(label, bold, header_fill)
+            for label in ['Column', 'Type', 'Unit', 'Formula/Info', 'Metadata']
+        ])
+        for values in metadata_rows:
+            ws.append(values)
         
         # Add spacing
-        row += 2
+        ws.append([])
+        ws.append([])
         
         # Write data section
-        ws[f'A{row}'] = 'Data:'
-        ws[f'A{row}'].font = Font(bold=True)
-        row += 1
-        
-        # Write column headers
-        for col_idx, col_name in enumerate(df.columns, start=1):
-            cell = ws.cell(row, col_idx, col_name)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color='EEEEEE', fill_type='solid')
-        row += 1
-        
-        # Write data rows
-        for _, data_row in df.iterrows():
-            for col_idx, value in enumerate(data_row, start=1):
-                ws.cell(row, col_idx, value)
-            row += 1
-        
-        # Auto-adjust column widths
-        for col in ws.columns:
-            max_length = 0
-            col_letter = col[0].column_letter
-            for cell in col:
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except (AttributeError, TypeError):
-                    # Skip cells that can't be converted to string
-                    pass
-            ws.column_dimensions[col_letter].width = min(max_length + EXCEL_COLUMN_WIDTH_PADDING, EXCEL_MAX_COLUMN_WIDTH)
+        ws.append([styled('Data:', bold)])
+        data_fill = PatternFill(start_color='EEEEEE', fill_type='solid')
+        ws.append([styled(col_name, bold, data_fill) for col_name in df.columns])
+        
+        # Stream data rows in chunks; missing values become empty cells
+        for start in range(0, len(df), EXCEL_WRITE_CHUNK_ROWS):
+            chunk = df.iloc[start:start + EXCEL_WRITE_CHUNK_ROWS]
+            columns = []
+            for col_name in chunk.columns:
+                values = chunk[col_name].to_numpy(dtype=object)
+                values[pd.isna(chunk[col_name]).to_numpy()] = None
+                columns.append(values.tolist())
+            for values in zip(*columns):
+                ws.append(values)
         
         # Save workbook
         wb.save(filepath)
@@ -1468,33 +2277,302 @@ class DataTableStudy(Study):
     def import_from_excel(self, filepath: str, sheet_name: str = "Data") -> None:
         """Import table from Excel format.
         
+        The sheet is scanned once in openpyxl's read-only mode. For files
+        written by export_to_excel() the metadata table restores column
+        types, units and formulas, and the block after the "Data:" marker
+        is read as the table. Any other sheet is read with its first
+        non-empty row as header. Numeric columns are collected directly
+        into float buffers.
+        
         Args:
             filepath: Path to Excel file (.xlsx)
-            sheet_name: Name of the sheet to read
-            
-        Note:
-            Imports the data section only. Metadata needs manual recreation.
+            sheet_name: Name of the sheet to read (falls back to the active
+                sheet if missing)
             
         Example:
             >>> study.import_from_excel("data.xlsx")
             >>> study.import_from_excel("data.xlsx", sheet_name="Experiment1")
         """
-        # Use pandas to read Excel
-        df = pd.read_excel(filepath, sheet_name=sheet_name, skiprows=None)
+        try:
+            import openpyxl
+        except ImportError:
+            raise ImportError(
+                "openpyxl is required for Excel import. "
+                "Install with: pip install openpyxl"
+            )
+        
+        wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+        try:
+            ws = wb[sheet_name] if sheet_name in wb.sheetnames else wb.active
+            names, buffers, restored_metadata = _scan_excel_sheet(ws.iter_rows(values_only=True))
+        finally:
+            wb.close()
+        
+        columns = {name: buffer.to_array() for name, buffer in zip(names, buffers)}
+        self._load_table(DataObject(name="main_table", data=pd.DataFrame(columns, copy=False)))
+        
+        # Restore column types and formulas from the metadata table
+        for col_name, meta in restored_metadata.items():
+            if col_name in self.column_metadata:
+                self.column_metadata[col_name] = meta
+        self._rebuild_computed_columns()
+    
+    def import_from_binary(self, filepath: str, layout: BinaryLayout) -> None:
+        """Import table from a fixed-record binary file.
+        
+        The file is memory-mapped rather than read: unscaled channels stay
+        views into the file and are only copied when edited. Channel units
+        from the layout are kept as column units.
+        
+        Args:
+            filepath: Path to binary file
+            layout: Record layout (channel dtypes, header size, scaling)
+            
+        Raises:
+            FileImportError: If the file does not match the layout
+            
+        Example:
+            >>> layout = BinaryLayout([BinaryChannel("t", "float64", unit="s"),
+            ...                        BinaryChannel("v", "int16", scale=1e-3, unit="V")],
+            ...                       header_bytes=512)
+            >>> study.import_from_binary("run42.bin", layout)
+        """
+        self._load_table(DataObject.from_binary("main_table", filepath, layout))
+        
+        for channel in layout.channels:
+            self.column_metadata[channel.name]["unit"] = channel.unit
+    
+    def _load_table(self, table: DataObject) -> None:
+        """Replace the table with imported data.
         
-        # Find where data section starts (look for "Data:" marker)
-        # For now, simple approach - assume data starts after empty rows
-        # TODO: Smarter parsing to find data section
+        All columns become DATA columns; formulas, dependencies and dirty
+        state of the previous table are discarded.
         
-        # Clear existing table
-        self.table = DataObject.from_dataframe("table", df)
+        Args:
+            table: New main table
+        """
+        self.table = table
+        self.add_data_object(table)
         self.column_metadata.clear()
         self.formula_engine = FormulaEngine()
+        self._dirty_columns.clear()
+        self._dependency_graph.clear()
+        self._fingerprints.clear()
         
-        # Create basic metadata
-        for col_name in df.columns:
+        # Create basic metadata for all columns
+        for col_name in table.columns:
             self.column_metadata[col_name] = {
                 "type": ColumnType.DATA,
                 "unit": None
             }
 
+
+
+def _as_cell_values(values: Any, count: int) -> np.ndarray:
+    """Convert cell values (or a fill scalar) to an array of count values.
+    
+    Numbers and missing values (None/NaN) become float64; anything else
+    is kept as objects.
+    """
+    if np.ndim(values) == 0:
+        values = [values] * count
+    try:
+        return np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        return np.asarray(values, dtype=object)
+
+
+def _merge_ranges(parts: List[np.ndarray]) -> np.ndarray:
+    """Union of [start, stop) row ranges as sorted, disjoint (k, 2) ranges."""
+    ranges = np.concatenate([np.reshape(part, (-1, 2)) for part in parts] + [np.empty((0, 2))]).astype(np.int64)
+    ranges = ranges[ranges[:, 1] > ranges[:, 0]]
+    if len(ranges) <= 1:
+        return ranges
+    
+    ranges = ranges[np.argsort(ranges[:, 0], kind="stable")]
+    stops = np.maximum.accumulate(ranges[:, 1])
+    # A range overlapping or touching everything before it extends the run
+    first = np.flatnonzero(np.r_[True, ranges[1:, 0] > stops[:-1]])
+    last = np.r_[first[1:] - 1, len(ranges) - 1]
+    return np.column_stack([ranges[first, 0], stops[last]])
+
+
+def _range_rows(ranges: np.ndarray) -> np.ndarray:
+    """Row indices covered by (k, 2) [start, stop) ranges."""
+    if len(ranges) == 0:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate([np.arange(start, stop) for start, stop in ranges])
+
+
+def read_csv_frame(
+    filepath: str,
+    has_metadata: bool = True,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+    decimal: str = ".",
+    skip_rows: int = 0,
+    header: Optional[int] = 0
+) -> pd.DataFrame:
+    """Read a CSV file with the import settings of CSVImportDialog.
+    
+    Module-level so it can run in worker processes for batch imports.
+    Arguments match DataTableStudy.import_from_csv().
+    
+    Returns:
+        Parsed DataFrame (generated column names if there is no header)
+    """
+    # Read CSV with advanced parameters
+    df = pd.read_csv(
+        filepath, 
+        delimiter=delimiter,
+        encoding=encoding,
+        decimal=decimal,
+        skiprows=skip_rows if skip_rows > 0 else None,
+        header=header,
+        comment='#' if has_metadata else None
+    )
+    
+    # If no header, generate column names
+    if header is None:
+        df.columns = [f"Column_{i}" for i in range(len(df.columns))]
+    
+    return df
+
+
+class _ColumnBuffer:
+    """Growable column buffer used while scanning a spreadsheet.
+    
+    Values are stored in a compact float64 array as long as they are
+    numeric; the first non-numeric value switches the column to objects.
+    """
+    
+    def __init__(self):
+        self.values = array('d')
+        self.numeric = True
+        self.integral = True
+        self.has_missing = False
+    
+    def append(self, value: Any):
+        """Append one cell value (None for an empty cell)."""
+        if not self.numeric:
+            self.values.append(value)
+        elif value is None:
+            self.values.append(np.nan)
+            self.has_missing = True
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            self.values.append(value)
+            if self.integral and not isinstance(value, int):
+                self.integral = False
+        else:
+            self.values = [None if np.isnan(v) else v for v in self.values]
+            self.values.append(value)
+            self.numeric = False
+    
+    def to_array(self) -> np.ndarray:
+        """Get the collected values as a numpy array (no copy for floats)."""
+        if not self.numeric:
+            return np.array(self.values, dtype=object)
+        arr = np.frombuffer(self.values, dtype=np.float64) if self.values else np.empty(0)
+        if self.integral and not self.has_missing and len(arr) > 0:
+            return arr.astype(np.int64)
+        return arr
+
+
+def _parse_excel_column_metadata(row: tuple, json_index: Optional[int]) -> Dict[str, Any]:
+    """Parse one row of the exported column metadata table.
+    
+    Prefers the full JSON metadata; older exports only carry type, unit
+    and a formula/info column, from which calculated and derivative
+    columns can still be restored. Anything else is imported as DATA.
+    """
+    if json_index is not None and json_index < len(row) and row[json_index]:
+        try:
+            meta = json.loads(row[json_index])
+            if isinstance(meta, dict):
+                return meta
+        except ValueError:
+            pass
+    
+    cells = list(row) + [None] * (4 - len(row))
+    col_type, unit, info = cells[1], cells[2] or None, cells[3]
+    meta: Dict[str, Any] = {"type": ColumnType.DATA, "unit": unit}
+    
+    if col_type == ColumnType.CALCULATED and info:
+        meta.update(type=ColumnType.CALCULATED, formula=str(info))
+    elif col_type == ColumnType.DERIVATIVE and info:
+        match = re.fullmatch(r"d\((.+)\)/d\((.+)\)", str(info))
+        if match:
+            meta.update(
+                type=ColumnType.DERIVATIVE,
+                derivative_of=match.group(1),
+                with_respect_to=match.group(2)
+            )
+    return meta
+
+
+def _scan_excel_sheet(rows) -> Tuple[List[str], List[_ColumnBuffer], Dict[str, Dict[str, Any]]]:
+    """Scan spreadsheet rows once, collecting column metadata and data.
+    
+    Args:
+        rows: Iterable of row value tuples (openpyxl ``values_only`` rows)
+        
+    Returns:
+        Tuple of (column names, column buffers, column metadata by name)
+    """
+    names: List[str] = []
+    buffers: List[_ColumnBuffer] = []
+    metadata: Dict[str, Dict[str, Any]] = {}
+    json_index = None
+    pending_empty = 0
+    state = "start"
+    
+    for row in rows:
+        empty = all(value is None or value == "" for value in row)
+        first = row[0] if row else None
+        
+        if state == "start":
+            if empty:
+                continue
+            if first == "DataManip Export":
+                state = "sections"
+                continue
+            # Not a DataManip export: first non-empty row is the header
+            state = "header"
+        
+        if state == "sections":
+            if first == "Column Metadata:":
+                state = "metadata_header"
+            elif first == "Data:":
+                state = "header"
+        elif state == "metadata_header":
+            json_index = row.index("Metadata") if "Metadata" in row else None
+            state = "metadata"
+        elif state == "metadata":
+            if empty:
+                state = "sections"
+            elif first is not None:
+                metadata[str(first)] = _parse_excel_column_metadata(row, json_index)
+        elif state == "header":
+            if empty:
+                continue
+            header = list(row)
+            while header and header[-1] is None:
+                header.pop()
+            names = [
+                str(value) if value is not None else f"Column_{i}"
+                for i, value in enumerate(header)
+            ]
+            buffers = [_ColumnBuffer() for _ in names]
+            state = "data"
+        elif empty:
+            # Only keep empty rows that are followed by more data
+            pending_empty += 1
+        else:
+            for _ in range(pending_empty):
+                for buffer in buffers:
+                    buffer.append(None)
+            pending_empty = 0
+            for i, buffer in enumerate(buffers):
+                buffer.append(row[i] if i < len(row) else None)
+    
+    return names, buffers, metadata
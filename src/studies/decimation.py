@@ -0,0 +1,179 @@
+"""
+Downsampling of large plot series.
+
+Every function returns indices into the original arrays rather than new
+values, so x, y and error arrays stay aligned and can be indexed with the
+same selection.
+
+- minmax_indices: first, last, minimum and maximum of every bucket; keeps
+  every spike visible (the envelope a full-resolution line would draw)
+- lttb_indices: Largest-Triangle-Three-Buckets; keeps the visual shape
+  with one point per bucket
+- thin_indices: every k-th point, for error bars
+
+density_grid is the exception: it bins points into a 2D histogram for
+density rendering of scatter series too large to draw point by point.
+"""
+
+from __future__ import annotations
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def visible_range(x: np.ndarray, x_range: Optional[Tuple[float, float]]) -> np.ndarray:
+    """Indices of points inside an x-range, plus one neighbour on each side.
+
+    The neighbours keep lines running to the edge of the view.
+
+    Args:
+        x: X values
+        x_range: (xmin, xmax), or None for all points
+
+    Returns:
+        Sorted indices
+    """
+    n = len(x)
+    if x_range is None or n == 0:
+        return np.arange(n)
+
+    low, high = min(x_range), max(x_range)
+    if n < 2 or np.all(x[1:] >= x[:-1]):
+        # Sorted x (the common case): two binary searches
+        start = max(int(np.searchsorted(x, low, side="left")) - 1, 0)
+        stop = min(int(np.searchsorted(x, high, side="right")) + 1, n)
+        return np.arange(start, stop)
+
+    inside = (x >= low) & (x <= high)
+    inside[:-1] |= inside[1:]
+    inside[1:] |= (x[:-1] >= low) & (x[:-1] <= high)
+    return np.flatnonzero(inside)
+
+
+def minmax_indices(y: np.ndarray, buckets: int) -> np.ndarray:
+    """Min/max decimation over equal-count buckets.
+
+    Keeps the first and last point of the series and, for each bucket, the
+    indices of its minimum and maximum (in their original order), so at
+    most 2 * buckets + 2 points remain. NaN values are never chosen as
+    extremes.
+
+    Args:
+        y: Y values
+        buckets: Number of buckets (about the plot width in pixels)
+
+    Returns:
+        Sorted indices into y
+    """
+    n = len(y)
+    if n <= 2 * buckets + 2 or buckets < 1:
+        return np.arange(n)
+
+    size = -(-n // buckets)
+    padded = np.full(size * buckets, np.nan)
+    padded[:n] = y
+    blocks = padded.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+
+    lows = np.argmin(np.where(np.isnan(blocks), np.inf, blocks), axis=1) + offsets
+    highs = np.argmax(np.where(np.isnan(blocks), -np.inf, blocks), axis=1) + offsets
+    picked = np.concatenate(([0, n - 1], lows, highs))
+    return np.unique(picked[picked < n])
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Each bucket keeps the point forming the largest triangle with the point
+    kept from the previous bucket and the mean of the next bucket. Points
+    with NaN coordinates are skipped.
+
+    Args:
+        x: X values (sorted)
+        y: Y values
+        threshold: Number of points to keep (at least 3)
+
+    Returns:
+        Sorted indices into x and y
+    """
+    valid = np.flatnonzero(~(np.isnan(x) | np.isnan(y)))
+    n = len(valid)
+    if threshold < 3 or n <= threshold:
+        return valid
+
+    xv, yv = x[valid], y[valid]
+    # Interior points split into threshold - 2 buckets
+    edges = (np.arange(threshold - 1) * (n - 2) / (threshold - 2)).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    # Mean of every bucket, the "next bucket" point of its predecessor
+    sums_x = np.add.reduceat(xv[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(yv[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    means_x = np.append(sums_x / counts, xv[-1])
+    means_y = np.append(sums_y / counts, yv[-1])
+
+    picked = np.empty(threshold, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        cx, cy = means_x[bucket + 1], means_y[bucket + 1]
+        # Twice the triangle area for every candidate of the bucket
+        area = np.abs(
+            (xv[a] - cx) * (yv[start:stop] - yv[a])
+            - (xv[a] - xv[start:stop]) * (cy - yv[a])
+        )
+        a = start + int(np.argmax(area))
+        picked[bucket + 1] = a
+    return valid[picked]
+
+
+def thin_indices(n: int, budget: int) -> np.ndarray:
+    """Every k-th index so that at most budget remain.
+
+    Args:
+        n: Number of points
+        budget: Maximum number of indices
+
+    Returns:
+        Sorted indices
+    """
+    if budget < 1:
+        return np.arange(0)
+    return np.arange(0, n, max(1, -(-n // budget)))
+
+
+def density_grid(x: np.ndarray, y: np.ndarray, x_range: Tuple[float, float],
+                 y_range: Tuple[float, float], shape: Tuple[int, int]) -> np.ndarray:
+    """Count points per cell of a regular grid.
+
+    One bincount over flattened cell numbers; points outside the ranges or
+    with NaN coordinates are ignored.
+
+    Args:
+        x: X values
+        y: Y values
+        x_range: (xmin, xmax) covered by the grid
+        y_range: (ymin, ymax) covered by the grid
+        shape: (rows, columns) of the grid; rows follow y
+
+    Returns:
+        Counts as float array of the given shape (row 0 at ymin)
+    """
+    rows, cols = shape
+    (x0, x1), (y0, y1) = sorted(x_range), sorted(y_range)
+    if x1 <= x0:
+        x0, x1 = x0 - 0.5, x1 + 0.5
+    if y1 <= y0:
+        y0, y1 = y0 - 0.5, y1 + 0.5
+
+    # Scaled coordinates: inside the grid when in [0, cols) / [0, rows)
+    fx = (x - x0) * (cols / (x1 - x0))
+    fy = (y - y0) * (rows / (y1 - y0))
+    inside = (fx >= 0) & (fx <= cols) & (fy >= 0) & (fy <= rows)
+    # The upper edge belongs to the last cell, like np.histogram2d
+    ix = np.minimum(fx[inside].astype(np.int64), cols - 1)
+    iy = np.minimum(fy[inside].astype(np.int64), rows - 1)
+    counts = np.bincount(iy * cols + ix, minlength=rows * cols)
+    return counts.reshape(rows, cols).astype(float)
@@ -0,0 +1,288 @@
+"""
+Vectorized descriptive statistics over blocks of columns.
+
+describe() computes everything StatisticsStudy reports for every column of
+a 2D block at once: counts and means from one sum, central moments
+(M2, M3, M4) from one pass over the deviations, and min, max and all
+quartiles from a single np.partition call with every needed order
+statistic. Missing and infinite values are ignored per column.
+
+describe_groups() computes the same statistics per group of rows: moments
+from np.bincount over the group codes, order statistics by indexing the
+segments of one sort by (group, value).
+
+pairwise_covariance() computes covariance and correlation matrices of all
+columns with one matrix product, using pairwise-complete rows.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+QUARTILES: Tuple[float, ...] = (0.25, 0.5, 0.75)
+
+# Statistics reported per group by default (see describe_groups)
+GROUP_STATISTICS: Tuple[str, ...] = ("count", "mean", "std", "variance", "min", "q25", "median", "q75", "max")
+
+
+def describe(values: np.ndarray) -> List[Dict[str, float]]:
+    """Descriptive statistics of each column of a block.
+
+    Standard deviation and variance are sample estimates (ddof=1);
+    skewness and excess kurtosis are bias-corrected. Quartiles use linear
+    interpolation, like np.percentile.
+
+    Args:
+        values: 1D array (one column) or 2D array (rows x columns)
+
+    Returns:
+        One dict per column with count, mean, median, std, variance, min,
+        max, range, q25, q50, q75, iqr, skewness and kurtosis; empty for
+        columns without finite values
+    """
+    block = np.asarray(values, dtype=float)
+    if block.ndim == 1:
+        block = block[:, None]
+
+    valid = np.isfinite(block)
+    all_valid = bool(valid.all())
+    count = np.full(block.shape[1], block.shape[0]) if all_valid else valid.sum(axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        total = block.sum(axis=0) if all_valid else np.where(valid, block, 0.0).sum(axis=0)
+        mean = total / count
+        dev = block - mean
+        if not all_valid:
+            dev[~valid] = 0.0
+        dev2 = dev * dev
+        m2 = dev2.sum(axis=0)
+        m3 = np.einsum("ij,ij->j", dev2, dev)
+        m4 = np.einsum("ij,ij->j", dev2, dev2)
+    del dev, dev2
+
+    order = _order_statistics(block, valid, count, all_valid)
+
+    results = []
+    for j, n in enumerate(count.tolist()):
+        if n == 0:
+            results.append({})
+            continue
+        results.append(summarize(n, mean[j], m2[j], m3[j], m4[j], order[j]))
+    return results
+
+
+def describe_groups(values: np.ndarray, codes: np.ndarray, n_groups: int) -> List[Dict[str, np.ndarray]]:
+    """Descriptive statistics of each column of a block, per group of rows.
+
+    Same definitions as describe(). Rows with a negative code (e.g. a
+    missing key) belong to no group.
+
+    Args:
+        values: 1D array (one column) or 2D array (rows x columns)
+        codes: Group index of every row, in [0, n_groups) or negative
+        n_groups: Number of groups
+
+    Returns:
+        One dict per column mapping each statistic to an array with one
+        value per group (NaN for groups without finite values; count 0)
+    """
+    block = np.asarray(values, dtype=float)
+    if block.ndim == 1:
+        block = block[:, None]
+    codes = np.asarray(codes)
+    # Stable sorts of 16-bit keys use radix sort
+    key_dtype = np.uint16 if n_groups <= np.iinfo(np.uint16).max else np.int64
+
+    results = []
+    for j in range(block.shape[1]):
+        column = block[:, j]
+        valid = np.isfinite(column) & (codes >= 0)
+        x, c = column[valid], codes[valid].astype(key_dtype)
+
+        count = np.bincount(c, minlength=n_groups)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.bincount(c, weights=x, minlength=n_groups) / count
+            dev = x - mean[c]
+            dev2 = dev * dev
+            m2 = np.bincount(c, weights=dev2, minlength=n_groups)
+            m3 = np.bincount(c, weights=dev2 * dev, minlength=n_groups)
+            m4 = np.bincount(c, weights=dev2 * dev2, minlength=n_groups)
+        del dev, dev2
+
+        # Sort by value, then (stable) by group: each group is a sorted segment
+        order = np.argsort(x)
+        order = order[np.argsort(c[order], kind="stable")]
+        ordered = x[order]
+        del order
+
+        starts = np.concatenate(([0], np.cumsum(count)[:-1]))
+
+        stats = _summarize_groups(count, mean, m2, m3, m4)
+        stats["min"] = _segment_quantile(ordered, starts, count, 0.0)
+        stats["max"] = _segment_quantile(ordered, starts, count, 1.0)
+        stats["range"] = stats["max"] - stats["min"]
+        for p, name in zip(QUARTILES, ("q25", "q50", "q75")):
+            stats[name] = _segment_quantile(ordered, starts, count, p)
+        stats["median"] = stats["q50"]
+        stats["iqr"] = stats["q75"] - stats["q25"]
+        results.append(stats)
+    return results
+
+
+def pairwise_covariance(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Covariance and Pearson correlation of every pair of columns.
+
+    Each pair uses the rows where both columns are finite (like
+    DataFrame.cov/corr). Without missing values this is one product of
+    the centered block with itself. Otherwise the block of values, their
+    squares and the validity mask is multiplied by the block of values and
+    mask once, which yields per pair the row counts, sums, sums of squares
+    and cross products.
+
+    Args:
+        values: 2D array (rows x columns)
+
+    Returns:
+        (covariance, correlation, counts) matrices, columns x columns;
+        NaN where a pair has fewer than two rows (or zero variance, for
+        the correlation)
+    """
+    block = np.asarray(values, dtype=float)
+    n_rows, n_cols = block.shape
+    valid = np.isfinite(block)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Centering by the column means keeps the sums well-conditioned
+        count = valid.sum(axis=0)
+        mean = np.where(valid, block, 0.0).sum(axis=0) / np.maximum(count, 1)
+        centered = np.asfortranarray(block - mean)
+
+        if valid.all():
+            counts = np.full((n_cols, n_cols), n_rows, dtype=float)
+            cross = centered.T @ centered
+            sums = np.zeros((n_cols, n_cols))
+            squares = np.repeat(np.diag(cross)[:, None], n_cols, axis=1)
+        else:
+            mask = valid.astype(float)
+            centered[~valid] = 0.0
+            left = np.concatenate([centered, centered * centered, mask], axis=1)
+            product = left.T @ np.concatenate([centered, mask], axis=1)
+            cross = product[:n_cols, :n_cols]
+            sums = product[:n_cols, n_cols:]
+            squares = product[n_cols:2 * n_cols, n_cols:]
+            counts = product[2 * n_cols:, n_cols:]
+
+        # sums[i, j]: sum of column i over rows where j is valid too
+        covariance = (cross - sums * sums.T / counts) / (counts - 1)
+        variance = (squares - sums * sums / counts) / (counts - 1)
+        correlation = covariance / np.sqrt(variance * variance.T)
+
+    few = counts < 2
+    covariance[few] = np.nan
+    correlation[few | ~np.isfinite(correlation)] = np.nan
+    np.clip(correlation, -1.0, 1.0, out=correlation)
+    return covariance, correlation, counts.astype(np.int64)
+
+
+def _segment_quantile(ordered: np.ndarray, starts: np.ndarray, count: np.ndarray, p: float) -> np.ndarray:
+    """Quantile of every sorted segment (NaN for empty segments)."""
+    if len(ordered) == 0:
+        return np.full(len(count), np.nan)
+    position = starts + p * np.maximum(count - 1, 0)
+    lo = np.floor(position).astype(np.int64)
+    hi = np.ceil(position).astype(np.int64)
+    last = len(ordered) - 1
+    low, high = ordered[np.minimum(lo, last)], ordered[np.minimum(hi, last)]
+    return np.where(count == 0, np.nan, low + (high - low) * (position - lo))
+
+
+def _summarize_groups(count: np.ndarray, mean: np.ndarray, m2: np.ndarray, m3: np.ndarray,
+                      m4: np.ndarray) -> Dict[str, np.ndarray]:
+    """Moment statistics of every group, like summarize() but vectorized."""
+    n = count.astype(float)
+    empty = count == 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        variance = np.where(count > 1, m2 / (n - 1), 0.0)
+        std = np.sqrt(variance)
+
+        skewness = (m3 / n) / std**3 * np.sqrt(n * (n - 1)) / (n - 2)
+        skewness = np.where((count >= 3) & (std > 0), skewness, 0.0)
+
+        excess = (m4 / n) / std**4 - 3.0
+        kurtosis = ((n - 1) * ((n + 1) * excess + 6)) / ((n - 2) * (n - 3))
+        kurtosis = np.where((count >= 4) & (std > 0), kurtosis, 0.0)
+
+    return {
+        'count': count,
+        'mean': np.where(empty, np.nan, mean),
+        'std': np.where(empty, np.nan, std),
+        'variance': np.where(empty, np.nan, variance),
+        'skewness': np.where(empty, np.nan, skewness),
+        'kurtosis': np.where(empty, np.nan, kurtosis),
+    }
+
+
+def _order_statistics(block: np.ndarray, valid: np.ndarray, count: np.ndarray,
+                      all_valid: bool) -> List[Dict[float, float]]:
+    """Min, max and quartiles of every column from one partition.
+
+    Returns:
+        Per column {0.0: min, 0.25: q25, 0.5: median, 0.75: q75, 1.0: max}
+    """
+    probabilities = (0.0,) + QUARTILES + (1.0,)
+    positions = [np.asarray(p) * (count - 1) for p in probabilities]
+    kth = set()
+    for pos in positions:
+        for n, p in zip(count.tolist(), pos.tolist()):
+            if n:
+                kth.update((int(np.floor(p)), int(np.ceil(p))))
+    if not kth:
+        return [{} for _ in count]
+
+    # Missing values sort last, behind every column's valid values
+    filled = block if all_valid else np.where(valid, block, np.inf)
+    part = np.partition(filled, sorted(kth), axis=0)
+
+    order = [{} for _ in count]
+    for p, pos in zip(probabilities, positions):
+        for j, (n, at) in enumerate(zip(count.tolist(), pos.tolist())):
+            if n:
+                lo, hi = int(np.floor(at)), int(np.ceil(at))
+                low, high = part[lo, j], part[hi, j]
+                order[j][p] = float(low + (high - low) * (at - lo))
+    return order
+
+
+def summarize(n: int, mean: float, m2: float, m3: float, m4: float,
+              order: Dict[float, float]) -> Dict[str, float]:
+    """Assemble the statistics of one column from its moments and order statistics."""
+    variance = m2 / (n - 1) if n > 1 else 0.0
+    std = float(np.sqrt(variance))
+
+    skewness = 0.0
+    if n >= 3 and std > 0:
+        skewness = (m3 / n) / std**3 * np.sqrt(n * (n - 1)) / (n - 2)
+
+    kurtosis = 0.0
+    if n >= 4 and std > 0:
+        excess = (m4 / n) / std**4 - 3.0
+        kurtosis = ((n - 1) * ((n + 1) * excess + 6)) / ((n - 2) * (n - 3))
+
+    q25, q50, q75 = (order[p] for p in QUARTILES)
+    return {
+        'count': int(n),
+        'mean': float(mean),
+        'median': q50,
+        'std': std,
+        'variance': float(variance),
+        'min': order[0.0],
+        'max': order[1.0],
+        'range': order[1.0] - order[0.0],
+        'q25': q25,
+        'q50': q50,
+        'q75': q75,
+        'iqr': q75 - q25,
+        'skewness': float(skewness),
+        'kurtosis': float(kurtosis),
+    }
@@ -0,0 +1,115 @@
+"""
+Incremental reader for CSV files that grow while being watched.
+
+The follower remembers the byte offset after the last complete line it
+parsed. Polling compares the file size against that offset and only
+parses the newly appended complete lines; a partially written last line
+is left for the next poll.
+"""
+
+from __future__ import annotations
+from typing import List, Optional
+from io import BytesIO
+import os
+
+import pandas as pd
+
+from studies.data_table_study import read_csv_frame
+
+
+class FileFollower:
+    """Reads rows appended to a CSV file since the previous read.
+
+    Attributes:
+        filepath: Followed file
+        columns: Column names taken from the file header
+        truncated: True if the last poll found the file shorter than
+            before and re-read it from the start
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        has_metadata: bool = True,
+        delimiter: str = ",",
+        encoding: str = "utf-8",
+        decimal: str = ".",
+        skip_rows: int = 0,
+        header: Optional[int] = 0
+    ):
+        """Initialize follower.
+
+        Args:
+            filepath: Path to CSV file
+            has_metadata, delimiter, encoding, decimal, skip_rows, header:
+                CSV settings (see DataTableStudy.import_from_csv)
+        """
+        self.filepath = filepath
+        self.settings = {
+            "has_metadata": has_metadata,
+            "delimiter": delimiter,
+            "encoding": encoding,
+            "decimal": decimal,
+            "skip_rows": skip_rows,
+            "header": header,
+        }
+        self.columns: List[str] = []
+        self.truncated = False
+        self._offset = 0
+
+    @property
+    def offset(self) -> int:
+        """Byte offset after the last parsed line."""
+        return self._offset
+
+    def read_all(self) -> pd.DataFrame:
+        """Parse all complete lines of the file and start following from there.
+
+        Returns:
+            Current file content
+        """
+        with open(self.filepath, "rb") as f:
+            data = f.read()
+
+        end = data.rfind(b"\n") + 1
+        df = read_csv_frame(BytesIO(data[:end]), **self.settings)
+        self.columns = [str(c) for c in df.columns]
+        self._offset = end
+        return df
+
+    def poll(self) -> Optional[pd.DataFrame]:
+        """Parse lines appended since the last read.
+
+        Returns:
+            New rows (possibly empty), the full content if the file was
+            truncated (see ``truncated``), or None if the file did not grow
+        """
+        self.truncated = False
+        size = os.path.getsize(self.filepath)
+
+        if size < self._offset:
+            self.truncated = True
+            return self.read_all()
+        if size == self._offset:
+            return None
+
+        with open(self.filepath, "rb") as f:
+            f.seek(self._offset)
+            chunk = f.read(size - self._offset)
+
+        end = chunk.rfind(b"\n") + 1
+        if end == 0:
+            # Only a partial line so far
+            return None
+        self._offset += end
+
+        return pd.read_csv(
+            BytesIO(chunk[:end]),
+            header=None,
+            names=self.columns,
+            index_col=False,
+            delimiter=self.settings["delimiter"],
+            encoding=self.settings["encoding"],
+            decimal=self.settings["decimal"],
+            comment='#' if self.settings["has_metadata"] else None
+        )
@@ -0,0 +1,264 @@
+"""
+Headless rendering and batch export of plots.
+
+Plots are drawn on an Agg canvas without Qt, so they can be rendered in
+worker processes. Each plot export job carries a plot definition plus
+only the table columns it reads (see PlotStudy.get_dependencies);
+workspace files are loaded by the worker itself. Exports run on a
+process pool and finish in any order; one failing plot does not abort
+the batch.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from pathlib import Path
+import concurrent.futures
+import copy
+import json
+import os
+import re
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from constants import PLOT_EXPORT_DPI, PLOT_EXPORT_SIZE_INCHES
+from core.data_object import DataObject
+from core.workspace import Workspace
+from studies.data_table_study import DataTableStudy
+from studies.plot_study import PlotStudy
+
+
+@dataclass
+class PlotExportResult:
+    """Outcome of a batch export.
+
+    Attributes:
+        files: Written file per plot ("plot" or "workspace/plot")
+        errors: Error message per plot (or workspace file) that failed
+        cancelled: True if the batch was stopped before all plots were written
+    """
+
+    files: Dict[str, str] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    cancelled: bool = False
+
+    @property
+    def succeeded(self) -> int:
+        """Number of plots exported."""
+        return len(self.files)
+
+    @property
+    def failed(self) -> int:
+        """Number of plots or workspace files that failed."""
+        return len(self.errors)
+
+
+def render_plot(
+    plot: PlotStudy,
+    filepath: str,
+    dpi: int = PLOT_EXPORT_DPI,
+    format: Optional[str] = None,
+    size: Tuple[float, float] = PLOT_EXPORT_SIZE_INCHES
+) -> str:
+    """Render a plot to an image file without Qt.
+
+    The plot is drawn on a copy, so its live figure is left untouched.
+    The point budget grows with the output width, so decimated series keep
+    full detail at high DPI.
+
+    Args:
+        plot: Plot to render (its series are read from plot.workspace)
+        filepath: Output file
+        dpi: Resolution
+        format: Image format (None: from the file extension)
+        size: Figure size in inches
+
+    Returns:
+        Output file path
+    """
+    plot = PlotStudy.from_dict(plot.to_dict(), workspace=plot.workspace)
+    # Min/max decimation keeps two points per bucket of about one pixel
+    plot.point_budget = max(plot.point_budget, 2 * int(size[0] * dpi))
+
+    figure = Figure(figsize=size, dpi=dpi)
+    FigureCanvasAgg(figure)
+    plot.update_plot(figure)
+    figure.savefig(filepath, dpi=dpi, format=format, bbox_inches="tight")
+    return filepath
+
+
+def export_workspace_plots(
+    workspace: Workspace,
+    output_dir: str,
+    format: str = "png",
+    dpi: int = PLOT_EXPORT_DPI,
+    size: Tuple[float, float] = PLOT_EXPORT_SIZE_INCHES,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int, str], bool]] = None
+) -> PlotExportResult:
+    """Export every plot of a workspace to output_dir/<plot>.<format>.
+
+    Args:
+        workspace: Workspace whose plots are exported
+        output_dir: Output directory (created if needed)
+        format: Image format (png, svg, pdf, jpg)
+        dpi: Resolution
+        size: Figure size in inches
+        max_workers: Worker processes (None: one per core, 1: render inline)
+        progress_callback: Called as ``(done, total, plot name)`` after each
+            plot; returning False cancels the remaining plots
+
+    Returns:
+        PlotExportResult keyed by plot name
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = {
+        name: (_plot_snapshot(study), os.path.join(output_dir, f"{_safe_filename(name)}.{format}"))
+        for name, study in workspace.studies.items()
+        if isinstance(study, PlotStudy)
+    }
+    args = {name: (snapshot, filepath, dpi, format, size) for name, (snapshot, filepath) in jobs.items()}
+    return _run_jobs(_render_snapshot, args, max_workers, progress_callback)
+
+
+def export_workspace_files(
+    files: List[str],
+    output_dir: str,
+    format: str = "png",
+    dpi: int = PLOT_EXPORT_DPI,
+    size: Tuple[float, float] = PLOT_EXPORT_SIZE_INCHES,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int, str], bool]] = None
+) -> PlotExportResult:
+    """Export the plots of many saved workspaces.
+
+    Each workspace file is loaded and rendered in a worker process; its
+    plots go to output_dir/<file stem>/<plot>.<format>.
+
+    Args:
+        files: Workspace JSON files
+        output_dir: Output directory (created if needed)
+        format: Image format (png, svg, pdf, jpg)
+        dpi: Resolution
+        size: Figure size in inches
+        max_workers: Worker processes (None: one per core, 1: render inline)
+        progress_callback: Called as ``(done, total, filepath)`` after each
+            workspace; returning False cancels the remaining ones
+
+    Returns:
+        PlotExportResult keyed by "<file stem>/<plot>"; errors of files that
+        could not be loaded are keyed by file path
+    """
+    args = {
+        filepath: (filepath, os.path.join(output_dir, _safe_filename(Path(filepath).stem)), format, dpi, size)
+        for filepath in files
+    }
+    per_file = _run_jobs(_render_workspace_file, args, max_workers, progress_callback)
+
+    result = PlotExportResult(errors=dict(per_file.errors), cancelled=per_file.cancelled)
+    for filepath, (written, errors) in per_file.files.items():
+        stem = Path(filepath).stem
+        result.files.update({f"{stem}/{name}": path for name, path in written.items()})
+        result.errors.update({f"{stem}/{name}": error for name, error in errors.items()})
+    return result
+
+
+def _run_jobs(
+    function: Callable,
+    args: Dict[str, tuple],
+    max_workers: Optional[int],
+    progress_callback: Optional[Callable[[int, int, str], bool]]
+) -> PlotExportResult:
+    """Run one job per key, inline or on a process pool."""
+    result = PlotExportResult()
+    outputs: Dict[str, Any] = {}
+
+    def finish(key: str, output: Any, error: Optional[BaseException], done: int) -> bool:
+        if error is None:
+            outputs[key] = output
+        else:
+            result.errors[key] = str(error)
+        if progress_callback:
+            return progress_callback(done, len(args), key) is not False
+        return True
+
+    if max_workers == 1 or len(args) <= 1:
+        for done, (key, job_args) in enumerate(args.items(), start=1):
+            try:
+                output, error = function(*job_args), None
+            except Exception as e:
+                output, error = None, e
+            if not finish(key, output, error, done):
+                result.cancelled = done < len(args)
+                break
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(function, *job_args): key for key, job_args in args.items()}
+            for done, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+                error = future.exception()
+                output = future.result() if error is None else None
+                if not finish(futures[future], output, error, done):
+                    result.cancelled = done < len(args)
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+    # Input order, like batch_import_csv
+    result.files = {key: outputs[key] for key in args if key in outputs}
+    return result
+
+
+def _plot_snapshot(plot: PlotStudy) -> Dict[str, Any]:
+    """Picklable copy of a plot and the table columns it reads."""
+    tables = {}
+    for study_name, columns in plot.get_dependencies().items():
+        study = plot.workspace.get_study(study_name) if plot.workspace else None
+        if not isinstance(study, DataTableStudy):
+            continue
+        columns = [name for name in study.table.data.columns if columns is None or name in columns]
+        tables[study_name] = (
+            study.table.data[columns].copy(),
+            {name: copy.deepcopy(study.column_metadata.get(name, {})) for name in columns}
+        )
+    return {"plot": plot.to_dict(), "tables": tables}
+
+
+def _render_snapshot(snapshot: Dict[str, Any], filepath: str, dpi: int, format: str,
+                     size: Tuple[float, float]) -> str:
+    """Rebuild a plot snapshot in a scratch workspace and render it."""
+    workspace = Workspace("Export", "numerical")
+    for study_name, (frame, metadata) in snapshot["tables"].items():
+        study = DataTableStudy(study_name, workspace=workspace)
+        study._load_table(DataObject(name="main_table", data=frame))
+        study.column_metadata.update(metadata)
+        workspace.add_study(study)
+
+    plot = PlotStudy.from_dict(snapshot["plot"], workspace=workspace)
+    return render_plot(plot, filepath, dpi=dpi, format=format, size=size)
+
+
+def _render_workspace_file(filepath: str, output_dir: str, format: str, dpi: int,
+                           size: Tuple[float, float]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Load a workspace file and render its plots (written, errors)."""
+    with open(filepath, "r", encoding="utf-8") as f:
+        workspace = Workspace.from_dict(json.load(f))
+
+    os.makedirs(output_dir, exist_ok=True)
+    written, errors = {}, {}
+    for name, study in workspace.studies.items():
+        if not isinstance(study, PlotStudy):
+            continue
+        try:
+            written[name] = render_plot(
+                study, os.path.join(output_dir, f"{_safe_filename(name)}.{format}"),
+                dpi=dpi, format=format, size=size
+            )
+        except Exception as e:
+            errors[name] = str(e)
+    return written, errors
+
+
+def _safe_filename(name: str) -> str:
+    """Replace characters that are not allowed in file names."""
+    return re.sub(r'[<>:"/\\|?*\x00-\x1f]', "_", name).strip(" .") or "plot"
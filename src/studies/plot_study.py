@@ -5,11 +5,20 @@ Provides 2D plotting capabilities using matplotlib backend.
 """
 
 from __future__ import annotations
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
+from matplotlib.collections import PathCollection
+from matplotlib.colors import LogNorm
+from matplotlib.container import ErrorbarContainer
+from matplotlib.image import AxesImage
 
 from core.study import Study
+from studies.decimation import visible_range, minmax_indices, lttb_indices, density_grid
+from constants import (
+    PLOT_POINT_BUDGET, PLOT_ERRORBAR_BUDGET, PLOT_DENSITY_COLORMAP, PLOT_DENSITY_BIN_PIXELS
+)
 
 
 class PlotStudy(Study):
@@ -18,12 +27,17 @@ class PlotStudy(Study):
     Features:
     - Multiple series on same plot
     - Line, scatter, and mixed plots
+    - Density images (2D histograms) for huge scatter series
     - Axis labels and legend
     - Data references to DataTable studies
+    - Decimation of series longer than point_budget
     
     Attributes:
         figure: Matplotlib Figure object
         series: List of plot series configurations
+        point_budget: Maximum points drawn per decimated series
+        decimation_method: "minmax" (keeps every spike) or "lttb"
+            (keeps the shape with fewer points)
     """
     
     def __init__(self, name: str, workspace=None):
@@ -46,8 +60,16 @@ class PlotStudy(Study):
         # Series: [{study: str, x_col: str, y_col: str, label: str, style: str}]
         self.series: List[Dict[str, Any]] = []
         
+        # Decimation of long series (per-series switch: series["decimate"])
+        self.point_budget = PLOT_POINT_BUDGET
+        self.decimation_method = "minmax"
+        
         # Matplotlib figure
         self.figure: Optional[Figure] = None
+        
+        # Drawn series: [index, series, axes, artist, (x, y, x_err, y_err)]
+        self._drawn: List[list] = []
+        self._drawn_config: Optional[str] = None
     
     def get_type(self) -> str:
         """Get study type identifier."""
@@ -64,7 +86,9 @@ class PlotStudy(Study):
         marker: str = "o",
         linestyle: str = "-",
         xerr_column: Optional[str] = None,
-        yerr_column: Optional[str] = None
+        yerr_column: Optional[str] = None,
+        decimate: bool = True,
+        colormap: str = PLOT_DENSITY_COLORMAP
     ):
         """Add data series to plot.
         
@@ -73,12 +97,17 @@ class PlotStudy(Study):
             x_column: Column name for X data
             y_column: Column name for Y data
             label: Series label for legend
-            style: Plot style (line, scatter, both)
+            style: Plot style (line, scatter, both, density); density
+                draws point counts per pixel cell as an image, at a cost
+                independent of the number of points
             color: Line/marker color
             marker: Marker style
             linestyle: Line style
             xerr_column: Optional column name for X error bars
             yerr_column: Optional column name for Y error bars
+            decimate: Downsample the series when it has more points than
+                point_budget
+            colormap: Matplotlib colormap of density images
         """
         series = {
             "study": study_name,
@@ -90,7 +119,9 @@ class PlotStudy(Study):
             "marker": marker,
             "linestyle": linestyle,
             "xerr_col": xerr_column,
-            "yerr_col": yerr_column
+            "yerr_col": yerr_column,
+            "decimate": decimate,
+            "colormap": colormap
         }
         self.series.append(series)
     
@@ -107,6 +138,19 @@ class PlotStudy(Study):
         """Remove all series."""
         self.series.clear()
     
+    def get_dependencies(self) -> Dict[str, Optional[Set[str]]]:
+        """Get the data and error columns read by the series.
+        
+        Returns:
+            Dictionary mapping study name to column names
+        """
+        dependencies: Dict[str, Optional[Set[str]]] = {}
+        for series in self.series:
+            columns = dependencies.setdefault(series["study"], set())
+            columns.update(series[key] for key in ("x_col", "y_col", "xerr_col", "yerr_col")
+                           if series.get(key))
+        return dependencies
+    
     def get_data_for_series(self, series_index: int):
         """Get X and Y data arrays for a series.
         
@@ -164,77 +208,29 @@ class PlotStudy(Study):
         except Exception:
             return None
     
-    def update_plot(self, figure: Figure):
-        """Update matplotlib figure with current data.
+    def update_plot(self, figure: Figure, x_range: Optional[Tuple[float, float]] = None):
+        """Rebuild matplotlib figure with current data.
+        
+        Creates the axes and one persistent artist per series; later data
+        changes can update them with refresh_data().
         
         Args:
             figure: Matplotlib Figure to update
+            x_range: Visible x-range to decimate for (None: all points)
         """
         self.figure = figure
         figure.clear()
+        self._drawn = []
         
         ax = figure.add_subplot(111)
         
         # Plot each series
         for i, series in enumerate(self.series):
-            data = self.get_data_for_series(i)
-            if not data:
+            arrays = self._series_arrays(i)
+            if arrays is None:
                 continue
-            
-            x_data, y_data, x_label, y_label, x_err, y_err = data
-            
-            # Convert None values in error arrays to NaN (matplotlib requirement)
-            import numpy as np
-            if x_err is not None:
-                x_err = np.array([np.nan if v is None else v for v in x_err])
-                # If all NaN, treat as no error bars
-                if np.all(np.isnan(x_err)):
-                    x_err = None
-            if y_err is not None:
-                y_err = np.array([np.nan if v is None else v for v in y_err])
-                # If all NaN, treat as no error bars
-                if np.all(np.isnan(y_err)):
-                    y_err = None
-            
-            # Set default labels if not already set
-            if self.xlabel == "X" and x_label:
-                self.xlabel = x_label
-            if self.ylabel == "Y" and y_label:
-                self.ylabel = y_label
-            
-            # Plot based on style
-            style = series["style"]
-            color = series["color"]
-            label = series["label"]
-            
-            # Use errorbar if any error data present
-            has_errors = (x_err is not None) or (y_err is not None)
-            
-            if has_errors:
-                # errorbar can handle all styles
-                fmt = ""
-                if style == "scatter":
-                    fmt = series["marker"]  # Just marker
-                elif style == "line":
-                    fmt = series["linestyle"]  # Just line
-                elif style == "both":
-                    fmt = series["linestyle"] + series["marker"]  # Line + marker
-                
-                ax.errorbar(x_data, y_data, xerr=x_err, yerr=y_err,
-                           fmt=fmt, label=label, color=color,
-                           capsize=3, capthick=1, elinewidth=1, alpha=0.8)
-            else:
-                # No errors - use standard plotting
-                if style == "scatter":
-                    ax.scatter(x_data, y_data, label=label, color=color, 
-                              marker=series["marker"], alpha=0.7)
-                elif style == "line":
-                    ax.plot(x_data, y_data, label=label, color=color,
-                           linestyle=series["linestyle"])
-                elif style == "both":
-                    ax.plot(x_data, y_data, label=label, color=color,
-                           linestyle=series["linestyle"], marker=series["marker"],
-                           markersize=4)
+            artist = self._draw_series(ax, series, arrays, x_range)
+            self._drawn.append([i, series, ax, artist, arrays])
         
         # Configure plot
         ax.set_xlabel(self.xlabel)
@@ -251,6 +247,317 @@ class PlotStudy(Study):
                 ax.legend()
         
         figure.tight_layout()
+        self._drawn_config = self._config_key()
+    
+    def refresh_data(self) -> bool:
+        """Update the drawn series in place with current table data.
+        
+        Lines get set_data, scatters set_offsets and error bars new segments;
+        data limits are then recomputed. Axes, labels and legend are kept.
+        
+        Returns:
+            False if the figure has to be rebuilt with update_plot() instead
+            (nothing drawn yet, or the series configuration changed)
+        """
+        if self.figure is None or not self._drawn or self._drawn_config != self._config_key():
+            return False
+        
+        all_arrays = [self._series_arrays(i) for i in range(len(self.series))]
+        drawn = [record[0] for record in self._drawn]
+        if drawn != [i for i, arrays in enumerate(all_arrays) if arrays is not None]:
+            return False
+        
+        for record in self._drawn:
+            ax = record[2]
+            record[4] = all_arrays[record[0]]
+            # Keep decimating for the zoomed range, all points otherwise
+            x_range = None if ax.get_autoscalex_on() else self._widened(ax.get_xlim())
+            self._set_artist_data(record, x_range)
+        
+        for ax in {id(record[2]): record[2] for record in self._drawn}.values():
+            ax.relim()
+            # relim() skips collections: add scatter points
+            for collection in ax.collections:
+                if isinstance(collection, PathCollection) and len(collection.get_offsets()):
+                    ax.update_datalim(collection.get_offsets())
+            ax.autoscale_view()
+        return True
+    
+    def redecimate(self, x_range: Tuple[float, float]) -> bool:
+        """Decimate drawn series again for a new visible x-range.
+        
+        Called after zoom/pan.
+        
+        Args:
+            x_range: Visible (xmin, xmax)
+            
+        Returns:
+            True if any artist changed (the canvas needs a redraw)
+        """
+        x_range = self._widened(x_range)
+        changed = False
+        for record in self._drawn:
+            if isinstance(record[3], AxesImage):
+                # Re-bin density images for a zoomed view (with autoscaling
+                # on, the new extent would move the limits again)
+                if not record[2].get_autoscalex_on():
+                    self._set_artist_data(record, x_range)
+                    changed = True
+            elif self._decimates(record[1], record[4][0]):
+                self._set_artist_data(record, x_range)
+                changed = True
+        return changed
+    
+    @staticmethod
+    def _widened(x_range: Tuple[float, float]) -> Tuple[float, float]:
+        """Widen a visible range by half its width on each side.
+        
+        Decimating a bit beyond the view keeps short pans from uncovering
+        undrawn regions.
+        """
+        low, high = min(x_range), max(x_range)
+        margin = (high - low) / 2
+        return low - margin, high + margin
+    
+    def _config_key(self) -> str:
+        """Snapshot of everything that needs a full rebuild when changed."""
+        return repr((
+            self.series, self.title, self.xlabel, self.ylabel, self.grid,
+            self.legend, self.point_budget, self.decimation_method
+        ))
+    
+    def _series_arrays(self, series_index: int) -> Optional[tuple]:
+        """Get (x, y, x_err, y_err) of a series ready for plotting.
+        
+        Error arrays are float with NaN for missing values, or None if
+        entirely missing. Also takes over default axis labels.
+        
+        Args:
+            series_index: Index of series
+            
+        Returns:
+            Arrays, or None if the series has no data
+        """
+        data = self.get_data_for_series(series_index)
+        if not data:
+            return None
+        
+        x_data, y_data, x_label, y_label, x_err, y_err = data
+        
+        # Convert None values in error arrays to NaN (matplotlib requirement)
+        if x_err is not None:
+            x_err = np.asarray(x_err, dtype=float)
+            # If all NaN, treat as no error bars
+            if np.all(np.isnan(x_err)):
+                x_err = None
+        if y_err is not None:
+            y_err = np.asarray(y_err, dtype=float)
+            # If all NaN, treat as no error bars
+            if np.all(np.isnan(y_err)):
+                y_err = None
+        
+        # Set default labels if not already set
+        if self.xlabel == "X" and x_label:
+            self.xlabel = x_label
+        if self.ylabel == "Y" and y_label:
+            self.ylabel = y_label
+        
+        return x_data, y_data, x_err, y_err
+    
+    def _set_artist_data(self, record: list, x_range: Optional[Tuple[float, float]]):
+        """Put a series' current (decimated) data into its artist.
+        
+        Args:
+            record: Drawn series [index, series, axes, artist, arrays]
+            x_range: Visible x-range to decimate for
+        """
+        _, series, ax, artist, arrays = record
+        if isinstance(artist, AxesImage):
+            counts, extent = self._density(ax, arrays, x_range)
+            artist.set_data(counts)
+            artist.set_extent(extent)
+            artist.set_clim(1, max(2.0, np.nanmax(counts, initial=0)))
+            return
+        
+        x, y, x_err, y_err = self._decimate(series, arrays, x_range)
+        
+        if isinstance(artist, ErrorbarContainer):
+            if not self._set_errorbar_data(artist, x, y, x_err, y_err, self._errorevery(series, arrays, len(x))):
+                # Error columns appeared or vanished: redraw this series only
+                color = artist.lines[0].get_color() if artist.lines[0] is not None else series["color"]
+                artist.remove()
+                record[3] = self._draw_series(ax, dict(series, color=color), arrays, x_range)
+        elif x_err is not None or y_err is not None:
+            color = artist.get_facecolor()[0] if isinstance(artist, PathCollection) else artist.get_color()
+            artist.remove()
+            record[3] = self._draw_series(ax, dict(series, color=color), arrays, x_range)
+        elif isinstance(artist, PathCollection):
+            artist.set_offsets(np.column_stack([x, y]))
+        else:
+            artist.set_data(x, y)
+    
+    @staticmethod
+    def _set_errorbar_data(container: ErrorbarContainer, x, y, x_err, y_err, errorevery: int) -> bool:
+        """Update an error bar container's line, caps and bar segments in place.
+        
+        Returns:
+            False if the container has a different set of error bars
+        """
+        data_line, caplines, barcols = container.lines
+        present = [(axis, err) for axis, err in (("x", x_err), ("y", y_err)) if err is not None]
+        if data_line is None or len(barcols) != len(present) or len(caplines) != 2 * len(present):
+            return False
+        
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        data_line.set_data(x, y)
+        
+        every = slice(None, None, errorevery)
+        xs, ys = x[every], y[every]
+        for k, (axis, err) in enumerate(present):
+            err = err[every]
+            if axis == "x":
+                low, high = (xs - err, ys), (xs + err, ys)
+            else:
+                low, high = (xs, ys - err), (xs, ys + err)
+            barcols[k].set_segments(np.stack([np.column_stack(low), np.column_stack(high)], axis=1))
+            caplines[2 * k].set_data(*low)
+            caplines[2 * k + 1].set_data(*high)
+        return True
+    
+    def _errorevery(self, series: Dict[str, Any], arrays: tuple, n_drawn: int) -> int:
+        """Error bar stride: decimated series draw at most PLOT_ERRORBAR_BUDGET."""
+        if not self._decimates(series, arrays[0]):
+            return 1
+        return max(1, -(-n_drawn // PLOT_ERRORBAR_BUDGET))
+    
+    def _decimates(self, series: Dict[str, Any], x_data) -> bool:
+        """Check whether a series is long enough to be decimated."""
+        return series.get("decimate", True) and len(x_data) > self.point_budget
+    
+    def _decimate(self, series: Dict[str, Any], arrays: tuple, x_range: Optional[Tuple[float, float]]) -> tuple:
+        """Select the points of a series to draw.
+        
+        Args:
+            series: Series configuration
+            arrays: (x, y, x_err, y_err) full arrays
+            x_range: Visible x-range (None: all points)
+            
+        Returns:
+            (x, y, x_err, y_err) of the selected points
+        """
+        x_data, y_data = arrays[:2]
+        if not self._decimates(series, x_data):
+            return arrays
+        
+        try:
+            x = np.asarray(x_data, dtype=float)
+            y = np.asarray(y_data, dtype=float)
+        except (TypeError, ValueError):
+            return arrays
+        
+        rows = visible_range(x, x_range)
+        if len(rows) > self.point_budget:
+            if self.decimation_method == "lttb":
+                rows = rows[lttb_indices(x[rows], y[rows], self.point_budget)]
+            else:
+                rows = rows[minmax_indices(y[rows], self.point_budget // 2 - 1)]
+        return tuple(None if a is None else a[rows] for a in (x, y, arrays[2], arrays[3]))
+    
+    def _density(self, ax, arrays: tuple, x_range: Optional[Tuple[float, float]]) -> tuple:
+        """Bin a series into a density image for the current view.
+        
+        Cells are PLOT_DENSITY_BIN_PIXELS screen pixels wide. With x_range
+        (a zoomed, widened view) the grid covers it and the widened y-limits;
+        otherwise it covers all data.
+        
+        Args:
+            ax: Matplotlib Axes the image is drawn on
+            arrays: (x, y, x_err, y_err) full arrays
+            x_range: Widened visible x-range (None: all points)
+            
+        Returns:
+            (counts with NaN for empty cells, extent)
+        """
+        x = np.asarray(arrays[0], dtype=float)
+        y = np.asarray(arrays[1], dtype=float)
+        
+        if x_range is None:
+            finite = np.isfinite(x) & np.isfinite(y)
+            x_range = (x[finite].min(), x[finite].max()) if finite.any() else (0.0, 1.0)
+            y_range = (y[finite].min(), y[finite].max()) if finite.any() else (0.0, 1.0)
+            scale = 1
+        else:
+            y_range = self._widened(ax.get_ylim())
+            scale = 2  # Widened ranges span twice the view
+        
+        bbox = ax.get_window_extent()
+        shape = (
+            max(1, int(scale * bbox.height / PLOT_DENSITY_BIN_PIXELS)),
+            max(1, int(scale * bbox.width / PLOT_DENSITY_BIN_PIXELS))
+        )
+        counts = density_grid(x, y, x_range, y_range, shape)
+        counts[counts == 0] = np.nan  # Empty cells stay transparent
+        (x0, x1), (y0, y1) = sorted(x_range), sorted(y_range)
+        return counts, (x0, x1, y0, y1)
+    
+    def _draw_series(self, ax, series: Dict[str, Any], arrays: tuple, x_range: Optional[Tuple[float, float]]):
+        """Draw one series (decimated if needed).
+        
+        Args:
+            ax: Matplotlib Axes
+            series: Series configuration
+            arrays: (x, y, x_err, y_err) full arrays
+            x_range: Visible x-range to decimate for
+            
+        Returns:
+            Drawn artist (Line2D, PathCollection, ErrorbarContainer or
+            AxesImage)
+        """
+        # Plot based on style
+        style = series["style"]
+        if style == "density":
+            counts, extent = self._density(ax, arrays, x_range)
+            return ax.imshow(counts, extent=extent, origin="lower", aspect="auto",
+                             interpolation="nearest",
+                             cmap=series.get("colormap") or PLOT_DENSITY_COLORMAP,
+                             norm=LogNorm(1, max(2.0, np.nanmax(counts, initial=0))),
+                             label=series["label"])
+        
+        x_data, y_data, x_err, y_err = self._decimate(series, arrays, x_range)
+        color = series["color"]
+        label = series["label"]
+        
+        # Use errorbar if any error data present
+        has_errors = (x_err is not None) or (y_err is not None)
+        
+        if has_errors:
+            # errorbar can handle all styles
+            fmt = ""
+            if style == "scatter":
+                fmt = series["marker"]  # Just marker
+            elif style == "line":
+                fmt = series["linestyle"]  # Just line
+            elif style == "both":
+                fmt = series["linestyle"] + series["marker"]  # Line + marker
+            
+            # Thin error bars of decimated series
+            errorevery = self._errorevery(series, arrays, len(x_data))
+            
+            return ax.errorbar(x_data, y_data, xerr=x_err, yerr=y_err,
+                               fmt=fmt, label=label, color=color, errorevery=errorevery,
+                               capsize=3, capthick=1, elinewidth=1, alpha=0.8)
+        
+        # No errors - use standard plotting
+        if style == "scatter":
+            return ax.scatter(x_data, y_data, label=label, color=color,
+                              marker=series["marker"], alpha=0.7)
+        if style == "both":
+            return ax.plot(x_data, y_data, label=label, color=color,
+                           linestyle=series["linestyle"], marker=series["marker"],
+                           markersize=4)[0]
+        return ax.plot(x_data, y_data, label=label, color=color,
+                       linestyle=series["linestyle"])[0]
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize study to dictionary."""
@@ -261,7 +568,9 @@ class PlotStudy(Study):
             "ylabel": self.ylabel,
             "grid": self.grid,
             "legend": self.legend,
-            "series": self.series
+            "series": self.series,
+            "point_budget": self.point_budget,
+            "decimation_method": self.decimation_method
         })
         return data
     
@@ -280,4 +589,6 @@ class PlotStudy(Study):
         study.grid = data.get("grid", True)
         study.legend = data.get("legend", True)
         study.series = data.get("series", [])
+        study.point_budget = data.get("point_budget", PLOT_POINT_BUDGET)
+        study.decimation_method = data.get("decimation_method", "minmax")
         return study
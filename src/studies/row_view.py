@@ -0,0 +1,197 @@
+"""
+Sorted and filtered row order of a DataTableStudy.
+
+The view is an index array of source rows: sorting is one stable argsort
+(lexsort for several keys) and filtering a boolean mask evaluated by the
+study's FormulaEngine. Table data is never moved, so edits made through
+the view go straight to the source rows.
+
+The order is a snapshot taken when sort keys or the filter are set (or
+refresh() is called): editing values does not reorder rows, the same way
+spreadsheets keep rows in place after a sort. Only a change of the rows
+themselves recomputes it: rows appended or removed, or the frame
+replaced (e.g. ring-buffer appends evicting the oldest rows).
+"""
+
+from __future__ import annotations
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.exceptions import FormulaError
+
+
+class RowView:
+    """Index-based sort and filter over a study's table.
+
+    Attributes:
+        study: DataTableStudy whose rows are viewed
+        sort_keys: (column, ascending) pairs, most significant first
+        filter_expression: Boolean formula rows must satisfy (e.g.
+            "({x} > 0) & ({y} < 5)"), or None
+        generation: Incremented whenever the row order is recomputed
+    """
+
+    def __init__(self, study):
+        """Initialize view showing all rows in table order.
+
+        Args:
+            study: DataTableStudy whose rows are viewed
+        """
+        self.study = study
+        self.sort_keys: List[Tuple[str, bool]] = []
+        self.filter_expression: Optional[str] = None
+        self.generation = 0
+        self._index: Optional[np.ndarray] = None  # None: identity
+        self._rows_key: Optional[Tuple[int, int]] = None  # (frame generation, length)
+
+    @property
+    def is_identity(self) -> bool:
+        """Whether the view shows all rows in table order."""
+        return not self.sort_keys and not self.filter_expression
+
+    @property
+    def index(self) -> Optional[np.ndarray]:
+        """Source row of every view row (None if the view is the identity)."""
+        if self.is_identity:
+            return None
+        if self._index is None or self._rows_key != self._current_rows_key():
+            try:
+                self.refresh()
+            except FormulaError:
+                # Filter no longer evaluates (e.g. a column was removed)
+                self.filter_expression = None
+                self.refresh()
+        return self._index
+
+    def __len__(self) -> int:
+        """Number of rows in the view."""
+        index = self.index
+        return len(self.study.table.data) if index is None else len(index)
+
+    def set_sort(self, keys: List[Tuple[str, bool]]):
+        """Sort rows by one or more columns (stable, missing values last).
+
+        Args:
+            keys: (column, ascending) pairs, most significant first; empty
+                to restore table order
+
+        Raises:
+            ValueError: If a column does not exist
+        """
+        missing = [name for name, _ in keys if name not in self.study.table.data.columns]
+        if missing:
+            raise ValueError(f"Unknown columns: {', '.join(missing)}")
+        self.sort_keys = list(keys)
+        self.refresh()
+
+    def set_filter(self, expression: Optional[str]):
+        """Show only rows for which a formula is true.
+
+        Args:
+            expression: Boolean formula over columns and constants; None
+                or empty to show all rows
+
+        Raises:
+            FormulaError: If the expression cannot be evaluated
+        """
+        previous = self.filter_expression
+        self.filter_expression = expression.strip() if expression and expression.strip() else None
+        try:
+            self.refresh()
+        except FormulaError:
+            self.filter_expression = previous
+            self.refresh()
+            raise
+
+    def clear(self):
+        """Show all rows in table order."""
+        self.sort_keys = []
+        self.filter_expression = None
+        self._index = None
+        self.generation += 1
+
+    def refresh(self):
+        """Recompute the row order from the current data.
+
+        Raises:
+            FormulaError: If the filter expression cannot be evaluated
+        """
+        data = self.study.table.data
+        self._rows_key = self._current_rows_key()
+        self.generation += 1
+        self.sort_keys = [(name, asc) for name, asc in self.sort_keys if name in data.columns]
+        if self.is_identity:
+            self._index = None
+            return
+
+        index = np.arange(len(data))
+        if self.filter_expression:
+            index = np.flatnonzero(self._evaluate_filter())
+        if self.sort_keys:
+            index = index[self._sort_order(index)]
+        self._index = index
+
+    def _current_rows_key(self) -> Tuple[int, int]:
+        """Identify the table's rows (changes when rows are added, removed or replaced)."""
+        table = self.study.table
+        return (table.generation, len(table.data))
+
+    def source_rows(self, rows) -> np.ndarray:
+        """Map view rows to source rows.
+
+        Args:
+            rows: View row indices
+
+        Returns:
+            Source row indices
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        index = self.index
+        return rows if index is None else index[rows]
+
+    def _sort_order(self, rows: np.ndarray) -> np.ndarray:
+        """Stable order of the given rows by the sort keys."""
+        keys = []
+        for name, ascending in self.sort_keys:
+            values = self.study.table.data[name].to_numpy()[rows]
+            if values.dtype.kind not in "fiub":
+                # Rank non-numeric values; missing ones (-1) go last
+                try:
+                    codes, _ = pd.factorize(values, sort=True)
+                except TypeError:
+                    # Mixed types: order by text
+                    codes, _ = pd.factorize(np.where(pd.isna(values), None, values.astype(str)), sort=True)
+                values = np.where(codes < 0, np.nan, codes)
+            values = values.astype(float)
+            keys.append(values if ascending else -values)
+
+        if len(keys) == 1:
+            return np.argsort(keys[0], kind="stable")
+        # lexsort sorts by the last key first
+        return np.lexsort(keys[::-1])
+
+    def _evaluate_filter(self) -> np.ndarray:
+        """Evaluate the filter expression to a boolean row mask."""
+        study = self.study
+        context = {
+            name: study.table.data[name].to_numpy(dtype=float, na_value=np.nan)
+            if study.table.data[name].dtype.kind in "fiub" else study.table.data[name].to_numpy()
+            for name in study.table.columns
+        }
+        workspace = study.workspace
+        context = study.formula_engine.build_context_with_workspace(
+            context,
+            workspace.constants if workspace else None,
+            workspace_id=id(workspace) if workspace else None,
+            workspace_version=workspace._version if workspace else 0
+        )
+
+        result = study.formula_engine.evaluate(self.filter_expression, context)
+        mask = np.asarray(result)
+        if mask.ndim == 0:
+            mask = np.full(len(study.table.data), bool(mask))
+        if mask.shape != (len(study.table.data),):
+            raise FormulaError(f"Filter must give one value per row: {self.filter_expression}")
+        return np.where(pd.isna(mask), False, mask).astype(bool)
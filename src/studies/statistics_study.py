@@ -6,12 +6,17 @@ distributions, and visualizations.
 """
 
 from __future__ import annotations
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Sequence, Set, Tuple
 import numpy as np
 import pandas as pd
 
 from core.study import Study
 from core.data_object import DataObject
+from constants import BOOTSTRAP_CONFIDENCE, BOOTSTRAP_RESAMPLES
+from studies.bootstrap import BOOTSTRAP_STATISTICS, BootstrapResult, bootstrap
+from studies.data_table_study import DataTableStudy
+from studies.descriptive_stats import GROUP_STATISTICS, describe, describe_groups, pairwise_covariance
+from studies.streaming_stats import StreamingStats
 
 
 class StatisticsStudy(Study):
@@ -22,11 +27,16 @@ class StatisticsStudy(Study):
     - Distribution analysis (skewness, kurtosis)
     - Linked to a DataTableStudy for data source
     - Multiple column analysis support
+    - Incremental updates after cell edits and appended rows
+    - Grouped statistics by a key column
+    - Bootstrap confidence intervals
+    - Correlation and covariance matrices
     
     Attributes:
         source_study: Name of the DataTableStudy to analyze
         analyzed_columns: List of column names being analyzed
         results: Dictionary of analysis results per column
+        confidence_intervals: Bootstrap intervals per column (see bootstrap_column)
     """
     
     def __init__(self, name: str, source_study: Optional[str] = None, workspace=None):
@@ -43,11 +53,35 @@ class StatisticsStudy(Study):
         self.source_study = source_study
         self.analyzed_columns: List[str] = []
         self.results: Dict[str, Dict[str, Any]] = {}
+        self.confidence_intervals: Dict[str, Dict[str, Any]] = {}
+        self._streams: Dict[str, _ColumnStream] = {}
+        # Source data version each result (and numeric check) was computed for
+        self._result_versions: Dict[str, tuple] = {}
+        self._interval_versions: Dict[str, tuple] = {}
+        self._numeric_cache: Dict[str, Tuple[tuple, bool]] = {}
+        self._matrix_cache: Optional[Tuple[tuple, Dict[str, pd.DataFrame]]] = None
     
     def get_type(self) -> str:
         """Get study type identifier."""
         return "statistics"
     
+    def get_dependencies(self) -> Dict[str, Optional[Set[str]]]:
+        """Get the analyzed columns of the source study.
+        
+        Before any analysis the whole source study is read (the column
+        list shown for selection depends on it). Columns of the last
+        correlation matrix count as analyzed.
+        
+        Returns:
+            Dictionary mapping study name to column names (None: any column)
+        """
+        if not self.source_study:
+            return {}
+        columns = set(self.analyzed_columns)
+        if self._matrix_cache is not None:
+            columns.update(name for name, _ in self._matrix_cache[0])
+        return {self.source_study: columns or None}
+    
     # ========================================================================
     # Data Source Management
     # ========================================================================
@@ -59,6 +93,11 @@ class StatisticsStudy(Study):
             study_name: Name of DataTableStudy in workspace
         """
         self.source_study = study_name
+        self._streams.clear()
+        self._result_versions.clear()
+        self._interval_versions.clear()
+        self._numeric_cache.clear()
+        self._matrix_cache = None
     
     def get_source_data(self, column_name: str) -> Optional[np.ndarray]:
         """Get numerical data from source study column.
@@ -67,60 +106,87 @@ class StatisticsStudy(Study):
             column_name: Name of column to extract
             
         Returns:
-            Numpy array of cleaned numerical values, or None
+            Numpy array of finite values (one copy of the column), or None
         """
-        if not self.workspace or not self.source_study:
+        table = self._source_table()
+        if table is None or column_name not in table.columns:
             return None
         
         try:
-            # Get source study
-            study = self.workspace.get_study(self.source_study)
-            if study is None or study.get_type() != "data_table":
-                return None
-            
-            # Check if column exists
-            if column_name not in study.table.data.columns:
-                return None
-            
-            # Get column data as Series
-            series = study.table.data[column_name]
-            
-            # Clean data: remove NaN and inf
-            data = series.replace([np.inf, -np.inf], np.nan).dropna().to_numpy()
-            
-            return data if len(data) > 0 else None
-            
-        except Exception:
+            values = table[column_name].to_numpy(dtype=float, na_value=np.nan)
+        except (TypeError, ValueError):
             return None
+        
+        data = values[np.isfinite(values)]
+        return data if len(data) > 0 else None
+    
+    def _source_table(self) -> Optional[pd.DataFrame]:
+        """Get the source study's table data, or None."""
+        table = self._source_object()
+        return table.data if table is not None else None
+    
+    def _source_object(self) -> Optional[DataObject]:
+        """Get the source study's table, or None."""
+        study = self._source_data_study()
+        return study.table if study is not None else None
+    
+    def _source_data_study(self) -> Optional[Study]:
+        """Get the source DataTableStudy, or None."""
+        if not self.workspace or not self.source_study:
+            return None
+        study = self.workspace.get_study(self.source_study)
+        if study is None or study.get_type() != "data_table":
+            return None
+        return study
+    
+    @staticmethod
+    def _data_version(table: DataObject, column_name: str) -> tuple:
+        """Key that changes whenever a column of the source changes."""
+        return (id(table),) + table.column_version(column_name)
     
     def get_available_columns(self) -> List[str]:
         """Get list of numerical columns available for analysis.
         
+        Decided from column dtypes and metadata without reading the data;
+        only text columns of DATA type are checked for numeric content,
+        once per version of the column.
+        
         Returns:
             List of column names
         """
-        if not self.workspace or not self.source_study:
+        study = self._source_data_study()
+        if study is None:
             return []
+        return [name for name in study.table.data.columns if self.is_numeric_column(name)]
+    
+    def is_numeric_column(self, column_name: str) -> bool:
+        """Check whether a source column holds numbers.
         
-        try:
-            study = self.workspace.get_study(self.source_study)
-            if study is None or study.get_type() != "data_table":
-                return []
-            
-            # Get all columns and filter numerical ones
-            columns = []
-            for col_name in study.table.data.columns:
-                try:
-                    data = self.get_source_data(col_name)
-                    if data is not None and len(data) > 0:
-                        columns.append(col_name)
-                except Exception:
-                    continue
-            
-            return columns
+        Args:
+            column_name: Column name
             
-        except Exception:
-            return []
+        Returns:
+            True for numeric dtypes and computed columns (calculated,
+            derivative, range, uncertainty), and for object columns whose
+            values convert to numbers
+        """
+        study = self._source_data_study()
+        if study is None or column_name not in study.table.data.columns:
+            return False
+        
+        dtype = study.table.data[column_name].dtype
+        if dtype.kind in "fiub":
+            return True
+        if not (pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)):
+            return False
+        if study.column_metadata.get(column_name, {}).get("type", "data") != "data":
+            return True
+        
+        version = self._data_version(study.table, column_name)
+        cached = self._numeric_cache.get(column_name)
+        if cached is None or cached[0] != version:
+            cached = self._numeric_cache[column_name] = (version, self.get_source_data(column_name) is not None)
+        return cached[1]
     
     # ========================================================================
     # Statistical Analysis
@@ -135,97 +201,314 @@ class StatisticsStudy(Study):
         Returns:
             Dictionary of statistical measures
         """
-        data = self.get_source_data(column_name)
-        
-        if data is None or len(data) == 0:
-            return {}
-        
-        # Calculate statistics
-        stats = {
-            'column_name': column_name,
-            'count': int(len(data)),
-            'mean': float(np.mean(data)),
-            'median': float(np.median(data)),
-            'std': float(np.std(data, ddof=1)) if len(data) > 1 else 0.0,
-            'variance': float(np.var(data, ddof=1)) if len(data) > 1 else 0.0,
-            'min': float(np.min(data)),
-            'max': float(np.max(data)),
-            'range': float(np.max(data) - np.min(data)),
-            'q25': float(np.percentile(data, 25)),
-            'q50': float(np.percentile(data, 50)),
-            'q75': float(np.percentile(data, 75)),
-            'iqr': float(np.percentile(data, 75) - np.percentile(data, 25)),
-            'skewness': float(self._calculate_skewness(data)),
-            'kurtosis': float(self._calculate_kurtosis(data)),
-        }
-        
-        # Store results
-        self.results[column_name] = stats
-        
-        # Add to analyzed columns if not already present
-        if column_name not in self.analyzed_columns:
-            self.analyzed_columns.append(column_name)
-        
-        return stats
+        return self.analyze_columns([column_name]).get(column_name, {})
     
-    def _calculate_skewness(self, data: np.ndarray) -> float:
-        """Calculate skewness (measure of asymmetry).
+    def analyze_columns(self, column_names: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Analyze several columns in one vectorized pass (see descriptive_stats).
+        
+        Results are cached per column and source data version: columns
+        unchanged since their last exact analysis are not recomputed.
         
         Args:
-            data: Numpy array of values
+            column_names: Columns to analyze (None: all numerical columns)
             
         Returns:
-            Skewness value
+            Statistics per analyzed column; non-numerical, missing or empty
+            columns are left out
         """
-        if len(data) < 3:
-            return 0.0
+        source = self._source_object()
+        if source is None:
+            return {}
+        table = source.data
+        if column_names is None:
+            column_names = [name for name in table.columns if table[name].dtype.kind in "fiub"]
+        
+        columns = [name for name in column_names if self.is_numeric_column(name)]
+        versions = {name: self._data_version(source, name) for name in columns}
+        
+        analyzed = {}
+        stale = []
+        for name in columns:
+            if name in self.results and self._result_versions.get(name) == versions[name]:
+                analyzed[name] = self.results[name]
+            else:
+                stale.append(name)
+        
+        if stale:
+            block = table[stale].to_numpy(dtype=float, na_value=np.nan)
+            for name, stats in zip(stale, describe(block)):
+                if not stats:
+                    continue
+                stats = {'column_name': name, **stats}
+                analyzed[name] = stats
+                self._store_result(name, stats, versions[name])
         
-        n = len(data)
-        mean = np.mean(data)
-        std = np.std(data, ddof=1)
+        return {name: analyzed[name] for name in columns if name in analyzed}
+    
+    def _store_result(self, name: str, stats: Dict[str, Any], version: Optional[tuple]):
+        """Store the statistics of a column and the data version they describe."""
+        self.results[name] = stats
+        if version is None:
+            self._result_versions.pop(name, None)
+        else:
+            self._result_versions[name] = version
+        if name not in self.analyzed_columns:
+            self.analyzed_columns.append(name)
+    
+    def update_statistics(self, column_names: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Bring results up to date with the source, incrementally.
         
-        if std == 0:
-            return 0.0
+        Each column keeps running statistics (see streaming_stats) and a
+        copy of the values they summarize. Edited rows remove their old and
+        add their new values, appended rows are added, so an update costs
+        O(changed rows). Columns whose changes are unknown (table replaced,
+        rows removed) are rebuilt. Quartiles are approximate on large
+        columns; analyze_columns() recomputes everything exactly.
         
-        m3 = np.sum((data - mean)**3) / n
-        skew = m3 / (std**3)
+        Args:
+            column_names: Columns to update (None: analyzed columns)
+            
+        Returns:
+            Statistics per updated column; non-numerical, missing or empty
+            columns are left out
+        """
+        table = self._source_object()
+        if table is None:
+            return {}
+        if column_names is None:
+            column_names = list(self.analyzed_columns)
+        
+        updated = {}
+        for name in column_names:
+            if name not in table.data.columns:
+                self._streams.pop(name, None)
+                continue
+            if not self.is_numeric_column(name):
+                continue
+            version = self._data_version(table, name)
+            stream = self._streams.get(name)
+            current = (self._result_versions.get(name), stream.version if stream is not None else None)
+            if name in self.results and version in current:
+                # Unchanged since the last (exact or incremental) update
+                updated[name] = self.results[name]
+                continue
+            
+            column = table.data[name]
+            rows = None
+            if stream is not None and stream.version[0] == version[0]:
+                rows = table.changed_rows(name, stream.version[1:])
+            if rows is None or len(column) < stream.size:
+                stream = self._streams[name] = _ColumnStream(column)
+            else:
+                stream.update(column, *rows)
+            stream.version = version
+            
+            stats = stream.stats.summary()
+            if not stats:
+                continue
+            stats = {'column_name': name, **stats}
+            updated[name] = stats
+            # Quartiles may be approximate, so this is no exact result
+            self._store_result(name, stats, None)
+        
+        return updated
+    
+    def get_statistics_state(self, column_name: str) -> Optional[StreamingStats]:
+        """Get the running statistics of a column (see update_statistics).
         
-        # Apply bias correction
-        skew = skew * np.sqrt(n * (n - 1)) / (n - 2)
+        The state can be merged with the statistics of other chunks, e.g.
+        computed in worker processes.
         
-        return skew
+        Args:
+            column_name: Column name
+            
+        Returns:
+            Running statistics, or None if the column was never updated
+        """
+        stream = self._streams.get(column_name)
+        return stream.stats if stream is not None else None
     
-    def _calculate_kurtosis(self, data: np.ndarray) -> float:
-        """Calculate excess kurtosis (measure of tailedness).
-        
-        Excess kurtosis: subtract 3 so normal distribution has kurtosis of 0.
+    def group_statistics(
+        self,
+        key_column: str,
+        column_names: Optional[List[str]] = None,
+        statistics: Tuple[str, ...] = GROUP_STATISTICS
+    ) -> pd.DataFrame:
+        """Descriptive statistics per group of rows sharing a key value.
+        
+        The key column is factorized once and all groups are computed in
+        one vectorized pass per column (see descriptive_stats.describe_groups).
+        Rows with a missing key are left out.
         
         Args:
-            data: Numpy array of values
+            key_column: Column whose values define the groups (run id,
+                setpoint, sample, ...)
+            column_names: Columns to analyze (None: all numerical columns
+                except the key)
+            statistics: Statistics to report (keys of describe())
             
         Returns:
-            Excess kurtosis value
+            One row per key value (sorted), with the key column followed by
+            "<column>_<statistic>" columns
+            
+        Raises:
+            ValueError: If there is no source table or key column
         """
-        if len(data) < 4:
-            return 0.0
+        source = self._source_object()
+        if source is None:
+            raise ValueError("No source data table")
+        table = source.data
+        if key_column not in table.columns:
+            raise ValueError(f"Key column '{key_column}' not found")
+        
+        if column_names is None:
+            column_names = self.get_available_columns()
+        columns = [name for name in column_names if name != key_column and self.is_numeric_column(name)]
+        
+        codes, keys = pd.factorize(table[key_column], sort=True)
+        result = {key_column: keys}
+        if columns:
+            block = table[columns].to_numpy(dtype=float, na_value=np.nan)
+            for name, stats in zip(columns, describe_groups(block, codes, len(keys))):
+                for statistic in statistics:
+                    result[f"{name}_{statistic}"] = stats[statistic]
+        return pd.DataFrame(result)
+    
+    def create_group_table(
+        self,
+        key_column: str,
+        column_names: Optional[List[str]] = None,
+        name: Optional[str] = None,
+        statistics: Tuple[str, ...] = GROUP_STATISTICS
+    ) -> DataTableStudy:
+        """Create a data table of grouped statistics (see group_statistics).
+        
+        Units of the analyzed columns carry over to statistics in the same
+        unit. The study is not added to the workspace.
         
-        n = len(data)
-        mean = np.mean(data)
-        std = np.std(data, ddof=1)
+        Args:
+            key_column: Column whose values define the groups
+            column_names: Columns to analyze (None: all numerical columns)
+            name: Study name (default: "<statistics name> by <key column>")
+            statistics: Statistics to report
+            
+        Returns:
+            New DataTableStudy with one row per group
+        """
+        frame = self.group_statistics(key_column, column_names, statistics)
+        study = DataTableStudy(name or f"{self.name} by {key_column}", workspace=self.workspace)
+        study._load_table(DataObject(name="main_table", data=frame))
+        
+        source = self.workspace.get_study(self.source_study)
+        units = {col: meta.get("unit") for col, meta in source.column_metadata.items()}
+        study.column_metadata[key_column]["unit"] = units.get(key_column)
+        for col_name in frame.columns[1:]:
+            column, statistic = col_name.rsplit("_", 1)
+            if statistic not in ("count", "variance", "skewness", "kurtosis"):
+                study.column_metadata[col_name]["unit"] = units.get(column)
+        return study
+    
+    def correlation_matrix(self, column_names: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
+        """Correlation and covariance of every pair of columns.
         
-        if std == 0:
-            return 0.0
+        The columns are stacked into one 2D array and all pairs are computed
+        with a single matrix product (see descriptive_stats.pairwise_covariance);
+        each pair uses the rows where both values are finite. The result is
+        cached until one of the columns changes.
         
-        m4 = np.sum((data - mean)**4) / n
-        kurt = m4 / (std**4)
+        Args:
+            column_names: Columns to correlate (None: all numerical columns)
+            
+        Returns:
+            Dictionary with "correlation", "covariance" and "count" (rows
+            used per pair) DataFrames indexed by column name; empty if there
+            is no source table
+        """
+        source = self._source_object()
+        if source is None:
+            return {}
+        if column_names is None:
+            column_names = self.get_available_columns()
+        columns = [name for name in column_names if self.is_numeric_column(name)]
+        
+        key = tuple((name, self._data_version(source, name)) for name in columns)
+        if self._matrix_cache is not None and self._matrix_cache[0] == key:
+            return self._matrix_cache[1]
+        
+        block = source.data[columns].to_numpy(dtype=float, na_value=np.nan)
+        covariance, correlation, counts = pairwise_covariance(block.reshape(len(source.data), len(columns)))
+        result = {
+            "correlation": pd.DataFrame(correlation, index=columns, columns=columns),
+            "covariance": pd.DataFrame(covariance, index=columns, columns=columns),
+            "count": pd.DataFrame(counts, index=columns, columns=columns),
+        }
+        self._matrix_cache = (key, result)
+        return result
+    
+    def bootstrap_column(
+        self,
+        column_name: str,
+        statistics: Sequence[str] = BOOTSTRAP_STATISTICS,
+        n_resamples: int = BOOTSTRAP_RESAMPLES,
+        confidence: float = BOOTSTRAP_CONFIDENCE,
+        seed: int = 0,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], bool]] = None
+    ) -> BootstrapResult:
+        """Bootstrap confidence intervals of a column (see studies.bootstrap).
+        
+        Intervals of a complete run are stored in confidence_intervals
+        until the column changes.
         
-        # Excess kurtosis (subtract 3 for normal distribution = 0)
-        excess_kurt = kurt - 3.0
+        Args:
+            column_name: Column to resample
+            statistics: Statistics to estimate ("mean", "median", "std")
+            n_resamples: Number of resamples
+            confidence: Confidence level in (0, 1)
+            seed: Random seed (equal seeds give equal intervals)
+            max_workers: Worker processes (None: one per core, 1: run inline)
+            progress_callback: Called as ``(resamples done, total)``;
+                returning False cancels
+            
+        Returns:
+            BootstrapResult
+            
+        Raises:
+            ValueError: If the column has fewer than two finite values
+        """
+        data = self.get_source_data(column_name)
+        if data is None:
+            raise ValueError(f"No numerical data in column '{column_name}'")
         
-        # Apply bias correction
-        excess_kurt = ((n - 1) * ((n + 1) * excess_kurt + 6)) / ((n - 2) * (n - 3))
+        result = bootstrap(
+            data, statistics, n_resamples, confidence, seed,
+            max_workers=max_workers, progress_callback=progress_callback
+        )
+        if not result.cancelled:
+            self.confidence_intervals[column_name] = {
+                "confidence": result.confidence,
+                "n_resamples": result.n_resamples,
+                "intervals": {name: list(interval) for name, interval in result.intervals.items()},
+            }
+            self._interval_versions[column_name] = self._data_version(self._source_object(), column_name)
+        return result
+    
+    def get_confidence_intervals(self, column_name: str) -> Optional[Dict[str, Any]]:
+        """Get the bootstrap intervals of a column if its data is unchanged.
         
-        return excess_kurt
+        Args:
+            column_name: Column name
+            
+        Returns:
+            Dictionary with confidence, n_resamples and intervals
+            ({statistic: [low, high]}), or None
+        """
+        source = self._source_object()
+        if source is None or column_name not in source.data.columns:
+            return None
+        if self._interval_versions.get(column_name) != self._data_version(source, column_name):
+            return None
+        return self.confidence_intervals.get(column_name)
     
     def get_results(self, column_name: str) -> Optional[Dict[str, Any]]:
         """Get analysis results for a column.
@@ -241,7 +524,13 @@ class StatisticsStudy(Study):
     def clear_results(self):
         """Clear all analysis results."""
         self.results.clear()
+        self.confidence_intervals.clear()
         self.analyzed_columns.clear()
+        self._streams.clear()
+        self._result_versions.clear()
+        self._interval_versions.clear()
+        self._numeric_cache.clear()
+        self._matrix_cache = None
     
     # ========================================================================
     # Serialization
@@ -258,6 +547,7 @@ class StatisticsStudy(Study):
         base_dict["metadata"]["source_study"] = self.source_study
         base_dict["metadata"]["analyzed_columns"] = self.analyzed_columns
         base_dict["metadata"]["results"] = self.results
+        base_dict["metadata"]["confidence_intervals"] = self.confidence_intervals
         
         return base_dict
     
@@ -282,6 +572,7 @@ class StatisticsStudy(Study):
         
         study.analyzed_columns = metadata.get("analyzed_columns", [])
         study.results = metadata.get("results", {})
+        study.confidence_intervals = metadata.get("confidence_intervals", {})
         
         # Restore base metadata
         study.metadata = metadata
@@ -290,3 +581,59 @@ class StatisticsStudy(Study):
     
     def __repr__(self) -> str:
         return f"StatisticsStudy(name='{self.name}', source='{self.source_study}', analyzed={len(self.analyzed_columns)})"
+
+
+class _ColumnStream:
+    """Running statistics of a column and the values they summarize.
+    
+    Attributes:
+        stats: Running statistics
+        values: Float copy of the column (capacity grows by doubling)
+        size: Number of rows in values
+        version: Column version the statistics correspond to
+    """
+    
+    def __init__(self, column: pd.Series):
+        values = _as_float(column)
+        self.stats = StreamingStats.from_values(values)
+        self.values = values.copy()
+        self.size = len(values)
+        self.version: Optional[tuple] = None
+    
+    def update(self, column: pd.Series, start: int, stop: int):
+        """Apply changed rows [start, stop) of the column."""
+        n_old, n = self.size, len(column)
+        
+        edit_stop = min(stop, n_old)
+        if start < edit_stop:
+            new = _as_float(column.iloc[start:edit_stop])
+            old = self.values[start:edit_stop]
+            changed = ~((old == new) | (np.isnan(old) & np.isnan(new)))
+            if changed.any():
+                self.stats.remove(old[changed])
+                self.stats.add(new[changed])
+                old[changed] = new[changed]
+        
+        if n > n_old:
+            appended = _as_float(column.iloc[n_old:n])
+            if n > len(self.values):
+                grown = np.empty(max(n, 2 * len(self.values)))
+                grown[:n_old] = self.values[:n_old]
+                self.values = grown
+            self.values[n_old:n] = appended
+            self.stats.add(appended)
+            self.size = n
+        
+        current = self.values[:self.size]
+        if self.stats.needs_rebuild:
+            self.stats = StreamingStats.from_values(current)
+        elif not self.stats.moments.extremes_valid:
+            self.stats.moments.reset_extremes(current)
+
+
+def _as_float(column: pd.Series) -> np.ndarray:
+    """Column values as floats (non-numerical values become NaN)."""
+    if column.dtype.kind in "fiub":
+        return column.to_numpy(dtype=float, na_value=np.nan)
+    return pd.to_numeric(column, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+
@@ -0,0 +1,331 @@
+"""
+Incremental descriptive statistics with mergeable state.
+
+StreamingStats keeps the moments of a column (count, mean, M2, M3, M4,
+min, max) and a KLL-style quantile sketch. Both can be updated with new
+values, have values removed (cell edits remove the old and add the new
+value) and be merged with the state of other chunks or processes, so
+statistics stay current at a cost proportional to the changed rows.
+
+Moments are combined with the pairwise update formulas of Chan et al.
+and Pébay, which are exact up to rounding. Quantiles are approximate:
+the sketch keeps a few hundred weighted samples with a rank error of
+about 1/k of the count, and is exact while it has not compacted yet.
+Removed values go to a second sketch whose ranks are subtracted; once
+removals grow large relative to the count, callers should rebuild
+(see needs_rebuild).
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from constants import QUANTILE_SKETCH_K, STREAMING_REBUILD_FRACTION
+from studies.descriptive_stats import QUARTILES, summarize
+
+
+def _finite(values) -> np.ndarray:
+    """Finite values of an array as a flat float array."""
+    values = np.asarray(values, dtype=float).ravel()
+    return values[np.isfinite(values)]
+
+
+class MomentAccumulator:
+    """Count, mean, central moment sums (M2, M3, M4) and extremes.
+
+    Attributes:
+        count: Number of values
+        mean: Mean
+        m2, m3, m4: Sums of 2nd, 3rd and 4th powers of deviations
+        min, max: Extremes (only reliable while extremes_valid)
+        extremes_valid: False once a removal may have taken the min or max
+    """
+
+    __slots__ = ("count", "mean", "m2", "m3", "m4", "min", "max", "extremes_valid")
+
+    def __init__(self):
+        """Initialize empty accumulator."""
+        self.count = 0
+        self.mean = self.m2 = self.m3 = self.m4 = 0.0
+        self.min, self.max = np.inf, -np.inf
+        self.extremes_valid = True
+
+    @classmethod
+    def from_values(cls, values) -> MomentAccumulator:
+        """Accumulate a batch of values (missing and infinite values are ignored)."""
+        values = _finite(values)
+        moments = cls()
+        if len(values) == 0:
+            return moments
+        moments.count = len(values)
+        moments.mean = float(values.mean())
+        dev = values - moments.mean
+        dev2 = dev * dev
+        moments.m2 = float(dev2.sum())
+        moments.m3 = float(np.dot(dev2, dev))
+        moments.m4 = float(np.dot(dev2, dev2))
+        moments.min, moments.max = float(values.min()), float(values.max())
+        return moments
+
+    def add(self, values):
+        """Add a batch of values."""
+        self.merge(MomentAccumulator.from_values(values))
+
+    def merge(self, other: MomentAccumulator):
+        """Combine with the accumulator of another set of values."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            for name in self.__slots__:
+                setattr(self, name, getattr(other, name))
+            return
+
+        na, nb = self.count, other.count
+        n = na + nb
+        delta = other.mean - self.mean
+        m2a, m3a = self.m2, self.m3
+
+        self.mean += delta * nb / n
+        self.m2 = m2a + other.m2 + delta**2 * na * nb / n
+        self.m3 = (m3a + other.m3 + delta**3 * na * nb * (na - nb) / n**2
+                   + 3 * delta * (na * other.m2 - nb * m2a) / n)
+        self.m4 = (self.m4 + other.m4 + delta**4 * na * nb * (na * na - na * nb + nb * nb) / n**3
+                   + 6 * delta**2 * (na * na * other.m2 + nb * nb * m2a) / n**2
+                   + 4 * delta * (na * other.m3 - nb * m3a) / n)
+        self.count = n
+        self.min, self.max = min(self.min, other.min), max(self.max, other.max)
+        self.extremes_valid = self.extremes_valid and other.extremes_valid
+
+    def remove(self, values):
+        """Remove a batch of values that were added before.
+
+        Inverts merge(). Removing a value equal to the current min or max
+        clears extremes_valid (see reset_extremes).
+        """
+        other = MomentAccumulator.from_values(values)
+        nb = other.count
+        if nb == 0:
+            return
+        n = self.count
+        na = n - nb
+        if na <= 0:
+            self.__init__()
+            return
+
+        mean = (n * self.mean - nb * other.mean) / na
+        delta = other.mean - mean
+        m2 = max(self.m2 - other.m2 - delta**2 * na * nb / n, 0.0)
+        m3 = (self.m3 - other.m3 - delta**3 * na * nb * (na - nb) / n**2
+              - 3 * delta * (na * other.m2 - nb * m2) / n)
+        m4 = max(self.m4 - other.m4 - delta**4 * na * nb * (na * na - na * nb + nb * nb) / n**3
+                 - 6 * delta**2 * (na * na * other.m2 + nb * nb * m2) / n**2
+                 - 4 * delta * (na * other.m3 - nb * m3) / n, 0.0)
+
+        self.count, self.mean, self.m2, self.m3, self.m4 = na, mean, m2, m3, m4
+        if other.min <= self.min or other.max >= self.max:
+            self.extremes_valid = False
+
+    def reset_extremes(self, values):
+        """Recompute min and max from all current values."""
+        values = _finite(values)
+        if len(values):
+            self.min, self.max = float(values.min()), float(values.max())
+        else:
+            self.min, self.max = np.inf, -np.inf
+        self.extremes_valid = True
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch (KLL compactor hierarchy).
+
+    Level h holds samples of weight 2**h. A level over its capacity is
+    sorted and every other sample (random offset) is promoted to the next
+    level; capacities shrink geometrically below the top level, so the
+    sketch holds about 3k samples whatever the count.
+
+    Attributes:
+        k: Capacity of the top level (accuracy parameter)
+        count: Number of values added
+    """
+
+    def __init__(self, k: int = QUANTILE_SKETCH_K, seed: Optional[int] = None):
+        """Initialize empty sketch.
+
+        Args:
+            k: Accuracy parameter (rank error about count / k)
+            seed: Seed of the compaction offsets (None: random)
+        """
+        self.k = k
+        self.count = 0
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def exact(self) -> bool:
+        """Whether every added value is still held with weight 1."""
+        return len(self._levels) == 1
+
+    def add(self, values):
+        """Add a batch of values (missing and infinite values are ignored)."""
+        values = _finite(values)
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+    def merge(self, other: QuantileSketch):
+        """Add the values summarized by another sketch."""
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge sketches with k={self.k} and k={other.k}")
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self.count += other.count
+        self._compress()
+
+    def weighted_samples(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Samples and their weights (unsorted)."""
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(items), 2.0**level) for level, items in enumerate(self._levels)])
+        return values, weights
+
+    def quantiles(self, probabilities: Sequence[float]) -> List[float]:
+        """Approximate quantiles (linear interpolation, like np.percentile)."""
+        return weighted_quantiles(*self.weighted_samples(), probabilities)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - 1 - level
+        return max(2, int(np.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd sample out stays behind, so weights add up exactly
+                odd = len(items) % 2
+                promoted = items[odd + int(self._rng.integers(2))::2]
+                self._levels[level] = items[:odd]
+                self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+            level += 1
+
+
+def weighted_quantiles(values: np.ndarray, weights: np.ndarray,
+                       probabilities: Sequence[float]) -> List[float]:
+    """Quantiles of weighted samples.
+
+    With unit weights the result equals np.percentile's linear
+    interpolation. Negative weights (removed values) cancel samples of
+    the same value.
+
+    Args:
+        values: Samples
+        weights: Sample weights
+        probabilities: Probabilities in [0, 1]
+
+    Returns:
+        One quantile per probability (NaN if the total weight is not positive)
+    """
+    if len(values) == 0:
+        return [np.nan] * len(probabilities)
+    values, inverse = np.unique(values, return_inverse=True)
+    weights = np.bincount(inverse, weights=weights)
+    cumulative = np.maximum.accumulate(np.cumsum(weights))
+    total = cumulative[-1]
+    if total <= 0:
+        return [np.nan] * len(probabilities)
+
+    last = len(values) - 1
+    results = []
+    for p in probabilities:
+        position = p * (total - 1)
+        lo, hi = np.floor(position), np.ceil(position)
+        low = values[min(int(np.searchsorted(cumulative, lo, side="right")), last)]
+        high = values[min(int(np.searchsorted(cumulative, hi, side="right")), last)]
+        results.append(float(low + (high - low) * (position - lo)))
+    return results
+
+
+class StreamingStats:
+    """Mergeable running statistics of one column.
+
+    Attributes:
+        moments: Running moments and extremes
+        sketch: Quantile sketch of added values
+        removed: Quantile sketch of removed values
+    """
+
+    def __init__(self, k: int = QUANTILE_SKETCH_K, seed: Optional[int] = None):
+        """Initialize empty statistics.
+
+        Args:
+            k: Quantile sketch accuracy parameter
+            seed: Seed of the sketch compactions (None: random)
+        """
+        self.moments = MomentAccumulator()
+        self.sketch = QuantileSketch(k, seed)
+        self.removed = QuantileSketch(k, seed)
+
+    @classmethod
+    def from_values(cls, values, k: int = QUANTILE_SKETCH_K, seed: Optional[int] = None) -> StreamingStats:
+        """Statistics of a batch of values."""
+        stats = cls(k, seed)
+        stats.add(values)
+        return stats
+
+    @property
+    def count(self) -> int:
+        """Number of (finite) values."""
+        return self.moments.count
+
+    @property
+    def needs_rebuild(self) -> bool:
+        """Whether removals have grown large enough to hurt quantile accuracy."""
+        return self.removed.count > STREAMING_REBUILD_FRACTION * max(self.count, 1)
+
+    def add(self, values):
+        """Add a batch of values."""
+        values = _finite(values)
+        self.moments.add(values)
+        self.sketch.add(values)
+
+    def remove(self, values):
+        """Remove a batch of values that were added before."""
+        values = _finite(values)
+        self.moments.remove(values)
+        self.removed.add(values)
+
+    def merge(self, other: StreamingStats):
+        """Combine with the statistics of another chunk."""
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+        self.removed.merge(other.removed)
+
+    def quantiles(self, probabilities: Sequence[float]) -> List[float]:
+        """Approximate quantiles of the current values."""
+        values, weights = self.sketch.weighted_samples()
+        if self.removed.count:
+            removed, removed_weights = self.removed.weighted_samples()
+            values = np.concatenate([values, removed])
+            weights = np.concatenate([weights, -removed_weights])
+        return weighted_quantiles(values, weights, probabilities)
+
+    def summary(self) -> Dict[str, float]:
+        """Current statistics, with the keys of descriptive_stats.describe().
+
+        Returns:
+            Statistics dict (empty without values)
+        """
+        m = self.moments
+        if m.count == 0:
+            return {}
+        order = {0.0: m.min, 1.0: m.max}
+        for p, q in zip(QUARTILES, self.quantiles(QUARTILES)):
+            order[p] = float(np.clip(q, m.min, m.max))
+        return summarize(m.count, m.mean, m.m2, m.m3, m.m4, order)
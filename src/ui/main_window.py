@@ -5,7 +5,8 @@ Single workspace containing multiple study tabs.
 """
 
 from PySide6.QtWidgets import (
-    QMainWindow, QTabWidget, QMessageBox, QInputDialog, QFileDialog, QTabBar
+    QMainWindow, QTabWidget, QMessageBox, QInputDialog, QFileDialog, QTabBar,
+    QProgressDialog, QApplication
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QAction
@@ -15,19 +16,23 @@ import numpy as np
 
 from .preferences_dialog import PreferencesDialog
 from .notification_manager import NotificationManager, ProgressNotification
+from .refresh_scheduler import RefreshScheduler
 from utils.lang import tr
 from constants import (
     MAIN_WINDOW_WIDTH, MAIN_WINDOW_HEIGHT,
-    APP_NAME, APP_VERSION, APP_DESCRIPTION
+    APP_NAME, APP_VERSION, APP_DESCRIPTION,
+    PLOT_DPI_OPTIONS, PLOT_EXPORT_DPI
 )
 from core.workspace import Workspace
 from core.study import Study
 from studies.data_table_study import DataTableStudy, ColumnType
 from studies.plot_study import PlotStudy
 from studies.statistics_study import StatisticsStudy
+from studies.batch_import import batch_import_csv, collect_import_files
+from studies.plot_export import export_workspace_plots, export_workspace_files
 from .widgets import DataTableWidget, ConstantsWidget, StatisticsWidget
 from .widgets.plot_widget import PlotWidget
-from .widgets.column_dialogs import CSVImportDialog
+from .widgets.column_dialogs import CSVImportDialog, BinaryImportDialog
 
 
 class MainWindow(QMainWindow):
@@ -49,6 +54,10 @@ class MainWindow(QMainWindow):
         # Notification manager
         self.notifications = None  # Initialized after UI setup
         
+        # Coalesces plot/statistics refreshes after data table edits
+        self.refresh_scheduler = RefreshScheduler(parent=self)
+        self._connect_workspace_events()
+        
         # Load preferences
         self.preferences = PreferencesDialog.get_settings()
         
@@ -123,6 +132,16 @@ class MainWindow(QMainWindow):
         export_excel_action.triggered.connect(self._export_to_excel)
         export_menu.addAction(export_excel_action)
         
+        export_menu.addSeparator()
+        
+        export_plots_action = QAction("Export All &Plots...", self)
+        export_plots_action.triggered.connect(self._export_all_plots)
+        export_menu.addAction(export_plots_action)
+        
+        batch_export_plots_action = QAction("Batch Export Workspace P&lots...", self)
+        batch_export_plots_action.triggered.connect(self._batch_export_workspace_plots)
+        export_menu.addAction(batch_export_plots_action)
+        
         import_menu = file_menu.addMenu("&Import")
         
         import_csv_action = QAction("Import from &CSV...", self)
@@ -130,10 +149,18 @@ class MainWindow(QMainWindow):
         import_csv_action.triggered.connect(self._import_from_csv)
         import_menu.addAction(import_csv_action)
         
+        batch_import_csv_action = QAction("Batch Import CSV &Folder...", self)
+        batch_import_csv_action.triggered.connect(self._batch_import_csv)
+        import_menu.addAction(batch_import_csv_action)
+        
         import_excel_action = QAction("Import from &Excel...", self)
         import_excel_action.triggered.connect(self._import_from_excel)
         import_menu.addAction(import_excel_action)
         
+        import_binary_action = QAction("Import from &Binary...", self)
+        import_binary_action.triggered.connect(self._import_from_binary)
+        import_menu.addAction(import_binary_action)
+        
         file_menu.addSeparator()
         
         # Save/Load
@@ -450,14 +477,30 @@ class MainWindow(QMainWindow):
         if isinstance(study, DataTableStudy):
             widget = DataTableWidget(study)
             self.study_tabs.addTab(widget, study.name)
-            # Connect dataChanged signal to refresh dependent widgets
-            widget.dataChanged.connect(self._on_data_table_changed)
         elif isinstance(study, PlotStudy):
             widget = PlotWidget(study, self.workspace)
             self.study_tabs.addTab(widget, study.name)
+            self._subscribe_view(widget)
         elif isinstance(study, StatisticsStudy):
             widget = StatisticsWidget(study, self)
+            widget.groupTableCreated.connect(self._add_group_table)
             self.study_tabs.addTab(widget, study.name)
+            self._subscribe_view(widget)
+    
+    def _subscribe_view(self, widget):
+        """Register a plot or statistics widget with the refresh scheduler.
+        
+        The widget is refreshed when a column its study declares (see
+        Study.get_dependencies) changes.
+        
+        Args:
+            widget: PlotWidget or StatisticsWidget
+        """
+        self.refresh_scheduler.subscribe(widget, widget.study.get_dependencies)
+    
+    def _connect_workspace_events(self):
+        """Forward column changes of the current workspace to the scheduler."""
+        self.workspace.events.subscribe(self.refresh_scheduler.invalidate)
     
     def _new_data_table(self):
         """Create new Data Table study."""
@@ -546,6 +589,17 @@ class MainWindow(QMainWindow):
                 # Switch to new study
                 self.study_tabs.setCurrentIndex(self.study_tabs.count() - 1)
     
+    def _add_group_table(self, study: DataTableStudy):
+        """Add a table of grouped statistics and switch to it."""
+        base_name, index = study.name, 2
+        while study.name in self.workspace.studies:
+            study.name = f"{base_name} ({index})"
+            index += 1
+        
+        self._add_study(study)
+        self.study_tabs.setCurrentIndex(self.study_tabs.count() - 1)
+        self.notifications.show_success(f"Data table '{study.name}' created")
+    
     def _new_variables_tab(self):
         """Create new Variables tab (only if one doesn't already exist)."""
         # Check if Constants & Functions tab already exists
@@ -582,9 +636,11 @@ class MainWindow(QMainWindow):
     def _on_variables_changed(self):
         """Handle variables changed signal."""
         # Recalculate all studies that use formulas
-        for study in self.workspace.studies.values():
-            if isinstance(study, DataTableStudy):
-                study.recalculate_all()
+        with self.workspace.events.batch():
+            for study in self.workspace.studies.values():
+                if isinstance(study, DataTableStudy):
+                    study.recalculate_all()
+                    study.publish_changes()
         
         # Refresh the Constants tab itself to show updated calculated values
         # Find Constants tab by searching all tabs
@@ -596,30 +652,6 @@ class MainWindow(QMainWindow):
         
         self.statusBar().showMessage("Constants updated, studies recalculated")
     
-    def _on_data_table_changed(self, study_name: str):
-        """Handle data table change to refresh dependent widgets.
-        
-        Args:
-            study_name: Name of the data table that changed
-        """
-        # Refresh all plot widgets that depend on this data table
-        for i in range(self.study_tabs.count()):
-            widget = self.study_tabs.widget(i)
-            
-            # Refresh PlotWidget if it references this data table
-            if isinstance(widget, PlotWidget):
-                if hasattr(widget.study, 'series'):
-                    for series in widget.study.series:
-                        if series.get('study_name') == study_name:
-                            widget.refresh()
-                            break
-            
-            # Refresh StatisticsWidget if it references this data table
-            elif isinstance(widget, StatisticsWidget):
-                if hasattr(widget.study, 'source_study_name'):
-                    if widget.study.source_study_name == study_name:
-                        widget.refresh()
-    
     def _close_study(self, index: int):
         """Close study tab.
         
@@ -693,6 +725,110 @@ class MainWindow(QMainWindow):
                     f"Failed to export: {str(e)}"
                 )
     
+    def _ask_plot_export_settings(self):
+        """Ask for image format and DPI of a plot export.
+        
+        Returns:
+            (format, dpi), or None if cancelled
+        """
+        image_format, ok = QInputDialog.getItem(
+            self, "Export Plots", "Format:", ["png", "svg", "pdf", "jpg"], 0, False
+        )
+        if not ok:
+            return None
+        dpi, ok = QInputDialog.getItem(
+            self, "Export Plots", "DPI (resolution):", PLOT_DPI_OPTIONS,
+            PLOT_DPI_OPTIONS.index(str(PLOT_EXPORT_DPI)), True
+        )
+        if not ok:
+            return None
+        try:
+            return image_format, int(dpi)
+        except ValueError:
+            QMessageBox.warning(self, "Export Plots", f"Invalid DPI: {dpi}")
+            return None
+    
+    def _run_plot_export(self, label: str, steps: int, export):
+        """Run a batch plot export with a progress dialog and report the result.
+        
+        Args:
+            label: Progress dialog text
+            steps: Number of progress steps
+            export: Called with a progress callback, returns a PlotExportResult
+        """
+        progress = QProgressDialog(label, "Cancel", 0, steps, self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        
+        def update_progress(done, total, name):
+            progress.setValue(done)
+            progress.setLabelText(f"Exported {done}/{total}: {Path(name).name}")
+            QApplication.processEvents()
+            return not progress.wasCanceled()
+        
+        try:
+            result = export(update_progress)
+        except Exception as e:
+            progress.close()
+            QMessageBox.critical(self, "Export Error", f"Failed to export plots: {str(e)}")
+            return
+        progress.close()
+        
+        self.statusBar().showMessage(f"Exported {result.succeeded} plot(s)")
+        if result.errors:
+            details = "\n".join(f"{name}: {error}" for name, error in list(result.errors.items())[:20])
+            if result.failed > 20:
+                details += f"\n... and {result.failed - 20} more"
+            QMessageBox.warning(
+                self,
+                "Export Plots",
+                f"{result.failed} plot(s) could not be exported:\n\n{details}"
+            )
+        elif result.succeeded:
+            self.notifications.show_success(f"Exported {result.succeeded} plot(s)")
+    
+    def _export_all_plots(self):
+        """Export every plot of the workspace to a folder (rendered off the GUI)."""
+        plots = [study for study in self.workspace.studies.values() if isinstance(study, PlotStudy)]
+        if not plots:
+            QMessageBox.information(self, "Export Plots", "The workspace has no plots.")
+            return
+        
+        directory = QFileDialog.getExistingDirectory(self, "Export All Plots")
+        settings = self._ask_plot_export_settings() if directory else None
+        if settings is None:
+            return
+        image_format, dpi = settings
+        
+        self._run_plot_export(
+            "Exporting plots...",
+            len(plots),
+            lambda progress: export_workspace_plots(
+                self.workspace, directory, format=image_format, dpi=dpi, progress_callback=progress
+            )
+        )
+    
+    def _batch_export_workspace_plots(self):
+        """Export the plots of many saved workspace files."""
+        files, _ = QFileDialog.getOpenFileNames(
+            self, "Select Workspaces", "", "DataManip Workspace (*.dmw);;JSON Files (*.json);;All Files (*)"
+        )
+        if not files:
+            return
+        directory = QFileDialog.getExistingDirectory(self, "Output Folder")
+        settings = self._ask_plot_export_settings() if directory else None
+        if settings is None:
+            return
+        image_format, dpi = settings
+        
+        self._run_plot_export(
+            f"Exporting plots of {len(files)} workspaces...",
+            len(files),
+            lambda progress: export_workspace_files(
+                files, directory, format=image_format, dpi=dpi, progress_callback=progress
+            )
+        )
+    
     def _export_to_excel(self):
         """Export current data table to Excel."""
         current_widget = self.study_tabs.currentWidget()
@@ -767,6 +903,96 @@ class MainWindow(QMainWindow):
                     f"Failed to import: {str(e)}"
                 )
     
+    def _batch_import_csv(self):
+        """Import every CSV file of a folder into its own data table."""
+        directory = QFileDialog.getExistingDirectory(self, "Batch Import CSV Folder")
+        if not directory:
+            return
+        
+        pattern, ok = QInputDialog.getText(
+            self,
+            "Batch Import CSV",
+            "File pattern:",
+            text="*.csv"
+        )
+        if not ok or not pattern:
+            return
+        
+        files = collect_import_files(directory, pattern)
+        if not files:
+            QMessageBox.information(
+                self,
+                "Batch Import CSV",
+                f"No files matching '{pattern}' in {directory}."
+            )
+            return
+        
+        try:
+            # One configuration, previewed on the first file, for the whole batch
+            dialog = CSVImportDialog(files[0], self)
+            dialog.setWindowTitle(f"Import {len(files)} CSV files")
+            if not dialog.exec():
+                return
+            settings = dialog.get_import_settings()
+            
+            # Optionally reuse the column setup of the current data table
+            template = None
+            current_widget = self.study_tabs.currentWidget()
+            if isinstance(current_widget, DataTableWidget) and current_widget.study.column_metadata:
+                reply = QMessageBox.question(
+                    self,
+                    "Column Template",
+                    f"Apply units and computed columns of '{current_widget.study.name}' to every imported table?",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    QMessageBox.StandardButton.No
+                )
+                if reply == QMessageBox.StandardButton.Yes:
+                    template = current_widget.study.column_metadata
+            
+            progress = QProgressDialog("Importing CSV files...", "Cancel", 0, len(files), self)
+            progress.setWindowModality(Qt.WindowModality.WindowModal)
+            progress.setMinimumDuration(0)
+            
+            def update_progress(done, total, filepath):
+                progress.setValue(done)
+                progress.setLabelText(f"Imported {done}/{total}: {Path(filepath).name}")
+                QApplication.processEvents()
+                return not progress.wasCanceled()
+            
+            result = batch_import_csv(
+                files,
+                settings,
+                workspace=self.workspace,
+                metadata_template=template,
+                max_undo_steps=self.preferences.get("max_undo_steps", 50),
+                on_study=self._add_study,
+                progress_callback=update_progress
+            )
+            progress.close()
+        except Exception as e:
+            QMessageBox.critical(
+                self,
+                "Import Error",
+                f"Failed to import: {str(e)}"
+            )
+            return
+        
+        self.statusBar().showMessage(f"Imported {result.succeeded} of {len(files)} files from {directory}")
+        if result.errors:
+            details = "\n".join(
+                f"{Path(filepath).name}: {error}"
+                for filepath, error in list(result.errors.items())[:20]
+            )
+            if result.failed > 20:
+                details += f"\n... and {result.failed - 20} more"
+            QMessageBox.warning(
+                self,
+                "Batch Import",
+                f"{result.failed} file(s) could not be imported:\n\n{details}"
+            )
+        elif result.succeeded:
+            self.notifications.show_success(f"Imported {result.succeeded} data tables")
+    
     def _import_from_excel(self):
         """Import data table from Excel."""
         filename, _ = QFileDialog.getOpenFileName(
@@ -803,6 +1029,48 @@ class MainWindow(QMainWindow):
                     f"Failed to import: {str(e)}"
                 )
     
+    def _import_from_binary(self):
+        """Import data table from a fixed-record binary file."""
+        filename, _ = QFileDialog.getOpenFileName(
+            self,
+            "Import from Binary",
+            "",
+            "Binary Files (*.bin *.dat *.raw);;All Files (*)"
+        )
+        
+        if filename:
+            try:
+                # Open binary import dialog to describe the record layout
+                dialog = BinaryImportDialog(filename, self)
+                
+                if dialog.exec():
+                    layout = dialog.get_layout()
+                    
+                    # Ask for study name
+                    import os
+                    default_name = os.path.splitext(os.path.basename(filename))[0]
+                    name, ok = QInputDialog.getText(
+                        self,
+                        "Import Binary",
+                        "Study name:",
+                        text=default_name
+                    )
+                    
+                    if ok and name:
+                        max_undo_steps = self.preferences.get("max_undo_steps", 50)
+                        study = DataTableStudy(name, workspace=self.workspace, max_undo_steps=max_undo_steps)
+                        study.import_from_binary(filename, layout)
+                        
+                        self._add_study(study)
+                        self.study_tabs.setCurrentIndex(self.study_tabs.count() - 1)
+                        self.statusBar().showMessage(f"Imported from {filename}")
+            except Exception as e:
+                QMessageBox.critical(
+                    self,
+                    "Import Error",
+                    f"Failed to import: {str(e)}"
+                )
+    
     def _rename_current_study(self):
         """Rename current study."""
         current_index = self.study_tabs.currentIndex()
@@ -901,6 +1169,7 @@ class MainWindow(QMainWindow):
             
             # Load new workspace
             self.workspace = Workspace.from_dict(data)
+            self._connect_workspace_events()
             self.setWindowTitle(f"{APP_NAME} v{APP_VERSION} - {self.workspace.name}")
             
             # Create tabs for each study
@@ -1003,17 +1272,17 @@ class MainWindow(QMainWindow):
             
             # Load workspace
             self.workspace = Workspace.from_dict(workspace_data)
+            self._connect_workspace_events()
             
             # Recreate study tabs
             for study_name, study in self.workspace.studies.items():
                 if isinstance(study, DataTableStudy):
                     widget = DataTableWidget(study)
                     self.study_tabs.addTab(widget, study.name)
-                    # Connect dataChanged signal
-                    widget.dataChanged.connect(self._on_data_table_changed)
                 elif isinstance(study, PlotStudy):
                     widget = PlotWidget(study, self.workspace)
                     self.study_tabs.addTab(widget, study.name)
+                    self._subscribe_view(widget)
             
             # Add variables tab
             self._new_variables_tab()
@@ -1193,6 +1462,8 @@ class MainWindow(QMainWindow):
                 description = undo_mgr.get_undo_description()
                 try:
                     undo_mgr.undo()
+                    if hasattr(widget.study, 'publish_changes'):
+                        widget.study.publish_changes()
                     self.notifications.show_info(f"Undone: {description}")
                     
                     # Update model display (no full recalculation needed)
@@ -1215,6 +1486,8 @@ class MainWindow(QMainWindow):
                 description = undo_mgr.get_redo_description()
                 try:
                     undo_mgr.redo()
+                    if hasattr(widget.study, 'publish_changes'):
+                        widget.study.publish_changes()
                     self.notifications.show_info(f"Redone: {description}")
                     
                     # Update model display (no full recalculation needed)
@@ -0,0 +1,127 @@
+"""
+Coalescing refresh scheduler for views that depend on data tables.
+
+Views subscribe with the (study, columns) they read (see
+Study.get_dependencies). Changes published on Workspace.events only mark
+matching views stale; a single-shot timer then refreshes each stale view
+once, however many edits arrived in the meantime. Views that are not
+visible (e.g. background tabs) stay stale and are refreshed when shown.
+"""
+
+from __future__ import annotations
+from typing import Callable, Dict, Iterable, Optional
+
+from PySide6.QtCore import QObject, QEvent, QTimer
+from PySide6.QtWidgets import QWidget
+
+from constants import REFRESH_INTERVAL_MS
+from core.event_bus import Dependencies, affects
+
+_SHOW_EVENT = QEvent.Type.Show
+
+
+class _Subscription:
+    """Dependencies and refresh callback of one view."""
+
+    __slots__ = ("dependencies", "callback", "stale")
+
+    def __init__(self, dependencies: Callable[[], Dependencies], callback: Callable[[], None]):
+        self.dependencies = dependencies
+        self.callback = callback
+        self.stale = False
+
+    def depends_on(self, study_name: str, columns: Optional[Iterable[str]]) -> bool:
+        """Whether a change to the given columns of a study affects the view."""
+        return affects(self.dependencies(), study_name, columns)
+
+
+class RefreshScheduler(QObject):
+    """Refreshes dependent views at most once per interval.
+
+    Attributes:
+        interval_ms: Time invalidations are collected before refreshing
+        refresh_count: Number of view refreshes performed
+    """
+
+    def __init__(self, interval_ms: int = REFRESH_INTERVAL_MS, parent: Optional[QObject] = None):
+        """Initialize scheduler.
+
+        Args:
+            interval_ms: Time invalidations are collected before refreshing
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.interval_ms = interval_ms
+        self.refresh_count = 0
+        self._subscriptions: Dict[QWidget, _Subscription] = {}
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+    def subscribe(self, view: QWidget, dependencies: Callable[[], Dependencies],
+                  callback: Optional[Callable[[], None]] = None):
+        """Refresh a view when data it reads changes.
+
+        Dependencies are queried on every invalidation, so views whose
+        inputs change (e.g. series added to a plot) stay up to date.
+
+        Args:
+            view: Dependent widget
+            dependencies: Returns {study name: column names or None}
+            callback: Refresh function (default: view.refresh)
+        """
+        if view not in self._subscriptions:
+            view.installEventFilter(self)
+            view.destroyed.connect(lambda *_, v=view: self._subscriptions.pop(v, None))
+        self._subscriptions[view] = _Subscription(dependencies, callback or view.refresh)
+
+    def unsubscribe(self, view: QWidget):
+        """Stop refreshing a view.
+
+        Args:
+            view: Dependent widget
+        """
+        if self._subscriptions.pop(view, None) is not None:
+            view.removeEventFilter(self)
+
+    def invalidate(self, study_name: str, columns: Optional[Iterable[str]] = None):
+        """Mark views reading changed data stale and schedule a refresh.
+
+        Args:
+            study_name: Study whose data changed
+            columns: Changed column names (None: any column may have changed)
+        """
+        columns = None if columns is None else set(columns)
+        for subscription in self._subscriptions.values():
+            if not subscription.stale and subscription.depends_on(study_name, columns):
+                subscription.stale = True
+                if not self._timer.isActive():
+                    self._timer.start(self.interval_ms)
+
+    def is_stale(self, view: QWidget) -> bool:
+        """Whether a view waits for a refresh."""
+        subscription = self._subscriptions.get(view)
+        return subscription is not None and subscription.stale
+
+    def flush(self):
+        """Refresh every stale visible view now."""
+        self._timer.stop()
+        for view, subscription in list(self._subscriptions.items()):
+            if subscription.stale and view.isVisible():
+                self._refresh(subscription)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Refresh a stale view when it is shown."""
+        if event.type() == _SHOW_EVENT:
+            subscription = self._subscriptions.get(watched)
+            if subscription is not None and subscription.stale:
+                # Refresh once the show has been processed
+                QTimer.singleShot(0, self.flush)
+        return False
+
+    def _refresh(self, subscription: _Subscription):
+        """Run a view's refresh callback."""
+        subscription.stale = False
+        self.refresh_count += 1
+        subscription.callback()
@@ -13,6 +13,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 
 from studies.data_table_study import ColumnType
+from core.binary_io import BinaryChannel, BinaryLayout
+from constants import BINARY_CHANNEL_DTYPES, BINARY_MAX_HEADER_BYTES
 from .shared.base_dialog import BaseDialog, BaseColumnDialog
 from .shared.dialog_utils import show_warning, show_info
 
@@ -610,3 +612,155 @@ class CSVImportDialog(BaseDialog):
             "header": None if header_row < 0 else header_row,
             "has_metadata": self.has_metadata_checkbox.isChecked()
         }
+
+
+class BinaryImportDialog(BaseDialog):
+    """Binary import dialog for describing a fixed-record file layout."""
+    
+    def __init__(self, filepath: str, parent=None):
+        import os
+        filename = os.path.basename(filepath)
+        
+        super().__init__(
+            title=f"Import Binary: {filename}",
+            description="Describe one record of the file. Channels are read in the order listed.",
+            parent=parent,
+            width=700,
+            height=500
+        )
+        
+        self.filepath = filepath
+        self.set_ok_button_text("Import")
+        
+        # Header size
+        self.header_spin = QSpinBox()
+        self.header_spin.setRange(0, BINARY_MAX_HEADER_BYTES)
+        self.header_spin.setSuffix(" bytes")
+        self.header_spin.setToolTip("Number of bytes to skip at the start of the file")
+        self.header_spin.valueChanged.connect(self._update_status)
+        self.add_form_row("Header Size:", self.header_spin)
+        
+        # Byte order
+        self.byte_order_combo = QComboBox()
+        self.byte_order_combo.addItem("Little-endian", "<")
+        self.byte_order_combo.addItem("Big-endian", ">")
+        self.byte_order_combo.currentIndexChanged.connect(self._update_status)
+        self.add_form_row("Byte Order:", self.byte_order_combo)
+        
+        # Channel table
+        self.add_widget(QLabel("<b>Channels</b>"))
+        
+        self.channel_table = QTableWidget(0, 5)
+        self.channel_table.setHorizontalHeaderLabels(["Name", "Type", "Scale", "Offset", "Unit"])
+        self.channel_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.channel_table.itemChanged.connect(self._update_status)
+        self.add_widget(self.channel_table, stretch=1)
+        
+        channel_buttons = QHBoxLayout()
+        add_btn = QPushButton("Add Channel")
+        add_btn.clicked.connect(lambda: self._add_channel_row())
+        channel_buttons.addWidget(add_btn)
+        
+        remove_btn = QPushButton("Remove Channel")
+        remove_btn.clicked.connect(self._remove_channel_row)
+        channel_buttons.addWidget(remove_btn)
+        channel_buttons.addStretch()
+        self.main_layout.insertLayout(self.main_layout.count() - 2, channel_buttons)
+        
+        # Status label
+        self.status_label = QLabel()
+        self.status_label.setWordWrap(True)
+        self.add_widget(self.status_label)
+        
+        self._add_channel_row("ch0")
+    
+    def _add_channel_row(self, name: str = "", dtype: str = "float32"):
+        """Append a channel row to the table."""
+        row = self.channel_table.rowCount()
+        if not name:
+            name = f"ch{row}"
+        
+        self.channel_table.blockSignals(True)
+        self.channel_table.insertRow(row)
+        self.channel_table.setItem(row, 0, QTableWidgetItem(name))
+        
+        dtype_combo = QComboBox()
+        dtype_combo.addItems(BINARY_CHANNEL_DTYPES)
+        dtype_combo.setCurrentText(dtype)
+        dtype_combo.currentIndexChanged.connect(self._update_status)
+        self.channel_table.setCellWidget(row, 1, dtype_combo)
+        
+        self.channel_table.setItem(row, 2, QTableWidgetItem("1.0"))
+        self.channel_table.setItem(row, 3, QTableWidgetItem("0.0"))
+        self.channel_table.setItem(row, 4, QTableWidgetItem(""))
+        self.channel_table.blockSignals(False)
+        
+        self._update_status()
+    
+    def _remove_channel_row(self):
+        """Remove the selected channel row (or the last one)."""
+        row = self.channel_table.currentRow()
+        if row < 0:
+            row = self.channel_table.rowCount() - 1
+        if row >= 0:
+            self.channel_table.removeRow(row)
+            self._update_status()
+    
+    def _cell_text(self, row: int, col: int) -> str:
+        """Get stripped text of a channel table cell."""
+        item = self.channel_table.item(row, col)
+        return item.text().strip() if item else ""
+    
+    def get_layout(self) -> BinaryLayout:
+        """Build the record layout from the dialog inputs.
+        
+        Raises:
+            ValueError: If a scale or offset is not a number
+        """
+        channels = []
+        for row in range(self.channel_table.rowCount()):
+            channels.append(BinaryChannel(
+                name=self._cell_text(row, 0),
+                dtype=self.channel_table.cellWidget(row, 1).currentText(),
+                scale=float(self._cell_text(row, 2) or 1.0),
+                offset=float(self._cell_text(row, 3) or 0.0),
+                unit=self._cell_text(row, 4) or None
+            ))
+        
+        return BinaryLayout(
+            channels=channels,
+            header_bytes=self.header_spin.value(),
+            byte_order=self.byte_order_combo.currentData()
+        )
+    
+    def _update_status(self):
+        """Show record size and number of records for the current layout."""
+        try:
+            layout = self.get_layout()
+            record_size = layout.record_size
+            count = layout.count_records(self.filepath)
+            self.status_label.setText(
+                f"<span style='color: green;'>✓ {record_size} bytes per record, "
+                f"{count} records × {len(layout.channels)} channels</span>"
+            )
+        except (ValueError, TypeError, OSError) as e:
+            self.status_label.setText(
+                f"<span style='color: red;'>✗ Invalid layout: {str(e)}</span>"
+            )
+    
+    def validate(self) -> bool:
+        """Validate channel names and record layout."""
+        try:
+            layout = self.get_layout()
+            if any(not ch.name for ch in layout.channels):
+                raise ValueError("Every channel needs a name")
+            layout.record_dtype()
+        except (ValueError, TypeError) as e:
+            show_warning(self, "Invalid Layout", str(e))
+            return False
+        
+        if layout.count_records(self.filepath) == 0:
+            show_warning(self, "Invalid Layout", "File contains no complete record for this layout.")
+            return False
+        
+        return True
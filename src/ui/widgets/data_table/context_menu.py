@@ -48,6 +48,22 @@ def show_data_table_context_menu(widget, position):
         
         menu.addSeparator()
         
+        # Sort/filter (display order only)
+        sort_asc_action = menu.addAction("Sort Ascending")
+        sort_asc_action.triggered.connect(lambda: widget._sort_by_column(index.column(), True))
+        
+        sort_desc_action = menu.addAction("Sort Descending")
+        sort_desc_action.triggered.connect(lambda: widget._sort_by_column(index.column(), False))
+        
+        filter_action = menu.addAction("Filter Rows...")
+        filter_action.triggered.connect(widget._filter_rows)
+        
+        if not widget.study.row_view.is_identity:
+            clear_view_action = menu.addAction("Clear Sort/Filter")
+            clear_view_action.triggered.connect(widget._clear_sort_filter)
+        
+        menu.addSeparator()
+        
         # Row actions
         insert_row_action = menu.addAction("Insert Row Above")
         insert_row_action.triggered.connect(lambda: widget._insert_row(index.row()))
@@ -2,15 +2,32 @@
 
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PySide6.QtGui import QFont
-from typing import Any
+from typing import Any, Dict, List, Optional, Tuple
 
 from studies.data_table_study import DataTableStudy, ColumnType
-from ..shared import format_cell_value, emit_full_model_update
-from constants import COLUMN_SYMBOLS
+from ..shared import format_cell_block, emit_full_model_update, get_display_precision
+from constants import COLUMN_SYMBOLS, TABLE_FORMAT_BLOCK_ROWS, TABLE_MAX_CHANGED_RECTS, TABLE_FETCH_BATCH_ROWS
+
+# Looking up Qt enum members is slow; data() is called per visible cell
+_DISPLAY_ROLE = Qt.DisplayRole  # type: ignore
+_EDIT_ROLE = Qt.EditRole  # type: ignore
 
 
 class DataTableModel(QAbstractTableModel):
-    """Qt model for DataTableStudy."""
+    """Qt model for DataTableStudy.
+    
+    Cell values are read from per-column NumPy arrays and display strings
+    are formatted a block of rows at a time. Both are cached per column
+    and dropped when the column version (see DataObject.column_version)
+    or the display precision changes.
+    
+    Rows are handed to views in batches of TABLE_FETCH_BATCH_ROWS through
+    canFetchMore()/fetchMore(), so opening a long table costs the same as
+    opening a short one.
+    
+    Rows are shown in the order of the study's row_view (sort/filter);
+    model rows are view rows and edits are written to the source rows.
+    """
     
     def __init__(self, study: DataTableStudy):
         """Initialize model.
@@ -20,12 +37,148 @@ class DataTableModel(QAbstractTableModel):
         """
         super().__init__()
         self.study = study
+        # {column name: ((version, view generation), precision, values, {block: strings})}
+        self._column_cache: Dict[str, tuple] = {}
+        self.modelReset.connect(self.invalidate_cache)
+        self.layoutChanged.connect(self.invalidate_cache)
+        
+        # Rows exposed to views so far (see fetchMore)
+        self._loaded_rows = min(len(study.row_view), TABLE_FETCH_BATCH_ROWS)
+        self.modelReset.connect(self._reset_loaded_rows)
+    
+    def invalidate_cache(self):
+        """Drop cached column arrays and formatted strings."""
+        self._column_cache.clear()
+    
+    def _reset_loaded_rows(self):
+        """Keep the rows loaded before a reset (at least one batch) loaded."""
+        self._loaded_rows = min(len(self.study.row_view), max(self._loaded_rows, TABLE_FETCH_BATCH_ROWS))
+    
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        """Check whether rows beyond the loaded ones exist."""
+        if parent.isValid():
+            return False
+        return self._loaded_rows < len(self.study.row_view)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        """Expose the next batch of rows to views."""
+        if parent.isValid():
+            return
+        count = min(len(self.study.row_view) - self._loaded_rows, TABLE_FETCH_BATCH_ROWS)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded_rows, self._loaded_rows + count - 1)
+        self._loaded_rows += count
+        self.endInsertRows()
+    
+    def rows_appended(self, n_old: int):
+        """Show rows appended to the table after its first n_old rows.
+        
+        Views only see loaded rows, so the append can be announced after
+        it happened. The rows are inserted right away only if all earlier
+        rows are loaded; otherwise they are fetched later. In a sorted or
+        filtered view they may land anywhere, so the model is reset.
+        
+        Args:
+            n_old: Number of table rows before the append
+        """
+        if not self.study.row_view.is_identity:
+            self.beginResetModel()
+            self.endResetModel()
+            return
+        
+        count = len(self.study.table.data) - n_old
+        if count > 0 and self._loaded_rows >= n_old:
+            self.beginInsertRows(QModelIndex(), n_old, n_old + count - 1)
+            self._loaded_rows += count
+            self.endInsertRows()
+    
+    def set_sort(self, keys: List[Tuple[str, bool]]):
+        """Sort view rows by (column, ascending) keys, see RowView.set_sort."""
+        self.beginResetModel()
+        try:
+            self.study.row_view.set_sort(keys)
+        finally:
+            self.endResetModel()
+    
+    def set_filter(self, expression: Optional[str]):
+        """Filter view rows by a boolean formula, see RowView.set_filter."""
+        self.beginResetModel()
+        try:
+            self.study.row_view.set_filter(expression)
+        finally:
+            self.endResetModel()
+    
+    def clear_view(self):
+        """Show all rows in table order."""
+        self.beginResetModel()
+        self.study.row_view.clear()
+        self.endResetModel()
+    
+    def emit_changes(self, changes: Dict[str, Tuple[int, int]]):
+        """Emit dataChanged for the changed rows of each column.
+        
+        Adjacent columns with the same row range share one rectangle. With
+        more than TABLE_MAX_CHANGED_RECTS rectangles the whole table is
+        updated instead.
+        
+        Args:
+            changes: Column name -> [start, stop) source row range
+        """
+        n = self.rowCount()
+        if not self.study.row_view.is_identity:
+            # Source ranges are scattered over a sorted/filtered view
+            changes = dict.fromkeys(changes, (0, n))
+        position = {name: i for i, name in enumerate(self.study.table.columns)}
+        spans = sorted(
+            (position[name], max(0, start), min(stop, n))
+            for name, (start, stop) in changes.items() if name in position
+        )
+        
+        rects = []
+        for col, start, stop in spans:
+            if stop <= start:
+                continue
+            if rects and rects[-1][1] == col - 1 and rects[-1][2:] == [start, stop]:
+                rects[-1][1] = col
+            else:
+                rects.append([col, col, start, stop])
+        
+        if len(rects) > TABLE_MAX_CHANGED_RECTS:
+            emit_full_model_update(self)
+            return
+        for first_col, last_col, start, stop in rects:
+            self.dataChanged.emit(self.index(start, first_col), self.index(stop - 1, last_col))
+    
+    def _column_entry(self, col_name: str) -> tuple:
+        """Get the cache entry of a column, rebuilding it if outdated."""
+        view = self.study.row_view
+        rows = view.index
+        version = (self.study.table.column_version(col_name), view.generation)
+        precision = get_display_precision()
+        entry = self._column_cache.get(col_name)
+        if entry is None or entry[0] != version or entry[1] != precision:
+            values = self.study.table.data[col_name].to_numpy()
+            entry = (version, precision, values if rows is None else values[rows], {})
+            self._column_cache[col_name] = entry
+        return entry
+    
+    def _display_text(self, col_name: str, row: int) -> str:
+        """Get the display string of a cell, formatting its whole row block."""
+        _, precision, values, blocks = self._column_entry(col_name)
+        block = row // TABLE_FORMAT_BLOCK_ROWS
+        text = blocks.get(block)
+        if text is None:
+            start = block * TABLE_FORMAT_BLOCK_ROWS
+            text = format_cell_block(values[start:start + TABLE_FORMAT_BLOCK_ROWS], precision)
+            blocks[block] = text
+        return text[row % TABLE_FORMAT_BLOCK_ROWS]
     
     def rowCount(self, parent=QModelIndex()) -> int:
-        """Get row count."""
+        """Get number of loaded rows."""
         if parent.isValid():
             return 0
-        return len(self.study.table.data)
+        return min(self._loaded_rows, len(self.study.row_view))
     
     def columnCount(self, parent=QModelIndex()) -> int:
         """Get column count."""
@@ -46,14 +199,15 @@ class DataTableModel(QAbstractTableModel):
         if not index.isValid():
             return None
         
-        value = self.study.table.data.iloc[index.row(), index.column()]
-        
-        if role == Qt.DisplayRole:  # type: ignore
+        if role == _DISPLAY_ROLE:
             # Format for display with limited precision
-            return format_cell_value(value)
+            col_name = self.study.table.data.columns[index.column()]
+            return self._display_text(col_name, index.row())
         
-        if role == Qt.EditRole:  # type: ignore
+        if role == _EDIT_ROLE:
             # Return full precision value for editing
+            col_name = self.study.table.data.columns[index.column()]
+            value = self._column_entry(col_name)[2][index.row()]
             if value is None or (isinstance(value, float) and value != value):  # NaN
                 return ""
             return str(value)
@@ -73,6 +227,8 @@ class DataTableModel(QAbstractTableModel):
         """
         if not index.isValid() or role != Qt.EditRole:  # type: ignore
             return False
+        if self.study.ring_buffer is not None:
+            return False
         
         col_name = self.study.table.columns[index.column()]
         
@@ -97,40 +253,21 @@ class DataTableModel(QAbstractTableModel):
             else:
                 value = float(value)
             
-            # Track undo for data edits
-            row = index.row()
-            col = index.column()
-            old_value = self.study.table.data.iloc[row, col]
+            row = int(self.study.row_view.source_rows(index.row()))
+            old_value = self.study.table.data.iloc[row, index.column()]
             
-            # Only track if value actually changed
+            # Only record if value actually changed; rapid edits are
+            # coalesced into one undo step
             if old_value != value:
-                from core.undo_manager import UndoAction, ActionType
-                
-                def undo_edit():
-                    self.study.table.data.iloc[row, col] = old_value
-                    self.study.on_data_changed(col_name)
-                    emit_full_model_update(self)
-                
-                def redo_edit():
-                    self.study.table.data.iloc[row, col] = value
-                    self.study.on_data_changed(col_name)
-                    emit_full_model_update(self)
-                
-                action = UndoAction(
-                    action_type=ActionType.MODIFY_DATA,
-                    undo_func=undo_edit,
-                    redo_func=redo_edit,
-                    description=f"Edit cell [{row+1}, {col_name}]"
+                changes = self.study.set_values(
+                    col_name, [row], [value],
+                    description=f"Edit cell [{row+1}, {col_name}]",
+                    merge_key="edit_cells"
                 )
-                self.study.undo_manager.push(action)
-            
-            self.study.table.data.iloc[row, col] = value
-            
-            # Trigger recalculation
-            self.study.on_data_changed(col_name)
-            
-            # Emit data changed for entire table (dependent columns may have changed)
-            emit_full_model_update(self)
+                # The cell and the rows of recalculated dependents
+                self.emit_changes(changes)
+            else:
+                self.dataChanged.emit(index, index)
             
             return True
         except (ValueError, TypeError):
@@ -163,8 +300,9 @@ class DataTableModel(QAbstractTableModel):
                         header += f" [{unit}]"
                     
                     return header
-            else:
-                return str(section + 1)
+            elif section < self.rowCount():
+                # Source row number (differs from section in sorted/filtered views)
+                return str(int(self.study.row_view.source_rows(section)) + 1)
         
         # Bold font for headers
         if role == Qt.FontRole and orientation == Qt.Horizontal:  # type: ignore
@@ -239,6 +377,10 @@ class DataTableModel(QAbstractTableModel):
         
         flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable  # type: ignore
         
+        # Ring-buffered tables are live windows overwritten by append()
+        if self.study.ring_buffer is not None:
+            return flags
+        
         # Data columns are always editable
         # Uncertainty columns are editable only if manually created (not auto-propagated)
         if col_type == ColumnType.DATA:
@@ -2,7 +2,10 @@
 
 from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtWidgets import QApplication
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+from io import StringIO
+import csv
+import numpy as np
 import pandas as pd
 
 from ..shared import show_warning
@@ -44,64 +47,78 @@ def _get_selected_cells(widget) -> List[Tuple[int, int]]:
     return [(index.row(), index.column()) for index in selection]
 
 
+def _get_selection_rect(widget) -> Optional[Tuple[int, int, np.ndarray]]:
+    """Get the bounding rectangle of the selection and the selected cells in it.
+    
+    Reads the selection ranges instead of one index per cell.
+    
+    Args:
+        widget: DataTableWidget instance
+        
+    Returns:
+        Tuple of (top row, left column, boolean mask of selected cells),
+        or None if nothing is selected
+    """
+    ranges = [
+        (r.top(), r.left(), r.bottom(), r.right())
+        for r in widget.view.selectionModel().selection() if r.isValid()
+    ]
+    if not ranges:
+        return None
+    
+    top = min(r[0] for r in ranges)
+    left = min(r[1] for r in ranges)
+    mask = np.zeros((max(r[2] for r in ranges) - top + 1, max(r[3] for r in ranges) - left + 1), dtype=bool)
+    for r_top, r_left, r_bottom, r_right in ranges:
+        mask[r_top - top:r_bottom - top + 1, r_left - left:r_right - left + 1] = True
+    return top, left, mask
+
+
 def _on_copy(widget):
     """Handle copy operation (Ctrl+C).
     
     Args:
         widget: DataTableWidget instance
     """
-    selection = _get_selected_cells(widget)
-    if not selection:
+    rect = _get_selection_rect(widget)
+    if rect is None:
         return
     
     # Convert selection to TSV format
-    tsv_data = _selection_to_tsv(widget, selection)
+    tsv_data = _selection_to_tsv(widget, *rect)
     if tsv_data:
         clipboard = QApplication.clipboard()
         clipboard.setText(tsv_data)
 
 
-def _selection_to_tsv(widget, selection: List[Tuple[int, int]]) -> str:
-    """Convert selection to TSV format.
+def _selection_to_tsv(widget, top: int, left: int, mask: np.ndarray) -> str:
+    """Convert selected cells to TSV format at full precision.
+    
+    The bounding rectangle is taken from the table in one go (through the
+    row view, if sorted or filtered) and written by a single to_csv call.
+    Rows without selected cells are left out and unselected cells inside
+    the rectangle are empty.
     
     Args:
         widget: DataTableWidget instance
-        selection: List of (row, col) tuples
+        top: First selected row
+        left: First selected column
+        mask: Selected cells of the rectangle starting at (top, left)
         
     Returns:
         TSV-formatted string
     """
-    if not selection:
+    n_rows = min(mask.shape[0], len(widget.study.row_view) - top)
+    rows = widget.study.row_view.source_rows(np.arange(top, top + max(n_rows, 0)))
+    block = widget.study.table.data.iloc[rows, left:left + mask.shape[1]]
+    mask = mask[:block.shape[0], :block.shape[1]]
+    if block.empty:
         return ""
     
-    # Group by row
-    rows_dict = {}
-    for row, col in selection:
-        if row not in rows_dict:
-            rows_dict[row] = {}
-        rows_dict[row][col] = (row, col)
-    
-    # Build TSV output
-    lines = []
-    for row in sorted(rows_dict.keys()):
-        cols_dict = rows_dict[row]
-        min_col = min(cols_dict.keys())
-        max_col = max(cols_dict.keys())
-        
-        # Build line with all columns in range
-        values = []
-        for col in range(min_col, max_col + 1):
-            if col < len(widget.study.table.columns):
-                col_name = widget.study.table.columns[col]
-                if col in cols_dict and row < len(widget.study.table.data):
-                    value = widget.study.table.data[col_name].iloc[row]
-                    values.append(str(value) if pd.notna(value) else "")
-                else:
-                    values.append("")
-        
-        lines.append("\t".join(values))
+    if not mask.all():
+        block = block.where(mask)[mask.any(axis=1)]
     
-    return "\n".join(lines)
+    return block.to_csv(sep="\t", header=False, index=False, lineterminator="\n").rstrip("\n")
 
 
 def _on_paste(widget):
@@ -115,21 +132,58 @@ def _on_paste(widget):
     if not tsv_data:
         return
     
-    selection = _get_selected_cells(widget)
-    if not selection:
+    rect = _get_selection_rect(widget)
+    if rect is None:
         return
     
-    # Get top-left of selection
-    start_row = min(row for row, col in selection)
-    start_col = min(col for row, col in selection)
+    # Paste at top-left of selection
+    start_row, start_col, _ = rect
+    try:
+        _paste_tsv(widget, tsv_data, start_row, start_col)
+    except pd.errors.ParserError as e:
+        show_warning(widget, "Paste Error", f"Clipboard text could not be read as a table:\n{e}")
+
+
+def _parse_tsv(tsv_data: str) -> pd.DataFrame:
+    """Parse tab-separated text into a frame of cell values.
+    
+    Numbers become floats and empty cells NaN; columns with other text
+    keep it as strings. Quotes and text such as "NA" are taken literally.
+    Short lines are padded with empty cells.
     
-    # Parse and paste TSV data
-    _paste_tsv(widget, tsv_data, start_row, start_col)
+    Args:
+        tsv_data: Tab-separated values
+        
+    Returns:
+        DataFrame with one column per field, numbered from 0
+    """
+    text = tsv_data.strip("\r\n")
+    if not text:
+        return pd.DataFrame()
+    
+    n_fields = 1 + max(line.count("\t") for line in text.split("\n"))
+    block = pd.read_csv(
+        StringIO(text), sep="\t", header=None, names=range(n_fields),
+        skip_blank_lines=False, skipinitialspace=True,
+        # '""' is how to_csv() writes an empty single-column row
+        quoting=csv.QUOTE_NONE, keep_default_na=False, na_values=["", '""']
+    )
+    
+    for col in block.columns:
+        if pd.api.types.is_object_dtype(block[col]) or pd.api.types.is_string_dtype(block[col]):
+            numeric = pd.to_numeric(block[col], errors="coerce")
+            is_text = block[col].notna() & numeric.isna() & (block[col].str.strip() != "")
+            block[col] = numeric.astype(object).where(~is_text, block[col]) if is_text.any() else numeric
+    return block
 
 
 def _paste_tsv(widget, tsv_data: str, start_row: int, start_col: int):
     """Paste TSV data into table.
     
+    The text is parsed in one pass and each target column is written as
+    one slice; the whole paste is a single set_block call, so dependents
+    are recalculated once and it is recorded as one undo step.
+    
     Args:
         widget: DataTableWidget instance
         tsv_data: Tab-separated values
@@ -137,83 +191,39 @@ def _paste_tsv(widget, tsv_data: str, start_row: int, start_col: int):
         start_col: Starting column
     """
     from studies.data_table_study import ColumnType
-    from core.undo_manager import UndoAction, ActionType
-    
-    lines = tsv_data.strip().split('\n')
-    errors = []
-    
-    # Track old values for undo
-    old_values = {}
-    new_values = {}
-    affected_columns = set()
-    
-    for row_offset, line in enumerate(lines):
-        values = line.split('\t')
-        for col_offset, value in enumerate(values):
-            target_row = start_row + row_offset
-            target_col = start_col + col_offset
-            
-            # Check bounds
-            if target_row >= len(widget.study.table.data):
-                continue
-            if target_col >= len(widget.study.table.columns):
-                continue
-            
-            col_name = widget.study.table.columns[target_col]
-            
-            # Skip non-editable columns
-            if col_name in widget.study.column_metadata:
-                col_type = widget.study.column_metadata[col_name].get("type", "data")
-                if col_type != ColumnType.DATA:
-                    continue
-            
-            # Save old value for undo
-            old_val = widget.study.table.data.iloc[target_row, target_col]
-            old_values[(target_row, target_col, col_name)] = old_val
-            affected_columns.add(col_name)
-            
-            # Set value
-            try:
-                if value.strip() == "":
-                    new_val = pd.NA
-                else:
-                    # Try to convert to appropriate type
-                    try:
-                        new_val = float(value)
-                    except ValueError:
-                        new_val = value
-                
-                widget.study.table.data.loc[target_row, col_name] = new_val
-                new_values[(target_row, target_col, col_name)] = new_val
-            except Exception as e:
-                errors.append(f"Row {target_row}, Col {col_name}: {str(e)}")
-    
-    # Create undo action for paste
-    if old_values:
-        def undo_paste():
-            for (row, col, col_name), old_val in old_values.items():
-                widget.study.table.data.iloc[row, col] = old_val
-            widget._refresh_data(affected_columns)
-        
-        def redo_paste():
-            for (row, col, col_name), new_val in new_values.items():
-                widget.study.table.data.loc[row, col_name] = new_val
-            widget._refresh_data(affected_columns)
-        
-        cell_count = len(old_values)
-        action = UndoAction(
-            action_type=ActionType.MODIFY_DATA,
-            undo_func=undo_paste,
-            redo_func=redo_paste,
+    
+    block = _parse_tsv(tsv_data)
+    
+    # Clip to the table
+    n_rows = min(len(block), len(widget.study.row_view) - start_row)
+    columns = widget.study.table.columns[start_col:start_col + block.shape[1]]
+    if n_rows <= 0:
+        return
+    
+    # {col_name: (rows, values)} for editable columns only
+    rows = widget.study.row_view.source_rows(np.arange(start_row, start_row + n_rows))
+    changes = {}
+    for offset, col_name in enumerate(columns):
+        col_type = widget.study.column_metadata.get(col_name, {}).get("type", "data")
+        if col_type != ColumnType.DATA:
+            continue
+        changes[col_name] = (rows, block.iloc[:n_rows, offset].to_numpy())
+    
+    if not changes:
+        return
+    
+    cell_count = n_rows * len(changes)
+    try:
+        changes = widget.study.set_block(
+            changes,
             description=f"Paste {cell_count} cell{'s' if cell_count > 1 else ''}"
         )
-        widget.study.undo_manager.push(action)
+    except Exception as e:
+        show_warning(widget, "Paste Warnings", f"Cells could not be pasted:\n{e}")
+        changes = None
     
-    # Refresh view (incremental update)
-    widget._refresh_data(affected_columns)
-    
-    if errors:
-        show_warning(widget, "Paste Warnings", f"Some cells could not be pasted:\n" + "\n".join(errors[:5]))
+    # Refresh view (dependents were recalculated by set_block)
+    widget._refresh_data(changes=changes)
 
 
 def _on_cut(widget):
@@ -233,17 +243,15 @@ def _on_delete(widget):
         widget: DataTableWidget instance
     """
     from studies.data_table_study import ColumnType
-    from core.undo_manager import UndoAction, ActionType
     
     selection = _get_selected_cells(widget)
     if not selection:
         return
     
-    # Track old values for undo
-    old_values = {}
-    affected_columns = set()
+    # Rows to clear per column
+    changes = {}
+    cell_count = 0
     
-    # Clear selected cells
     for row, col in selection:
         if col >= len(widget.study.table.columns):
             continue
@@ -256,35 +264,19 @@ def _on_delete(widget):
             if col_type != ColumnType.DATA:
                 continue
         
-        # Save old value for undo
-        if row < len(widget.study.table.data):
-            old_val = widget.study.table.data.iloc[row, col]
-            old_values[(row, col, col_name)] = old_val
-            affected_columns.add(col_name)
-            
-            # Clear value
-            widget.study.table.data.loc[row, col_name] = pd.NA
-    
-    # Create undo action for delete
-    if old_values:
-        def undo_delete():
-            for (row, col, col_name), old_val in old_values.items():
-                widget.study.table.data.iloc[row, col] = old_val
-            widget._refresh_data(affected_columns)
-        
-        def redo_delete():
-            for (row, col, col_name), _ in old_values.items():
-                widget.study.table.data.loc[row, col_name] = pd.NA
-            widget._refresh_data(affected_columns)
-        
-        cell_count = len(old_values)
-        action = UndoAction(
-            action_type=ActionType.MODIFY_DATA,
-            undo_func=undo_delete,
-            redo_func=redo_delete,
+        if row < len(widget.study.row_view):
+            changes.setdefault(col_name, ([], None))[0].append(row)
+            cell_count += 1
+    
+    # View rows -> source rows
+    for col_name, (rows, _) in changes.items():
+        changes[col_name] = (widget.study.row_view.source_rows(rows), None)
+    
+    if changes:
+        changes = widget.study.set_block(
+            changes,
             description=f"Delete {cell_count} cell{'s' if cell_count > 1 else ''}"
         )
-        widget.study.undo_manager.push(action)
     
-    # Refresh view (incremental update)
-    widget._refresh_data(affected_columns)
+    # Refresh view (dependents were recalculated by set_block)
+    widget._refresh_data(changes=changes)
@@ -2,25 +2,33 @@
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QTableView, QHeaderView, QToolBar,
-    QPushButton, QMenu, QInputDialog, QApplication
+    QPushButton, QMenu, QInputDialog, QFileDialog
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QAction, QKeySequence, QShortcut
 from typing import Tuple, List, Optional
+import numpy as np
 import pandas as pd
 
 from studies.data_table_study import DataTableStudy, ColumnType
-from ..shared import show_error, show_warning, confirm_action, validate_column_name, emit_full_model_update
+from ..shared import (
+    show_error, show_warning, confirm_action, validate_column_name,
+    emit_full_model_update, format_cell_block, get_display_precision
+)
 from ..column_dialogs import (
     AddDataColumnDialog,
     AddCalculatedColumnDialog,
     AddDerivativeColumnDialog,
-    AddRangeColumnDialog
+    AddRangeColumnDialog,
+    CSVImportDialog
 )
 
 from .model import DataTableModel
 from .header import EditableHeaderView
-from constants import COLUMN_SYMBOLS, TABLE_ROW_HEIGHT
+from constants import (
+    COLUMN_SYMBOLS, TABLE_ROW_HEIGHT, TABLE_RESIZE_SAMPLE_ROWS,
+    FOLLOW_POLL_INTERVAL_MS
+)
 
 
 class DataTableWidget(QWidget):
@@ -34,7 +42,7 @@ class DataTableWidget(QWidget):
     """
     
     # Signal emitted when data changes (for plot/statistics updates)
-    dataChanged = Signal(str)  # Emits study name
+    dataChanged = Signal(str, object)  # Emits study name, changed columns (None: any)
     
     def __init__(self, study: DataTableStudy):
         """Initialize widget.
@@ -66,6 +74,8 @@ class DataTableWidget(QWidget):
         
         self.view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)  # type: ignore
         self.view.horizontalHeader().setStretchLastSection(True)  # type: ignore
+        # Uniform row height: the view never measures rows one by one
+        self.view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)  # type: ignore
         self.view.verticalHeader().setDefaultSectionSize(TABLE_ROW_HEIGHT)
         self.view.setAlternatingRowColors(True)  # Better readability
         self.view.setContextMenuPolicy(Qt.CustomContextMenu)  # type: ignore
@@ -76,6 +86,12 @@ class DataTableWidget(QWidget):
         
         # Setup keyboard shortcuts
         self._setup_shortcuts()
+        
+        # Follow mode: poll the followed file (dependent view refreshes are
+        # coalesced by the main window's RefreshScheduler)
+        self._follow_timer = QTimer(self)
+        self._follow_timer.setInterval(FOLLOW_POLL_INTERVAL_MS)
+        self._follow_timer.timeout.connect(self._poll_follow)
     
     def _create_toolbar(self) -> QToolBar:
         """Create toolbar.
@@ -150,6 +166,13 @@ class DataTableWidget(QWidget):
         
         toolbar.addSeparator()
         
+        # Live data
+        self.follow_action = QAction("Follow File", self)
+        self.follow_action.setCheckable(True)
+        self.follow_action.setToolTip("Append rows as they are written to a CSV file")
+        self.follow_action.toggled.connect(self._toggle_follow)
+        toolbar.addAction(self.follow_action)
+        
         return toolbar
     
     def _get_context(self, exclude_column: Optional[str] = None) -> Tuple[List[str], List[str]]:
@@ -173,37 +196,45 @@ class DataTableWidget(QWidget):
             available_vars = []
         return available_cols, available_vars
     
-    def _refresh_data(self, changed_columns: set = None):
+    def _refresh_data(self, changed_columns: set = None, changes: dict = None):
         """Refresh after data changes (incremental update).
         
         Use for: cell edits, paste, fill, delete cell values.
-        Only recalculates dependent columns (fast).
+        Only recalculates dependent columns (fast) and only emits
+        dataChanged for what changed. Without arguments the whole
+        table is updated.
         
         Args:
             changed_columns: Column names that changed (or empty set if no formulas affected)
+            changes: Already applied changes, column name -> [start, stop)
+                row range (as returned by DataTableStudy.set_block)
         """
-        if changed_columns is None:
-            changed_columns = set()
-        
-        # Mark columns dirty (if any)
-        for col_name in changed_columns:
-            self.study.mark_dirty(col_name)
+        if changed_columns is None and changes is None:
+            emit_full_model_update(self.model)
+            self._notify_changed()
+            return
         
-        # Recalculate only affected columns (uses dependency tracking)
+        changes = dict(changes or {})
         if changed_columns:
-            self.study._recalculate_dirty_columns()
-        
-        # Emit dataChanged for cell range (NOT layoutChanged - faster)
-        if len(self.study.table.data) > 0 and len(self.study.table.columns) > 0:
-            top_left = self.model.index(0, 0)
-            bottom_right = self.model.index(
-                len(self.study.table.data) - 1,
-                len(self.study.table.columns) - 1
-            )
-            self.model.dataChanged.emit(top_left, bottom_right)
+            # Mark columns dirty and recalculate only affected columns
+            for col_name in changed_columns:
+                self.study.mark_dirty(col_name)
+            recalculated = self.study._recalculate_dirty_columns()
+            
+            n = len(self.study.table.data)
+            for col_name in set(changed_columns) | recalculated:
+                changes[col_name] = (0, n)
+        
+        # Emit dataChanged for changed ranges (NOT layoutChanged - faster)
+        self.model.emit_changes(changes)
         
         # Notify other widgets
-        self.dataChanged.emit(self.study.name)
+        self._notify_changed()
+    
+    def _notify_changed(self):
+        """Publish changed columns to dependent studies and emit dataChanged."""
+        changed = self.study.publish_changes()
+        self.dataChanged.emit(self.study.name, None if changed is None else sorted(changed))
     
     def _refresh_structure(self):
         """Refresh after structural changes (full reset).
@@ -214,7 +245,7 @@ class DataTableWidget(QWidget):
         self.model.beginResetModel()
         self.study.recalculate_all()
         self.model.endResetModel()
-        self.dataChanged.emit(self.study.name)
+        self._notify_changed()
     
     def _refresh_batch(self):
         """Refresh after batch operations (full reset).
@@ -225,7 +256,68 @@ class DataTableWidget(QWidget):
         self.model.beginResetModel()
         self.study.recalculate_all()
         self.model.endResetModel()
-        self.dataChanged.emit(self.study.name)
+        self._notify_changed()
+    
+    def _toggle_follow(self, checked: bool):
+        """Start or stop following a CSV file."""
+        if not checked:
+            self._follow_timer.stop()
+            self.study.stop_follow()
+            return
+        
+        filename, _ = QFileDialog.getOpenFileName(self, "Follow CSV File", "", "CSV Files (*.csv);;All Files (*)")
+        dialog = CSVImportDialog(filename, self) if filename else None
+        if dialog is None or not dialog.exec():
+            self.follow_action.setChecked(False)
+            return
+        
+        try:
+            self.model.beginResetModel()
+            try:
+                self.study.follow_file(filename, **dialog.get_import_settings())
+            finally:
+                self.model.endResetModel()
+        except Exception as e:
+            self.follow_action.setChecked(False)
+            show_error(self, "Follow Error", f"Failed to read file: {str(e)}")
+            return
+        
+        self._notify_changed()
+        self._follow_timer.start()
+    
+    def _poll_follow(self):
+        """Show rows the study read from the followed file since the last poll."""
+        if self.study.follower is None:
+            self.follow_action.setChecked(False)
+            return
+        
+        scrollbar = self.view.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        n_old = len(self.study.table.data)
+        
+        try:
+            first_changed = self.study.poll_follow()
+        except Exception as e:
+            self.follow_action.setChecked(False)
+            show_error(self, "Follow Error", f"Failed to read file: {str(e)}")
+            return
+        
+        if first_changed is None:
+            return
+        
+        if self.study.follower.truncated:
+            self.model.beginResetModel()
+            self.model.endResetModel()
+        else:
+            self.model.rows_appended(n_old)
+            
+            # Derivatives and aggregate formulas also change earlier rows
+            if first_changed < n_old:
+                self.model.emit_changes({name: (first_changed, n_old) for name in self.study.table.columns})
+        
+        if at_bottom:
+            self.view.scrollToBottom()
+        self._notify_changed()
     
     def _add_row(self):
         """Add row to table."""
@@ -233,13 +325,55 @@ class DataTableWidget(QWidget):
         self._refresh_batch()  # Batch operation - full reset
     
     def _auto_resize_columns(self):
-        """Auto-resize all columns to fit content."""
-        self.view.resizeColumnsToContents()
-        # Ensure minimum width for readability
-        for col in range(self.model.columnCount()):
-            width = self.view.columnWidth(col)
-            if width < 60:
-                self.view.setColumnWidth(col, 60)
+        """Auto-resize all columns to fit content.
+        
+        Widths are measured on at most TABLE_RESIZE_SAMPLE_ROWS rows spread
+        over the table (first and last rows included), so resizing costs
+        the same for any table length.
+        """
+        n = len(self.study.table.data)
+        rows = np.unique(np.linspace(0, n - 1, min(n, TABLE_RESIZE_SAMPLE_ROWS)).astype(np.int64))
+        metrics = self.view.fontMetrics()
+        header = self.view.horizontalHeader()
+        precision = get_display_precision()
+        
+        for col, col_name in enumerate(self.study.table.columns):
+            values = self.study.table.data[col_name].to_numpy()[rows]
+            texts = format_cell_block(values, precision)
+            # Cell text plus margins, at least the header width
+            width = max([header.sectionSizeHint(col)] + [metrics.horizontalAdvance(text) + 12 for text in texts])
+            # Ensure minimum width for readability
+            self.view.setColumnWidth(col, max(width, 60))
+    
+    def _sort_by_column(self, col_index: int, ascending: bool = True):
+        """Sort displayed rows by a column (table rows are not moved).
+        
+        Args:
+            col_index: Column index
+            ascending: Sort order
+        """
+        col_name = self.study.table.columns[col_index]
+        self.model.set_sort([(col_name, ascending)])
+    
+    def _filter_rows(self):
+        """Ask for a filter formula and show only the rows matching it."""
+        text, ok = QInputDialog.getText(
+            self,
+            "Filter Rows",
+            "Show rows where (e.g. ({x} > 0) & ({y} < 5)):",
+            text=self.study.row_view.filter_expression or ""
+        )
+        if not ok:
+            return
+        
+        try:
+            self.model.set_filter(text)
+        except Exception as e:
+            show_error(self, "Filter Error", f"Invalid filter: {str(e)}")
+    
+    def _clear_sort_filter(self):
+        """Show all rows in table order."""
+        self.model.clear_view()
     
     def _toggle_uncertainty_columns(self):
         """Toggle visibility of uncertainty columns."""
@@ -479,6 +613,7 @@ class DataTableWidget(QWidget):
         Args:
             row: Row index
         """
+        row = int(self.study.row_view.source_rows(row))
         if confirm_action(self, "Confirm Delete", f"Delete row {row + 1}?"):
             self.study.remove_rows([row])
             self._refresh_batch()  # Batch operation - full reset
@@ -521,72 +656,20 @@ class DataTableWidget(QWidget):
         if not selected:
             return
         
-        rows = sorted([idx.row() for idx in selected], reverse=True)
+        rows = sorted(self.study.row_view.source_rows([idx.row() for idx in selected]).tolist(), reverse=True)
         if confirm_action(self, "Confirm Delete", f"Delete {len(rows)} row(s)?"):
             self.study.remove_rows(rows)
             self._refresh_batch()  # Batch operation - full reset
     
     def _copy_selection(self):
         """Copy selected cells to clipboard."""
-        selection = self.view.selectionModel().selectedIndexes()
-        if not selection:
-            return
-        
-        # Group by row
-        rows = {}
-        for index in selection:
-            row = index.row()
-            if row not in rows:
-                rows[row] = []
-            rows[row].append((index.column(), index.data()))
-        
-        # Build tab-separated text
-        lines = []
-        for row in sorted(rows.keys()):
-            cols = sorted(rows[row])
-            line = "\t".join(str(val) for _, val in cols)
-            lines.append(line)
-        
-        text = "\n".join(lines)
-        QApplication.clipboard().setText(text)
+        from .shortcuts import _on_copy
+        _on_copy(self)
     
     def _paste_data(self):
         """Paste from clipboard into selected cells."""
-        selection = self.view.selectionModel().selectedIndexes()
-        if not selection:
-            return
-        
-        # Get clipboard text
-        text = QApplication.clipboard().text()
-        if not text:
-            return
-        
-        # Parse tab/newline separated data
-        lines = text.strip().split('\n')
-        start_row = selection[0].row()
-        start_col = selection[0].column()
-        
-        try:
-            for row_offset, line in enumerate(lines):
-                values = line.split('\t')
-                for col_offset, value in enumerate(values):
-                    row = start_row + row_offset
-                    col = start_col + col_offset
-                    
-                    if row < self.model.rowCount() and col < self.model.columnCount():
-                        col_name = self.study.table.columns[col]
-                        # Only paste into DATA columns
-                        if self.study.get_column_type(col_name) == ColumnType.DATA:
-                            try:
-                                numeric_value = float(value) if value else None
-                                self.study.table.data.at[row, col_name] = numeric_value
-                            except (ValueError, TypeError):
-                                pass  # Skip non-numeric values
-            
-            # Refresh display
-            self._refresh_table()
-        except Exception as e:
-            show_error(self, "Paste Error", f"Failed to paste data: {str(e)}")
+        from .shortcuts import _on_paste
+        _on_paste(self)
     
     def _setup_shortcuts(self):
         """Setup keyboard shortcuts for clipboard operations."""
@@ -679,21 +762,20 @@ class DataTableWidget(QWidget):
             show_warning(self, "Invalid Value", f"'{value_str}' is not a valid number.")
             return
         
-        # Fill cells
+        # Fill cells (one vectorized write, one undo step)
         if selected_radio.isChecked():
             # Fill selected cells only
-            for idx in selection:
-                row = idx.row()
-                self.study.table.data.iloc[row, col_idx] = value
+            rows = self.study.row_view.source_rows([idx.row() for idx in selection])
         else:
             # Fill entire column
-            self.study.table.data.iloc[:, col_idx] = value
+            rows = range(len(self.study.table.data))
+        scope_text = f"{len(selection)} cells" if selected_radio.isChecked() else "entire column"
+        changes = self.study.set_values(col_name, rows, value, description=f"Fill {scope_text} of '{col_name}'")
         
-        # Mark dependent columns as dirty and recalculate
-        self._refresh_data({col_name})  # Data change - incremental update
+        # Dependent columns were recalculated by set_values
+        self._refresh_data(changes=changes)
         
         # Show confirmation
-        scope_text = f"{len(selection)} cells" if selected_radio.isChecked() else "entire column"
         from ..shared import show_info
         show_info(self, "Fill Complete", f"Filled {scope_text} with value {value}")
     
@@ -12,9 +12,11 @@ from PySide6.QtWidgets import (
     QComboBox, QLabel, QFormLayout, QLineEdit, QDialogButtonBox,
     QListWidget, QListWidgetItem, QCheckBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
-from constants import PLOT_DPI_OPTIONS
+from constants import (
+    PLOT_DPI_OPTIONS, PLOT_REDECIMATE_DELAY_MS, PLOT_DENSITY_COLORMAP, PLOT_DENSITY_COLORMAPS
+)
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
 from matplotlib.figure import Figure
@@ -29,6 +31,7 @@ class PlotWidget(QWidget):
     - Matplotlib canvas with toolbar
     - Add/remove series dialog
     - Auto-refresh on data changes
+    - Decimated series re-sampled and density images re-binned after zoom/pan
     """
     
     def __init__(self, study: PlotStudy, workspace):
@@ -42,6 +45,12 @@ class PlotWidget(QWidget):
         self.study = study
         self.workspace = workspace
         
+        # Zoom/pan fires many limit changes: decimate once they settle
+        self._redecimate_timer = QTimer(self)
+        self._redecimate_timer.setSingleShot(True)
+        self._redecimate_timer.setInterval(PLOT_REDECIMATE_DELAY_MS)
+        self._redecimate_timer.timeout.connect(self._redecimate)
+        
         self._init_ui()
         self._refresh_plot()
     
@@ -105,11 +114,29 @@ class PlotWidget(QWidget):
     def _refresh_plot(self):
         """Redraw plot with current data."""
         self.study.update_plot(self.figure)
+        for ax in self.figure.axes:
+            ax.callbacks.connect("xlim_changed", lambda _ax: self._redecimate_timer.start())
+            ax.callbacks.connect("ylim_changed", lambda _ax: self._redecimate_timer.start())
         self.canvas.draw()
     
+    def _redecimate(self):
+        """Re-sample decimated series and density images for the current view."""
+        if not self.figure.axes:
+            return
+        if self.study.redecimate(self.figure.axes[0].get_xlim()):
+            self.canvas.draw_idle()
+    
     def refresh(self):
-        """Refresh plot (alias for _refresh_plot for external calls)."""
-        self._refresh_plot()
+        """Refresh plot after data changes.
+        
+        Updates the existing artists in place and redraws on the next event
+        loop pass; the figure is only rebuilt if the series configuration
+        changed.
+        """
+        if self.study.refresh_data():
+            self.canvas.draw_idle()
+        else:
+            self._refresh_plot()
     
     def _add_series_dialog(self):
         """Show dialog to add new series."""
@@ -229,7 +256,14 @@ class AddSeriesDialog(QDialog):
         
         # Style
         self.style_combo = QComboBox()
-        self.style_combo.addItems(["line", "scatter", "both"])
+        self.style_combo.addItems(["line", "scatter", "both", "density"])
+        self.style_combo.currentTextChanged.connect(self._on_style_changed)
+        
+        # Colormap (density style)
+        self.colormap_combo = QComboBox()
+        self.colormap_combo.addItems(PLOT_DENSITY_COLORMAPS)
+        self.colormap_combo.setCurrentText(PLOT_DENSITY_COLORMAP)
+        self.colormap_combo.setEnabled(False)
         
         # Color
         self.color_edit = QLineEdit()
@@ -243,6 +277,10 @@ class AddSeriesDialog(QDialog):
         self.linestyle_combo = QComboBox()
         self.linestyle_combo.addItems(["-", "--", "-.", ":"])
         
+        # Decimation
+        self.decimate_check = QCheckBox("Downsample long series for display")
+        self.decimate_check.setChecked(True)
+        
         # Layout
         layout.addRow("Study:", self.study_combo)
         layout.addRow("X Column:", self.x_combo)
@@ -254,6 +292,8 @@ class AddSeriesDialog(QDialog):
         layout.addRow("Color:", self.color_edit)
         layout.addRow("Marker:", self.marker_combo)
         layout.addRow("Line Style:", self.linestyle_combo)
+        layout.addRow("Colormap:", self.colormap_combo)
+        layout.addRow("", self.decimate_check)
         
         # Buttons
         buttons = QDialogButtonBox(
@@ -268,6 +308,14 @@ class AddSeriesDialog(QDialog):
         if self.study_combo.count() > 0:
             self._on_study_changed(self.study_combo.currentText())
     
+    def _on_style_changed(self, style: str):
+        """Enable the options that apply to the selected style."""
+        density = style == "density"
+        self.colormap_combo.setEnabled(density)
+        self.color_edit.setEnabled(not density)
+        self.marker_combo.setEnabled(not density)
+        self.linestyle_combo.setEnabled(not density)
+    
     def _on_study_changed(self, study_name: str):
         """Update column lists when study selection changes."""
         self.x_combo.clear()
@@ -316,7 +364,9 @@ class AddSeriesDialog(QDialog):
             "marker": self.marker_combo.currentText(),
             "linestyle": self.linestyle_combo.currentText(),
             "xerr_column": xerr_col,
-            "yerr_column": yerr_col
+            "yerr_column": yerr_col,
+            "decimate": self.decimate_check.isChecked(),
+            "colormap": self.colormap_combo.currentText()
         }
 
 
@@ -1,7 +1,7 @@
 """Shared utilities for all widgets."""
 
 from .dialog_utils import show_error, show_warning, show_info, confirm_action, validate_column_name
-from .model_utils import format_cell_value, emit_full_model_update, set_display_precision, get_display_precision
+from .model_utils import format_cell_value, format_cell_block, emit_full_model_update, set_display_precision, get_display_precision
 
 __all__ = [
     "show_error",
@@ -10,6 +10,7 @@ __all__ = [
     "confirm_action",
     "validate_column_name",
     "format_cell_value",
+    "format_cell_block",
     "emit_full_model_update",
     "set_display_precision",
     "get_display_precision",
@@ -6,6 +6,7 @@ Provides reusable model operations and formatting.
 
 from PySide6.QtCore import QAbstractTableModel
 from typing import Any, Optional
+import numpy as np
 from constants import DISPLAY_PRECISION
 
 # Module-level variable for dynamic precision (defaults to constant)
@@ -64,6 +65,32 @@ def format_cell_value(value: Any, precision: Optional[int] = None) -> str:
     return str(value)
 
 
+def format_cell_block(values: np.ndarray, precision: Optional[int] = None) -> np.ndarray:
+    """Format an array of cell values at once.
+    
+    Gives the same strings as format_cell_value() per element, but float,
+    integer and boolean arrays are formatted in a single vectorized call.
+    
+    Args:
+        values: Cell values (one column slice)
+        precision: Optional override for precision (uses module-level if None)
+        
+    Returns:
+        Array of formatted strings
+    """
+    prec = precision if precision is not None else _display_precision
+    kind = values.dtype.kind
+    
+    if kind == "f":
+        text = np.char.mod(f"%.{prec}g", values).astype(object)
+        text[np.isnan(values)] = ""
+        return text
+    if kind in "iub":
+        return values.astype(str).astype(object)
+    
+    return np.array([format_cell_value(value, prec) for value in values], dtype=object)
+
+
 def emit_full_model_update(model: QAbstractTableModel):
     """Emit data changed signal for entire model.
     
@@ -8,9 +8,10 @@ descriptive statistics display, and interactive plots.
 from typing import Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QLabel,
-    QGroupBox, QPushButton, QTextEdit, QSplitter
+    QGroupBox, QPushButton, QTextEdit, QSplitter, QInputDialog, QMessageBox,
+    QProgressDialog, QApplication
 )
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, Signal, Slot
 
 # Matplotlib imports
 import matplotlib
@@ -22,7 +23,7 @@ import numpy as np
 
 from constants import (
     COLUMN_COMBO_MIN_WIDTH, STATS_SPLITTER_LEFT, STATS_SPLITTER_RIGHT,
-    HISTOGRAM_MIN_BINS, HISTOGRAM_MAX_BINS
+    HISTOGRAM_MIN_BINS, HISTOGRAM_MAX_BINS, CORRELATION_COLORMAP, CORRELATION_ANNOTATE_MAX_COLUMNS
 )
 from studies.statistics_study import StatisticsStudy
 
@@ -36,8 +37,14 @@ class StatisticsWidget(QWidget):
     - Histogram visualization
     - Box plot visualization
     - Real-time analysis updates
+    - Grouped statistics tables
+    - Bootstrap confidence intervals
+    - Correlation matrix heatmap
     """
     
+    # Signal emitted with a new DataTableStudy of grouped statistics
+    groupTableCreated = Signal(object)
+    
     def __init__(self, study: StatisticsStudy, parent: Optional[QWidget] = None):
         """Initialize the statistics widget.
         
@@ -48,6 +55,10 @@ class StatisticsWidget(QWidget):
         super().__init__(parent)
         
         self.study = study
+        # Column (None: correlation matrix) and results currently displayed
+        # (results are cached by the study, so unchanged statistics come
+        # back as the same object)
+        self._shown: Optional[tuple] = None
         
         self._setup_ui()
         self._populate_column_selector()
@@ -72,6 +83,21 @@ class StatisticsWidget(QWidget):
         self.analyze_button.clicked.connect(self._on_analyze_clicked)
         selection_layout.addWidget(self.analyze_button)
         
+        self.bootstrap_button = QPushButton("Bootstrap CI")
+        self.bootstrap_button.setToolTip("Bootstrap confidence intervals of mean, median and std")
+        self.bootstrap_button.clicked.connect(self._on_bootstrap_clicked)
+        selection_layout.addWidget(self.bootstrap_button)
+        
+        self.correlation_button = QPushButton("Correlation")
+        self.correlation_button.setToolTip("Correlation matrix of all numerical columns")
+        self.correlation_button.clicked.connect(self._show_correlation)
+        selection_layout.addWidget(self.correlation_button)
+        
+        self.group_button = QPushButton("Group By...")
+        self.group_button.setToolTip("Create a table of statistics per value of a key column")
+        self.group_button.clicked.connect(self._on_group_clicked)
+        selection_layout.addWidget(self.group_button)
+        
         main_layout.addLayout(selection_layout)
         
         # Create splitter for statistics and plots
@@ -110,6 +136,8 @@ class StatisticsWidget(QWidget):
     
     def _populate_column_selector(self):
         """Populate the column dropdown with available columns."""
+        selected = self.column_combo.currentData()
+        
         # Block signals during population
         self.column_combo.blockSignals(True)
         
@@ -122,11 +150,18 @@ class StatisticsWidget(QWidget):
         for col_name in columns:
             self.column_combo.addItem(col_name, col_name)
         
+        # Keep the selected column
+        if selected in columns:
+            self.column_combo.setCurrentIndex(columns.index(selected))
+        
         # Re-enable signals
         self.column_combo.blockSignals(False)
         
         # Enable/disable analyze button
         self.analyze_button.setEnabled(len(columns) > 0)
+        self.bootstrap_button.setEnabled(len(columns) > 0)
+        self.correlation_button.setEnabled(len(columns) > 1)
+        self.group_button.setEnabled(len(columns) > 0)
     
     def _format_statistics_html(self, stats: dict, column_name: str) -> str:
         """Format statistics as HTML for display.
@@ -174,6 +209,14 @@ class StatisticsWidget(QWidget):
         html += f"Skewness: {stats['skewness']:.4f}<br>\n"
         html += f"Kurtosis: {stats['kurtosis']:.4f}<br>\n"
         
+        intervals = self.study.get_confidence_intervals(column_name)
+        if intervals:
+            html += "<br>\n"
+            html += (f"<b>{intervals['confidence']:.0%} Confidence Intervals</b> "
+                     f"<small>(bootstrap, {intervals['n_resamples']} resamples)</small><br>\n")
+            for name, (low, high) in intervals["intervals"].items():
+                html += f"{name.capitalize()}: [{low:.6g}, {high:.6g}]<br>\n"
+        
         # Interpretation hints
         html += "<br><hr>\n"
         html += "<small><i>Interpretation:</i><br>\n"
@@ -244,6 +287,81 @@ class StatisticsWidget(QWidget):
         self.figure.tight_layout()
         self.canvas.draw()
     
+    @Slot()
+    def _show_correlation(self):
+        """Display the correlation matrix of all numerical columns as a heatmap."""
+        matrices = self.study.correlation_matrix()
+        if self._shown is not None and self._shown[0] is None and self._shown[1] is matrices:
+            return
+        self._shown = (None, matrices)
+        
+        correlation = matrices.get("correlation")
+        if correlation is None or len(correlation) < 2:
+            self.stats_display.setHtml(
+                "<h3>Correlation Matrix</h3>"
+                "<p><b>Error:</b> At least two numerical columns are needed.</p>"
+            )
+            self._show_no_data_plot()
+            return
+        
+        self.stats_display.setHtml(self._format_correlation_html(matrices))
+        
+        names = list(correlation.columns)
+        values = correlation.to_numpy()
+        
+        self.figure.clear()
+        ax = self.figure.add_subplot(1, 1, 1)
+        image = ax.imshow(values, cmap=CORRELATION_COLORMAP, vmin=-1.0, vmax=1.0)
+        ax.set_xticks(range(len(names)))
+        ax.set_yticks(range(len(names)))
+        ax.set_xticklabels(names, rotation=45, ha="right")
+        ax.set_yticklabels(names)
+        ax.set_title("Correlation Matrix")
+        
+        if len(names) <= CORRELATION_ANNOTATE_MAX_COLUMNS:
+            for i in range(len(names)):
+                for j in range(len(names)):
+                    if np.isfinite(values[i, j]):
+                        ax.text(j, i, f"{values[i, j]:.2f}", ha="center", va="center",
+                                color="white" if abs(values[i, j]) > 0.6 else "black", fontsize=8)
+        
+        self.figure.colorbar(image, ax=ax, label="Pearson r")
+        self.figure.tight_layout()
+        self.canvas.draw()
+    
+    def _format_correlation_html(self, matrices: dict) -> str:
+        """Format the strongest correlations as HTML.
+        
+        Args:
+            matrices: Result of StatisticsStudy.correlation_matrix()
+            
+        Returns:
+            Formatted HTML string
+        """
+        correlation, covariance, count = matrices["correlation"], matrices["covariance"], matrices["count"]
+        names = list(correlation.columns)
+        pairs = [
+            (abs(correlation.iat[i, j]), names[i], names[j], i, j)
+            for i in range(len(names)) for j in range(i + 1, len(names))
+            if np.isfinite(correlation.iat[i, j])
+        ]
+        pairs.sort(reverse=True)
+        
+        html = "<h3>Correlation Matrix</h3>\n"
+        html += "<hr>\n"
+        html += f"<b>Columns</b>: {len(names)}<br>\n"
+        html += "<br>\n"
+        html += "<b>Strongest Correlations</b><br>\n"
+        for _, a, b, i, j in pairs[:10]:
+            html += (f"{a} / {b}: r = {correlation.iat[i, j]:.4f}, "
+                     f"cov = {covariance.iat[i, j]:.4g} (n = {count.iat[i, j]})<br>\n")
+        if not pairs:
+            html += "No pair has enough common values.<br>\n"
+        
+        html += "<br><hr>\n"
+        html += "<small><i>Each pair uses the rows where both values are present.</i></small>\n"
+        return html
+    
     def _show_initial_message(self):
         """Show initial message when no analysis has been performed."""
         self.stats_display.setHtml(
@@ -277,11 +395,18 @@ class StatisticsWidget(QWidget):
         # Get selected column name
         col_name = self.column_combo.currentData()
         if col_name is None:
+            self._shown = None
             self._show_initial_message()
             return
         
         # Analyze column
-        stats = self.study.analyze_column(col_name)
+        self._show_statistics(col_name, self.study.analyze_column(col_name))
+    
+    def _show_statistics(self, col_name: str, stats: dict):
+        """Display statistics and visualizations of a column."""
+        if self._shown is not None and self._shown[0] == col_name and self._shown[1] is stats and stats:
+            return
+        self._shown = (col_name, stats)
         
         if not stats:
             self.stats_display.setHtml(
@@ -298,6 +423,56 @@ class StatisticsWidget(QWidget):
         # Create visualizations
         self._create_visualizations(col_name)
     
+    @Slot()
+    def _on_bootstrap_clicked(self):
+        """Compute bootstrap confidence intervals of the selected column."""
+        col_name = self.column_combo.currentData()
+        if col_name is None:
+            return
+        
+        progress = QProgressDialog("Resampling...", "Cancel", 0, 100, self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        
+        def update_progress(done, total):
+            progress.setValue(int(100 * done / total))
+            progress.setLabelText(f"Resampled {done}/{total}")
+            QApplication.processEvents()
+            return not progress.wasCanceled()
+        
+        try:
+            result = self.study.bootstrap_column(col_name, progress_callback=update_progress)
+        except ValueError as e:
+            progress.close()
+            QMessageBox.warning(self, "Bootstrap", str(e))
+            return
+        progress.close()
+        
+        if not result.cancelled:
+            self._shown = None
+            self._show_statistics(col_name, self.study.analyze_column(col_name))
+    
+    @Slot()
+    def _on_group_clicked(self):
+        """Ask for a key column and create a table of grouped statistics."""
+        source = self.study.workspace.get_study(self.study.source_study) if self.study.workspace else None
+        if source is None or source.get_type() != "data_table":
+            return
+        
+        keys = [str(name) for name in source.table.columns]
+        key_column, ok = QInputDialog.getItem(
+            self, "Group By", "Key column (one row per value):", keys, 0, False
+        )
+        if not ok:
+            return
+        
+        try:
+            group_table = self.study.create_group_table(key_column)
+        except ValueError as e:
+            QMessageBox.warning(self, "Group By", str(e))
+            return
+        self.groupTableCreated.emit(group_table)
+    
     @Slot()
     def _on_column_changed(self):
         """Handle column selection change."""
@@ -308,7 +483,10 @@ class StatisticsWidget(QWidget):
     def refresh(self):
         """Refresh the widget (update column list and redraw)."""
         self._populate_column_selector()
-        # If a column is currently selected and analyzed, re-analyze it
+        if self._shown is not None and self._shown[0] is None:
+            self._show_correlation()
+            return
+        # If a column is currently selected, update its statistics incrementally
         col_name = self.column_combo.currentData()
         if col_name is not None:
-            self._on_analyze_clicked()
+            self._show_statistics(col_name, self.study.update_statistics([col_name]).get(col_name, {}))
@@ -0,0 +1,177 @@
+"""Unit tests for memory-mapped binary import."""
+
+import pytest
+import numpy as np
+from core.binary_io import BinaryChannel, BinaryLayout, map_binary_records
+from core.data_object import DataObject
+from core.exceptions import FileImportError
+from studies.data_table_study import DataTableStudy, ColumnType
+
+
+def _write_records(path, header=b"", count=5, byte_order="<"):
+    """Write interleaved float64/float32/int16 records after a header."""
+    dtype = np.dtype([
+        ("t", byte_order + "f8"),
+        ("v", byte_order + "f4"),
+        ("raw", byte_order + "i2"),
+    ])
+    records = np.zeros(count, dtype=dtype)
+    records["t"] = np.arange(count) * 0.5
+    records["v"] = np.arange(count) * 2.0
+    records["raw"] = np.arange(count) * 100
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(records.tobytes())
+    return records
+
+
+def _layout(header_bytes=0, byte_order="<"):
+    return BinaryLayout(
+        channels=[
+            BinaryChannel("t", "float64", unit="s"),
+            BinaryChannel("v", "float32"),
+            BinaryChannel("raw", "int16", scale=0.01, offset=1.0, unit="V"),
+        ],
+        header_bytes=header_bytes,
+        byte_order=byte_order
+    )
+
+
+class TestBinaryLayout:
+    """Test record layout description."""
+
+    def test_record_size(self):
+        """Test packed record size."""
+        assert _layout().record_size == 8 + 4 + 2
+
+    def test_padding(self):
+        """Test trailing padding bytes count towards record size."""
+        layout = _layout()
+        layout.padding_bytes = 2
+        assert layout.record_size == 16
+
+    def test_empty_layout_invalid(self):
+        """Test layout without channels is rejected."""
+        with pytest.raises(ValueError):
+            BinaryLayout().record_dtype()
+
+    def test_duplicate_names_invalid(self):
+        """Test duplicate channel names are rejected."""
+        layout = BinaryLayout([BinaryChannel("a"), BinaryChannel("a")])
+        with pytest.raises(ValueError):
+            layout.record_dtype()
+
+    def test_roundtrip_dict(self):
+        """Test layout serialization round-trip."""
+        layout = _layout(header_bytes=16, byte_order=">")
+        restored = BinaryLayout.from_dict(layout.to_dict())
+
+        assert restored == layout
+
+
+class TestMapBinaryRecords:
+    """Test memory mapping of record files."""
+
+    def test_header_skipped(self, tmp_path):
+        """Test header bytes are skipped."""
+        path = tmp_path / "run.bin"
+        records = _write_records(path, header=b"H" * 32)
+
+        mapped = map_binary_records(str(path), _layout(header_bytes=32))
+
+        assert len(mapped) == 5
+        np.testing.assert_array_equal(mapped["t"], records["t"])
+
+    def test_partial_record_ignored(self, tmp_path):
+        """Test trailing partial record is ignored."""
+        path = tmp_path / "run.bin"
+        _write_records(path, count=3)
+        with open(path, "ab") as f:
+            f.write(b"\x00" * 5)
+
+        assert len(map_binary_records(str(path), _layout())) == 3
+
+    def test_file_too_small(self, tmp_path):
+        """Test file without a complete record raises FileImportError."""
+        path = tmp_path / "run.bin"
+        path.write_bytes(b"\x00" * 4)
+
+        with pytest.raises(FileImportError):
+            map_binary_records(str(path), _layout())
+
+
+class TestDataObjectFromBinary:
+    """Test DataObject creation from binary files."""
+
+    def test_values_and_scaling(self, tmp_path):
+        """Test raw and scaled channel values."""
+        path = tmp_path / "run.bin"
+        records = _write_records(path)
+
+        obj = DataObject.from_binary("run", str(path), _layout())
+
+        assert obj.columns == ["t", "v", "raw"]
+        np.testing.assert_array_equal(obj["t"], records["t"])
+        np.testing.assert_allclose(obj["raw"], records["raw"] * 0.01 + 1.0)
+        assert obj["raw"].dtype == np.float64
+
+    def test_raw_channels_are_views(self, tmp_path):
+        """Test unscaled channels share memory with the mapped file."""
+        path = tmp_path / "run.bin"
+        _write_records(path)
+        mapped = map_binary_records(str(path), _layout())
+
+        obj = DataObject.from_binary("run", str(path), _layout())
+
+        assert obj["t"].to_numpy().strides == (mapped.itemsize,)
+
+    def test_edit_does_not_touch_file(self, tmp_path):
+        """Test edits stay in memory (copy-on-write mapping)."""
+        path = tmp_path / "run.bin"
+        _write_records(path)
+        before = path.read_bytes()
+
+        obj = DataObject.from_binary("run", str(path), _layout())
+        obj.data.iloc[0, 0] = 123.0
+
+        assert obj["t"].iloc[0] == 123.0
+        assert path.read_bytes() == before
+
+    def test_big_endian(self, tmp_path):
+        """Test big-endian files are converted to native order."""
+        path = tmp_path / "run.bin"
+        records = _write_records(path, byte_order=">")
+
+        obj = DataObject.from_binary("run", str(path), _layout(byte_order=">"))
+
+        np.testing.assert_array_equal(obj["v"], records["v"])
+        assert obj["v"].dtype.isnative
+
+
+class TestStudyImportFromBinary:
+    """Test DataTableStudy binary import."""
+
+    def test_import(self, tmp_path):
+        """Test import creates DATA columns with channel units."""
+        path = tmp_path / "run.bin"
+        _write_records(path)
+
+        study = DataTableStudy("Run")
+        study.import_from_binary(str(path), _layout())
+
+        assert study.table.columns == ["t", "v", "raw"]
+        assert study.get_column_type("raw") == ColumnType.DATA
+        assert study.get_column_unit("t") == "s"
+        assert study.get_column_unit("raw") == "V"
+        assert study.data_objects["main_table"] is study.table
+
+    def test_calculated_column_on_import(self, tmp_path):
+        """Test formulas work on imported channels."""
+        path = tmp_path / "run.bin"
+        records = _write_records(path)
+
+        study = DataTableStudy("Run")
+        study.import_from_binary(str(path), _layout())
+        study.add_column("y", ColumnType.CALCULATED, formula="{v} * 2")
+
+        np.testing.assert_allclose(study.table["y"], records["v"] * 2)
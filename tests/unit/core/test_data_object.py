@@ -104,3 +104,66 @@ class TestDataObjectSerialization:
         assert "x" in data["data"]
         assert "y" in data["data"]
         assert data["metadata"]["unit"] == "m"
+
+
+class TestDataObjectVersions:
+    """Test column version tracking."""
+    
+    def test_set_column_bumps_version(self):
+        """Test setting a column changes only its version."""
+        obj = DataObject.from_dict("test", {"x": [1, 2], "y": [3, 4]})
+        x_before, y_before = obj.column_version("x"), obj.column_version("y")
+        
+        obj.set_column("x", [5, 6])
+        
+        assert obj.column_version("x") != x_before
+        assert obj.column_version("y") == y_before
+    
+    def test_touch(self):
+        """Test in-place changes are recorded with touch()."""
+        obj = DataObject.from_dict("test", {"x": [1, 2]})
+        before = obj.column_version("x")
+        
+        obj.data.loc[0, "x"] = 10
+        obj.touch("x")
+        
+        assert obj.column_version("x") != before
+    
+    def test_replacing_frame_bumps_all(self):
+        """Test assigning a new frame changes every column version."""
+        obj = DataObject.from_dict("test", {"x": [1, 2]})
+        before = obj.column_version("x")
+        
+        obj.data = obj.data.copy()
+        
+        assert obj.column_version("x") != before
+    
+    def test_changed_rows(self):
+        """Test row ranges of in-place changes are combined."""
+        obj = DataObject.from_dict("test", {"x": [1.0, 2.0, 3.0, 4.0]})
+        before = obj.column_version("x")
+        assert obj.changed_rows("x", before) == (0, 0)
+        
+        obj.touch("x", (2, 3))
+        obj.touch("x", (0, 1))
+        assert obj.changed_rows("x", before) == (0, 3)
+        
+        # Changes without a row range, or a replaced frame, are unknown
+        middle = obj.column_version("x")
+        obj.touch("x")
+        assert obj.changed_rows("x", middle) is None
+        obj.data = obj.data.copy()
+        assert obj.changed_rows("x", obj.column_version("x")) == (0, 0)
+        assert obj.changed_rows("x", middle) is None
+    
+    def test_append(self):
+        """Test appending rows keeps versions comparable."""
+        obj = DataObject.from_dict("test", {"x": [1.0, 2.0], "y": [3.0, 4.0]})
+        before = obj.column_version("x")
+        
+        obj.append(pd.DataFrame({"x": [5.0, 6.0, 7.0]}))
+        
+        assert obj.data["x"].tolist() == [1.0, 2.0, 5.0, 6.0, 7.0]
+        assert obj.data.index.tolist() == list(range(5))
+        assert obj.data["y"].isna().sum() == 3
+        assert obj.changed_rows("x", before) == (2, 5)
@@ -0,0 +1,97 @@
+"""
+Unit tests for EventBus column change notifications.
+"""
+
+import pytest
+from core.event_bus import EventBus, affects
+
+
+@pytest.fixture
+def bus():
+    return EventBus()
+
+
+class TestAffects:
+    """Test dependency matching."""
+
+    def test_matching(self):
+        """Test study and column matching, with None as wildcard."""
+        dependencies = {"Table": {"x", "y"}, "Other": None}
+
+        assert affects(dependencies, "Table", {"x"})
+        assert not affects(dependencies, "Table", {"z"})
+        assert affects(dependencies, "Table", None)
+        assert affects(dependencies, "Other", {"anything"})
+        assert not affects(dependencies, "Unknown", None)
+
+
+class TestEventBus:
+    """Test publish/subscribe."""
+
+    def test_only_consumers_of_column_called(self, bus):
+        """Test a change wakes only subscribers reading the column."""
+        calls = []
+        bus.subscribe(lambda s, c: calls.append(("x", c)), {"Table": {"x"}})
+        bus.subscribe(lambda s, c: calls.append(("y", c)), {"Table": {"y"}})
+        bus.subscribe(lambda s, c: calls.append(("all", c)))
+
+        bus.publish("Table", ["x"])
+
+        assert calls == [("x", {"x"}), ("all", {"x"})]
+
+    def test_structural_change_wakes_all_readers(self, bus):
+        """Test columns=None reaches every reader of the study."""
+        calls = []
+        bus.subscribe(lambda s, c: calls.append(s), {"Table": {"x"}})
+        bus.subscribe(lambda s, c: calls.append("other"), {"Other": {"x"}})
+
+        bus.publish("Table")
+
+        assert calls == ["Table"]
+
+    def test_empty_change_not_published(self, bus):
+        """Test publishing no columns calls nobody."""
+        calls = []
+        bus.subscribe(lambda s, c: calls.append(c))
+
+        bus.publish("Table", [])
+
+        assert calls == []
+
+    def test_dependencies_callable(self, bus):
+        """Test dependency functions are queried on every publish."""
+        read = {}
+        calls = []
+        bus.subscribe(lambda s, c: calls.append(c), lambda: read)
+
+        bus.publish("Table", ["x"])
+        read["Table"] = {"x"}
+        bus.publish("Table", ["x"])
+
+        assert calls == [{"x"}]
+
+    def test_unsubscribe(self, bus):
+        """Test unsubscribed callbacks are not called."""
+        calls = []
+        token = bus.subscribe(lambda s, c: calls.append(c))
+        bus.unsubscribe(token)
+
+        bus.publish("Table", ["x"])
+
+        assert calls == []
+        assert bus.subscriber_count() == 0
+
+    def test_batch_merges_changes(self, bus):
+        """Test changes inside a batch are delivered once per study."""
+        calls = []
+        bus.subscribe(lambda s, c: calls.append((s, c)))
+
+        with bus.batch():
+            bus.publish("Table", ["x"])
+            with bus.batch():
+                bus.publish("Table", ["y"])
+            bus.publish("Other", None)
+            bus.publish("Other", ["z"])
+            assert calls == []
+
+        assert calls == [("Table", {"x", "y"}), ("Other", None)]
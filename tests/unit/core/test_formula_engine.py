@@ -250,3 +250,33 @@ class TestVariableRenaming:
         # Check that all dependencies are correct
         deps = engine.get_dependencies("result")
         assert deps == {"x_new", "y", "z"}
+
+
+class TestElementwiseDetection:
+    """Test detection of element-wise formulas."""
+    
+    @pytest.mark.parametrize("formula", [
+        "{x} * 2 + {y}",
+        "sqrt({x}**2 + {y}**2)",
+        "-{x} / (1 + exp({x}))",
+        "np.hypot({x}, {y})",
+        "{x} > 0",
+        "{g} * {t}**2 / 2",
+        "pi * round({x})",
+    ])
+    def test_elementwise(self, formula):
+        """Test arithmetic and element-wise functions are detected."""
+        assert FormulaEngine().is_elementwise(formula)
+    
+    @pytest.mark.parametrize("formula", [
+        "{x} - mean({x})",
+        "cumsum({x})",
+        "np.sum({x})",
+        "{x}[0]",
+        "len({x})",
+        "myfunc({x})",
+        "{x} +",
+    ])
+    def test_not_elementwise(self, formula):
+        """Test aggregates, indexing, unknown calls and bad syntax are rejected."""
+        assert not FormulaEngine().is_elementwise(formula)
@@ -0,0 +1,155 @@
+"""
+Unit tests for ResultCache and memoized recalculation.
+"""
+
+import numpy as np
+import pandas as pd
+from core.result_cache import ResultCache, fingerprint
+from studies.data_table_study import DataTableStudy, ColumnType
+
+
+class TestFingerprint:
+    """Test content fingerprints."""
+
+    def test_content_based(self):
+        """Test equal content gives equal fingerprints."""
+        a = np.arange(5.0)
+        assert fingerprint(a) == fingerprint(a.copy())
+        assert fingerprint(a) == fingerprint(pd.Series(a))
+        assert fingerprint(a) != fingerprint(a + 1)
+
+    def test_dtype_and_shape(self):
+        """Test dtype and shape are part of the fingerprint."""
+        assert fingerprint(np.zeros(4)) != fingerprint(np.zeros(4, dtype=np.int64))
+        assert fingerprint(np.zeros(4)) != fingerprint(np.zeros((2, 2)))
+
+    def test_scalars_and_objects(self):
+        """Test picklable non-arrays are fingerprinted."""
+        assert fingerprint(2.0) == fingerprint(2.0)
+        assert fingerprint(np.array(["a", None], dtype=object)) is not None
+        assert fingerprint(lambda: None) is None
+
+
+class TestResultCache:
+    """Test LRU behaviour and statistics."""
+
+    def test_hit_returns_copy(self):
+        """Test hits return a copy of the stored result."""
+        cache = ResultCache(max_bytes=1024)
+        cache.put("k", np.ones(3))
+
+        result = cache.get("k")
+        result[0] = 5
+
+        assert cache.get("k")[0] == 1
+        assert cache.stats()["hits"] == 2
+
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted over budget."""
+        cache = ResultCache(max_bytes=3 * 80)
+        for key in "abc":
+            cache.put(key, np.zeros(10))
+        cache.get("a")
+
+        cache.put("d", np.zeros(10))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["bytes"] <= 3 * 80
+
+    def test_hit_rate(self):
+        """Test hit rate statistics."""
+        cache = ResultCache(max_bytes=1024)
+        cache.put("k", np.ones(3))
+        cache.get("k")
+        cache.get("missing")
+
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_disabled(self):
+        """Test a zero budget stores nothing."""
+        cache = ResultCache(max_bytes=0)
+        cache.put("k", np.ones(3))
+
+        assert not cache.enabled
+        assert cache.get("k") is None
+
+
+class TestMemoizedRecalculation:
+    """Test DataTableStudy reuses results on undo/redo."""
+
+    def test_undo_redo_hits(self):
+        """Test toggling an edit restores computed columns from the cache."""
+        study = DataTableStudy("Cache")
+        study.add_column("x", initial_data=np.arange(5, dtype=float))
+        study.add_column("y", ColumnType.CALCULATED, formula="{x} ** 2")
+        study.add_column("s", ColumnType.CALCULATED, formula="cumsum({x})")
+        study.set_values("x", [1], [10.0])
+
+        study.undo_manager.undo()
+        study.undo_manager.redo()
+        hits = study.get_profiling_stats()["result_cache"]["hits"]
+        study.undo_manager.undo()
+
+        # Only the full recompute of s is cached; y is re-evaluated per row range
+        assert study.get_profiling_stats()["result_cache"]["hits"] == hits + 1
+        np.testing.assert_allclose(study.table["y"], np.arange(5) ** 2)
+        np.testing.assert_allclose(study.table["s"], np.cumsum(np.arange(5)))
+
+    def test_row_evaluations_not_cached(self):
+        """Test partial recalculations neither store nor look up results."""
+        study = DataTableStudy("Cache")
+        study.add_column("x", initial_data=np.arange(1000, dtype=float))
+        study.add_column("y", ColumnType.CALCULATED, formula="{x} * 2")
+        stats = study.get_profiling_stats()["result_cache"]
+
+        study.set_values("x", [990], [5.0])
+
+        assert study.get_profiling_stats()["result_cache"] == stats
+
+    def test_fingerprint_once_per_version(self, monkeypatch):
+        """Test input columns are hashed once per version (and per full recalculation)."""
+        import studies.data_table_study as data_table_study
+        calls = []
+
+        def counting_fingerprint(value):
+            calls.append(value.name)
+            return fingerprint(value)
+
+        monkeypatch.setattr(data_table_study, "fingerprint", counting_fingerprint)
+        study = DataTableStudy("Cache")
+        study.add_column("x", initial_data=np.arange(5, dtype=float))
+        study.add_column("y", ColumnType.CALCULATED, formula="{x} + 1")
+        study.add_column("z", ColumnType.CALCULATED, formula="cumsum({x})")
+        hits = study.get_profiling_stats()["result_cache"]["hits"]
+        calls.clear()
+
+        study.recalculate_all()
+
+        # Shared by y and z
+        assert calls == ["x"]
+        assert study.get_profiling_stats()["result_cache"]["hits"] == hits + 2
+
+        study.set_values("x", [0], [7.0])
+        assert calls == ["x", "x"]
+
+    def test_constants_version_in_key(self):
+        """Test formulas using workspace constants are cached per constants version."""
+        from core.workspace import Workspace
+        workspace = Workspace("ws", "numerical")
+        workspace.add_constant("k", 2.0)
+        study = DataTableStudy("Cache", workspace=workspace)
+        study.add_column("x", initial_data=[1.0, 2.0])
+        study.add_column("y", ColumnType.CALCULATED, formula="cumsum({x}) * {k}")
+        hits = study.get_profiling_stats()["result_cache"]["hits"]
+
+        # Unchanged constant: served from the cache
+        study.recalculate_all()
+        assert study.get_profiling_stats()["result_cache"]["hits"] == hits + 1
+        assert study.table["y"].tolist() == [2.0, 6.0]
+
+        # Changed constant: evaluated again
+        workspace.add_constant("k", 3.0)
+        study.recalculate_all()
+        assert study.get_profiling_stats()["result_cache"]["hits"] == hits + 1
+        assert study.table["y"].tolist() == [3.0, 9.0]
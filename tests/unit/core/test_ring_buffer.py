@@ -0,0 +1,129 @@
+"""
+Unit tests for RingBuffer and DataTableStudy ring buffer mode.
+"""
+
+import pytest
+import numpy as np
+from core.ring_buffer import RingBuffer
+from studies.data_table_study import DataTableStudy, ColumnType
+
+
+class TestRingBuffer:
+    """Test mirrored ring buffer storage."""
+
+    def test_keeps_last_rows(self):
+        """Test oldest rows are evicted beyond capacity."""
+        ring = RingBuffer(["a"], capacity=4)
+        assert ring.append({"a": [1, 2, 3]}) == 0
+        assert ring.append({"a": [4, 5, 6]}) == 2
+
+        np.testing.assert_array_equal(ring.column("a"), [3, 4, 5, 6])
+        assert ring.total_appended == 6
+
+    def test_window_is_view(self):
+        """Test columns are contiguous views of the storage."""
+        ring = RingBuffer(["a", "b"], capacity=3)
+        for i in range(5):
+            ring.append(np.array([[i], [10 * i]]))
+
+        column = ring.column("b")
+        assert np.shares_memory(column, ring._storage)
+        assert column.flags["C_CONTIGUOUS"]
+        np.testing.assert_array_equal(column, [20, 30, 40])
+
+    def test_block_larger_than_capacity(self):
+        """Test only the tail of an oversized block is kept."""
+        ring = RingBuffer(["a"], capacity=3)
+        ring.append({"a": [0]})
+
+        assert ring.append({"a": np.arange(10)}) == 8
+        np.testing.assert_array_equal(ring.column("a"), [7, 8, 9])
+
+    def test_write_survives_wrap(self):
+        """Test writes reach both copies, so they survive the window wrapping."""
+        ring = RingBuffer(["a"], capacity=4)
+        ring.append({"a": [0, 1, 2, 3, 4, 5]})
+        ring.write("a", 2, [40, 50])
+
+        ring.append({"a": [6, 7]})
+
+        np.testing.assert_array_equal(ring.column("a"), [40, 50, 6, 7])
+
+    def test_missing_columns_are_nan(self):
+        """Test columns absent from a dict block are NaN."""
+        ring = RingBuffer(["a", "b"], capacity=2)
+        ring.append({"a": [1.0]})
+
+        assert np.isnan(ring.column("b")[0])
+
+    def test_invalid_capacity(self):
+        """Test capacity must be positive."""
+        with pytest.raises(ValueError):
+            RingBuffer(["a"], capacity=0)
+
+
+class TestRingBufferStudy:
+    """Test DataTableStudy.append in ring buffer mode."""
+
+    @pytest.fixture
+    def study(self):
+        study = DataTableStudy("Acquisition")
+        study.add_column("t")
+        study.add_column("v")
+        study.add_column("p", ColumnType.CALCULATED, formula="{v} * 2")
+        study.add_column("c", ColumnType.CALCULATED, formula="{v} - mean({v})")
+        study.add_column("a", ColumnType.DERIVATIVE, derivative_of="v", with_respect_to="t")
+        study.enable_ring_buffer(5)
+        return study
+
+    def test_append_keeps_window(self, study):
+        """Test table holds the last capacity rows."""
+        for start in range(0, 12, 3):
+            t = np.arange(start, start + 3, dtype=float)
+            study.append({"t": t, "v": t ** 2})
+
+        np.testing.assert_array_equal(study.table["t"], [7, 8, 9, 10, 11])
+        assert study.ring_buffer.total_appended == 12
+
+    def test_formulas_over_window(self, study):
+        """Test element-wise, window and derivative columns match a full recompute."""
+        for start in range(0, 12, 3):
+            t = np.arange(start, start + 3, dtype=float)
+            study.append({"t": t, "v": t ** 2})
+
+        t = np.arange(7, 12, dtype=float)
+        np.testing.assert_allclose(study.table["p"], 2 * t ** 2)
+        np.testing.assert_allclose(study.table["c"], t ** 2 - np.mean(t ** 2))
+        np.testing.assert_allclose(study.table["a"], np.gradient(t ** 2, t))
+
+    def test_columns_stay_views(self, study):
+        """Test computed columns are written back into the ring buffer."""
+        study.append(np.array([[0.0, 1.0], [1.0, 2.0]]))
+
+        for name in study.table.columns:
+            assert np.shares_memory(study.table[name].values, study.ring_buffer._storage)
+
+    def test_array_block_columns(self, study):
+        """Test 2D arrays need one column per DATA column."""
+        with pytest.raises(ValueError):
+            study.append(np.zeros((2, 3)))
+
+    def test_structure_change_reseeds(self, study):
+        """Test a column added between appends is picked up."""
+        study.append({"t": [0.0, 1.0], "v": [1.0, 2.0]})
+        study.add_column("w", initial_data=[5.0, 6.0])
+
+        study.append({"t": [2.0], "v": [3.0], "w": [7.0]})
+
+        np.testing.assert_array_equal(study.table["w"], [5, 6, 7])
+
+    def test_disable_detaches(self, study):
+        """Test disabling copies the window out of the buffer."""
+        study.append({"t": [0.0, 1.0], "v": [1.0, 2.0]})
+        storage = study.ring_buffer._storage
+        study.disable_ring_buffer()
+
+        assert study.ring_buffer is None
+        assert not np.shares_memory(study.table["v"].values, storage)
+        study.append({"t": [2.0], "v": [3.0]})
+        assert len(study.table.data) == 3
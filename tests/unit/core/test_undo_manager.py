@@ -4,7 +4,7 @@ import pytest
 import numpy as np
 import pandas as pd
 
-from core.undo_manager import UndoManager, UndoAction, ActionType, UndoContext
+from core.undo_manager import UndoManager, UndoAction, ActionType, UndoContext, ArrayDelta
 from studies.data_table_study import DataTableStudy, ColumnType
 from core.workspace import Workspace
 
@@ -235,6 +235,165 @@ class TestUndoManager:
         assert history[2] == "Action 2"
 
 
+class TestArrayDelta:
+    """Tests for ArrayDelta."""
+    
+    def test_sparse_rows(self):
+        """Test selected rows are stored as ranges with their values."""
+        values = np.arange(10, dtype=float)
+        
+        delta = ArrayDelta(values, rows=[7, 2, 3, 4])
+        
+        assert delta.ranges.tolist() == [[2, 5], [7, 8]]
+        np.testing.assert_array_equal(delta.values(), [2, 3, 4, 7])
+    
+    def test_apply(self):
+        """Test captured values are written back into a column."""
+        delta = ArrayDelta(pd.Series([1.0, 2.0, 3.0]), rows=[1])
+        
+        patched = delta.apply(pd.Series([0.0, 0.0, 0.0]))
+        
+        assert patched.tolist() == [0.0, 2.0, 0.0]
+    
+    def test_large_payload_compressed(self):
+        """Test large compressible columns are stored compressed."""
+        values = np.zeros(100_000)
+        
+        delta = ArrayDelta(values)
+        
+        assert delta.nbytes < values.nbytes // 10
+        np.testing.assert_array_equal(delta.values(), values)
+    
+    def test_object_column(self):
+        """Test non-numeric columns round-trip."""
+        series = pd.Series(["a", None, "c"])
+        delta = ArrayDelta(series)
+        
+        pd.testing.assert_series_equal(delta.to_series(), series)
+    
+    def test_spill(self, tmp_path):
+        """Test spilled payload is read back from the file."""
+        values = np.random.default_rng(0).random(1000)
+        delta = ArrayDelta(values)
+        
+        with open(tmp_path / "spill.bin", "w+b") as f:
+            delta.spill(f)
+            assert delta.nbytes == delta.ranges.nbytes
+            np.testing.assert_array_equal(delta.values(), values)
+
+
+class TestUndoByteBudget:
+    """Tests for the UndoManager byte budget."""
+    
+    @staticmethod
+    def _action(i, size):
+        return UndoAction(
+            action_type=ActionType.MODIFY_DATA,
+            undo_func=lambda: None,
+            redo_func=lambda: None,
+            description=f"Action {i}",
+            deltas=[ArrayDelta(np.random.default_rng(i).random(size))]
+        )
+    
+    def test_oldest_dropped_over_budget(self):
+        """Test oldest actions are dropped to fit the budget."""
+        undo_mgr = UndoManager(max_bytes=20_000)
+        for i in range(5):
+            undo_mgr.push(self._action(i, 1000))
+        
+        assert undo_mgr.get_undo_count() == 2
+        assert undo_mgr.memory_bytes <= 20_000
+        assert undo_mgr.get_undo_description() == "Action 4"
+    
+    def test_latest_action_kept(self):
+        """Test an action larger than the budget is still undoable."""
+        undo_mgr = UndoManager(max_bytes=100)
+        undo_mgr.push(self._action(0, 1000))
+        
+        assert undo_mgr.can_undo()
+    
+    def test_spill_keeps_history(self):
+        """Test spilling moves old data out of memory without dropping actions."""
+        undo_mgr = UndoManager(max_bytes=20_000, spill=True)
+        actions = [self._action(i, 1000) for i in range(5)]
+        for action in actions:
+            undo_mgr.push(action)
+        
+        assert undo_mgr.get_undo_count() == 5
+        assert undo_mgr.memory_bytes <= 20_000
+        np.testing.assert_array_equal(
+            actions[0].deltas[0].values(), np.random.default_rng(0).random(1000)
+        )
+        undo_mgr.clear()
+    
+    def test_accounting_follows_redo_clear(self):
+        """Test bytes of discarded redo actions are released."""
+        undo_mgr = UndoManager()
+        undo_mgr.push(self._action(0, 1000))
+        undo_mgr.undo()
+        
+        undo_mgr.push(self._action(1, 10))
+        
+        assert undo_mgr.memory_bytes == undo_mgr.undo_stack[-1].nbytes
+
+
+class TestUndoCoalescing:
+    """Tests for merged and grouped undo actions."""
+    
+    @staticmethod
+    def _counter_action(log, key, merge_key=None, merge_func=None):
+        return UndoAction(
+            action_type=ActionType.MODIFY_DATA,
+            undo_func=lambda: log.append(f"undo {key}"),
+            redo_func=lambda: log.append(f"redo {key}"),
+            description=key,
+            merge_key=merge_key,
+            merge_func=merge_func
+        )
+    
+    def test_merge_within_window(self):
+        """Test actions with the same merge key are combined."""
+        undo_mgr = UndoManager(coalesce_window=10.0)
+        log = []
+        merged = self._counter_action(log, "ab")
+        first = self._counter_action(log, "a", "edit", merge_func=lambda later: merged)
+        
+        undo_mgr.push(first)
+        undo_mgr.push(self._counter_action(log, "b", "edit"))
+        
+        assert undo_mgr.get_undo_count() == 1
+        undo_mgr.undo()
+        assert log == ["undo ab"]
+    
+    def test_no_merge_outside_window(self):
+        """Test actions further apart than the window stay separate."""
+        undo_mgr = UndoManager(coalesce_window=0.0)
+        log = []
+        first = self._counter_action(log, "a", "edit", merge_func=lambda later: later)
+        second = self._counter_action(log, "b", "edit")
+        second.timestamp = first.timestamp + 1.0
+        
+        undo_mgr.push(first)
+        undo_mgr.push(second)
+        
+        assert undo_mgr.get_undo_count() == 2
+    
+    def test_group(self):
+        """Test actions pushed in a group are undone and redone together."""
+        undo_mgr = UndoManager()
+        log = []
+        
+        with undo_mgr.group("Both"):
+            undo_mgr.push(self._counter_action(log, "a"))
+            undo_mgr.push(self._counter_action(log, "b"))
+        
+        assert undo_mgr.get_undo_count() == 1
+        assert undo_mgr.get_undo_description() == "Both"
+        undo_mgr.undo()
+        undo_mgr.redo()
+        assert log == ["undo b", "undo a", "redo a", "redo b"]
+
+
 class TestUndoContext:
     """Tests for UndoContext."""
     
@@ -0,0 +1,108 @@
+"""
+Unit tests for batch CSV import.
+"""
+
+import pytest
+import numpy as np
+from core.workspace import Workspace
+from studies.batch_import import batch_import_csv, collect_import_files
+from studies.data_table_study import ColumnType
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    """Directory with three CSV runs and one unrelated file."""
+    for i in range(3):
+        (tmp_path / f"run{i}.csv").write_text(
+            "t,v\n" + "\n".join(f"{k},{k * (i + 1)}" for k in range(5)) + "\n"
+        )
+    (tmp_path / "notes.txt").write_text("not data")
+    return tmp_path
+
+
+class TestCollectFiles:
+    """Test resolving directories and glob patterns."""
+
+    def test_directory(self, csv_dir):
+        """Test directory is searched with the pattern."""
+        files = collect_import_files(str(csv_dir))
+        assert [f.rsplit("/", 1)[-1] for f in files] == ["run0.csv", "run1.csv", "run2.csv"]
+
+    def test_glob(self, csv_dir):
+        """Test glob pattern is used as-is."""
+        assert len(collect_import_files(str(csv_dir / "run[01].csv"))) == 2
+
+
+class TestBatchImport:
+    """Test batch import into studies."""
+
+    def test_inline_import(self, csv_dir):
+        """Test each file becomes a study registered in the workspace."""
+        workspace = Workspace("Campaign", "numerical")
+        files = collect_import_files(str(csv_dir))
+
+        result = batch_import_csv(files, workspace=workspace, max_workers=1)
+
+        assert result.succeeded == 3
+        assert result.failed == 0
+        assert [s.name for s in result.studies] == ["run0", "run1", "run2"]
+        assert set(workspace.studies) == {"run0", "run1", "run2"}
+        np.testing.assert_array_equal(result.studies[2].table["v"], [0, 3, 6, 9, 12])
+
+    def test_process_pool(self, csv_dir):
+        """Test import through worker processes keeps input order."""
+        files = collect_import_files(str(csv_dir))
+
+        result = batch_import_csv(files, max_workers=2)
+
+        assert [s.name for s in result.studies] == ["run0", "run1", "run2"]
+
+    def test_per_file_errors(self, csv_dir):
+        """Test a failing file is reported without aborting the batch."""
+        files = collect_import_files(str(csv_dir)) + [str(csv_dir / "missing.csv")]
+
+        result = batch_import_csv(files, max_workers=1)
+
+        assert result.succeeded == 3
+        assert list(result.errors) == [str(csv_dir / "missing.csv")]
+
+    def test_metadata_template(self, csv_dir):
+        """Test template units and computed columns are applied."""
+        template = {
+            "t": {"type": ColumnType.DATA, "unit": "s"},
+            "v2": {"type": ColumnType.CALCULATED, "formula": "{v} * 2", "unit": None},
+            "absent": {"type": ColumnType.DATA, "unit": "m"},
+        }
+        files = collect_import_files(str(csv_dir))
+
+        result = batch_import_csv(files, metadata_template=template, max_workers=1)
+
+        study = result.studies[1]
+        assert study.get_column_unit("t") == "s"
+        assert "absent" not in study.table.columns
+        np.testing.assert_allclose(study.table["v2"], [0, 4, 8, 12, 16])
+
+    def test_unique_names(self, csv_dir):
+        """Test names already used in the workspace get a suffix."""
+        workspace = Workspace("Campaign", "numerical")
+        files = collect_import_files(str(csv_dir))
+        batch_import_csv(files[:1], workspace=workspace, max_workers=1)
+
+        result = batch_import_csv(files[:1], workspace=workspace, max_workers=1)
+
+        assert result.studies[0].name == "run0_2"
+
+    def test_progress_and_cancel(self, csv_dir):
+        """Test progress callback is called and can cancel the batch."""
+        calls = []
+
+        def progress(done, total, filepath):
+            calls.append((done, total))
+            return done < 2
+
+        files = collect_import_files(str(csv_dir))
+        result = batch_import_csv(files, max_workers=1, progress_callback=progress)
+
+        assert calls == [(1, 3), (2, 3)]
+        assert result.cancelled
+        assert result.succeeded == 2
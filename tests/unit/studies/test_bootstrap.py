@@ -0,0 +1,96 @@
+"""
+Unit tests for bootstrap confidence intervals.
+"""
+
+import pytest
+import numpy as np
+from studies.bootstrap import bootstrap
+from studies.statistics_study import StatisticsStudy
+from studies.data_table_study import DataTableStudy
+from core.workspace import Workspace
+
+
+@pytest.fixture
+def sample():
+    """Noisy measurements around 10."""
+    return np.random.default_rng(0).normal(10.0, 2.0, size=400)
+
+
+class TestBootstrap:
+    """Test the chunked bootstrap engine."""
+
+    def test_intervals_contain_estimates(self, sample):
+        """Test intervals bracket the sample statistics."""
+        result = bootstrap(sample, n_resamples=500, max_workers=1)
+
+        assert result.n_resamples == 500
+        assert not result.cancelled
+        assert result.estimates["mean"] == pytest.approx(sample.mean())
+        assert result.estimates["median"] == pytest.approx(np.median(sample))
+        for name, (low, high) in result.intervals.items():
+            assert low < result.estimates[name] < high, name
+        # Standard error of the mean is about std / sqrt(n)
+        assert result.standard_errors["mean"] == pytest.approx(2.0 / np.sqrt(400), rel=0.2)
+
+    def test_deterministic_for_any_worker_count(self, sample):
+        """Test equal seeds give equal intervals inline and on a pool."""
+        inline = bootstrap(sample, n_resamples=600, seed=5, max_workers=1)
+        pooled = bootstrap(sample, n_resamples=600, seed=5, max_workers=2)
+        other = bootstrap(sample, n_resamples=600, seed=6, max_workers=1)
+
+        assert pooled.intervals == inline.intervals
+        assert other.intervals != inline.intervals
+
+    def test_memory_budget(self, sample):
+        """Test small budgets (down to counts per value) give the same resamples."""
+        full = bootstrap(sample, n_resamples=300, max_workers=1)
+        blocked = bootstrap(sample, n_resamples=300, max_workers=1, max_bytes=16 * 400 * 3)
+        counted = bootstrap(sample, n_resamples=300, max_workers=1, max_bytes=1000)
+
+        for name, interval in full.intervals.items():
+            assert blocked.intervals[name] == pytest.approx(interval)
+            assert counted.intervals[name] == pytest.approx(interval)
+
+    def test_progress_and_cancel(self, sample):
+        """Test progress is reported per chunk and can cancel."""
+        calls = []
+
+        def progress(done, total):
+            calls.append((done, total))
+            return done < 500
+
+        result = bootstrap(sample, n_resamples=1000, max_workers=1, progress_callback=progress)
+
+        assert calls == [(250, 1000), (500, 1000)]
+        assert result.cancelled
+        assert result.n_resamples == 500
+        assert "mean" in result.intervals
+
+    def test_invalid_arguments(self, sample):
+        """Test unknown statistics and tiny samples raise."""
+        with pytest.raises(ValueError):
+            bootstrap(sample, statistics=("mode",))
+        with pytest.raises(ValueError):
+            bootstrap([1.0, np.nan])
+
+
+class TestBootstrapColumn:
+    """Test bootstrap intervals of StatisticsStudy."""
+
+    def test_intervals_stored_until_column_changes(self, sample):
+        """Test stored intervals are dropped once the data changes."""
+        workspace = Workspace("Test", "general")
+        data_study = DataTableStudy("Data", workspace=workspace)
+        workspace.add_study(data_study)
+        data_study.add_column("v", initial_data=sample)
+        stats_study = StatisticsStudy("Stats", source_study="Data", workspace=workspace)
+
+        result = stats_study.bootstrap_column("v", n_resamples=250, max_workers=1)
+
+        stored = stats_study.get_confidence_intervals("v")
+        assert stored["n_resamples"] == 250
+        assert stored["intervals"]["mean"] == list(result.intervals["mean"])
+        assert "confidence_intervals" in stats_study.to_dict()["metadata"]
+
+        data_study.set_values("v", [0], 100.0)
+        assert stats_study.get_confidence_intervals("v") is None
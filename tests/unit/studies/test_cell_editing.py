@@ -0,0 +1,145 @@
+"""
+Unit tests for DataTableStudy block edits and their undo actions.
+"""
+
+import pytest
+import numpy as np
+from studies.data_table_study import DataTableStudy, ColumnType
+
+
+@pytest.fixture
+def study():
+    """Study with two data columns and dependent columns."""
+    study = DataTableStudy("Edits")
+    study.add_column("x", initial_data=np.arange(6, dtype=float))
+    study.add_column("w", initial_data=np.ones(6))
+    study.add_column("y", ColumnType.CALCULATED, formula="{x} * {w}")
+    study.add_column("s", ColumnType.CALCULATED, formula="sum({x})")
+    study.undo_manager.clear()
+    return study
+
+
+class TestSetBlock:
+    """Test vectorized edits."""
+
+    def test_values_and_dependents(self, study):
+        """Test values are written and dependents recalculated."""
+        study.set_block({"x": ([1, 2], [10.0, 20.0]), "w": ([2], [2.0])})
+
+        assert study.table["x"].tolist() == [0, 10, 20, 3, 4, 5]
+        assert study.table["y"].tolist() == [0, 10, 40, 3, 4, 5]
+        assert study.table["s"].iloc[0] == 42
+
+    def test_single_undo_step(self, study):
+        """Test a block edit is undone and redone as one action."""
+        study.set_block({"x": ([1, 2], [10.0, 20.0]), "w": ([2], [2.0])}, description="Paste 3 cells")
+
+        assert study.undo_manager.get_undo_count() == 1
+        assert study.undo_manager.get_undo_description() == "Paste 3 cells"
+
+        study.undo_manager.undo()
+        assert study.table["x"].tolist() == [0, 1, 2, 3, 4, 5]
+        assert study.table["y"].tolist() == [0, 1, 2, 3, 4, 5]
+
+        study.undo_manager.redo()
+        assert study.table["y"].iloc[2] == 40
+
+    def test_fill_scalar(self, study):
+        """Test a scalar fills all given rows."""
+        study.set_values("w", range(6), 3.0)
+
+        assert study.table["y"].tolist() == [0, 3, 6, 9, 12, 15]
+
+    def test_clear_cells(self, study):
+        """Test None clears cells."""
+        study.set_values("x", [0, 5], None)
+
+        assert np.isnan(study.table["x"].iloc[5])
+        assert np.isnan(study.table["y"].iloc[0])
+
+
+    def test_returns_changed_ranges(self, study):
+        """Test edited rows and recalculated dependents are reported."""
+        changes = study.set_block({"x": ([2, 4], [10.0, 20.0])})
+
+        # y is element-wise, s is recomputed over the whole column; w is untouched
+        assert changes == {"x": (2, 5), "y": (2, 5), "s": (0, 6)}
+
+    def test_elementwise_dependents_evaluate_edited_rows(self, study):
+        """Test element-wise chains recompute only the edited rows."""
+        study.add_column("z", ColumnType.CALCULATED, formula="{y} + 1")
+        # Rows outside the edit are not evaluated again
+        study.table.data.loc[3, ["y", "z"]] = -1.0
+
+        changes = study.set_values("x", [1, 5], [10.0, 20.0])
+
+        assert changes["y"] == (1, 6) and changes["z"] == (1, 6)
+        assert study.table["y"].tolist() == [0, 10, 2, -1, 4, 20]
+        assert study.table["z"].tolist() == [1, 11, 3, -1, 5, 21]
+
+    def test_propagated_uncertainty_follows_edited_rows(self):
+        """Test element-wise uncertainties recompute only the edited rows."""
+        study = DataTableStudy("Uncertainty")
+        study.add_column("x", initial_data=np.arange(8, dtype=float))
+        study.add_column("δx")
+        study.table.data["δx"] = 0.1
+        study.column_metadata["δx"] = {"type": ColumnType.UNCERTAINTY, "uncertainty_reference": "x", "unit": None}
+        study.add_column("q", ColumnType.CALCULATED, formula="{x} ** 2", propagate_uncertainty=True)
+        study.table.data.loc[4, "q_u"] = -1.0
+
+        changes = study.set_values("δx", [2, 6], [1.0, 2.0])
+
+        assert changes["q_u"] == (2, 7)
+        assert study.table["q_u"].tolist() == pytest.approx([0.0, 0.2, 4.0, 0.6, -1.0, 1.0, 24.0, 1.4])
+
+    def test_unaffected_dependents_not_reported(self, study):
+        """Test computed columns not depending on the edit are left out."""
+        study.add_column("v", ColumnType.CALCULATED, formula="{w} + 1")
+
+        changes = study.set_values("x", [1], [7.0])
+
+        assert "v" not in changes and "w" not in changes
+        assert changes["x"] == (1, 2)
+
+    def test_no_changes(self, study):
+        """Test an empty edit reports nothing."""
+        assert study.set_values("x", [], []) == {}
+
+
+class TestEditCoalescing:
+    """Test rapid single-cell edits merge into one undo step."""
+
+    def test_edits_merge(self, study):
+        """Test consecutive edits with a merge key become one action."""
+        study.set_values("x", [0], [100.0], merge_key="edit_cells")
+        study.set_values("x", [0], [200.0], merge_key="edit_cells")
+        study.set_values("w", [3], [5.0], merge_key="edit_cells")
+
+        assert study.undo_manager.get_undo_count() == 1
+        assert study.undo_manager.get_undo_description() == "Edit 2 cells"
+
+        study.undo_manager.undo()
+        assert study.table["x"].iloc[0] == 0
+        assert study.table["w"].iloc[3] == 1
+
+        study.undo_manager.redo()
+        assert study.table["x"].iloc[0] == 200
+        assert study.table["y"].iloc[3] == 15
+
+    def test_window_expired(self, study):
+        """Test edits outside the coalesce window stay separate."""
+        study.undo_manager.coalesce_window = 0.0
+        study.set_values("x", [0], [100.0], merge_key="edit_cells")
+        study.undo_manager.undo_stack[-1].timestamp -= 1.0
+        study.set_values("x", [1], [200.0], merge_key="edit_cells")
+
+        assert study.undo_manager.get_undo_count() == 2
+
+    def test_batch_add_columns_grouped(self, study):
+        """Test columns added in a batch are undone together."""
+        study.add_columns_batch([{"name": "a"}, {"name": "b"}])
+
+        study.undo_manager.undo()
+
+        assert "a" not in study.table.columns
+        assert "b" not in study.table.columns
@@ -0,0 +1,109 @@
+"""
+Unit tests for column change publishing and study dependencies.
+"""
+
+import pytest
+import numpy as np
+from core.workspace import Workspace
+from studies.data_table_study import DataTableStudy, ColumnType
+from studies.plot_study import PlotStudy
+from studies.statistics_study import StatisticsStudy
+
+
+@pytest.fixture
+def workspace():
+    """Workspace with a table whose column y depends on x."""
+    workspace = Workspace("Test", "numerical")
+    study = DataTableStudy("Table", workspace=workspace)
+    study.add_column("x", initial_data=np.arange(5, dtype=float))
+    study.add_column("w", initial_data=np.ones(5))
+    study.add_column("y", ColumnType.CALCULATED, formula="{x} * 2")
+    workspace.add_study(study)
+    study.publish_changes()
+    return workspace
+
+
+@pytest.fixture
+def published(workspace):
+    """Changes published on the workspace bus."""
+    calls = []
+    workspace.events.subscribe(lambda name, columns: calls.append((name, columns)))
+    return calls
+
+
+class TestPublishChanges:
+    """Test DataTableStudy.publish_changes."""
+
+    def test_edit_publishes_column_and_dependents(self, workspace, published):
+        """Test an edit publishes the edited and recalculated columns."""
+        study = workspace.get_study("Table")
+        study.set_values("x", [1], [10.0])
+
+        assert study.publish_changes() == {"x", "y"}
+        assert published == [("Table", {"x", "y"})]
+
+    def test_nothing_changed(self, workspace, published):
+        """Test nothing is published without changes."""
+        assert workspace.get_study("Table").publish_changes() == set()
+        assert published == []
+
+    def test_undo_publishes(self, workspace, published):
+        """Test undo is detected from column versions."""
+        study = workspace.get_study("Table")
+        study.set_values("w", [0], [3.0])
+        study.publish_changes()
+        study.undo_manager.undo()
+
+        assert study.publish_changes() == {"w"}
+
+    def test_structural_change(self, workspace, published):
+        """Test adding a column publishes a change of any column."""
+        study = workspace.get_study("Table")
+        study.add_column("z", initial_data=np.zeros(5))
+
+        assert study.publish_changes() is None
+        assert published == [("Table", None)]
+
+    def test_remove_study_publishes(self, workspace, published):
+        """Test removing a study notifies its consumers."""
+        workspace.remove_study("Table")
+
+        assert published == [("Table", None)]
+
+
+class TestDependencies:
+    """Test declared dependencies of consumer studies."""
+
+    def test_plot_dependencies(self):
+        """Test plots declare data and error columns per study."""
+        plot = PlotStudy("Plot")
+        plot.add_series("Table", "x", "y", yerr_column="dy")
+        plot.add_series("Other", "t", "v")
+
+        assert plot.get_dependencies() == {"Table": {"x", "y", "dy"}, "Other": {"t", "v"}}
+
+    def test_statistics_dependencies(self, workspace):
+        """Test statistics read the analyzed columns of their source."""
+        stats = StatisticsStudy("Stats", source_study="Table", workspace=workspace)
+        assert stats.get_dependencies() == {"Table": None}
+
+        stats.analyze_column("w")
+        assert stats.get_dependencies() == {"Table": {"w"}}
+
+        assert StatisticsStudy("Empty").get_dependencies() == {}
+
+    def test_edit_wakes_only_plot_consumers(self, workspace):
+        """Test a change to w does not wake a plot of x and y."""
+        plot = PlotStudy("Plot", workspace=workspace)
+        plot.add_series("Table", "x", "y")
+        woken = []
+        workspace.events.subscribe(lambda name, columns: woken.append(columns), plot.get_dependencies)
+
+        study = workspace.get_study("Table")
+        study.set_values("w", [0], [2.0])
+        study.publish_changes()
+        assert woken == []
+
+        study.set_values("x", [0], [2.0])
+        study.publish_changes()
+        assert woken == [{"x", "y"}]
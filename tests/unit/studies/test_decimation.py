@@ -0,0 +1,182 @@
+"""
+Unit tests for plot series decimation.
+"""
+
+import numpy as np
+from matplotlib.figure import Figure
+
+from core.workspace import Workspace
+from studies.data_table_study import DataTableStudy
+from studies.plot_study import PlotStudy
+from studies.decimation import visible_range, minmax_indices, lttb_indices, thin_indices, density_grid
+
+
+class TestDecimation:
+    """Test index selection functions."""
+
+    def test_minmax_keeps_extremes(self):
+        """Test spikes and end points survive min/max decimation."""
+        y = np.sin(np.linspace(0, 20, 100_000))
+        y[12_345], y[67_890] = 5.0, -5.0
+
+        rows = minmax_indices(y, 100)
+
+        assert len(rows) <= 202
+        assert {0, 12_345, 67_890, 99_999} <= set(rows.tolist())
+        assert np.all(np.diff(rows) > 0)
+
+    def test_minmax_ignores_nan(self):
+        """Test NaN values are not chosen as extremes."""
+        y = np.arange(1000, dtype=float)
+        y[::2] = np.nan
+
+        rows = minmax_indices(y, 10)
+
+        assert not np.any(np.isnan(y[rows[1:-1]]))
+
+    def test_lttb_budget_and_ends(self):
+        """Test LTTB keeps exactly the threshold and both ends."""
+        x = np.linspace(0, 1, 10_000)
+        y = np.random.default_rng(0).normal(size=x.size)
+
+        rows = lttb_indices(x, y, 500)
+
+        assert len(rows) == 500
+        assert rows[0] == 0 and rows[-1] == 9_999
+        assert np.all(np.diff(rows) > 0)
+
+    def test_lttb_keeps_peak(self):
+        """Test a single peak is selected."""
+        x = np.arange(10_000, dtype=float)
+        y = np.zeros_like(x)
+        y[4_321] = 1.0
+
+        assert 4_321 in lttb_indices(x, y, 100)
+
+    def test_visible_range_sorted(self):
+        """Test the window of sorted x includes one neighbour per side."""
+        rows = visible_range(np.arange(100, dtype=float), (10.5, 20.5))
+
+        assert rows[0] == 10 and rows[-1] == 21
+
+    def test_visible_range_unsorted(self):
+        """Test unsorted x keeps inside points and their row neighbours."""
+        x = np.array([0.0, 5.0, 1.0, 9.0, 8.0])
+
+        assert visible_range(x, (4.0, 6.0)).tolist() == [0, 1, 2]
+
+    def test_thin(self):
+        """Test thinning stays within the budget."""
+        assert len(thin_indices(1001, 100)) <= 100
+        assert thin_indices(10, 100).tolist() == list(range(10))
+
+
+class TestDensityGrid:
+    """Test 2D binning for density rendering."""
+
+    def test_matches_histogram2d(self):
+        """Test counts equal numpy's 2D histogram (upper edge included)."""
+        rng = np.random.default_rng(0)
+        x, y = rng.normal(size=50_000), rng.normal(size=50_000)
+        x[:10], y[10:20] = 2.0, np.nan
+
+        counts = density_grid(x, y, (-2, 2), (-3, 3), (30, 40))
+        expected, _, _ = np.histogram2d(y, x, bins=(30, 40), range=((-3, 3), (-2, 2)))
+
+        assert counts.shape == (30, 40)
+        np.testing.assert_array_equal(counts, expected)
+
+    def test_degenerate_range(self):
+        """Test a zero-width range still bins its points."""
+        counts = density_grid(np.ones(5), np.arange(5.0), (1, 1), (0, 4), (4, 3))
+        assert counts.sum() == 5
+
+
+class TestPlotDecimation:
+    """Test PlotStudy draws decimated series."""
+
+    def setup_method(self):
+        """Setup workspace with a long series."""
+        self.workspace = Workspace("Test", "numerical")
+        data = DataTableStudy("Data", workspace=self.workspace)
+        self.workspace.add_study(data)
+        x = np.arange(200_000, dtype=float)
+        data.add_column("x", initial_data=x)
+        data.add_column("y", initial_data=np.sin(x / 1000))
+        data.add_column("e", initial_data=np.full(x.size, 0.1))
+
+        self.plot = PlotStudy("Plot", workspace=self.workspace)
+        self.plot.point_budget = 1000
+
+    def test_line_decimated(self):
+        """Test a long line is drawn with at most the budget of points."""
+        self.plot.add_series("Data", "x", "y")
+        figure = Figure()
+        self.plot.update_plot(figure)
+
+        line = figure.axes[0].lines[0]
+        assert len(line.get_xdata()) <= 1000
+        assert line.get_xdata()[-1] == 199_999
+
+    def test_switch_off(self):
+        """Test the per-series switch draws every point."""
+        self.plot.add_series("Data", "x", "y", decimate=False)
+        figure = Figure()
+        self.plot.update_plot(figure)
+
+        assert len(figure.axes[0].lines[0].get_xdata()) == 200_000
+
+    def test_redecimate_zoomed(self):
+        """Test zooming in re-samples the visible range at full detail."""
+        self.plot.add_series("Data", "x", "y")
+        figure = Figure()
+        self.plot.update_plot(figure)
+
+        assert self.plot.redecimate((1000.0, 1200.0))
+
+        xdata = figure.axes[0].lines[0].get_xdata()
+        # Visible range widened by half its width on both sides, not decimated
+        assert xdata[0] == 899 and xdata[-1] == 1301
+
+    def test_error_bars_thinned(self):
+        """Test error bar series are decimated and redrawn on zoom."""
+        self.plot.add_series("Data", "x", "y", yerr_column="e")
+        figure = Figure()
+        self.plot.update_plot(figure)
+
+        container = figure.axes[0].containers[0]
+        assert len(container.lines[0].get_xdata()) <= 1000
+
+        assert self.plot.redecimate((0.0, 100.0))
+        assert len(figure.axes[0].containers) == 1
+
+    def test_settings_serialized(self):
+        """Test budget and method round-trip through to_dict."""
+        self.plot.decimation_method = "lttb"
+        restored = PlotStudy.from_dict(self.plot.to_dict(), workspace=self.workspace)
+
+        assert restored.point_budget == 1000
+        assert restored.decimation_method == "lttb"
+
+    def test_density_rebinned_on_zoom(self):
+        """Test density series are drawn as an image re-binned for the view."""
+        self.plot.add_series("Data", "x", "y", style="density", colormap="magma")
+        figure = Figure(figsize=(4, 3), dpi=100)
+        self.plot.update_plot(figure)
+
+        ax = figure.axes[0]
+        image = ax.images[0]
+        assert not ax.collections and not ax.lines
+        assert image.get_cmap().name == "magma"
+        assert np.nansum(image.get_array()) == 200_000
+        assert image.get_extent()[:2] == [0, 199_999]
+
+        # Autoscaled view: nothing to re-bin
+        assert not self.plot.redecimate(ax.get_xlim())
+
+        ax.set_xlim(0, 1000)
+        ax.set_ylim(-1, 1)
+        assert self.plot.redecimate(ax.get_xlim())
+        x0, x1, y0, y1 = image.get_extent()
+        assert (x0, x1) == (-500, 1500)
+        assert (y0, y1) == (-2, 2)
@@ -0,0 +1,124 @@
+"""
+Unit tests for the vectorized descriptive statistics kernel.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from studies.descriptive_stats import describe, describe_groups, pairwise_covariance
+
+
+def _reference(data):
+    """Statistics computed the straightforward way, one pass each."""
+    n = len(data)
+    mean, std = np.mean(data), np.std(data, ddof=1)
+    skew = np.sum((data - mean) ** 3) / n / std**3 * np.sqrt(n * (n - 1)) / (n - 2)
+    kurt = np.sum((data - mean) ** 4) / n / std**4 - 3.0
+    kurt = ((n - 1) * ((n + 1) * kurt + 6)) / ((n - 2) * (n - 3))
+    return {
+        'count': n, 'mean': mean, 'median': np.median(data), 'std': std,
+        'variance': np.var(data, ddof=1), 'min': np.min(data), 'max': np.max(data),
+        'q25': np.percentile(data, 25), 'q75': np.percentile(data, 75),
+        'skewness': skew, 'kurtosis': kurt,
+    }
+
+
+class TestDescribe:
+    """Test describe() against per-statistic numpy calls."""
+
+    def test_single_column(self):
+        """Test a 1D array matches the reference statistics."""
+        data = np.random.default_rng(0).gamma(2.0, size=1001)
+
+        stats = describe(data)[0]
+
+        for key, expected in _reference(data).items():
+            assert stats[key] == pytest.approx(expected, rel=1e-9), key
+        assert stats['iqr'] == pytest.approx(stats['q75'] - stats['q25'])
+
+    def test_block_with_missing_values(self):
+        """Test each column of a block ignores its own NaN/inf values."""
+        rng = np.random.default_rng(1)
+        block = rng.normal(size=(500, 4))
+        block[rng.random(block.shape) < 0.2] = np.nan
+        block[7, 1] = np.inf
+        block[:, 3] = np.nan
+
+        results = describe(block)
+
+        assert results[3] == {}
+        for j in range(3):
+            data = block[:, j][np.isfinite(block[:, j])]
+            for key, expected in _reference(data).items():
+                assert results[j][key] == pytest.approx(expected, rel=1e-9), (j, key)
+
+    def test_small_samples(self):
+        """Test shape statistics are 0 when too few values exist."""
+        one, = describe(np.array([4.0]))
+        assert one['std'] == 0.0 and one['median'] == 4.0
+
+        three, = describe(np.array([1.0, 2.0, 4.0]))
+        assert three['skewness'] != 0.0
+        assert three['kurtosis'] == 0.0
+
+
+class TestDescribeGroups:
+    """Test describe_groups() against describe() on each group."""
+
+    def test_matches_describe_per_group(self):
+        """Test every group matches the statistics of its rows."""
+        rng = np.random.default_rng(7)
+        values = rng.normal(size=(5000, 2))
+        values[::13, 0] = np.nan
+        codes = rng.integers(-1, 40, size=5000)
+
+        results = describe_groups(values, codes, 41)
+
+        for j, stats in enumerate(results):
+            for group in (0, 17, 39):
+                expected = describe(values[codes == group, j])[0]
+                for key, value in expected.items():
+                    assert stats[key][group] == pytest.approx(value, rel=1e-9), key
+
+    def test_empty_groups(self):
+        """Test groups without finite values are NaN with count 0."""
+        values = np.array([1.0, 2.0, np.nan, 4.0])
+        codes = np.array([0, 0, 1, 2])
+
+        stats = describe_groups(values, codes, 4)[0]
+
+        assert stats['count'].tolist() == [2, 0, 1, 0]
+        assert np.isnan(stats['mean'][1]) and np.isnan(stats['median'][3])
+        assert stats['median'][0] == 1.5
+        assert stats['std'][2] == 0.0
+
+
+class TestPairwiseCovariance:
+    """Test pairwise_covariance() against pandas."""
+
+    def test_matches_pandas_with_missing_values(self):
+        """Test pairwise-complete covariance and correlation."""
+        rng = np.random.default_rng(8)
+        values = rng.normal(size=(500, 4)) + 1e4
+        values[:, 1] += 2.0 * values[:, 0]
+        values[rng.random(values.shape) < 0.1] = np.nan
+        frame = pd.DataFrame(values)
+
+        covariance, correlation, counts = pairwise_covariance(values)
+
+        np.testing.assert_allclose(covariance, frame.cov().to_numpy(), rtol=1e-9)
+        np.testing.assert_allclose(correlation, frame.corr().to_numpy(), rtol=1e-9)
+        assert counts[0, 1] == len(frame[[0, 1]].dropna())
+
+    def test_complete_and_degenerate_columns(self):
+        """Test the dense path and NaN for constant or empty columns."""
+        values = np.array([[1.0, 2.0, 5.0, np.nan], [2.0, 4.0, 5.0, np.nan], [4.0, 7.0, 5.0, 1.0]])
+
+        covariance, correlation, counts = pairwise_covariance(values[:, :2])
+        np.testing.assert_allclose(covariance, np.cov(values[:, :2], rowvar=False))
+        np.testing.assert_allclose(correlation, np.corrcoef(values[:, :2], rowvar=False))
+
+        covariance, correlation, counts = pairwise_covariance(values)
+        assert covariance[2, 2] == 0.0
+        assert np.isnan(correlation[0, 2])
+        assert np.isnan(covariance[0, 3]) and counts[0, 3] == 1
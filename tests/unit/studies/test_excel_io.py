@@ -0,0 +1,123 @@
+"""
+Unit tests for DataTableStudy Excel export/import.
+"""
+
+import pytest
+import numpy as np
+import openpyxl
+from studies.data_table_study import DataTableStudy, ColumnType
+
+
+@pytest.fixture
+def study():
+    """Study with data, calculated, derivative and range columns."""
+    study = DataTableStudy("Excel")
+    study.add_column("t", ColumnType.RANGE, range_type="linspace",
+                     range_start=0, range_stop=4, range_count=5)
+    study.add_column("x", unit="m", initial_data=[0.0, 1.0, np.nan, 9.0, 16.0])
+    study.add_column("y", ColumnType.CALCULATED, formula="{x} * 2", unit="m")
+    study.add_column("v", ColumnType.DERIVATIVE, derivative_of="x", with_respect_to="t")
+    return study
+
+
+class TestExcelRoundTrip:
+    """Test export followed by import restores the table."""
+
+    def test_values(self, study, tmp_path):
+        """Test data values and missing cells survive round-trip."""
+        path = tmp_path / "data.xlsx"
+        study.export_to_excel(str(path))
+
+        restored = DataTableStudy("Restored")
+        restored.import_from_excel(str(path))
+
+        assert restored.table.columns == ["t", "x", "y", "v"]
+        np.testing.assert_array_equal(restored.table["x"], study.table["x"])
+        assert np.isnan(restored.table["x"].iloc[2])
+
+    def test_metadata_restored(self, study, tmp_path):
+        """Test column types, units and formulas are restored."""
+        path = tmp_path / "data.xlsx"
+        study.export_to_excel(str(path))
+
+        restored = DataTableStudy("Restored")
+        restored.import_from_excel(str(path))
+
+        assert restored.get_column_type("t") == ColumnType.RANGE
+        assert restored.get_column_type("y") == ColumnType.CALCULATED
+        assert restored.get_column_formula("y") == "{x} * 2"
+        assert restored.get_column_type("v") == ColumnType.DERIVATIVE
+        assert restored.get_column_unit("x") == "m"
+
+    def test_formulas_live_after_import(self, study, tmp_path):
+        """Test restored calculated columns react to edits."""
+        path = tmp_path / "data.xlsx"
+        study.export_to_excel(str(path))
+
+        restored = DataTableStudy("Restored")
+        restored.import_from_excel(str(path))
+        restored.table.data.loc[0, "x"] = 5.0
+        restored.on_data_changed("x")
+
+        assert restored.table["y"].iloc[0] == pytest.approx(10.0)
+
+    def test_custom_sheet_name(self, study, tmp_path):
+        """Test export/import with a custom sheet name."""
+        path = tmp_path / "data.xlsx"
+        study.export_to_excel(str(path), sheet_name="Run1")
+
+        restored = DataTableStudy("Restored")
+        restored.import_from_excel(str(path), sheet_name="Run1")
+
+        assert len(restored.table.data) == 5
+
+    def test_export_uses_column_width_limits(self, study, tmp_path):
+        """Test column widths are capped."""
+        path = tmp_path / "data.xlsx"
+        study.export_to_excel(str(path))
+
+        ws = openpyxl.load_workbook(path)["Data"]
+        assert ws.column_dimensions["E"].width <= 50
+
+
+class TestPlainSheetImport:
+    """Test importing sheets not written by DataManip."""
+
+    def test_first_row_is_header(self, tmp_path):
+        """Test first non-empty row is used as header."""
+        path = tmp_path / "plain.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "Measurements"
+        ws.append(["a", "b", "label"])
+        ws.append([1, 1.5, "x"])
+        ws.append([2, None, "y"])
+        ws.append([3, 3.5, None])
+        wb.save(path)
+
+        study = DataTableStudy("Plain")
+        study.import_from_excel(str(path))
+
+        assert study.table.columns == ["a", "b", "label"]
+        assert study.table["a"].dtype == np.int64
+        assert study.table["b"].dtype == np.float64
+        assert np.isnan(study.table["b"].iloc[1])
+        assert study.table["label"].tolist()[:2] == ["x", "y"]
+        assert study.get_column_type("a") == ColumnType.DATA
+
+    def test_trailing_empty_rows_dropped(self, tmp_path):
+        """Test empty rows after the data are not imported."""
+        path = tmp_path / "plain.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(["a"])
+        ws.append([1.0])
+        ws.append([None])
+        ws.append([2.0])
+        ws.cell(10, 1, None)
+        wb.save(path)
+
+        study = DataTableStudy("Plain")
+        study.import_from_excel(str(path))
+
+        assert len(study.table.data) == 3
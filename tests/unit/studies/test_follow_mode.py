@@ -0,0 +1,173 @@
+"""
+Unit tests for incremental row appends and CSV follow mode.
+"""
+
+import numpy as np
+import pandas as pd
+from studies.data_table_study import DataTableStudy, ColumnType
+from studies.file_follower import FileFollower
+
+
+def _add_computed_columns(study):
+    """Add element-wise, aggregate, derivative and uncertainty columns."""
+    study.add_column("z", ColumnType.CALCULATED, formula="{y} * 2 + 1")
+    study.add_column("m", ColumnType.CALCULATED, formula="{y} - mean({y})")
+    study.add_column("dy", ColumnType.DERIVATIVE, derivative_of="y", with_respect_to="t")
+    study.add_column("d2y", ColumnType.DERIVATIVE, derivative_of="y", with_respect_to="t", order=2)
+    study.add_column("w", ColumnType.CALCULATED, formula="{dy} + {z}")
+    study.add_column("q", ColumnType.CALCULATED, formula="{y} * {t}", propagate_uncertainty=True)
+
+
+def _study(t, y):
+    """Study with t, y and a manual uncertainty column for y."""
+    study = DataTableStudy("Live")
+    study.add_column("t", initial_data=t)
+    study.add_column("y", initial_data=y)
+    study.add_column("δy")
+    study.table.data["δy"] = 0.1
+    study.column_metadata["δy"] = {"type": ColumnType.UNCERTAINTY, "uncertainty_reference": "y", "unit": None}
+    return study
+
+
+class TestAppendRows:
+    """Test incremental recomputation after appending rows."""
+    
+    def _full_and_incremental(self, n_old, n_new):
+        t = np.linspace(0, 2, n_old + n_new) ** 1.5
+        y = np.sin(t) * 10
+        
+        full = _study(t, y)
+        _add_computed_columns(full)
+        
+        inc = _study(t[:n_old], y[:n_old])
+        _add_computed_columns(inc)
+        first = inc.append_rows({"t": t[n_old:], "y": y[n_old:], "δy": np.full(n_new, 0.1)})
+        return full, inc, first
+    
+    def test_matches_full_recalculation(self):
+        """Test appended table equals a table computed from scratch."""
+        full, inc, _ = self._full_and_incremental(20, 7)
+        
+        for col in full.table.columns:
+            np.testing.assert_allclose(
+                inc.table[col].astype(float), full.table[col].astype(float), err_msg=col
+            )
+    
+    def test_first_changed_row(self):
+        """Test aggregate formula forces a change from row 0."""
+        _, _, first = self._full_and_incremental(20, 7)
+        assert first == 0
+    
+    def test_elementwise_only_touches_new_rows(self):
+        """Test element-wise columns keep old rows and only evaluate new ones."""
+        study = DataTableStudy("Live")
+        study.add_column("y", initial_data=[1.0, 2.0, 3.0])
+        study.add_column("z", ColumnType.CALCULATED, formula="{y} * 2")
+        study.table.data.loc[0, "z"] = -1.0  # sentinel: must survive the append
+        
+        first = study.append_rows(pd.DataFrame({"y": [4.0, 5.0]}))
+        
+        assert first == 3
+        np.testing.assert_array_equal(study.table["z"], [-1.0, 4.0, 6.0, 8.0, 10.0])
+    
+    def test_derivative_window(self):
+        """Test derivative rewrites only rows next to the old end."""
+        study = DataTableStudy("Live")
+        study.add_column("t", initial_data=np.arange(10.0))
+        study.add_column("y", initial_data=np.arange(10.0) ** 2)
+        study.add_column("dy", ColumnType.DERIVATIVE, derivative_of="y", with_respect_to="t")
+        
+        first = study.append_rows({"t": [10.0, 11.0], "y": [100.0, 121.0]})
+        
+        assert first == 9
+        np.testing.assert_allclose(study.table["dy"], np.gradient(np.arange(12.0) ** 2))
+    
+    def test_unknown_columns_ignored(self):
+        """Test columns not in the table are ignored and missing ones are NaN."""
+        study = DataTableStudy("Live")
+        study.add_column("a", initial_data=[1.0])
+        study.add_column("b", initial_data=[2.0])
+        
+        study.append_rows({"a": [3.0], "c": [9.0]})
+        
+        assert study.table.columns == ["a", "b"]
+        assert np.isnan(study.table["b"].iloc[1])
+
+
+class TestFileFollower:
+    """Test incremental CSV reading."""
+    
+    def test_partial_line_deferred(self, tmp_path):
+        """Test an incomplete last line is only read once it is finished."""
+        path = tmp_path / "live.csv"
+        path.write_text("t,y\n0,0\n1,1\n2,")
+        follower = FileFollower(str(path))
+        
+        assert len(follower.read_all()) == 2
+        assert follower.poll() is None
+        
+        with open(path, "a") as f:
+            f.write("4\n3,9\n")
+        rows = follower.poll()
+        
+        assert rows["y"].tolist() == [4, 9]
+        assert follower.poll() is None
+    
+    def test_truncation_rereads(self, tmp_path):
+        """Test a truncated file is re-read from the start."""
+        path = tmp_path / "live.csv"
+        path.write_text("t,y\n0,0\n1,1\n2,4\n")
+        follower = FileFollower(str(path))
+        follower.read_all()
+        
+        path.write_text("t,y\n5,5\n")
+        rows = follower.poll()
+        
+        assert follower.truncated
+        assert rows["t"].tolist() == [5]
+
+
+class TestFollowFile:
+    """Test following a file from a study."""
+    
+    def test_follow_keeps_formulas(self, tmp_path):
+        """Test appended rows update calculated columns without re-import."""
+        path = tmp_path / "live.csv"
+        path.write_text("t,y\n0,0\n1,1\n")
+        study = DataTableStudy("Live")
+        assert study.follow_file(str(path)) == 2
+        study.add_column("z", ColumnType.CALCULATED, formula="{y} + 1", unit="V")
+        
+        with open(path, "a") as f:
+            f.write("2,4\n")
+        first = study.poll_follow()
+        
+        assert first == 2
+        assert study.table["z"].tolist() == [1.0, 2.0, 5.0]
+        assert study.get_column_unit("z") == "V"
+        assert study.poll_follow() is None
+    
+    def test_follow_after_import(self, tmp_path):
+        """Test following a file that was already imported appends only new rows."""
+        path = tmp_path / "live.csv"
+        path.write_text("t,y\n0,0\n1,1\n")
+        study = DataTableStudy("Live")
+        study.import_from_csv(str(path))
+        
+        with open(path, "a") as f:
+            f.write("2,4\n")
+        appended = study.follow_file(str(path))
+        
+        assert appended == 1
+        assert study.table["y"].tolist() == [0, 1, 4]
+    
+    def test_stop_follow(self, tmp_path):
+        """Test polling after stop does nothing."""
+        path = tmp_path / "live.csv"
+        path.write_text("t,y\n0,0\n")
+        study = DataTableStudy("Live")
+        study.follow_file(str(path))
+        study.stop_follow()
+        
+        assert study.follower is None
+        assert study.poll_follow() is None
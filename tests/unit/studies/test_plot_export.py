@@ -0,0 +1,92 @@
+"""
+Unit tests for headless plot rendering and batch export.
+"""
+
+import json
+import pytest
+import numpy as np
+from core.workspace import Workspace
+from studies.data_table_study import DataTableStudy, ColumnType
+from studies.plot_study import PlotStudy
+from studies.plot_export import (
+    render_plot, export_workspace_plots, export_workspace_files, _plot_snapshot
+)
+
+
+@pytest.fixture
+def workspace():
+    """Workspace with one table and two plots of it."""
+    workspace = Workspace("Report", "numerical")
+    table = DataTableStudy("Data", workspace=workspace)
+    table.add_column("x", initial_data=np.linspace(0, 10, 50_000))
+    table.add_column("y", ColumnType.CALCULATED, formula="sin({x})")
+    table.add_column("unused", initial_data=np.zeros(50_000))
+    workspace.add_study(table)
+
+    for name in ("Sine", "Sine/2"):
+        plot = PlotStudy(name, workspace=workspace)
+        plot.add_series("Data", "x", "y")
+        workspace.add_study(plot)
+    return workspace
+
+
+class TestRenderPlot:
+    """Test rendering a single plot without Qt."""
+
+    def test_writes_image(self, workspace, tmp_path):
+        """Test an image is written and the live plot is untouched."""
+        plot = workspace.get_study("Sine")
+        filepath = render_plot(plot, str(tmp_path / "sine.png"), dpi=72)
+
+        with open(filepath, "rb") as f:
+            assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+        assert plot.figure is None
+
+    def test_vector_format(self, workspace, tmp_path):
+        """Test the format is taken from the file extension."""
+        filepath = render_plot(workspace.get_study("Sine"), str(tmp_path / "sine.svg"))
+        assert "<svg" in open(filepath).read(1000)
+
+
+class TestBatchExport:
+    """Test exporting all plots of workspaces."""
+
+    def test_snapshot_contains_only_read_columns(self, workspace):
+        """Test export jobs carry only the columns a plot reads."""
+        snapshot = _plot_snapshot(workspace.get_study("Sine"))
+        frame, metadata = snapshot["tables"]["Data"]
+
+        assert sorted(frame.columns) == ["x", "y"]
+        assert set(metadata) == {"x", "y"}
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_export_workspace(self, workspace, tmp_path, max_workers):
+        """Test every plot is exported, inline and on a process pool."""
+        result = export_workspace_plots(workspace, str(tmp_path), dpi=50, max_workers=max_workers)
+
+        assert result.failed == 0
+        assert list(result.files) == ["Sine", "Sine/2"]
+        assert result.files["Sine/2"].endswith("Sine_2.png")
+        assert all((tmp_path / name).exists() for name in ("Sine.png", "Sine_2.png"))
+
+    def test_cancel(self, workspace, tmp_path):
+        """Test returning False from the progress callback stops the batch."""
+        result = export_workspace_plots(
+            workspace, str(tmp_path), dpi=50, max_workers=1,
+            progress_callback=lambda done, total, name: False
+        )
+
+        assert result.cancelled
+        assert result.succeeded == 1
+
+    def test_export_workspace_files(self, workspace, tmp_path):
+        """Test saved workspaces are exported to one folder each."""
+        saved = tmp_path / "report.json"
+        saved.write_text(json.dumps(workspace.to_dict()))
+        missing = str(tmp_path / "missing.json")
+
+        result = export_workspace_files([str(saved), missing], str(tmp_path / "out"), dpi=50, max_workers=1)
+
+        assert sorted(result.files) == ["report/Sine", "report/Sine/2"]
+        assert list(result.errors) == [missing]
+        assert (tmp_path / "out" / "report" / "Sine.png").exists()
@@ -189,3 +189,75 @@ class TestPlotStudy:
         
         assert data1 is not None
         assert data2 is not None
+
+
+class TestIncrementalUpdate:
+    """Test refresh_data updates persistent artists."""
+    
+    def setup_method(self):
+        """Setup workspace with a drawn plot."""
+        from matplotlib.figure import Figure
+        
+        self.workspace = Workspace("Test", "numerical")
+        self.data_study = DataTableStudy("Data", workspace=self.workspace)
+        self.workspace.add_study(self.data_study)
+        self.data_study.add_column("x", initial_data=[0.0, 1.0, 2.0])
+        self.data_study.add_column("y", initial_data=[0.0, 1.0, 4.0])
+        self.data_study.add_column("e", initial_data=[0.1, 0.1, 0.1])
+        
+        self.plot = PlotStudy("Plot", workspace=self.workspace)
+        self.figure = Figure()
+    
+    def test_requires_drawn_figure(self):
+        """Test nothing can be refreshed before update_plot."""
+        self.plot.add_series("Data", "x", "y")
+        assert not self.plot.refresh_data()
+    
+    def test_line_updated_in_place(self):
+        """Test a data change reuses the line and rescales the axes."""
+        self.plot.add_series("Data", "x", "y")
+        self.plot.update_plot(self.figure)
+        ax = self.figure.axes[0]
+        line = ax.lines[0]
+        
+        self.data_study.set_values("y", [2], [40.0])
+        
+        assert self.plot.refresh_data()
+        assert self.figure.axes[0] is ax and ax.lines[0] is line
+        assert list(line.get_ydata()) == [0.0, 1.0, 40.0]
+        assert ax.get_ylim()[1] >= 40
+    
+    def test_scatter_updated_in_place(self):
+        """Test scatter offsets follow the data."""
+        self.plot.add_series("Data", "x", "y", style="scatter")
+        self.plot.update_plot(self.figure)
+        
+        self.data_study.set_values("x", [0], [-5.0])
+        
+        assert self.plot.refresh_data()
+        ax = self.figure.axes[0]
+        assert ax.collections[0].get_offsets()[0][0] == -5
+        assert ax.get_xlim()[0] <= -5
+    
+    def test_error_bars_updated_in_place(self):
+        """Test error bar segments and caps are moved."""
+        self.plot.add_series("Data", "x", "y", yerr_column="e")
+        self.plot.update_plot(self.figure)
+        container = self.figure.axes[0].containers[0]
+        
+        self.data_study.set_values("e", [1], [2.0])
+        
+        assert self.plot.refresh_data()
+        assert self.figure.axes[0].containers[0] is container
+        segments = container.lines[2][0].get_segments()
+        assert segments[1][0][1] == pytest.approx(-1.0)
+        assert segments[1][1][1] == pytest.approx(3.0)
+    
+    def test_config_change_needs_rebuild(self):
+        """Test changed series configuration is not refreshed in place."""
+        self.plot.add_series("Data", "x", "y")
+        self.plot.update_plot(self.figure)
+        
+        self.plot.series[0]["color"] = "red"
+        
+        assert not self.plot.refresh_data()
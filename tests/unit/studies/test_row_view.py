@@ -0,0 +1,120 @@
+"""
+Unit tests for RowView sort and filter.
+"""
+
+import pytest
+import numpy as np
+from core.exceptions import FormulaError
+from studies.data_table_study import DataTableStudy, ColumnType
+
+
+@pytest.fixture
+def study():
+    """Study with a key column containing ties and a missing value."""
+    study = DataTableStudy("View")
+    study.add_column("k", initial_data=[2.0, 1.0, np.nan, 2.0, 0.0])
+    study.add_column("v", initial_data=[10.0, 20.0, 30.0, 40.0, 50.0])
+    study.add_column("d", ColumnType.CALCULATED, formula="{v} / 10")
+    return study
+
+
+class TestSort:
+    """Test index-based sorting."""
+
+    def test_identity_by_default(self, study):
+        """Test an unsorted, unfiltered view has no index."""
+        assert study.row_view.is_identity
+        assert study.row_view.index is None
+        assert len(study.row_view) == 5
+
+    def test_stable_ascending(self, study):
+        """Test ties keep table order and missing values go last."""
+        study.row_view.set_sort([("k", True)])
+
+        assert study.row_view.index.tolist() == [4, 1, 0, 3, 2]
+
+    def test_descending(self, study):
+        """Test descending order keeps ties stable and missing values last."""
+        study.row_view.set_sort([("k", False)])
+
+        assert study.row_view.index.tolist() == [0, 3, 1, 4, 2]
+
+    def test_multiple_keys(self, study):
+        """Test secondary keys order ties of the primary key."""
+        study.row_view.set_sort([("k", True), ("v", False)])
+
+        assert study.row_view.index.tolist() == [4, 1, 3, 0, 2]
+
+    def test_text_column(self, study):
+        """Test non-numeric columns sort by value."""
+        study.add_column("s", initial_data=np.array(["b", "a", "c", None, "a"], dtype=object))
+        study.row_view.set_sort([("s", True)])
+
+        assert study.row_view.index.tolist() == [1, 4, 0, 2, 3]
+
+    def test_data_not_moved(self, study):
+        """Test the table keeps its order."""
+        study.row_view.set_sort([("k", True)])
+
+        assert study.table["v"].tolist() == [10, 20, 30, 40, 50]
+
+    def test_unknown_column(self, study):
+        """Test sorting by a missing column raises."""
+        with pytest.raises(ValueError):
+            study.row_view.set_sort([("missing", True)])
+
+
+class TestFilter:
+    """Test formula-based filtering."""
+
+    def test_mask(self, study):
+        """Test only matching rows are shown, missing values excluded."""
+        study.row_view.set_filter("({k} >= 1) & ({d} < 4)")
+
+        assert study.row_view.index.tolist() == [0, 1]
+
+    def test_filter_then_sort(self, study):
+        """Test sorting applies to the filtered rows."""
+        study.row_view.set_filter("{v} > 15")
+        study.row_view.set_sort([("k", True)])
+
+        assert study.row_view.source_rows([0, 1, 2, 3]).tolist() == [4, 1, 3, 2]
+
+    def test_invalid_filter_kept_previous(self, study):
+        """Test a failing expression raises and leaves the view unchanged."""
+        study.row_view.set_filter("{v} > 15")
+
+        with pytest.raises(FormulaError):
+            study.row_view.set_filter("{missing} > 1")
+
+        assert study.row_view.filter_expression == "{v} > 15"
+        assert len(study.row_view) == 4
+
+    def test_row_count_change_refreshes(self, study):
+        """Test appended rows are placed into the view."""
+        study.row_view.set_filter("{v} > 35")
+        study.append_rows({"k": [9.0], "v": [60.0]})
+
+        assert study.row_view.index.tolist() == [3, 4, 5]
+
+    def test_ring_buffer_eviction_refreshes(self):
+        """Test appends at ring capacity (same row count) update the view."""
+        study = DataTableStudy("Ring")
+        study.add_column("x", initial_data=[1.0, 5.0, 11.0, -2.0])
+        study.enable_ring_buffer(4)
+        study.row_view.set_filter("{x} > 2")
+        assert study.table["x"].to_numpy()[study.row_view.index].tolist() == [5.0, 11.0]
+
+        study.append({"x": [3.0, 0.0]})
+
+        assert len(study.table.data) == 4
+        assert study.table["x"].to_numpy()[study.row_view.index].tolist() == [11.0, 3.0]
+
+    def test_clear(self, study):
+        """Test clearing restores table order."""
+        study.row_view.set_filter("{v} > 15")
+        study.row_view.set_sort([("k", True)])
+        study.row_view.clear()
+
+        assert study.row_view.is_identity
+        assert len(study.row_view) == 5
@@ -227,6 +227,157 @@ class TestStatisticalAnalysis:
         assert len(stats_study.analyzed_columns) == 0
 
 
+class TestAnalyzeColumns:
+    """Test analyzing several columns at once."""
+    
+    def test_all_numerical_columns(self):
+        """Test every numerical column is analyzed and text is skipped."""
+        workspace = Workspace("Test", "general")
+        data_study = DataTableStudy("Data", workspace=workspace)
+        workspace.add_study(data_study)
+        data_study.add_column("a", initial_data=np.array([1.0, 2.0, 3.0, np.nan]))
+        data_study.add_column("b", initial_data=np.array([10.0, 20.0, np.inf, 40.0]))
+        data_study.table.data["label"] = ["p", "q", "r", "s"]
+        
+        stats_study = StatisticsStudy("Stats", source_study="Data", workspace=workspace)
+        results = stats_study.analyze_columns()
+        
+        assert list(results) == ["a", "b"]
+        assert results["a"]["mean"] == 2.0
+        assert results["b"]["count"] == 3
+        assert results["b"]["median"] == 20.0
+        assert stats_study.analyzed_columns == ["a", "b"]
+        assert stats_study.analyze_columns(["label"]) == {}
+        assert stats_study.get_source_data("label") is None
+
+
+class TestResultCache:
+    """Test availability checks and cached results."""
+    
+    @pytest.fixture
+    def studies(self):
+        """Statistics study over a table with numeric and text columns."""
+        workspace = Workspace("Test", "general")
+        data_study = DataTableStudy("Data", workspace=workspace)
+        workspace.add_study(data_study)
+        data_study.add_column("a", initial_data=np.array([1.0, 2.0, 3.0, 4.0]))
+        data_study.add_column("n", initial_data=np.array([1, 2, 3, 4]))
+        data_study.add_column("text", initial_data=np.array(["p", "q", "r", "s"], dtype=object))
+        data_study.add_column("numbers", initial_data=np.array([1, 2.5, None, 4], dtype=object))
+        stats_study = StatisticsStudy("Stats", source_study="Data", workspace=workspace)
+        return data_study, stats_study
+    
+    def test_available_columns_without_reading_data(self, studies, monkeypatch):
+        """Test numeric dtypes are available without copying the data."""
+        data_study, stats_study = studies
+        assert stats_study.get_available_columns() == ["a", "n", "numbers"]
+        
+        # Object columns were checked once; unchanged columns are not re-read
+        def fail(name):
+            raise AssertionError(f"{name} was read")
+        monkeypatch.setattr(stats_study, "get_source_data", fail)
+        assert stats_study.get_available_columns() == ["a", "n", "numbers"]
+    
+    def test_object_column_rechecked_after_edit(self, studies):
+        """Test a text column becomes available once it holds numbers."""
+        data_study, stats_study = studies
+        assert not stats_study.is_numeric_column("text")
+        
+        data_study.set_values("text", [0, 1, 2, 3], np.array([5.0, 6.0, 7.0, 8.0]))
+        
+        assert stats_study.is_numeric_column("text")
+    
+    def test_results_cached_per_version(self, studies):
+        """Test unchanged columns are not recomputed."""
+        data_study, stats_study = studies
+        first = stats_study.analyze_column("a")
+        assert stats_study.analyze_column("a") is first
+        assert stats_study.update_statistics(["a"])["a"] is first
+        
+        data_study.set_values("a", [0], 10.0)
+        
+        second = stats_study.analyze_column("a")
+        assert second is not first
+        assert second["max"] == 10.0
+    
+    def test_changing_source_clears_cache(self, studies):
+        """Test results of another source are not reused."""
+        data_study, stats_study = studies
+        first = stats_study.analyze_column("a")
+        
+        stats_study.set_source_study("Data")
+        
+        assert stats_study.analyze_column("a") is not first
+
+
+class TestGroupStatistics:
+    """Test statistics per group of a key column."""
+    
+    @pytest.fixture
+    def stats_study(self):
+        """Statistics study over measurements of three runs."""
+        workspace = Workspace("Test", "general")
+        data_study = DataTableStudy("Data", workspace=workspace)
+        workspace.add_study(data_study)
+        data_study.add_column("run", initial_data=np.array([2, 1, 2, 1, 3, 2, np.nan]))
+        data_study.add_column("v", unit="V", initial_data=np.array([1.0, 10.0, 3.0, 20.0, 5.0, 5.0, 99.0]))
+        return StatisticsStudy("Stats", source_study="Data", workspace=workspace)
+    
+    def test_group_statistics(self, stats_study):
+        """Test one row per key with the statistics of its rows."""
+        frame = stats_study.group_statistics("run")
+        
+        assert frame["run"].tolist() == [1.0, 2.0, 3.0]
+        assert frame["v_count"].tolist() == [2, 3, 1]
+        assert frame["v_mean"].tolist() == [15.0, 3.0, 5.0]
+        assert frame["v_median"].tolist() == [15.0, 3.0, 5.0]
+        assert frame["v_max"].tolist() == [20.0, 5.0, 5.0]
+        assert frame["v_variance"][1] == pytest.approx(4.0)
+    
+    def test_create_group_table(self, stats_study):
+        """Test grouped statistics become a data table with units."""
+        study = stats_study.create_group_table("run", ["v"], statistics=("count", "mean", "variance"))
+        
+        assert study.name == "Stats by run"
+        assert study.table.columns == ["run", "v_count", "v_mean", "v_variance"]
+        assert study.column_metadata["v_mean"]["unit"] == "V"
+        assert study.column_metadata["v_variance"]["unit"] is None
+    
+    def test_missing_key_column(self, stats_study):
+        """Test an unknown key column raises."""
+        with pytest.raises(ValueError):
+            stats_study.group_statistics("missing")
+
+
+class TestCorrelationMatrix:
+    """Test the correlation/covariance analysis."""
+    
+    def test_correlation_matrix(self):
+        """Test labeled matrices over numerical columns, cached until data changes."""
+        workspace = Workspace("Test", "general")
+        data_study = DataTableStudy("Data", workspace=workspace)
+        workspace.add_study(data_study)
+        data_study.add_column("x", initial_data=np.array([1.0, 2.0, 3.0, 4.0, np.nan]))
+        data_study.add_column("y", initial_data=np.array([2.0, 4.0, 6.0, 8.0, 1.0]))
+        data_study.add_column("z", initial_data=np.array([4.0, 3.0, 2.0, 1.0, 0.0]))
+        data_study.table.data["label"] = ["a", "b", "c", "d", "e"]
+        stats_study = StatisticsStudy("Stats", source_study="Data", workspace=workspace)
+        
+        matrices = stats_study.correlation_matrix()
+        
+        correlation = matrices["correlation"]
+        assert list(correlation.columns) == ["x", "y", "z"]
+        assert correlation.loc["x", "y"] == pytest.approx(1.0)
+        assert correlation.loc["x", "z"] == pytest.approx(-1.0)
+        assert matrices["count"].loc["x", "y"] == 4
+        assert matrices["covariance"].loc["y", "y"] == pytest.approx(np.var([2, 4, 6, 8, 1], ddof=1))
+        assert stats_study.get_dependencies() == {"Data": {"x", "y", "z"}}
+        
+        assert stats_study.correlation_matrix() is matrices
+        data_study.set_values("z", [0], 10.0)
+        assert stats_study.correlation_matrix() is not matrices
+
+
 class TestEdgeCases:
     """Test edge cases for statistics calculations."""
     
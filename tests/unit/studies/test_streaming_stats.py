@@ -0,0 +1,204 @@
+"""
+Unit tests for incremental statistics and their use in StatisticsStudy.
+"""
+
+import pickle
+
+import pytest
+import numpy as np
+import pandas as pd
+from studies.streaming_stats import MomentAccumulator, QuantileSketch, StreamingStats
+from studies.descriptive_stats import describe
+from studies.statistics_study import StatisticsStudy
+from studies.data_table_study import DataTableStudy
+from core.workspace import Workspace
+
+EXACT = ('count', 'mean', 'std', 'variance', 'min', 'max', 'skewness', 'kurtosis')
+
+
+def _rank_error(data, quantile, p):
+    """Distance between the rank of a quantile estimate and p."""
+    return abs(np.mean(data <= quantile) - p)
+
+
+class TestMomentAccumulator:
+    """Test merging and removing moments."""
+
+    def test_merge_matches_single_pass(self):
+        """Test merged chunks equal the moments of all values."""
+        data = np.random.default_rng(0).gamma(2.0, size=10000)
+        merged = MomentAccumulator()
+        for chunk in np.array_split(data, 7):
+            merged.merge(MomentAccumulator.from_values(chunk))
+        full = MomentAccumulator.from_values(data)
+
+        for name in ("count", "mean", "m2", "m3", "m4", "min", "max"):
+            assert getattr(merged, name) == pytest.approx(getattr(full, name), rel=1e-9), name
+
+    def test_remove_inverts_add(self):
+        """Test removing values restores the previous moments."""
+        rng = np.random.default_rng(1)
+        kept, extra = rng.normal(size=500), rng.normal(5.0, size=100)
+        moments = MomentAccumulator.from_values(np.concatenate([kept, extra]))
+
+        moments.remove(extra)
+        expected = MomentAccumulator.from_values(kept)
+
+        for name in ("count", "mean", "m2", "m3", "m4"):
+            assert getattr(moments, name) == pytest.approx(getattr(expected, name), rel=1e-6), name
+
+    def test_removing_extreme_invalidates(self):
+        """Test removing the max requires recomputing extremes."""
+        moments = MomentAccumulator.from_values([1.0, 2.0, 3.0])
+        moments.remove([2.0])
+        assert moments.extremes_valid
+        moments.remove([3.0])
+        assert not moments.extremes_valid
+
+        moments.reset_extremes([1.0])
+        assert (moments.min, moments.max, moments.extremes_valid) == (1.0, 1.0, True)
+
+
+class TestQuantileSketch:
+    """Test the mergeable quantile sketch."""
+
+    def test_exact_when_small(self):
+        """Test quantiles are exact before the sketch compacts."""
+        data = np.random.default_rng(2).normal(size=100)
+        sketch = QuantileSketch(k=512)
+        sketch.add(data)
+
+        assert sketch.exact
+        assert sketch.quantiles([0.25, 0.5, 0.75]) == pytest.approx(np.percentile(data, [25, 50, 75]))
+
+    def test_rank_error_and_merge(self):
+        """Test merged sketches of chunks stay within the rank error."""
+        data = np.random.default_rng(3).lognormal(size=200000)
+        sketch = QuantileSketch(k=512, seed=0)
+        for chunk in np.array_split(data, 20):
+            part = QuantileSketch(k=512, seed=1)
+            part.add(chunk)
+            sketch.merge(part)
+
+        assert sketch.count == len(data)
+        assert not sketch.exact
+        for p, q in zip((0.1, 0.5, 0.9), sketch.quantiles([0.1, 0.5, 0.9])):
+            assert _rank_error(data, q, p) < 0.01
+
+    def test_merge_requires_same_k(self):
+        """Test sketches of different sizes cannot be merged."""
+        with pytest.raises(ValueError):
+            QuantileSketch(k=64).merge(QuantileSketch(k=128))
+
+
+class TestStreamingStats:
+    """Test running statistics against describe()."""
+
+    def test_edits_and_appends(self):
+        """Test removals and additions match a recompute."""
+        rng = np.random.default_rng(4)
+        data = rng.normal(size=5000)
+        stats = StreamingStats.from_values(data, seed=0)
+
+        rows = rng.choice(len(data), 300, replace=False)
+        new = rng.exponential(size=300)
+        stats.remove(data[rows])
+        stats.add(new)
+        data[rows] = new
+        appended = rng.normal(2.0, size=1000)
+        stats.add(appended)
+        data = np.concatenate([data, appended])
+        stats.moments.reset_extremes(data)
+
+        summary, expected = stats.summary(), describe(data)[0]
+        for key in EXACT:
+            assert summary[key] == pytest.approx(expected[key], rel=1e-6), key
+        assert _rank_error(data, summary['median'], 0.5) < 0.01
+
+    def test_picklable(self):
+        """Test state can be sent to and merged from other processes."""
+        stats = StreamingStats.from_values(np.arange(10.0))
+        other = pickle.loads(pickle.dumps(StreamingStats.from_values(np.arange(10.0, 20.0))))
+
+        stats.merge(other)
+
+        assert stats.summary()['median'] == pytest.approx(9.5)
+        assert stats.summary()['max'] == 19.0
+
+    def test_empty(self):
+        """Test statistics without values are empty."""
+        assert StreamingStats.from_values([np.nan]).summary() == {}
+
+
+class TestUpdateStatistics:
+    """Test incremental updates of StatisticsStudy."""
+
+    @pytest.fixture
+    def studies(self):
+        """Statistics study over a data table with one column."""
+        workspace = Workspace("Test", "general")
+        data_study = DataTableStudy("Data", workspace=workspace)
+        workspace.add_study(data_study)
+        data_study.add_column("x", initial_data=np.random.default_rng(5).normal(size=2000))
+        stats_study = StatisticsStudy("Stats", source_study="Data", workspace=workspace)
+        return data_study, stats_study
+
+    def _assert_current(self, data_study, results):
+        expected = describe(data_study.table.data["x"].to_numpy(dtype=float))[0]
+        for key in EXACT:
+            assert results["x"][key] == pytest.approx(expected[key], rel=1e-6), key
+
+    def test_cell_edits(self, studies):
+        """Test edited cells update the statistics."""
+        data_study, stats_study = studies
+        stats_study.update_statistics(["x"])
+        state = stats_study.get_statistics_state("x")
+
+        data_study.set_values("x", [3, 10, 11], [100.0, -50.0, 7.0])
+        results = stats_study.update_statistics()
+
+        # Updated in place, not rebuilt
+        assert stats_study.get_statistics_state("x") is state
+        self._assert_current(data_study, results)
+        assert results["x"]["max"] == 100.0
+
+    def test_appended_rows(self, studies):
+        """Test appended rows are added without a rebuild."""
+        data_study, stats_study = studies
+        stats_study.update_statistics(["x"])
+        state = stats_study.get_statistics_state("x")
+
+        for _ in range(5):
+            data_study.append_rows({"x": np.random.default_rng(6).normal(3.0, size=700)})
+            results = stats_study.update_statistics()
+
+        assert stats_study.get_statistics_state("x") is state
+        assert results["x"]["count"] == 5500
+        self._assert_current(data_study, results)
+
+    def test_unknown_changes_rebuild(self, studies):
+        """Test a replaced table rebuilds the statistics."""
+        data_study, stats_study = studies
+        stats_study.update_statistics(["x"])
+        state = stats_study.get_statistics_state("x")
+
+        data_study.remove_rows([0, 1, 2])
+        results = stats_study.update_statistics()
+
+        assert stats_study.get_statistics_state("x") is not state
+        self._assert_current(data_study, results)
+
+    def test_matches_exact_analysis(self, studies):
+        """Test analyze_columns() agrees on small columns (exact sketch)."""
+        data_study, stats_study = studies
+        data_study.replace_rows({"x": np.linspace(0.0, 1.0, 300) ** 2})
+        incremental = stats_study.update_statistics(["x"])["x"]
+        exact = stats_study.analyze_columns(["x"])["x"]
+
+        assert incremental == pytest.approx(exact)
+
+    def test_text_column_skipped(self, studies):
+        """Test non-numerical columns have no statistics."""
+        data_study, stats_study = studies
+        data_study.table.data["label"] = pd.Series(["a"] * len(data_study.table.data))
+        assert stats_study.update_statistics(["label", "missing"]) == {}
@@ -0,0 +1,191 @@
+"""Unit tests for DataTableModel cell value caching and change signals."""
+
+import pytest
+import numpy as np
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt
+
+from studies.data_table_study import DataTableStudy, ColumnType
+from ui.widgets.data_table.model import DataTableModel
+from ui.widgets.shared import format_cell_value, format_cell_block, set_display_precision, get_display_precision
+
+
+@pytest.fixture
+def qapp():
+    """Create QApplication instance for tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def model(qapp):
+    """Model over a study with float, int and calculated columns."""
+    study = DataTableStudy("Model")
+    study.add_column("x", initial_data=[1.23456, np.nan, 1e12, -0.5])
+    study.add_column("n", initial_data=np.array([1, 20, 300, 4000]))
+    study.add_column("y", ColumnType.CALCULATED, formula="{x} * 2")
+    return DataTableModel(study)
+
+
+class TestFormatCellBlock:
+    """Test vectorized formatting matches per-cell formatting."""
+
+    @pytest.mark.parametrize("values", [
+        np.array([3.14159, np.nan, 1e-7, -2.5e20, np.inf]),
+        np.array([0, -12345, 7]),
+        np.array([True, False]),
+        np.array(["a", None, 1.5], dtype=object),
+    ])
+    def test_matches_format_cell_value(self, values):
+        """Test each element is formatted like format_cell_value."""
+        expected = [format_cell_value(value) for value in values]
+        assert list(format_cell_block(values)) == expected
+
+
+class TestModelCache:
+    """Test the model's per-column caches follow data and precision."""
+
+    def test_display_values(self, model):
+        """Test displayed strings equal per-cell formatting."""
+        data = model.study.table.data
+        for row in range(4):
+            for col in range(3):
+                expected = format_cell_value(data.iloc[row, col])
+                assert model.data(model.index(row, col)) == expected
+
+    def test_edit_role_full_precision(self, model):
+        """Test edit role returns the unrounded value."""
+        assert model.data(model.index(0, 0), Qt.EditRole) == "1.23456"
+        assert model.data(model.index(1, 0), Qt.EditRole) == ""
+
+    def test_invalidated_by_edit(self, model):
+        """Test cached strings are refreshed after a study edit."""
+        assert model.data(model.index(0, 2)) == "2.47"
+
+        model.study.set_values("x", [0], [5.0])
+
+        assert model.data(model.index(0, 0)) == "5"
+        assert model.data(model.index(0, 2)) == "10"
+
+    def test_invalidated_by_precision(self, model):
+        """Test a display precision change re-formats cells."""
+        previous = get_display_precision()
+        try:
+            model.data(model.index(0, 0))
+            set_display_precision(5)
+            assert model.data(model.index(0, 0)) == "1.2346"
+        finally:
+            set_display_precision(previous)
+
+
+class TestEmitChanges:
+    """Test dataChanged is emitted for changed ranges only."""
+
+    @pytest.fixture
+    def rects(self, model):
+        """Record emitted dataChanged rectangles as (top, left, bottom, right)."""
+        emitted = []
+        model.dataChanged.connect(
+            lambda tl, br, roles=None: emitted.append((tl.row(), tl.column(), br.row(), br.column()))
+        )
+        return emitted
+
+    def test_cell_edit(self, model, rects):
+        """Test editing a cell covers it and its element-wise dependent."""
+        assert model.setData(model.index(1, 0), "3.5", Qt.EditRole)
+
+        assert rects == [(1, 0, 1, 0), (1, 2, 1, 2)]
+
+    def test_adjacent_columns_merged(self, model, rects):
+        """Test neighbouring columns with the same rows share a rectangle."""
+        model.emit_changes({"x": (0, 2), "n": (0, 2), "y": (1, 4)})
+
+        assert rects == [(0, 0, 1, 1), (1, 2, 3, 2)]
+
+    def test_clipped_to_table(self, model, rects):
+        """Test ranges are clipped to the rows and known columns."""
+        model.emit_changes({"x": (2, 10), "n": (4, 4), "gone": (0, 4)})
+
+        assert rects == [(2, 0, 3, 0)]
+
+    def test_full_update_above_threshold(self, model, rects, monkeypatch):
+        """Test too many rectangles fall back to one full update."""
+        monkeypatch.setattr("ui.widgets.data_table.model.TABLE_MAX_CHANGED_RECTS", 1)
+
+        model.emit_changes({"x": (0, 1), "y": (2, 3)})
+
+        assert rects == [(0, 0, 3, 2)]
+
+
+class TestFetchMore:
+    """Test rows are handed to views in batches."""
+
+    @pytest.fixture
+    def paged(self, qapp, monkeypatch):
+        """Model over a 10-row study with a batch size of 4."""
+        monkeypatch.setattr("ui.widgets.data_table.model.TABLE_FETCH_BATCH_ROWS", 4)
+        study = DataTableStudy("Paged")
+        study.add_column("x", initial_data=np.arange(10, dtype=float))
+        return DataTableModel(study)
+
+    def test_batches(self, paged):
+        """Test rowCount grows one batch per fetchMore."""
+        assert paged.rowCount() == 4
+        assert paged.canFetchMore()
+
+        paged.fetchMore()
+        paged.fetchMore()
+
+        assert paged.rowCount() == 10
+        assert not paged.canFetchMore()
+
+    def test_reset_keeps_loaded_rows(self, paged):
+        """Test a model reset does not drop already fetched rows."""
+        paged.fetchMore()
+        paged.beginResetModel()
+        paged.endResetModel()
+
+        assert paged.rowCount() == 8
+
+    def test_append_when_fully_loaded(self, paged):
+        """Test appended rows are inserted only once all rows are loaded."""
+        paged.study.append_rows({"x": [10.0, 11.0]})
+        paged.rows_appended(10)
+        assert paged.rowCount() == 4
+
+        paged.fetchMore()
+        paged.fetchMore()
+        paged.fetchMore()
+        paged.study.append_rows({"x": [12.0]})
+        paged.rows_appended(12)
+        assert paged.rowCount() == 13
+
+
+class TestRowView:
+    """Test the model shows and edits rows through the study's row view."""
+
+    def test_sorted_display(self, model):
+        """Test cells and row headers follow the sort order."""
+        model.set_sort([("n", False)])
+
+        assert model.data(model.index(0, 1)) == "4000"
+        assert model.headerData(0, Qt.Vertical) == "4"
+
+    def test_filtered_row_count(self, model):
+        """Test filtered rows are hidden."""
+        model.set_filter("{n} > 10")
+        assert model.rowCount() == 3
+
+        model.clear_view()
+        assert model.rowCount() == 4
+
+    def test_edit_writes_source_row(self, model):
+        """Test an edit in a sorted view changes the source row."""
+        model.set_sort([("n", False)])
+
+        assert model.setData(model.index(0, 0), "7", Qt.EditRole)
+
+        assert model.study.table["x"].iloc[3] == 7
+        assert model.data(model.index(0, 2)) == "14"
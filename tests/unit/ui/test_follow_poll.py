@@ -0,0 +1,55 @@
+"""Unit tests for follow mode in the DataTable widget."""
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from studies.data_table_study import DataTableStudy, ColumnType
+from ui.widgets.data_table.widget import DataTableWidget
+
+
+@pytest.fixture
+def qapp():
+    """Create QApplication instance for tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def live(qapp, tmp_path):
+    """Widget following a CSV file with a calculated column z = y + 1."""
+    path = tmp_path / "live.csv"
+    path.write_text("t,y\n0,0\n1,1\n")
+    study = DataTableStudy("Live")
+    study.follow_file(str(path))
+    study.add_column("z", ColumnType.CALCULATED, formula="{y} + 1")
+    return DataTableWidget(study), path
+
+
+class TestPollFollow:
+    """Test the widget shows rows read by the study's follower."""
+
+    def test_appended_rows_shown(self, live):
+        """Test new rows reach the model with their calculated values."""
+        widget, path = live
+        with open(path, "a") as f:
+            f.write("2,4\n")
+
+        widget._poll_follow()
+
+        assert widget.model.rowCount() == 3
+        assert widget.model.data(widget.model.index(2, 2)) == "5"
+
+        widget._poll_follow()
+        assert widget.model.rowCount() == 3
+
+    def test_truncation_resets(self, live):
+        """Test a truncated file replaces the shown rows."""
+        widget, path = live
+        path.write_text("t,y\n5,7\n")
+
+        widget._poll_follow()
+
+        assert widget.model.rowCount() == 1
+        assert widget.model.data(widget.model.index(0, 2)) == "8"
@@ -0,0 +1,84 @@
+"""Unit tests for editing range column parameters in the DataTable widget."""
+
+import pytest
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from core.workspace import Workspace
+from studies.data_table_study import DataTableStudy, ColumnType
+from studies.statistics_study import StatisticsStudy
+from ui.widgets.column_dialogs import AddRangeColumnDialog
+from ui.widgets.data_table.widget import DataTableWidget
+from ui.widgets.data_table.column_edit import _edit_range_column
+
+
+@pytest.fixture
+def qapp():
+    """Create QApplication instance for tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def widget(qapp):
+    """Widget over a range column x = [0, 1, 2] and y = 2 x."""
+    workspace = Workspace("Test", "general")
+    study = DataTableStudy("Ranges", workspace=workspace)
+    workspace.add_study(study)
+    study.add_column("x", ColumnType.RANGE, range_type="linspace", range_start=0.0, range_stop=2.0, range_count=3)
+    study.add_column("y", ColumnType.CALCULATED, formula="{x} * 2")
+    return DataTableWidget(study)
+
+
+def edit_range(widget, monkeypatch, start, stop):
+    """Accept the range dialog of x with new linspace parameters."""
+    values = {"range_type": "linspace", "start": start, "stop": stop, "count": 3, "step": None, "unit": None}
+    monkeypatch.setattr(AddRangeColumnDialog, "exec", lambda self: True)
+    monkeypatch.setattr(AddRangeColumnDialog, "get_values", lambda self: values)
+    _edit_range_column(widget, "x")
+
+
+class TestEditRange:
+    """Test dependents see the regenerated range."""
+
+    def test_formula_recalculated(self, widget, monkeypatch):
+        """Test cached formula results are not reused for the new range."""
+        study = widget.study
+        assert study.table["y"].tolist() == [0.0, 2.0, 4.0]
+
+        edit_range(widget, monkeypatch, 10.0, 12.0)
+
+        assert study.table["x"].tolist() == [10.0, 11.0, 12.0]
+        assert study.table["y"].tolist() == [20.0, 22.0, 24.0]
+
+    def test_direct_write_recalculated(self, widget):
+        """Test a full recalculation sees writes that bypassed the versions."""
+        study = widget.study
+        study.table.data.loc[:, "x"] = [5.0, 6.0, 7.0]
+
+        study.recalculate_all()
+
+        assert study.table["y"].tolist() == [10.0, 12.0, 14.0]
+
+    def test_statistics_updated(self, widget, monkeypatch):
+        """Test cached and incremental statistics follow the new range."""
+        stats_study = StatisticsStudy("Stats", source_study="Ranges", workspace=widget.study.workspace)
+        assert stats_study.analyze_column("x")["mean"] == 1.0
+        assert stats_study.update_statistics(["x"])["x"]["mean"] == 1.0
+
+        edit_range(widget, monkeypatch, 10.0, 12.0)
+
+        assert stats_study.analyze_column("x")["mean"] == 11.0
+        assert stats_study.update_statistics(["x"])["x"]["mean"] == 11.0
+
+    def test_range_column_published(self, widget, monkeypatch):
+        """Test the edited range column is published with its dependents."""
+        widget.study.publish_changes()
+        published = []
+        widget.study.workspace.events.subscribe(lambda name, columns: published.append(columns))
+
+        edit_range(widget, monkeypatch, 10.0, 12.0)
+
+        assert published == [{"x", "y"}]
@@ -0,0 +1,120 @@
+"""Unit tests for the dependent view refresh scheduler."""
+
+import pytest
+from PySide6.QtWidgets import QApplication, QWidget
+
+from ui.refresh_scheduler import RefreshScheduler
+
+
+@pytest.fixture
+def qapp():
+    """Create QApplication instance for tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+class _View(QWidget):
+    """Widget counting its refreshes."""
+
+    def __init__(self, dependencies):
+        super().__init__()
+        self.dependencies = dependencies
+        self.refreshes = 0
+
+    def refresh(self):
+        self.refreshes += 1
+
+
+@pytest.fixture
+def scheduler(qapp):
+    """Scheduler with a long interval (tests flush explicitly)."""
+    return RefreshScheduler(interval_ms=10000)
+
+
+def _view(scheduler, dependencies, visible=True):
+    view = _View(dependencies)
+    if visible:
+        view.show()
+    scheduler.subscribe(view, lambda: view.dependencies)
+    return view
+
+
+class TestRefreshScheduler:
+    """Tests for RefreshScheduler."""
+
+    def test_invalidations_coalesced(self, scheduler):
+        """Many invalidations refresh a view once."""
+        view = _view(scheduler, {"Table": None})
+
+        for _ in range(100):
+            scheduler.invalidate("Table", ["x"])
+        assert view.refreshes == 0
+        assert scheduler.is_stale(view)
+
+        scheduler.flush()
+        assert view.refreshes == 1
+        assert not scheduler.is_stale(view)
+
+        scheduler.flush()
+        assert view.refreshes == 1
+
+    def test_column_filtering(self, scheduler):
+        """Only views reading a changed column are refreshed."""
+        reads_x = _view(scheduler, {"Table": {"x"}})
+        reads_y = _view(scheduler, {"Table": {"y"}})
+        other = _view(scheduler, {"Other": None})
+
+        scheduler.invalidate("Table", ["y", "z"])
+        scheduler.flush()
+        assert (reads_x.refreshes, reads_y.refreshes, other.refreshes) == (0, 1, 0)
+
+        # Unknown columns affect every reader of the study
+        scheduler.invalidate("Table")
+        scheduler.flush()
+        assert (reads_x.refreshes, reads_y.refreshes, other.refreshes) == (1, 2, 0)
+
+    def test_dependencies_queried_on_invalidate(self, scheduler):
+        """Changed dependencies take effect without resubscribing."""
+        view = _view(scheduler, {})
+        scheduler.invalidate("Table", ["x"])
+        assert not scheduler.is_stale(view)
+
+        view.dependencies = {"Table": {"x"}}
+        scheduler.invalidate("Table", ["x"])
+        assert scheduler.is_stale(view)
+
+    def test_hidden_view_deferred_until_shown(self, scheduler, qapp):
+        """Hidden views stay stale and refresh once when shown."""
+        view = _view(scheduler, {"Table": None}, visible=False)
+
+        scheduler.invalidate("Table")
+        scheduler.invalidate("Table")
+        scheduler.flush()
+        assert view.refreshes == 0
+        assert scheduler.is_stale(view)
+
+        view.show()
+        qapp.processEvents()
+        assert view.refreshes == 1
+        assert not scheduler.is_stale(view)
+
+    def test_timer_refreshes(self, qapp):
+        """The interval timer performs the refresh."""
+        scheduler = RefreshScheduler(interval_ms=0)
+        view = _view(scheduler, {"Table": None})
+
+        scheduler.invalidate("Table")
+        scheduler.invalidate("Table")
+        qapp.processEvents()
+        assert view.refreshes == 1
+
+    def test_unsubscribe(self, scheduler):
+        """Unsubscribed views are no longer refreshed."""
+        view = _view(scheduler, {"Table": None})
+        scheduler.unsubscribe(view)
+
+        scheduler.invalidate("Table")
+        scheduler.flush()
+        assert view.refreshes == 0
@@ -0,0 +1,125 @@
+"""Unit tests for DataTable clipboard copy and paste."""
+
+import pytest
+import numpy as np
+import pandas as pd
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QItemSelection, QItemSelectionModel
+
+from studies.data_table_study import DataTableStudy, ColumnType
+from ui.widgets.data_table.widget import DataTableWidget
+from ui.widgets.data_table.shortcuts import _on_copy, _on_paste, _parse_tsv
+
+
+@pytest.fixture
+def qapp():
+    """Create QApplication instance for tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def widget(qapp):
+    """Widget over a study with two data columns and a calculated column."""
+    study = DataTableStudy("Clipboard")
+    study.add_column("x", initial_data=[1 / 3, 2.0, np.nan, 4.0])
+    study.add_column("w", initial_data=[10.0, 20.0, 30.0, 40.0])
+    study.add_column("y", ColumnType.CALCULATED, formula="{x} + {w}")
+    study.undo_manager.clear()
+    return DataTableWidget(study)
+
+
+def select(widget, *rects):
+    """Select (top, left, bottom, right) rectangles in the widget's view."""
+    selection = QItemSelection()
+    for top, left, bottom, right in rects:
+        selection.select(widget.model.index(top, left), widget.model.index(bottom, right))
+    widget.view.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect)
+
+
+class TestCopy:
+    """Test copying selections as TSV."""
+
+    def test_full_precision(self, widget):
+        """Test values are copied unrounded and NaN as empty."""
+        select(widget, (0, 0, 2, 1))
+        _on_copy(widget)
+
+        assert QApplication.clipboard().text() == f"{1 / 3!r}\t10.0\n2.0\t20.0\n\t30.0"
+
+    def test_disjoint_ranges(self, widget):
+        """Test unselected cells in the bounding rectangle are empty."""
+        select(widget, (0, 0, 0, 0), (3, 2, 3, 2))
+        _on_copy(widget)
+
+        assert QApplication.clipboard().text() == f"{1 / 3!r}\t\t\n\t\t44.0"
+
+
+class TestPaste:
+    """Test pasting TSV text."""
+
+    def test_parse(self):
+        """Test numbers, empty cells, text and ragged lines."""
+        block = _parse_tsv("1\t2.5\n\tabc\n3\n")
+
+        assert block.shape == (3, 2)
+        assert block[0].tolist()[::2] == [1.0, 3.0] and np.isnan(block[0][1])
+        assert block[1][0] == 2.5 and block[1][1] == "abc"
+
+    def test_parse_literal_text(self):
+        """Test quotes and missing-value words are kept as typed."""
+        block = _parse_tsv('"abc\tNA\nx"y\tNone\n"\t1\n')
+
+        assert block[0].tolist() == ['"abc', 'x"y', '"']
+        assert block[1].tolist() == ["NA", "None", 1.0]
+
+    def test_unreadable_text_warns(self, widget, monkeypatch):
+        """Test parser errors are reported instead of raised."""
+        import ui.widgets.data_table.shortcuts as shortcuts
+        warnings = []
+
+        def fail(tsv_data):
+            raise pd.errors.ParserError("bad")
+
+        monkeypatch.setattr(shortcuts, "_parse_tsv", fail)
+        monkeypatch.setattr(shortcuts, "show_warning", lambda parent, title, message: warnings.append(title))
+        select(widget, (0, 0, 0, 0))
+        QApplication.clipboard().setText("1")
+
+        _on_paste(widget)
+
+        assert warnings == ["Paste Error"]
+
+    def test_paste_block(self, widget):
+        """Test a block is written into data columns as one undo step."""
+        select(widget, (1, 0, 1, 0))
+        QApplication.clipboard().setText("5\t50\n6\t60\n7\t70\n8\t80\n")
+
+        _on_paste(widget)
+
+        study = widget.study
+        assert study.table["x"].tolist()[1:] == [5, 6, 7]
+        assert study.table["y"].tolist()[1:] == [55, 66, 77]
+        assert study.undo_manager.get_undo_count() == 1
+
+    def test_skips_computed_columns(self, widget):
+        """Test calculated columns are not overwritten."""
+        select(widget, (0, 1, 0, 1))
+        QApplication.clipboard().setText("1\t2")
+
+        _on_paste(widget)
+
+        assert widget.study.table["w"].iloc[0] == 1
+        assert widget.study.table["y"].iloc[0] == pytest.approx(1 / 3 + 1)
+
+    def test_roundtrip(self, widget):
+        """Test copied values paste back bit-identical."""
+        select(widget, (0, 0, 3, 0))
+        _on_copy(widget)
+        select(widget, (0, 1, 0, 1))
+
+        _on_paste(widget)
+
+        np.testing.assert_array_equal(widget.study.table["w"], widget.study.table["x"])